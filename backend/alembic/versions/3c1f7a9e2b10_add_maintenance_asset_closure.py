@@ -0,0 +1,55 @@
+"""add_maintenance_asset_closure
+
+Revision ID: 3c1f7a9e2b10
+Revises: a8d6374d236d
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f7a9e2b10'
+down_revision: Union[str, None] = 'a8d6374d236d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'maintenance_asset_closure',
+        sa.Column('ancestor_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('descendant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['maintenance_assets.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['descendant_id'], ['maintenance_assets.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id'),
+    )
+    op.create_index(
+        'ix_maintenance_asset_closure_descendant_depth',
+        'maintenance_asset_closure',
+        ['descendant_id', 'depth'],
+    )
+
+    # Preenche a tabela a partir da hierarquia existente (parent_asset_id)
+    op.execute(
+        """
+        WITH RECURSIVE tree (ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM maintenance_assets
+            UNION ALL
+            SELECT t.ancestor_id, a.id, t.depth + 1
+            FROM tree t
+            JOIN maintenance_assets a ON a.parent_asset_id = t.descendant_id
+        )
+        INSERT INTO maintenance_asset_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_maintenance_asset_closure_descendant_depth', table_name='maintenance_asset_closure')
+    op.drop_table('maintenance_asset_closure')
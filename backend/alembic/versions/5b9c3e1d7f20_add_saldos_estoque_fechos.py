@@ -0,0 +1,49 @@
+"""add_saldos_estoque_fechos
+
+Revision ID: 5b9c3e1d7f20
+Revises: 7e2d4b8c1a55
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5b9c3e1d7f20'
+down_revision: Union[str, None] = '7e2d4b8c1a55'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'saldos_estoque_fechos',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('data_fecho', sa.DateTime(), nullable=False),
+        sa.Column('variante_produto_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('lote_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('local_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('quantidade', sa.Numeric(14, 4), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['variante_produto_id'], ['variantes_produto.id']),
+        sa.ForeignKeyConstraint(['lote_id'], ['lotes.id']),
+        sa.ForeignKeyConstraint(['local_id'], ['locais.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'data_fecho', 'variante_produto_id', 'lote_id', 'local_id',
+            name='uq_saldos_estoque_fechos_data_chave',
+            postgresql_nulls_not_distinct=True
+        ),
+    )
+    op.create_index(
+        op.f('ix_movimentacao_livro_razao_data_movimento'),
+        'movimentacao_livro_razao', ['data_movimento'], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_movimentacao_livro_razao_data_movimento'), table_name='movimentacao_livro_razao')
+    op.drop_table('saldos_estoque_fechos')
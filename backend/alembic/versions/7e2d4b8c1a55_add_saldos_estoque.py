@@ -0,0 +1,64 @@
+"""add_saldos_estoque
+
+Revision ID: 7e2d4b8c1a55
+Revises: 3c1f7a9e2b10
+Create Date: 2026-10-19 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '7e2d4b8c1a55'
+down_revision: Union[str, None] = '3c1f7a9e2b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'saldos_estoque',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('variante_produto_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('lote_id', postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column('local_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('quantidade', sa.Numeric(14, 4), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.ForeignKeyConstraint(['variante_produto_id'], ['variantes_produto.id']),
+        sa.ForeignKeyConstraint(['lote_id'], ['lotes.id']),
+        sa.ForeignKeyConstraint(['local_id'], ['locais.id']),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'variante_produto_id', 'lote_id', 'local_id',
+            name='uq_saldos_estoque_variante_lote_local',
+            postgresql_nulls_not_distinct=True
+        ),
+    )
+    op.create_index('ix_saldos_estoque_local_variante', 'saldos_estoque', ['local_id', 'variante_produto_id'])
+
+    # Saldos iniciais a partir dos movimentos já concluídos no livro razão
+    op.execute(
+        """
+        INSERT INTO saldos_estoque (id, variante_produto_id, lote_id, local_id, quantidade)
+        SELECT gen_random_uuid(), variante_produto_id, lote_id, local_id, SUM(quantidade)
+        FROM (
+            SELECT variante_produto_id, lote_id, local_destino_id AS local_id, qtd_realizada AS quantidade
+            FROM movimentacao_livro_razao
+            WHERE status = 'Concluído' AND local_destino_id IS NOT NULL
+            UNION ALL
+            SELECT variante_produto_id, lote_id, local_origem_id, -qtd_realizada
+            FROM movimentacao_livro_razao
+            WHERE status = 'Concluído' AND local_origem_id IS NOT NULL
+        ) AS movimentos
+        WHERE quantidade IS NOT NULL
+        GROUP BY variante_produto_id, lote_id, local_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_saldos_estoque_local_variante', table_name='saldos_estoque')
+    op.drop_table('saldos_estoque')
@@ -0,0 +1,43 @@
+"""add_typeahead_trigram_indexes
+
+Revision ID: 8e5d1c7a3b64
+Revises: b7c3e9a1f452
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '8e5d1c7a3b64'
+down_revision: Union[str, None] = 'b7c3e9a1f452'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (nome do índice, tabela, coluna)
+TRIGRAM_INDEXES = (
+    ('ix_variantes_produto_referencia_trgm', 'variantes_produto', 'referencia'),
+    ('ix_variantes_produto_nome_exibido_trgm', 'variantes_produto', 'nome_exibido'),
+    ('ix_maintenance_assets_internal_tag_trgm', 'maintenance_assets', 'internal_tag'),
+    ('ix_maintenance_assets_name_trgm', 'maintenance_assets', 'name'),
+    ('ix_locais_barcode_trgm', 'locais', 'barcode'),
+    ('ix_locais_nome_trgm', 'locais', 'nome'),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _column in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
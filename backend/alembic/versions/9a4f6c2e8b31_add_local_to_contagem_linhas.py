@@ -0,0 +1,52 @@
+"""add_local_to_contagem_linhas
+
+Revision ID: 9a4f6c2e8b31
+Revises: 5b9c3e1d7f20
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4f6c2e8b31'
+down_revision: Union[str, None] = '5b9c3e1d7f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('contagem_inventario_linhas', sa.Column('local_id', postgresql.UUID(as_uuid=True), nullable=True))
+    # As linhas existentes ficam no local da própria contagem
+    op.execute(
+        """
+        UPDATE contagem_inventario_linhas AS l
+        SET local_id = c.local_id
+        FROM contagens_inventario AS c
+        WHERE c.id = l.contagem_id
+        """
+    )
+    op.alter_column('contagem_inventario_linhas', 'local_id', nullable=False)
+    op.create_foreign_key(
+        'contagem_inventario_linhas_local_id_fkey', 'contagem_inventario_linhas', 'locais', ['local_id'], ['id']
+    )
+    op.alter_column('contagem_inventario_linhas', 'quantidade_contada', nullable=True)
+    op.alter_column('contagem_inventario_linhas', 'diferenca', nullable=True)
+    op.create_unique_constraint(
+        'uq_contagem_inventario_linhas_chave', 'contagem_inventario_linhas',
+        ['contagem_id', 'variante_produto_id', 'lote_id', 'local_id'],
+        postgresql_nulls_not_distinct=True
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_contagem_inventario_linhas_chave', 'contagem_inventario_linhas', type_='unique')
+    op.execute("UPDATE contagem_inventario_linhas SET quantidade_contada = quantidade_sistema WHERE quantidade_contada IS NULL")
+    op.execute("UPDATE contagem_inventario_linhas SET diferenca = quantidade_contada - quantidade_sistema WHERE diferenca IS NULL")
+    op.alter_column('contagem_inventario_linhas', 'diferenca', nullable=False)
+    op.alter_column('contagem_inventario_linhas', 'quantidade_contada', nullable=False)
+    op.drop_constraint('contagem_inventario_linhas_local_id_fkey', 'contagem_inventario_linhas', type_='foreignkey')
+    op.drop_column('contagem_inventario_linhas', 'local_id')
@@ -0,0 +1,29 @@
+"""index_ledger_updated_at
+
+Revision ID: a2f6c8e1b947
+Revises: d4a8e1f7c259
+Create Date: 2026-10-20 04:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a2f6c8e1b947'
+down_revision: Union[str, None] = 'd4a8e1f7c259'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rastreabilidade de lotes: a leitura incremental passa a usar 'updated_at'
+    # (movimentos 'Planeado' concluídos mais tarde mantêm o 'created_at')
+    op.drop_index(op.f('ix_movimentacao_livro_razao_created_at'), table_name='movimentacao_livro_razao')
+    op.create_index(op.f('ix_movimentacao_livro_razao_updated_at'), 'movimentacao_livro_razao', ['updated_at'])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_movimentacao_livro_razao_updated_at'), table_name='movimentacao_livro_razao')
+    op.create_index(op.f('ix_movimentacao_livro_razao_created_at'), 'movimentacao_livro_razao', ['created_at'])
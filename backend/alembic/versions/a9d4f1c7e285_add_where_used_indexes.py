@@ -0,0 +1,30 @@
+"""add_where_used_indexes
+
+Revision ID: a9d4f1c7e285
+Revises: c5f2a7e9d318
+Create Date: 2026-10-19 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4f1c7e285'
+down_revision: Union[str, None] = 'c5f2a7e9d318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Pesquisa "onde é usado" (BOM inversa, OPs e peças de reserva)
+    op.create_index(op.f('ix_bom_componentes_componente_variante_id'), 'bom_componentes', ['componente_variante_id'])
+    op.create_index(op.f('ix_ordens_producao_variante_produto_id'), 'ordens_producao', ['variante_produto_id'])
+    op.create_index(op.f('ix_maintenance_asset_spare_parts_product_id'), 'maintenance_asset_spare_parts', ['product_id'])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_maintenance_asset_spare_parts_product_id'), table_name='maintenance_asset_spare_parts')
+    op.drop_index(op.f('ix_ordens_producao_variante_produto_id'), table_name='ordens_producao')
+    op.drop_index(op.f('ix_bom_componentes_componente_variante_id'), table_name='bom_componentes')
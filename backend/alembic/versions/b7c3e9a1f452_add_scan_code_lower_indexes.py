@@ -0,0 +1,30 @@
+"""add_scan_code_lower_indexes
+
+Revision ID: b7c3e9a1f452
+Revises: d4e2a8f6b913
+Create Date: 2026-10-19 21:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c3e9a1f452'
+down_revision: Union[str, None] = 'd4e2a8f6b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Resolução de códigos lidos por scanner (comparação em minúsculas)
+    op.create_index('ix_locais_barcode_lower', 'locais', [sa.text('lower(barcode)')])
+    op.create_index('ix_maintenance_assets_internal_tag_lower', 'maintenance_assets', [sa.text('lower(internal_tag)')])
+    op.create_index('ix_variantes_produto_referencia_lower', 'variantes_produto', [sa.text('lower(referencia)')])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_variantes_produto_referencia_lower', table_name='variantes_produto')
+    op.drop_index('ix_maintenance_assets_internal_tag_lower', table_name='maintenance_assets')
+    op.drop_index('ix_locais_barcode_lower', table_name='locais')
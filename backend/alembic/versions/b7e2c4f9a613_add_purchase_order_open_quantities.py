@@ -0,0 +1,58 @@
+"""add_purchase_order_open_quantities
+
+Revision ID: b7e2c4f9a613
+Revises: f3c9a2b6d841
+Create Date: 2026-10-20 02:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c4f9a613'
+down_revision: Union[str, None] = 'f3c9a2b6d841'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('ordem_de_compra_linhas', sa.Column('qtd_recebida', sa.Numeric(precision=12, scale=4), server_default='0', nullable=False))
+
+    op.create_table('compras_em_aberto',
+    sa.Column('variante_produto_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('fornecedor_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('qtd_em_aberto', sa.Numeric(precision=14, scale=4), nullable=False),
+    sa.Column('valor_em_aberto', sa.Numeric(precision=14, scale=4), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['fornecedor_id'], ['fornecedores.id'], ),
+    sa.ForeignKeyConstraint(['variante_produto_id'], ['variantes_produto.id'], ),
+    sa.PrimaryKeyConstraint('variante_produto_id', 'fornecedor_id')
+    )
+    op.create_index(op.f('ix_compras_em_aberto_fornecedor_id'), 'compras_em_aberto', ['fornecedor_id'])
+
+    # Preenche o resumo e os totais a partir das linhas existentes
+    op.execute("""
+        INSERT INTO compras_em_aberto (variante_produto_id, fornecedor_id, qtd_em_aberto, valor_em_aberto)
+        SELECT l.variante_produto_id, o.fornecedor_id,
+               SUM(l.quantidade - l.qtd_recebida),
+               SUM((l.quantidade - l.qtd_recebida) * l.preco_unitario)
+        FROM ordem_de_compra_linhas l
+        JOIN ordens_de_compra o ON o.id = l.ordem_de_compra_id
+        WHERE o.status NOT IN ('Recebido', 'Cancelado') AND l.quantidade > l.qtd_recebida
+        GROUP BY l.variante_produto_id, o.fornecedor_id
+    """)
+    op.execute("""
+        UPDATE ordens_de_compra o
+        SET valor_total = COALESCE(
+            (SELECT SUM(l.quantidade * l.preco_unitario) FROM ordem_de_compra_linhas l WHERE l.ordem_de_compra_id = o.id), 0
+        )
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_compras_em_aberto_fornecedor_id'), table_name='compras_em_aberto')
+    op.drop_table('compras_em_aberto')
+    op.drop_column('ordem_de_compra_linhas', 'qtd_recebida')
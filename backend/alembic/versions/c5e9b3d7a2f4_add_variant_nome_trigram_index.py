@@ -0,0 +1,33 @@
+"""add_variant_nome_trigram_index
+
+Revision ID: c5e9b3d7a2f4
+Revises: a2f6c8e1b947
+Create Date: 2026-10-20 04:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e9b3d7a2f4'
+down_revision: Union[str, None] = 'a2f6c8e1b947'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # O seletor de variantes também pesquisa por 'nome' (variantes sem
+    # 'nome_exibido' só eram encontradas pela referência)
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_variantes_produto_nome_trgm',
+        'variantes_produto',
+        ['nome'],
+        postgresql_using='gin',
+        postgresql_ops={'nome': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_variantes_produto_nome_trgm', table_name='variantes_produto')
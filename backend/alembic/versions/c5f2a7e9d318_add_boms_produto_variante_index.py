@@ -0,0 +1,26 @@
+"""add_boms_produto_variante_index
+
+Revision ID: c5f2a7e9d318
+Revises: 8e5d1c7a3b64
+Create Date: 2026-10-19 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f2a7e9d318'
+down_revision: Union[str, None] = '8e5d1c7a3b64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Escolha da BOM aplicável a cada variante na explosão multinível
+    op.create_index('ix_boms_produto_variante', 'boms', ['produto_id', 'variante_produto_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_boms_produto_variante', table_name='boms')
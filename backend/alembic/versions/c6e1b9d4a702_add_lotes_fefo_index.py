@@ -0,0 +1,25 @@
+"""add_lotes_fefo_index
+
+Revision ID: c6e1b9d4a702
+Revises: 9a4f6c2e8b31
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e1b9d4a702'
+down_revision: Union[str, None] = '9a4f6c2e8b31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_lotes_variante_expiracao', 'lotes', ['variante_produto_id', 'data_de_expiracao'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_lotes_variante_expiracao', table_name='lotes')
@@ -0,0 +1,64 @@
+"""add_purchase_receipts
+
+Revision ID: d4a8e1f7c259
+Revises: b7e2c4f9a613
+Create Date: 2026-10-20 03:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8e1f7c259'
+down_revision: Union[str, None] = 'b7e2c4f9a613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('rececoes_compra',
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('chave_idempotencia', sa.String(length=100), nullable=True),
+    sa.Column('data_rececao', sa.DateTime(), nullable=False),
+    sa.Column('nfe', sa.String(length=100), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('ordem_de_compra_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('usuario_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.ForeignKeyConstraint(['ordem_de_compra_id'], ['ordens_de_compra.id'], ),
+    sa.ForeignKeyConstraint(['usuario_id'], ['usuarios.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_rececoes_compra_chave_idempotencia'), 'rececoes_compra', ['chave_idempotencia'], unique=True)
+    op.create_index(op.f('ix_rececoes_compra_ordem_de_compra_id'), 'rececoes_compra', ['ordem_de_compra_id'])
+
+    op.create_table('rececao_compra_linhas',
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('quantidade', sa.Numeric(precision=12, scale=4), nullable=False),
+    sa.Column('rececao_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('ordem_linha_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('variante_produto_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('lote_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('local_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('movimento_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.ForeignKeyConstraint(['rececao_id'], ['rececoes_compra.id'], ),
+    sa.ForeignKeyConstraint(['ordem_linha_id'], ['ordem_de_compra_linhas.id'], ),
+    sa.ForeignKeyConstraint(['variante_produto_id'], ['variantes_produto.id'], ),
+    sa.ForeignKeyConstraint(['lote_id'], ['lotes.id'], ),
+    sa.ForeignKeyConstraint(['local_id'], ['locais.id'], ),
+    sa.ForeignKeyConstraint(['movimento_id'], ['movimentacao_livro_razao.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_rececao_compra_linhas_rececao_id'), 'rececao_compra_linhas', ['rececao_id'])
+    op.create_index(op.f('ix_rececao_compra_linhas_ordem_linha_id'), 'rececao_compra_linhas', ['ordem_linha_id'])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_rececao_compra_linhas_ordem_linha_id'), table_name='rececao_compra_linhas')
+    op.drop_index(op.f('ix_rececao_compra_linhas_rececao_id'), table_name='rececao_compra_linhas')
+    op.drop_table('rececao_compra_linhas')
+    op.drop_index(op.f('ix_rececoes_compra_ordem_de_compra_id'), table_name='rececoes_compra')
+    op.drop_index(op.f('ix_rececoes_compra_chave_idempotencia'), table_name='rececoes_compra')
+    op.drop_table('rececoes_compra')
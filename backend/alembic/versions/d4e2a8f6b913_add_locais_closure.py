@@ -0,0 +1,62 @@
+"""add_locais_closure
+
+Revision ID: d4e2a8f6b913
+Revises: f1b8c3a6d209
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e2a8f6b913'
+down_revision: Union[str, None] = 'f1b8c3a6d209'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'locais_closure',
+        sa.Column('ancestor_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('descendant_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('depth', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['ancestor_id'], ['locais.id'], ondelete='CASCADE'),
+        sa.ForeignKeyConstraint(['descendant_id'], ['locais.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('ancestor_id', 'descendant_id'),
+    )
+    op.create_index(
+        'ix_locais_closure_descendant_depth',
+        'locais_closure',
+        ['descendant_id', 'depth'],
+    )
+    # Filtros "ativos/OS num local" (Asset.location_id)
+    op.create_index(
+        'ix_maintenance_assets_location_id',
+        'maintenance_assets',
+        ['location_id'],
+    )
+
+    # Preenche a tabela a partir da hierarquia existente (local_pai_id)
+    op.execute(
+        """
+        WITH RECURSIVE tree (ancestor_id, descendant_id, depth) AS (
+            SELECT id, id, 0 FROM locais
+            UNION ALL
+            SELECT t.ancestor_id, l.id, t.depth + 1
+            FROM tree t
+            JOIN locais l ON l.local_pai_id = t.descendant_id
+        )
+        INSERT INTO locais_closure (ancestor_id, descendant_id, depth)
+        SELECT ancestor_id, descendant_id, depth FROM tree
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_maintenance_assets_location_id', table_name='maintenance_assets')
+    op.drop_index('ix_locais_closure_descendant_depth', table_name='locais_closure')
+    op.drop_table('locais_closure')
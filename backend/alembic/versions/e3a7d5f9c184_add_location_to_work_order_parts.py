@@ -0,0 +1,47 @@
+"""add_location_to_work_order_parts
+
+Revision ID: e3a7d5f9c184
+Revises: c6e1b9d4a702
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3a7d5f9c184'
+down_revision: Union[str, None] = 'c6e1b9d4a702'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('maintenance_work_order_parts', sa.Column('location_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('maintenance_work_order_parts', sa.Column('created_by_user_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column(
+        'maintenance_work_order_parts',
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False)
+    )
+    op.create_foreign_key(
+        'maintenance_work_order_parts_location_id_fkey', 'maintenance_work_order_parts', 'locais', ['location_id'], ['id']
+    )
+    op.create_foreign_key(
+        'maintenance_work_order_parts_created_by_user_id_fkey', 'maintenance_work_order_parts', 'usuarios',
+        ['created_by_user_id'], ['id']
+    )
+    op.create_index(
+        'ix_maintenance_work_order_parts_variant_location', 'maintenance_work_order_parts',
+        ['product_variant_id', 'location_id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_maintenance_work_order_parts_variant_location', table_name='maintenance_work_order_parts')
+    op.drop_constraint('maintenance_work_order_parts_created_by_user_id_fkey', 'maintenance_work_order_parts', type_='foreignkey')
+    op.drop_constraint('maintenance_work_order_parts_location_id_fkey', 'maintenance_work_order_parts', type_='foreignkey')
+    op.drop_column('maintenance_work_order_parts', 'created_at')
+    op.drop_column('maintenance_work_order_parts', 'created_by_user_id')
+    op.drop_column('maintenance_work_order_parts', 'location_id')
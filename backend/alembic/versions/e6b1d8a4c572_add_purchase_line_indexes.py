@@ -0,0 +1,28 @@
+"""add_purchase_line_indexes
+
+Revision ID: e6b1d8a4c572
+Revises: a9d4f1c7e285
+Create Date: 2026-10-20 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b1d8a4c572'
+down_revision: Union[str, None] = 'a9d4f1c7e285'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Recebimentos programados do MRP (linhas de compra em aberto por variante)
+    op.create_index(op.f('ix_ordem_de_compra_linhas_ordem_de_compra_id'), 'ordem_de_compra_linhas', ['ordem_de_compra_id'])
+    op.create_index(op.f('ix_ordem_de_compra_linhas_variante_produto_id'), 'ordem_de_compra_linhas', ['variante_produto_id'])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_ordem_de_compra_linhas_variante_produto_id'), table_name='ordem_de_compra_linhas')
+    op.drop_index(op.f('ix_ordem_de_compra_linhas_ordem_de_compra_id'), table_name='ordem_de_compra_linhas')
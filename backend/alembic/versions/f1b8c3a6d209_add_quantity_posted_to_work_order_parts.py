@@ -0,0 +1,28 @@
+"""add_quantity_posted_to_work_order_parts
+
+Revision ID: f1b8c3a6d209
+Revises: e3a7d5f9c184
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b8c3a6d209'
+down_revision: Union[str, None] = 'e3a7d5f9c184'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'maintenance_work_order_parts',
+        sa.Column('quantity_posted', sa.Numeric(10, 4), server_default='0', nullable=False)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('maintenance_work_order_parts', 'quantity_posted')
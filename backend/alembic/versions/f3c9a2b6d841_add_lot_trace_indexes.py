@@ -0,0 +1,32 @@
+"""add_lot_trace_indexes
+
+Revision ID: f3c9a2b6d841
+Revises: e6b1d8a4c572
+Create Date: 2026-10-20 01:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c9a2b6d841'
+down_revision: Union[str, None] = 'e6b1d8a4c572'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Rastreabilidade de lotes: leituras por lote e incrementais (desde a última marca de água)
+    op.create_index(op.f('ix_movimentacao_livro_razao_lote_id'), 'movimentacao_livro_razao', ['lote_id'])
+    op.create_index(op.f('ix_movimentacao_livro_razao_created_at'), 'movimentacao_livro_razao', ['created_at'])
+    op.create_index(op.f('ix_ordens_producao_updated_at'), 'ordens_producao', ['updated_at'])
+    op.create_index(op.f('ix_saldos_estoque_lote_id'), 'saldos_estoque', ['lote_id'])
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_saldos_estoque_lote_id'), table_name='saldos_estoque')
+    op.drop_index(op.f('ix_ordens_producao_updated_at'), table_name='ordens_producao')
+    op.drop_index(op.f('ix_movimentacao_livro_razao_created_at'), table_name='movimentacao_livro_razao')
+    op.drop_index(op.f('ix_movimentacao_livro_razao_lote_id'), table_name='movimentacao_livro_razao')
@@ -0,0 +1,139 @@
+# File: backend/app/core/cache.py
+
+import threading
+import time
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Type
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+# Marca de "sem entrada" (um None guardado é um valor válido)
+_MISSING = object()
+
+
+class MemoryCache:
+    """
+    Cache em memória (por processo) para resultados de leitura caros.
+
+    - 'maxsize' limita o número de entradas (as mais antigas saem primeiro).
+    - 'ttl_seconds' (opcional) define a validade de cada entrada.
+    - 'invalidate()' descarta todas as entradas e incrementa 'version',
+      que pode ser usada para gerar ETags ou detetar alterações.
+
+    Nota: Cada worker do servidor tem a sua própria cópia do cache.
+    """
+
+    def __init__(self, *, maxsize: int = 256, ttl_seconds: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.version = 0
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Retorna o valor guardado para 'key' ou None (ausente/expirado)."""
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    def _lookup(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return _MISSING
+            stored_at, value = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._data[key]
+                return _MISSING
+            return value
+
+    def set(self, key: Hashable, value: Any, *, version: Optional[int] = None) -> None:
+        """
+        Guarda 'value' em 'key'. Com 'version' (lida antes de calcular o
+        valor), não guarda nada se o cache foi invalidado entretanto: o
+        valor pode ter sido calculado com dados anteriores ao commit.
+        """
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic(), value)
+            while len(self._data) > self.maxsize:
+                # Os dicts mantêm a ordem de inserção: o primeiro é o mais antigo.
+                del self._data[next(iter(self._data))]
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Obtém o valor de 'key'; se não existir, calcula-o com 'factory()'
+        e guarda-o. O cálculo corre fora do lock; se uma invalidação chegar
+        entretanto, o valor é devolvido mas não fica em cache.
+        """
+        version = self.version
+        value = self._lookup(key)
+        if value is _MISSING:
+            value = factory()
+            self.set(key, value, version=version)
+        return value
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.version += 1
+
+
+# --- INVALIDAÇÃO AUTOMÁTICA APÓS COMMIT ---
+# Cada entrada associa um conjunto de modelos a um cache. Quando uma
+# transação que escreveu nesses modelos é confirmada, o cache é invalidado.
+# Se a transação for revertida (rollback), nada é invalidado.
+
+_WATCHERS: List[Tuple[Tuple[Type, ...], MemoryCache]] = []
+_PENDING_KEY = "pending_cache_invalidations"
+
+
+def invalidate_on_commit(cache: MemoryCache, *models: Type) -> None:
+    """
+    Regista 'cache' para ser invalidado sempre que uma transação que
+    inseriu, alterou ou removeu instâncias de 'models' for confirmada.
+
+    Cobre tanto o flush normal do ORM como os 'insert()/update()/delete()'
+    executados em massa via 'Session.execute()'.
+    """
+    _WATCHERS.append((tuple(models), cache))
+
+
+def _mark_pending(session: Session, cache: MemoryCache) -> None:
+    session.info.setdefault(_PENDING_KEY, set()).add(cache)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_changes(session: Session, flush_context) -> None:
+    if not _WATCHERS:
+        return
+    changed = list(chain(session.new, session.dirty, session.deleted))
+    for models, cache in _WATCHERS:
+        if any(isinstance(obj, models) for obj in changed):
+            _mark_pending(session, cache)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_statements(orm_execute_state) -> None:
+    if not _WATCHERS or orm_execute_state.is_select:
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None:
+        return
+    for models, cache in _WATCHERS:
+        if issubclass(mapper.class_, models):
+            _mark_pending(orm_execute_state.session, cache)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_pending(session: Session) -> None:
+    for cache in session.info.pop(_PENDING_KEY, ()):
+        cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
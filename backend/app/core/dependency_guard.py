@@ -0,0 +1,72 @@
+# File: backend/app/core/dependency_guard.py
+
+from dataclasses import dataclass
+from typing import Any, List, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import select, exists
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import InstrumentedAttribute
+from sqlalchemy.sql.elements import ColumnElement
+
+
+@dataclass(frozen=True)
+class BlockingRelation:
+    """
+    Declara uma relação que impede a eliminação de um registo.
+
+    - 'column': a coluna (FK) do modelo dependente que aponta para o registo
+      (ex: WorkOrder.asset_id).
+    - 'reason': frase mostrada ao utilizador quando a relação existe.
+    - 'criteria': condições extra opcionais (ex: apenas registos ativos).
+    """
+    column: InstrumentedAttribute
+    reason: str
+    criteria: Tuple[ColumnElement, ...] = ()
+
+
+class DependencyGuard:
+    """
+    Proteção de eliminação baseada em EXISTS.
+
+    Em vez de carregar listas de relacionamentos (ex: 'if asset.work_orders')
+    só para saber se estão vazias, cada fatia declara as suas relações
+    bloqueantes e o guard responde a todas numa única query:
+
+        SELECT EXISTS(...) AS r0, EXISTS(...) AS r1, ...
+
+    Exemplo:
+        asset_delete_guard = DependencyGuard(
+            "o ativo",
+            BlockingRelation(WorkOrder.asset_id, "Ele possui Ordens de Serviço associadas."),
+        )
+        asset_delete_guard.check(db, asset_id)  # Levanta 400 se houver dependências
+    """
+
+    def __init__(self, entity_label: str, *relations: BlockingRelation):
+        self.entity_label = entity_label
+        self.relations = relations
+
+    def find_blocking(self, db: Session, target_id: Any) -> List[BlockingRelation]:
+        """Retorna as relações que têm pelo menos um registo dependente."""
+        if not self.relations:
+            return []
+        stmt = select(*[
+            exists().where(relation.column == target_id, *relation.criteria).label(f"r{index}")
+            for index, relation in enumerate(self.relations)
+        ])
+        row = db.execute(stmt).one()
+        return [relation for relation, blocked in zip(self.relations, row) if blocked]
+
+    def check(self, db: Session, target_id: Any) -> None:
+        """
+        Levanta HTTP 400 (com todos os motivos) se o registo tiver
+        dependências que impeçam a sua eliminação.
+        """
+        blocking = self.find_blocking(db, target_id)
+        if blocking:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Não é possível eliminar {self.entity_label}. "
+                       + " ".join(relation.reason for relation in blocking)
+            )
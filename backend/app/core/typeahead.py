@@ -0,0 +1,106 @@
+# File: backend/app/core/typeahead.py
+
+import uuid
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy import select, or_, case, func, literal
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.core.cache import MemoryCache, invalidate_on_commit
+
+# Termos mais curtos do que isto só procuram por prefixo (o índice de
+# trigramas não ajuda em '%ab%')
+MIN_CONTAINS_LENGTH = 3
+MAX_TYPEAHEAD_LIMIT = 50
+
+
+class TypeaheadItem(BaseModel):
+    """Resultado compacto de um seletor (typeahead)."""
+    id: uuid.UUID
+    codigo: Optional[str] = None
+    descricao: str
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class TypeaheadSource:
+    """
+    Pesquisa compacta (id, código, descrição) para os seletores da UI.
+
+    Em vez de devolver linhas ORM completas com relações, cada fatia
+    declara as colunas e o helper faz uma única query:
+    - 'code ILIKE termo%' ou 'coluna de pesquisa ILIKE %termo%' (suportado
+      pelos índices GIN de trigramas - pg_trgm);
+    - ordenação: código igual, código com o prefixo, descrição com o
+      prefixo e, por fim, os restantes (pelo código mais curto);
+    - apenas os N primeiros.
+
+    Os resultados ficam em cache por termo durante 'ttl_seconds' e são
+    descartados quando uma transação altera o modelo.
+
+    Exemplo:
+        variant_typeahead = TypeaheadSource(
+            VarianteProduto,
+            code=VarianteProduto.referencia,
+            label=func.coalesce(VarianteProduto.nome_exibido, VarianteProduto.nome),
+            search=(VarianteProduto.nome_exibido, VarianteProduto.nome),
+            criteria=(VarianteProduto.is_active == True,),
+        )
+        variant_typeahead.search(db, "parafuso", limit=10)
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        *,
+        code: ColumnElement,
+        label: ColumnElement,
+        search: Sequence[ColumnElement] = (),
+        criteria: Sequence[ColumnElement] = (),
+        ttl_seconds: float = 30,
+        maxsize: int = 2048,
+    ):
+        self.model = model
+        self.code = code
+        self.label = label
+        self.search_columns = tuple(search)
+        self.criteria = tuple(criteria)
+        self.cache = MemoryCache(maxsize=maxsize, ttl_seconds=ttl_seconds)
+        invalidate_on_commit(self.cache, model)
+
+    def search(self, db: Session, term: Optional[str], *, limit: int = 10) -> List[Dict[str, Any]]:
+        term = (term or "").strip()
+        if not term:
+            return []
+        limit = max(1, min(limit, MAX_TYPEAHEAD_LIMIT))
+        return self.cache.get_or_set((term.lower(), limit), lambda: self._query(db, term, limit))
+
+    def _query(self, db: Session, term: str, limit: int) -> List[Dict[str, Any]]:
+        escaped = _escape_like(term)
+        prefix = f"{escaped}%"
+        contains = f"{escaped}%" if len(term) < MIN_CONTAINS_LENGTH else f"%{escaped}%"
+
+        conditions = [self.code.ilike(prefix, escape="\\")]
+        conditions += [column.ilike(contains, escape="\\") for column in self.search_columns]
+
+        rank = case(
+            (func.lower(self.code) == term.lower(), 0),
+            (self.code.ilike(prefix, escape="\\"), 1),
+            *[(column.ilike(prefix, escape="\\"), 2) for column in self.search_columns],
+            else_=literal(3),
+        )
+        stmt = (
+            select(
+                self.model.id.label("id"),
+                self.code.label("codigo"),
+                self.label.label("descricao"),
+            )
+            .where(or_(*conditions), *self.criteria)
+            .order_by(rank, func.length(self.code), self.code, self.label)
+            .limit(limit)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
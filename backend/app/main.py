@@ -2,11 +2,13 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import SQLAlchemyError
 
 from .core import database
 from . import models
 
 from .modules.api_router import api_router
+from .modules.inventory.scan.scan_service import scan_service
 
 app = FastAPI(
     title="DecisumSystem API",
@@ -35,6 +37,18 @@ app.add_middleware(
 # def on_startup():
     # models.Base.metadata.create_all(bind=database.engine)
 
+@app.on_event("startup")
+def warm_scan_index():
+    # Carrega o mapa de códigos (scanner) para memória. Se a BD ainda não
+    # estiver disponível, o mapa é carregado no primeiro pedido.
+    db = database.SessionLocal()
+    try:
+        scan_service.warm(db)
+    except SQLAlchemyError:
+        pass
+    finally:
+        db.close()
+
 app.include_router(api_router)
 
 @app.get("/", tags=["Status"])
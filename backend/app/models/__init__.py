@@ -15,15 +15,19 @@ from .administration.user_model import Usuario, PasswordResetToken
 from .purchasing.supplier_model import Fornecedor
 # (Nota: Faltava OrdemDeCompra no seu ficheiro, mas estava no seu histórico - adicionei)
 from .purchasing.purchase_order_model import OrdemDeCompra, OrdemDeCompraLinha
+from .purchasing.on_order_model import CompraEmAberto
+from .purchasing.receipt_model import RececaoCompra, RececaoCompraLinha
 
 # Módulo de Inventário
 from .inventory.udm_model import CategoriaUdm, Udm
 from .inventory.product_model import CategoriaProduto, Produto, VarianteProduto
 from .inventory.lot_model import Lote
 from .inventory.location_model import TipoLocal, Local
+from .inventory.location_closure_model import LocalClosure
 from .inventory.transfer_type_model import TipoTransferencia
 from .inventory.transfer_model import Transferencia
 from .inventory.stock_movement_model import MovimentacaoLivroRazao
+from .inventory.stock_balance_model import SaldoEstoque, SaldoEstoqueFecho
 from .inventory.stock_count_model import ContagemInventario, ContagemInventarioLinha
 from .inventory.brand_model import Marca
 
@@ -42,6 +46,7 @@ from .maintenance.technician_model import Technician
 # Domínio 2: Ativos
 from .maintenance.manufacturer_model import Manufacturer
 from .maintenance.asset_model import Asset
+from .maintenance.asset_closure_model import AssetClosure
 from .maintenance.asset_spare_parts_model import AssetSparePart
 from .maintenance.asset_meter_model import AssetMeter, AssetMeterReading
 from .maintenance.asset_failure_mode_model import (
@@ -0,0 +1,31 @@
+# backend/app/models/inventory/location_closure_model.py
+
+from sqlalchemy import Column, ForeignKey, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+
+# Importa a Base partilhada a partir do nosso core
+from ...core.database import Base
+
+
+class LocalClosure(Base):
+    """
+    Tabela de fecho (closure table) da hierarquia de Locais
+    (armazém -> zona -> posição, via 'local_pai_id').
+
+    Uma linha por cada par (antecessor, descendente), incluindo o próprio
+    local (depth = 0). "Stock no armazém A, incluindo todas as posições" ou
+    "ativos no edifício 2" passam a ser um único JOIN indexado.
+
+    É mantida pelo CRUD dos Locais (criação e mudança de pai).
+    """
+    __tablename__ = 'locais_closure'
+
+    ancestor_id = Column(UUID(as_uuid=True), ForeignKey('locais.id', ondelete='CASCADE'), primary_key=True)
+    descendant_id = Column(UUID(as_uuid=True), ForeignKey('locais.id', ondelete='CASCADE'), primary_key=True)
+    # Distância na árvore (0 = o próprio local, 1 = filho direto, ...)
+    depth = Column(Integer, nullable=False)
+
+    __table_args__ = (
+        # Consulta de antecessores (caminho até à raiz)
+        Index('ix_locais_closure_descendant_depth', 'descendant_id', 'depth'),
+    )
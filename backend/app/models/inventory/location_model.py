@@ -1,6 +1,6 @@
 # File: backend/app/models/inventory/location_model.py
 
-from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime, func
+from sqlalchemy import Column, String, Boolean, ForeignKey, DateTime, func, Index
 from sqlalchemy.orm import relationship, Mapped  # <-- ALTERAÇÃO: Adicionado Mapped
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -45,4 +45,14 @@ class Local(Base):
     # Usamos "Asset" como string para evitar erros de importação circular.
     assets: Mapped[List["Asset"]] = relationship(back_populates="location")
     
-    # --- FIM DA ALTERAÇÃO ---
\ No newline at end of file
+    # --- FIM DA ALTERAÇÃO ---
+
+
+# Resolução de códigos lidos por scanner (case-insensitive)
+Index('ix_locais_barcode_lower', func.lower(Local.barcode))
+
+# Seletores (typeahead): ILIKE por prefixo/substring com trigramas (pg_trgm)
+Index('ix_locais_barcode_trgm', Local.barcode,
+      postgresql_using='gin', postgresql_ops={'barcode': 'gin_trgm_ops'})
+Index('ix_locais_nome_trgm', Local.nome,
+      postgresql_using='gin', postgresql_ops={'nome': 'gin_trgm_ops'})
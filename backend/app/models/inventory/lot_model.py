@@ -1,6 +1,6 @@
 # File: backend/app/models/inventory/lot_model.py
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, func
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, func
 # --- ALTERAÇÃO: Importações Mapped e List adicionadas ---
 from sqlalchemy.orm import relationship, Mapped
 from sqlalchemy.dialects.postgresql import UUID
@@ -36,4 +36,9 @@ class Lote(Base):
     wo_part_usages: Mapped[List["WorkOrderPartUsage"]] = relationship(
         back_populates="lot"
     )
-    # --- FIM DA NOVA RELAÇÃO ---
\ No newline at end of file
+    # --- FIM DA NOVA RELAÇÃO ---
+
+    __table_args__ = (
+        # Suporta a alocação FEFO (primeiro a expirar, primeiro a sair) por variante
+        Index('ix_lotes_variante_expiracao', 'variante_produto_id', 'data_de_expiracao'),
+    )
\ No newline at end of file
@@ -1,6 +1,6 @@
 # File: backend/app/models/inventory/product_model.py
 
-from sqlalchemy import Column, String, Boolean, Numeric, ForeignKey, Text
+from sqlalchemy import Column, String, Boolean, Numeric, ForeignKey, Text, Index, func
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -84,4 +84,15 @@ class VarianteProduto(Base):
         back_populates="product_variant"
     )
     # --- FIM DA NOVA RELAÇÃO ---
-    
\ No newline at end of file
+
+
+# Resolução de códigos lidos por scanner (case-insensitive)
+Index('ix_variantes_produto_referencia_lower', func.lower(VarianteProduto.referencia))
+
+# Seletores (typeahead): ILIKE por prefixo/substring com trigramas (pg_trgm)
+Index('ix_variantes_produto_referencia_trgm', VarianteProduto.referencia,
+      postgresql_using='gin', postgresql_ops={'referencia': 'gin_trgm_ops'})
+Index('ix_variantes_produto_nome_exibido_trgm', VarianteProduto.nome_exibido,
+      postgresql_using='gin', postgresql_ops={'nome_exibido': 'gin_trgm_ops'})
+Index('ix_variantes_produto_nome_trgm', VarianteProduto.nome,
+      postgresql_using='gin', postgresql_ops={'nome': 'gin_trgm_ops'})
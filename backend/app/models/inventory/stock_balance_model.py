@@ -0,0 +1,69 @@
+# File: backend/app/models/inventory/stock_balance_model.py
+
+from sqlalchemy import Column, ForeignKey, Numeric, DateTime, UniqueConstraint, Index, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+import uuid
+
+# Importa a Base partilhada a partir do nosso core
+from ...core.database import Base
+
+class SaldoEstoque(Base):
+    """
+    Saldo de stock atual por (variante, lote, local).
+
+    É uma tabela derivada do livro razão (MovimentacaoLivroRazao): cada
+    movimento 'Concluído' aplica um delta incremental (+ no destino,
+    - na origem). Pode ser reconstruída a partir do razão a qualquer momento.
+    """
+    __tablename__ = 'saldos_estoque'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False)
+    lote_id = Column(UUID(as_uuid=True), ForeignKey('lotes.id'), nullable=True, index=True)
+    local_id = Column(UUID(as_uuid=True), ForeignKey('locais.id'), nullable=False)
+    quantidade = Column(Numeric(14, 4), nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    variante_produto = relationship("VarianteProduto")
+    lote = relationship("Lote")
+    local = relationship("Local")
+
+    __table_args__ = (
+        # Um único saldo por chave; o lote nulo (sem lote) também conta como chave
+        UniqueConstraint(
+            'variante_produto_id', 'lote_id', 'local_id',
+            name='uq_saldos_estoque_variante_lote_local',
+            postgresql_nulls_not_distinct=True
+        ),
+        Index('ix_saldos_estoque_local_variante', 'local_id', 'variante_produto_id'),
+    )
+
+
+class SaldoEstoqueFecho(Base):
+    """
+    Fecho (checkpoint) periódico dos saldos, ex: no início de cada mês.
+
+    Cada linha guarda o saldo de (variante, lote, local) considerando todos os
+    movimentos com 'data_movimento' ANTERIOR a 'data_fecho'. Uma consulta
+    histórica parte do fecho mais próximo e aplica apenas os movimentos
+    posteriores, em vez de percorrer o livro razão desde o início.
+    """
+    __tablename__ = 'saldos_estoque_fechos'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    data_fecho = Column(DateTime, nullable=False)
+    variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False)
+    lote_id = Column(UUID(as_uuid=True), ForeignKey('lotes.id'), nullable=True)
+    local_id = Column(UUID(as_uuid=True), ForeignKey('locais.id'), nullable=False)
+    quantidade = Column(Numeric(14, 4), nullable=False)
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # O índice único começa por 'data_fecho': serve também as leituras de um fecho inteiro
+        UniqueConstraint(
+            'data_fecho', 'variante_produto_id', 'lote_id', 'local_id',
+            name='uq_saldos_estoque_fechos_data_chave',
+            postgresql_nulls_not_distinct=True
+        ),
+    )
@@ -1,6 +1,6 @@
 # backend/app/models/inventory/stock_count_model.py
 
-from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, func
+from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -8,6 +8,11 @@ import uuid
 # Importa a Base partilhada a partir do nosso core
 from ...core.database import Base
 
+# Estados de uma contagem de inventário
+CONTAGEM_EM_ABERTO = 'Em Aberto'
+CONTAGEM_EM_CONTAGEM = 'Em Contagem'
+CONTAGEM_APROVADA = 'Aprovada'
+
 class ContagemInventario(Base):
     __tablename__ = 'contagens_inventario'
     
@@ -17,7 +22,7 @@ class ContagemInventario(Base):
     
     data_contagem = Column(DateTime, nullable=False)
     data_aprovacao = Column(DateTime)
-    status = Column(String(50), nullable=False, default='Em Aberto')
+    status = Column(String(50), nullable=False, default=CONTAGEM_EM_ABERTO)
 
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -38,16 +43,28 @@ class ContagemInventarioLinha(Base):
     __tablename__ = 'contagem_inventario_linhas'
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     quantidade_sistema = Column(Numeric(12, 4), nullable=False)
-    quantidade_contada = Column(Numeric(12, 4), nullable=False)
-    diferenca = Column(Numeric(12, 4), nullable=False)
+    # Nulos enquanto a linha ainda não foi contada
+    quantidade_contada = Column(Numeric(12, 4), nullable=True)
+    diferenca = Column(Numeric(12, 4), nullable=True)
 
     # --- CORREÇÃO CRÍTICA AQUI ---
     # Tipos de FK corrigidos de String para UUID
     contagem_id = Column(UUID(as_uuid=True), ForeignKey('contagens_inventario.id'), nullable=False)
     variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False)
     lote_id = Column(UUID(as_uuid=True), ForeignKey('lotes.id'), nullable=True) # Lote pode ser opcional
+    # Local exato (a contagem pode abranger toda a subárvore do local da contagem)
+    local_id = Column(UUID(as_uuid=True), ForeignKey('locais.id'), nullable=False)
 
     contagem = relationship("ContagemInventario", back_populates="linhas")
     variante_produto = relationship("VarianteProduto")
     lote = relationship("Lote")
+    local = relationship("Local")
+
+    __table_args__ = (
+        UniqueConstraint(
+            'contagem_id', 'variante_produto_id', 'lote_id', 'local_id',
+            name='uq_contagem_inventario_linhas_chave',
+            postgresql_nulls_not_distinct=True
+        ),
+    )
 
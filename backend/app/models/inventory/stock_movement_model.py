@@ -8,6 +8,10 @@ import uuid
 # Importa a Base partilhada a partir do nosso core
 from ...core.database import Base
 
+# Status possíveis de um movimento. Apenas os 'Concluído' afetam o stock físico.
+MOVIMENTO_PLANEADO = 'Planeado'
+MOVIMENTO_CONCLUIDO = 'Concluído'
+
 class MovimentacaoLivroRazao(Base):
     __tablename__ = 'movimentacao_livro_razao'
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -18,13 +22,13 @@ class MovimentacaoLivroRazao(Base):
     status = Column(String(50), nullable=False, comment="Status do movimento (ex: 'Planeado', 'Concluído').")
     
     # --- MELHORIAS DE ARQUITETURA ---
-    data_movimento = Column(DateTime, nullable=False, comment="Data e hora em que a movimentação física ocorreu.")
+    data_movimento = Column(DateTime, nullable=False, index=True, comment="Data e hora em que a movimentação física ocorreu.")
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False, index=True)
 
     # Tipos de FK corrigidos para UUID
     variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False)
-    lote_id = Column(UUID(as_uuid=True), ForeignKey('lotes.id'), nullable=True) # Lote pode ser opcional
+    lote_id = Column(UUID(as_uuid=True), ForeignKey('lotes.id'), nullable=True, index=True) # Lote pode ser opcional
     local_origem_id = Column(UUID(as_uuid=True), ForeignKey('locais.id'), nullable=True) # Origem pode ser nula (ex: compra)
     local_destino_id = Column(UUID(as_uuid=True), ForeignKey('locais.id'), nullable=True) # Destino pode ser nulo (ex: venda)
     usuario_id = Column(UUID(as_uuid=True), ForeignKey('usuarios.id'), nullable=True, comment="Utilizador que registou a movimentação.")
@@ -0,0 +1,40 @@
+# File: backend/app/models/maintenance/asset_closure_model.py
+import uuid
+from sqlalchemy import ForeignKey, Integer, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class AssetClosure(Base):
+    """
+    Tabela de fecho (closure table) da hierarquia de Ativos.
+
+    Guarda uma linha para cada par (antecessor, descendente) da árvore,
+    incluindo o próprio ativo (depth = 0). Permite responder numa única
+    query indexada a perguntas como "todos os ativos/OS debaixo da linha 3"
+    sem percorrer 'parent_asset_id' recursivamente.
+
+    É mantida pela camada CRUD dos Ativos (criação e mudança de pai);
+    a eliminação de um ativo remove as suas linhas via ON DELETE CASCADE.
+    """
+    __tablename__ = 'maintenance_asset_closure'
+
+    ancestor_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('maintenance_assets.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    descendant_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('maintenance_assets.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    # Distância na árvore (0 = o próprio ativo, 1 = filho direto, ...)
+    depth: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    __table_args__ = (
+        # Consulta de antecessores (caminho até à raiz)
+        Index('ix_maintenance_asset_closure_descendant_depth', 'descendant_id', 'depth'),
+    )
@@ -3,7 +3,7 @@ import uuid
 import enum
 from sqlalchemy import (
     Column, String, Boolean, ForeignKey, DateTime, func, Text,
-    Integer, Enum 
+    Integer, Enum, Index
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
@@ -46,7 +46,7 @@ class Asset(Base):
     
     # --- CORREÇÃO DE TIPO DE DADO ---
     # O ID da tabela 'locais' é String(36), não UUID.
-    location_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey('locais.id'), nullable=True)
+    location_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True), ForeignKey('locais.id'), nullable=True, index=True)
     # --- FIM DA CORREÇÃO ---
     
     # Auto-relacionamento para hierarquia (Pai/Filho)
@@ -93,4 +93,14 @@ class Asset(Base):
     )
 
     created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
\ No newline at end of file
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+
+# Resolução de códigos lidos por scanner (case-insensitive)
+Index('ix_maintenance_assets_internal_tag_lower', func.lower(Asset.internal_tag))
+
+# Seletores (typeahead): ILIKE por prefixo/substring com trigramas (pg_trgm)
+Index('ix_maintenance_assets_internal_tag_trgm', Asset.internal_tag,
+      postgresql_using='gin', postgresql_ops={'internal_tag': 'gin_trgm_ops'})
+Index('ix_maintenance_assets_name_trgm', Asset.name,
+      postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
@@ -33,7 +33,8 @@ class AssetSparePart(Base):
     product_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True), 
         ForeignKey('produtos.id'), 
-        primary_key=True
+        primary_key=True,
+        index=True  # Pesquisa "onde é usado" por produto
     )
     
     # Colunas extra para uma BOM de nível líder
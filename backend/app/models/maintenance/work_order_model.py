@@ -47,6 +47,13 @@ class WorkOrderStatus(enum.Enum):
     COMPLETED = "COMPLETED"
     CANCELLED = "CANCELLED"
 
+# Estados em que uma OS é considerada "em aberto" (ainda por concluir)
+OPEN_WORK_ORDER_STATUSES = (
+    WorkOrderStatus.OPEN,
+    WorkOrderStatus.IN_PROGRESS,
+    WorkOrderStatus.ON_HOLD,
+)
+
 class WorkOrderType(enum.Enum):
     CORRECTIVE = "CORRECTIVE"
     PREVENTIVE = "PREVENTIVE"
@@ -2,7 +2,7 @@
 import uuid
 from sqlalchemy import (
     Column, String, Boolean, ForeignKey, DateTime, func, Text,
-    Integer, Numeric
+    Integer, Numeric, Index
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship, Mapped, mapped_column
@@ -47,14 +47,34 @@ class WorkOrderPartUsage(Base):
         index=True
     )
 
+    # Local de onde a peça sai (e contra cujo saldo fica reservada)
+    location_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('locais.id'),
+        nullable=True
+    )
+
+    # Quem registou a peça na OS
+    created_by_user_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey('usuarios.id'),
+        nullable=True
+    )
+
     # --- Dados do Consumo ---
     
     quantity_planned: Mapped[float] = mapped_column(Numeric(10, 4), nullable=False, default=0.0)
     quantity_used: Mapped[float] = mapped_column(Numeric(10, 4), nullable=False, default=0.0)
+    # Parte de 'quantity_used' já lançada no livro razão de stock
+    quantity_posted: Mapped[float] = mapped_column(Numeric(10, 4), nullable=False, default=0.0, server_default="0")
     
     # Guarda o custo unitário no momento do consumo para relatórios de custo precisos
     unit_cost: Mapped[Optional[float]] = mapped_column(Numeric(12, 4)) 
 
+    created_at: Mapped[DateTime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
     # --- Relacionamentos (bidirecionais) ---
 
     # Ligação de volta para a Ordem de Serviço
@@ -70,4 +90,15 @@ class WorkOrderPartUsage(Base):
     # Ligação de volta para o Lote
     lot: Mapped[Optional["Lote"]] = relationship(
         back_populates="wo_part_usages"
-    )
\ No newline at end of file
+    )
+
+    # Ligação ao Local de origem
+    location: Mapped[Optional["Local"]] = relationship("Local")
+
+    # Ligação ao Utilizador que registou
+    created_by_user: Mapped[Optional["Usuario"]] = relationship("Usuario")
+
+    __table_args__ = (
+        # Serve o cálculo das reservas por (variante, local)
+        Index('ix_maintenance_work_order_parts_variant_location', 'product_variant_id', 'location_id'),
+    )
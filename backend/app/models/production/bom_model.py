@@ -1,6 +1,6 @@
 # backend/app/models/production/bom_model.py
 
-from sqlalchemy import Column, String, Boolean, Numeric, ForeignKey, Interval, PrimaryKeyConstraint, DateTime, func
+from sqlalchemy import Column, String, Boolean, Numeric, ForeignKey, Interval, PrimaryKeyConstraint, DateTime, Index, func
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
@@ -9,6 +9,8 @@ from ...core.database import Base
 
 class Bom(Base):
     __tablename__ = 'boms'
+    # Escolha da BOM aplicável a cada variante na explosão multinível
+    __table_args__ = (Index('ix_boms_produto_variante', 'produto_id', 'variante_produto_id'),)
     
     # --- MELHORIAS DE ARQUITETURA ---
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -39,7 +41,7 @@ class BomComponente(Base):
     # Tipos de FK corrigidos para UUID
     bom_id = Column(UUID(as_uuid=True), ForeignKey('boms.id'), nullable=False)
     componente_produto_id = Column(UUID(as_uuid=True), ForeignKey('produtos.id'), nullable=False)
-    componente_variante_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False)
+    componente_variante_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False, index=True)
     
     qtd = Column(Numeric(12, 4), nullable=False)
 
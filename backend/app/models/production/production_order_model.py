@@ -25,12 +25,12 @@ class OrdemProducao(Base):
     datahora_realizado = Column(DateTime)
     
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False, index=True)
 
     # Tipos de FK corrigidos para String ou UUID, conforme o modelo de destino
     tipo_operacao_id = Column(String(50), ForeignKey('tipos_operacao.id'), nullable=False)
     centro_trabalho_id = Column(UUID(as_uuid=True), ForeignKey('centros_trabalho.id'), nullable=True)
-    variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False)
+    variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False, index=True)
     lote_id = Column(UUID(as_uuid=True), ForeignKey('lotes.id'), nullable=True)
     bom_id = Column(UUID(as_uuid=True), ForeignKey('boms.id'), nullable=False)
     confirmado_por_id = Column(UUID(as_uuid=True), ForeignKey('usuarios.id'), nullable=True)
@@ -0,0 +1,24 @@
+# backend/app/models/purchasing/on_order_model.py
+
+from sqlalchemy import Column, ForeignKey, Numeric, DateTime, func
+from sqlalchemy.dialects.postgresql import UUID
+
+# Importa a Base partilhada a partir do nosso core
+from ...core.database import Base
+
+class CompraEmAberto(Base):
+    """
+    Quantidade (e valor) encomendada e ainda por receber, por variante e fornecedor.
+
+    É uma tabela derivada das linhas das ordens de compra em aberto
+    (quantidade - qtd_recebida): cada alteração de linha, de status ou
+    receção aplica um delta incremental. Pode ser reconstruída a partir
+    das linhas a qualquer momento.
+    """
+    __tablename__ = 'compras_em_aberto'
+
+    variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), primary_key=True)
+    fornecedor_id = Column(UUID(as_uuid=True), ForeignKey('fornecedores.id'), primary_key=True, index=True)
+    qtd_em_aberto = Column(Numeric(14, 4), nullable=False, default=0)
+    valor_em_aberto = Column(Numeric(14, 4), nullable=False, default=0)
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -8,6 +8,13 @@ import uuid
 # Importa a Base partilhada a partir do nosso core
 from ...core.database import Base
 
+# Status de uma ordem de compra. Nas 'fechadas' não há quantidades em aberto.
+STATUS_OC_PENDENTE = 'Pendente'
+STATUS_OC_PARCIAL = 'Parcialmente Recebido'
+STATUS_OC_RECEBIDO = 'Recebido'
+STATUS_OC_CANCELADO = 'Cancelado'
+STATUS_OC_FECHADOS = (STATUS_OC_RECEBIDO, STATUS_OC_CANCELADO)
+
 class OrdemDeCompra(Base):
     __tablename__ = 'ordens_de_compra'
     
@@ -20,7 +27,7 @@ class OrdemDeCompra(Base):
     datahora_saida = Column(DateTime)
     datahora_prev_entrega = Column(DateTime)
     valor_total = Column(Numeric(12, 2))
-    status = Column(String(50), default='Pendente', nullable=False)
+    status = Column(String(50), default=STATUS_OC_PENDENTE, nullable=False)
     documento_origem = Column(String(50))
     datahora_confirmado = Column(DateTime)
     
@@ -49,9 +56,10 @@ class OrdemDeCompraLinha(Base):
     
     quantidade = Column(Numeric(12, 4), nullable=False)
     preco_unitario = Column(Numeric(12, 4), nullable=False)
+    qtd_recebida = Column(Numeric(12, 4), nullable=False, default=0, server_default="0")
     
-    ordem_de_compra_id = Column(UUID(as_uuid=True), ForeignKey('ordens_de_compra.id'), nullable=False)
-    variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False)
+    ordem_de_compra_id = Column(UUID(as_uuid=True), ForeignKey('ordens_de_compra.id'), nullable=False, index=True)
+    variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False, index=True)
 
     ordem_de_compra = relationship("OrdemDeCompra", back_populates="linhas")
     variante_produto = relationship("VarianteProduto", back_populates="linhas_de_compra")
\ No newline at end of file
@@ -0,0 +1,49 @@
+# backend/app/models/purchasing/receipt_model.py
+
+from sqlalchemy import Column, String, DateTime, ForeignKey, Numeric, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+import uuid
+
+# Importa a Base partilhada a partir do nosso core
+from ...core.database import Base
+
+class RececaoCompra(Base):
+    """
+    Receção (total ou parcial) de uma ordem de compra.
+
+    A 'chave_idempotencia' (opcional, única) permite repetir o mesmo pedido
+    sem lançar a receção duas vezes: a repetição devolve a receção original.
+    """
+    __tablename__ = 'rececoes_compra'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    chave_idempotencia = Column(String(100), unique=True, index=True, nullable=True)
+    data_rececao = Column(DateTime, nullable=False)
+    nfe = Column(String(100))
+
+    created_at = Column(DateTime, server_default=func.now(), nullable=False)
+
+    ordem_de_compra_id = Column(UUID(as_uuid=True), ForeignKey('ordens_de_compra.id'), nullable=False, index=True)
+    usuario_id = Column(UUID(as_uuid=True), ForeignKey('usuarios.id'), nullable=True)
+
+    ordem_de_compra = relationship("OrdemDeCompra")
+    usuario = relationship("Usuario")
+
+    linhas = relationship("RececaoCompraLinha", back_populates="rececao")
+
+class RececaoCompraLinha(Base):
+    """Uma linha recebida: quantidade de uma linha da OC, num lote e local, e o movimento lançado."""
+    __tablename__ = 'rececao_compra_linhas'
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    quantidade = Column(Numeric(12, 4), nullable=False)
+
+    rececao_id = Column(UUID(as_uuid=True), ForeignKey('rececoes_compra.id'), nullable=False, index=True)
+    ordem_linha_id = Column(UUID(as_uuid=True), ForeignKey('ordem_de_compra_linhas.id'), nullable=False, index=True)
+    variante_produto_id = Column(UUID(as_uuid=True), ForeignKey('variantes_produto.id'), nullable=False)
+    lote_id = Column(UUID(as_uuid=True), ForeignKey('lotes.id'), nullable=True)
+    local_id = Column(UUID(as_uuid=True), ForeignKey('locais.id'), nullable=False)
+    movimento_id = Column(UUID(as_uuid=True), ForeignKey('movimentacao_livro_razao.id'), nullable=False)
+
+    rececao = relationship("RececaoCompra", back_populates="linhas")
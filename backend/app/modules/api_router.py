@@ -13,9 +13,15 @@ from .administration.roles.roles_router import router_roles, router_permissions
 
 # Purchasing
 from .purchasing.suppliers.suppliers_router import router as suppliers_router
+from .purchasing.purchase_orders.purchase_orders_router import router as purchase_orders_router
+from .purchasing.receipts.receipts_router import router as receipts_router
 
 # Production
 from .production.work_centers.work_centers_router import router as work_centers_router
+from .production.boms.boms_router import router as boms_router
+from .production.mrp.mrp_router import router as mrp_router
+from .production.capacity.capacity_router import router as capacity_router
+from .production.costing.costing_router import router as costing_router
 
 # Inventory (com a nova estrutura verticalizada)
 from .inventory.locations.locations_router import router_locais, router_tipos_local
@@ -23,6 +29,13 @@ from .inventory.brands.brands_router import router as brands_router
 from .inventory.udms.udms_router import router_categorias_udm, router_udm
 from .inventory.product_categories.product_categories_router import router as product_categories_router
 from .inventory.products.products_router import router as products_router
+from .inventory.stock_balances.stock_balances_router import router as stock_balances_router
+from .inventory.stock_movements.stock_movements_router import router as stock_movements_router
+from .inventory.stock_counts.stock_counts_router import router as stock_counts_router
+from .inventory.stock_allocation.stock_allocation_router import router as stock_allocation_router
+from .inventory.stock_availability.stock_availability_router import router as stock_availability_router
+from .inventory.scan.scan_router import router as scan_router
+from .inventory.lot_trace.lot_trace_router import router as lot_trace_router
 
 # --- NOVO: Módulo de Manutenção ---
 from .maintenance.router import maintenance_router
@@ -44,9 +57,15 @@ api_router.include_router(router_permissions)
 
 # Módulo de Compras
 api_router.include_router(suppliers_router)
+api_router.include_router(purchase_orders_router)
+api_router.include_router(receipts_router)
 
 # Módulo de Produção
 api_router.include_router(work_centers_router)
+api_router.include_router(boms_router)
+api_router.include_router(mrp_router)
+api_router.include_router(capacity_router)
+api_router.include_router(costing_router)
 
 # Módulo de Inventário
 api_router.include_router(router_tipos_local)
@@ -56,6 +75,13 @@ api_router.include_router(router_categorias_udm)
 api_router.include_router(router_udm)
 api_router.include_router(product_categories_router)
 api_router.include_router(products_router)
+api_router.include_router(stock_balances_router)
+api_router.include_router(stock_movements_router)
+api_router.include_router(stock_counts_router)
+api_router.include_router(stock_allocation_router)
+api_router.include_router(stock_availability_router)
+api_router.include_router(scan_router)
+api_router.include_router(lot_trace_router)
 
 # --- NOVO: Módulo de Manutenção ---
 # Adiciona todos os endpoints de manutenção sob o prefixo /maintenance
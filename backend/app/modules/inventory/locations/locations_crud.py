@@ -1,10 +1,13 @@
 # backend/app/modules/inventory/locations/locations_crud.py
 
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import select, insert, delete, exists, literal, true, func
+from sqlalchemy.sql import Select
+from typing import Any, Dict, List, Optional, Union
 
 # --- IMPORTAÇÕES CORRIGIDAS ---
 from ....core.crud_base import CRUDBase
+from ....core.typeahead import TypeaheadSource
 from .... import models
 from . import locations_schemas
 
@@ -22,6 +25,15 @@ class CRUDTipoLocal(CRUDBase[models.TipoLocal, locations_schemas.TipoLocalCreate
         db.refresh(db_obj)
         return db_obj
 
+# Seletor de locais (código de barras + nome), com índices de trigramas
+local_typeahead = TypeaheadSource(
+    models.Local,
+    code=models.Local.barcode,
+    label=models.Local.nome,
+    search=(models.Local.nome,),
+    criteria=(models.Local.is_active == True,),
+)
+
 class CRUDLocal(CRUDBase[models.Local, locations_schemas.LocalCreate, locations_schemas.LocalUpdate]):
     def get_multi(self, db: Session, *, skip: int = 0, limit: int = 100, active_only: bool = True) -> List[models.Local]:
         query = db.query(self.model)
@@ -29,6 +41,159 @@ class CRUDLocal(CRUDBase[models.Local, locations_schemas.LocalCreate, locations_
             query = query.filter(self.model.is_active == True)
         return query.offset(skip).limit(limit).all()
 
+    def create(self, db: Session, *, obj_in: locations_schemas.LocalCreate) -> models.Local:
+        """
+        Cria o local e regista-o na tabela de fecho da hierarquia,
+        na mesma transação.
+        """
+        db_obj = self.model(**obj_in.model_dump())
+        db.add(db_obj)
+        db.flush()  # Garante o INSERT do local antes das linhas de fecho
+        self.insert_node(db, local_id=db_obj.id, parent_id=db_obj.local_pai_id)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update(self, db: Session, *, db_obj: models.Local, obj_in: Union[locations_schemas.LocalUpdate, Dict[str, Any]]) -> models.Local:
+        """
+        Atualiza o local e, se o pai mudou, move a sua subárvore na tabela
+        de fecho, na mesma transação. (A validação de ciclos é feita no 'service'.)
+        """
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        old_parent_id = db_obj.local_pai_id
+
+        for field in update_data:
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, update_data[field])
+
+        db.flush()
+        if db_obj.local_pai_id != old_parent_id:
+            self.move_subtree(db, local_id=db_obj.id, new_parent_id=db_obj.local_pai_id)
+
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def get_by_barcode(self, db: Session, *, barcode: str) -> Optional[models.Local]:
+        return db.scalars(select(self.model).where(func.lower(self.model.barcode) == barcode.strip().lower())).first()
+
+    # --- TABELA DE FECHO (escrita; NÃO faz commit) ---
+
+    def insert_node(self, db: Session, *, local_id, parent_id) -> None:
+        """
+        Regista um novo local na hierarquia: a linha (local, local, 0) e
+        uma linha por cada antecessor do pai (profundidade + 1).
+        """
+        closure = models.LocalClosure
+        db.execute(insert(closure).values(ancestor_id=local_id, descendant_id=local_id, depth=0))
+        if parent_id:
+            db.execute(
+                insert(closure).from_select(
+                    ["ancestor_id", "descendant_id", "depth"],
+                    select(closure.ancestor_id, literal(local_id), closure.depth + 1)
+                    .where(closure.descendant_id == parent_id),
+                )
+            )
+
+    def move_subtree(self, db: Session, *, local_id, new_parent_id) -> None:
+        """
+        Move a subárvore de 'local_id' para debaixo de 'new_parent_id'
+        (ou para a raiz), com duas instruções em bloco: remove as ligações
+        aos antecessores antigos e liga os antecessores do novo pai.
+        """
+        closure = models.LocalClosure
+        subtree = select(closure.descendant_id).where(closure.ancestor_id == local_id)
+        db.execute(
+            delete(closure)
+            .where(closure.descendant_id.in_(subtree), closure.ancestor_id.not_in(subtree))
+            .execution_options(synchronize_session=False)
+        )
+        if new_parent_id:
+            supertree = aliased(closure)
+            sub = aliased(closure)
+            db.execute(
+                insert(closure).from_select(
+                    ["ancestor_id", "descendant_id", "depth"],
+                    select(supertree.ancestor_id, sub.descendant_id, supertree.depth + sub.depth + 1)
+                    .select_from(supertree)
+                    .join(sub, true())
+                    .where(supertree.descendant_id == new_parent_id, sub.ancestor_id == local_id),
+                )
+            )
+
+    # --- TABELA DE FECHO (leitura) ---
+
+    def subtree_ids(self, local_id, *, include_self: bool = True) -> Select:
+        """
+        SELECT com os IDs do local e de todos os seus sublocais (tabela de
+        fecho, uma única subquery indexada). Usado como filtro 'IN (...)'.
+        """
+        closure = models.LocalClosure
+        stmt = select(closure.descendant_id).where(closure.ancestor_id == local_id)
+        if not include_self:
+            stmt = stmt.where(closure.depth > 0)
+        return stmt
+
+    def is_descendant(self, db: Session, *, ancestor_id, descendant_id) -> bool:
+        """Verifica (EXISTS) se 'descendant_id' está na subárvore de 'ancestor_id'."""
+        closure = models.LocalClosure
+        return bool(db.scalar(select(exists().where(
+            closure.ancestor_id == ancestor_id,
+            closure.descendant_id == descendant_id,
+        ))))
+
+    def get_subtree_rollup(self, db: Session, *, local_id, max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Lista o local e os seus sublocais com, para cada um, os totais da
+        sua própria subárvore: número de variantes e de posições com saldo
+        (tabela de saldos) e número de ativos. Uma única query:
+        cada agregado é um JOIN da tabela de fecho com a tabela de factos.
+        """
+        closure = models.LocalClosure
+        nodes = aliased(closure)
+        below = aliased(closure)
+        in_subtree = below.ancestor_id.in_(self.subtree_ids(local_id))
+
+        stock = (
+            select(
+                below.ancestor_id.label("local_id"),
+                func.count(func.distinct(models.SaldoEstoque.variante_produto_id)).label("variantes"),
+                func.count().label("saldos"),
+            )
+            .join(models.SaldoEstoque, models.SaldoEstoque.local_id == below.descendant_id)
+            .where(in_subtree, models.SaldoEstoque.quantidade != 0)
+            .group_by(below.ancestor_id)
+            .subquery("stock_rollup")
+        )
+        assets = (
+            select(below.ancestor_id.label("local_id"), func.count().label("ativos"))
+            .join(models.Asset, models.Asset.location_id == below.descendant_id)
+            .where(in_subtree)
+            .group_by(below.ancestor_id)
+            .subquery("asset_rollup")
+        )
+
+        stmt = (
+            select(
+                self.model.id,
+                self.model.nome,
+                self.model.local_pai_id,
+                self.model.local_sucata,
+                nodes.depth,
+                func.coalesce(stock.c.variantes, 0).label("variantes"),
+                func.coalesce(stock.c.saldos, 0).label("saldos"),
+                func.coalesce(assets.c.ativos, 0).label("ativos"),
+            )
+            .join(nodes, nodes.descendant_id == self.model.id)
+            .outerjoin(stock, stock.c.local_id == self.model.id)
+            .outerjoin(assets, assets.c.local_id == self.model.id)
+            .where(nodes.ancestor_id == local_id)
+            .order_by(nodes.depth, self.model.nome)
+        )
+        if max_depth is not None:
+            stmt = stmt.where(nodes.depth <= max_depth)
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
     def update_status(self, db: Session, *, db_obj: models.Local, is_active: bool) -> models.Local:
         db_obj.is_active = is_active
         db.add(db_obj)
@@ -1,12 +1,13 @@
 # backend/app/modules/inventory/locations/locations_router.py
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
 # --- IMPORTAÇÕES CORRIGIDAS ---
 from . import locations_schemas, locations_service
 from ....core.dependencies import get_db, require_permission
+from ....core.typeahead import TypeaheadItem
 from .... import models
 
 # --- Roteador para Tipos de Local ---
@@ -71,6 +72,13 @@ def read_locais_endpoint(
 ):
     return locations_service.local_service.get_all_locais(db, skip=skip, limit=limit, active_only=active_only)
 
+@router_locais.get("/typeahead", response_model=List[TypeaheadItem], summary="Pesquisa rápida de locais (seletor)")
+def typeahead_locais_endpoint(
+    q: str = Query(..., min_length=1), limit: int = Query(10, ge=1, le=50), db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("locais:ler"))
+):
+    return locations_service.local_service.typeahead_locais(db, q=q, limit=limit)
+
 @router_locais.get("/{local_id}", response_model=locations_schemas.Local, summary="Obter um local por ID")
 def read_local_endpoint(
     local_id: str, db: Session = Depends(get_db),
@@ -78,6 +86,13 @@ def read_local_endpoint(
 ):
     return locations_service.local_service.get_local_by_id(db, local_id=local_id)
 
+@router_locais.get("/{local_id}/subarvore", response_model=List[locations_schemas.LocalSubarvoreNo], summary="Obter a subárvore de um local com totais de stock e ativos")
+def read_local_subtree_endpoint(
+    local_id: str, max_depth: Optional[int] = Query(None, ge=0), db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("locais:ler"))
+):
+    return locations_service.local_service.get_local_subtree(db, local_id=local_id, max_depth=max_depth)
+
 @router_locais.put("/{local_id}", response_model=locations_schemas.Local, summary="Atualizar um local")
 def update_local_endpoint(
     local_id: str, local_in: locations_schemas.LocalUpdate, db: Session = Depends(get_db),
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel
 from typing import Optional
+import uuid
 
 # --- Schemas de Tipo de Local ---
 
@@ -27,6 +28,7 @@ class LocalBase(BaseModel):
     id: str
     nome: str
     local_sucata: bool = False
+    barcode: Optional[str] = None
     tipo_local_id: str
     local_pai_id: Optional[str] = None
 
@@ -36,6 +38,7 @@ class LocalCreate(LocalBase):
 class LocalUpdate(BaseModel):
     nome: Optional[str] = None
     local_sucata: Optional[bool] = None
+    barcode: Optional[str] = None
     tipo_local_id: Optional[str] = None
     local_pai_id: Optional[str] = None
 
@@ -45,3 +48,14 @@ class Local(LocalBase):
 
     class Config:
         from_attributes = True
+
+class LocalSubarvoreNo(BaseModel):
+    """Um local da subárvore com os totais acumulados dos seus sublocais."""
+    id: uuid.UUID
+    nome: str
+    local_pai_id: Optional[uuid.UUID] = None
+    local_sucata: bool
+    depth: int
+    variantes: int
+    saldos: int
+    ativos: int
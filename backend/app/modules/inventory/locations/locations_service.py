@@ -2,11 +2,12 @@
 
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List
+from typing import Any, Dict, List, Optional
 
 # --- IMPORTAÇÕES CORRIGIDAS ---
 from .... import models
 from . import locations_crud, locations_schemas
+from ..scan.scan_service import scan_service, TipoCodigo
 
 class LocalService:
     # --- Métodos para Tipo de Local ---
@@ -48,15 +49,54 @@ class LocalService:
         if db_local:
             raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="ID de local já registado")
         self.get_tipo_local_by_id(db, tipo_local_id=local_in.tipo_local_id)
-        return locations_crud.local_crud.create(db=db, obj_in=local_in)
+        if local_in.local_pai_id:
+            self.get_local_by_id(db, local_id=local_in.local_pai_id)
+        self._ensure_unique_barcode(db, barcode=local_in.barcode)
+        db_local = locations_crud.local_crud.create(db=db, obj_in=local_in)
+        scan_service.record_change(TipoCodigo.LOCAL, db_local.id, old_code=None, new_code=db_local.barcode)
+        return db_local
 
     def update_local(self, db: Session, local_id: str, local_in: locations_schemas.LocalUpdate) -> models.Local:
         db_local = self.get_local_by_id(db, local_id)
-        return locations_crud.local_crud.update(db=db, db_obj=db_local, obj_in=local_in)
+        new_parent_id = local_in.model_dump(exclude_unset=True).get("local_pai_id")
+        if new_parent_id:
+            db_parent = self.get_local_by_id(db, local_id=new_parent_id)
+            # O novo pai não pode ser o próprio local nem um dos seus sublocais
+            if locations_crud.local_crud.is_descendant(db, ancestor_id=db_local.id, descendant_id=db_parent.id):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="O local pai não pode ser o próprio local nem um dos seus sublocais."
+                )
+        if local_in.barcode:
+            self._ensure_unique_barcode(db, barcode=local_in.barcode, exclude_id=db_local.id)
+        old_barcode = db_local.barcode
+        db_local = locations_crud.local_crud.update(db=db, db_obj=db_local, obj_in=local_in)
+        scan_service.record_change(
+            TipoCodigo.LOCAL, db_local.id, old_code=old_barcode, new_code=db_local.barcode, active=db_local.is_active
+        )
+        return db_local
+
+    def _ensure_unique_barcode(self, db: Session, *, barcode: Optional[str], exclude_id=None) -> None:
+        if not barcode:
+            return
+        db_local = locations_crud.local_crud.get_by_barcode(db, barcode=barcode)
+        if db_local and db_local.id != exclude_id:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"O código de barras '{barcode}' já está associado ao local '{db_local.nome}'.")
+
+    def typeahead_locais(self, db: Session, q: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        return locations_crud.local_typeahead.search(db, q, limit=limit)
+
+    def get_local_subtree(self, db: Session, local_id: str, max_depth: Optional[int]) -> List[Dict[str, Any]]:
+        db_local = self.get_local_by_id(db, local_id)
+        return locations_crud.local_crud.get_subtree_rollup(db, local_id=db_local.id, max_depth=max_depth)
 
     def update_local_status(self, db: Session, local_id: str, is_active: bool) -> models.Local:
         db_local = self.get_local_by_id(db, local_id)
-        return locations_crud.local_crud.update_status(db, db_obj=db_local, is_active=is_active)
+        db_local = locations_crud.local_crud.update_status(db, db_obj=db_local, is_active=is_active)
+        scan_service.record_change(
+            TipoCodigo.LOCAL, db_local.id, old_code=db_local.barcode, new_code=db_local.barcode, active=is_active
+        )
+        return db_local
 
 # Cria uma instância do serviço para ser usada pelo resto da aplicação
 local_service = LocalService()
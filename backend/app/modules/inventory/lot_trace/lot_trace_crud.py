@@ -0,0 +1,135 @@
+# backend/app/modules/inventory/lot_trace/lot_trace_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, exists, or_
+from typing import Any, Collection, Dict, List, Optional, Set, Tuple
+from datetime import datetime
+from decimal import Decimal
+import uuid
+
+from .... import models
+from ....models.inventory.stock_movement_model import MOVIMENTO_CONCLUIDO
+
+# (ordem de produção, lote consumido, lote produzido, quantidade)
+LigacaoLote = Tuple[uuid.UUID, uuid.UUID, uuid.UUID, Decimal]
+
+
+class CRUDLotTrace:
+    """
+    Leituras para a genealogia de lotes.
+
+    Uma ligação 'lote consumido -> lote produzido' existe quando uma saída
+    concluída do razão (com lote) tem como referência uma ordem de produção
+    que tem 'lote_id' (o lote do produto acabado).
+    """
+
+    def _consumption_criteria(self):
+        mov = models.MovimentacaoLivroRazao
+        return (
+            mov.status == MOVIMENTO_CONCLUIDO,
+            mov.lote_id.is_not(None),
+            mov.local_origem_id.is_not(None),
+            mov.local_destino_id.is_(None),
+        )
+
+    def get_db_now(self, db: Session) -> datetime:
+        """Hora do servidor de BD (marca de água das leituras incrementais)."""
+        return db.execute(select(func.now())).scalar_one()
+
+    def get_edges(self, db: Session, ordem_ids: Optional[Collection[uuid.UUID]] = None) -> List[LigacaoLote]:
+        """Ligações de todas as ordens (ou só de 'ordem_ids'), numa só query agregada."""
+        mov, ordem = models.MovimentacaoLivroRazao, models.OrdemProducao
+        stmt = (
+            select(ordem.id, mov.lote_id, ordem.lote_id, func.sum(mov.qtd_realizada))
+            .join(ordem, ordem.referencia == mov.referencia)
+            .where(*self._consumption_criteria(), ordem.lote_id.is_not(None), mov.lote_id != ordem.lote_id)
+            .group_by(ordem.id, mov.lote_id, ordem.lote_id)
+        )
+        if ordem_ids is not None:
+            if not ordem_ids:
+                return []
+            stmt = stmt.where(ordem.id.in_(ordem_ids))
+        return [tuple(row) for row in db.execute(stmt)]
+
+    def get_orders_changed_since(self, db: Session, since: datetime) -> Set[uuid.UUID]:
+        """
+        Ordens alteradas depois de 'since', ou com consumos lançados ou
+        concluídos depois disso ('updated_at': um movimento 'Planeado'
+        concluído mais tarde mantém o 'created_at' original).
+        """
+        mov, ordem = models.MovimentacaoLivroRazao, models.OrdemProducao
+        new_consumption = exists().where(
+            mov.referencia == ordem.referencia, *self._consumption_criteria(), mov.updated_at > since
+        )
+        stmt = select(ordem.id).where(or_(ordem.updated_at > since, new_consumption))
+        return set(db.scalars(stmt))
+
+    # --- DETALHE DOS LOTES DO RASTREIO ---
+
+    def get_lots(self, db: Session, lote_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Dict[str, Any]]:
+        lote, variante = models.Lote, models.VarianteProduto
+        stmt = (
+            select(
+                lote.id.label("lote_id"), lote.nome.label("lote"), lote.data_de_expiracao,
+                lote.variante_produto_id, variante.referencia.label("variante_referencia"),
+            )
+            .join(variante, variante.id == lote.variante_produto_id)
+            .where(lote.id.in_(lote_ids))
+        )
+        return {row["lote_id"]: dict(row) for row in db.execute(stmt).mappings()}
+
+    def get_order_references(self, db: Session, ordem_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, str]:
+        if not ordem_ids:
+            return {}
+        ordem = models.OrdemProducao
+        return dict(db.execute(select(ordem.id, ordem.referencia).where(ordem.id.in_(ordem_ids))).all())
+
+    def get_stock(self, db: Session, lote_ids: Collection[uuid.UUID]) -> List[Dict[str, Any]]:
+        """Onde os lotes estão agora (saldos não nulos por local)."""
+        saldo, local = models.SaldoEstoque, models.Local
+        stmt = (
+            select(saldo.lote_id, saldo.local_id, local.nome.label("local"), saldo.quantidade)
+            .join(local, local.id == saldo.local_id)
+            .where(saldo.lote_id.in_(lote_ids), saldo.quantidade != 0)
+            .order_by(saldo.lote_id, local.nome)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_exits(self, db: Session, lote_ids: Collection[uuid.UUID]) -> List[Dict[str, Any]]:
+        """Saídas concluídas dos lotes (consumos, expedições), por documento."""
+        mov = models.MovimentacaoLivroRazao
+        stmt = (
+            select(
+                mov.lote_id, mov.referencia,
+                func.max(mov.data_movimento).label("data_movimento"),
+                func.sum(mov.qtd_realizada).label("quantidade"),
+            )
+            .where(
+                mov.lote_id.in_(lote_ids),
+                mov.status == MOVIMENTO_CONCLUIDO,
+                mov.local_origem_id.is_not(None),
+                mov.local_destino_id.is_(None),
+            )
+            .group_by(mov.lote_id, mov.referencia)
+            .order_by(mov.lote_id, func.max(mov.data_movimento))
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_maintenance_usage(self, db: Session, lote_ids: Collection[uuid.UUID]) -> List[Dict[str, Any]]:
+        """Peças dos lotes aplicadas em ordens de serviço (e em que ativo)."""
+        peca, os_, ativo = models.WorkOrderPartUsage, models.WorkOrder, models.Asset
+        stmt = (
+            select(
+                peca.lot_id.label("lote_id"), os_.id.label("work_order_id"), os_.wo_number,
+                ativo.id.label("asset_id"), ativo.internal_tag, peca.quantity_used,
+            )
+            .join(os_, os_.id == peca.work_order_id)
+            .join(ativo, ativo.id == os_.asset_id)
+            .where(peca.lot_id.in_(lote_ids), peca.quantity_used > 0)
+            .order_by(peca.lot_id, os_.wo_number)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+# Instância única (singleton)
+lot_trace_crud = CRUDLotTrace()
@@ -0,0 +1,41 @@
+# backend/app/modules/inventory/lot_trace/lot_trace_router.py
+
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.orm import Session
+from typing import Optional
+import uuid
+
+from . import lot_trace_schemas, lot_trace_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/inventory/lotes",
+    tags=["Inventário - Rastreabilidade de Lotes"]
+)
+
+@router.get("/{lote_id}/rastreio", response_model=lot_trace_schemas.LoteRastreio, summary="Rastrear um lote (para a frente ou para trás)")
+def trace_lot_endpoint(
+    lote_id: uuid.UUID,
+    direcao: lot_trace_schemas.DirecaoRastreio = lot_trace_schemas.DirecaoRastreio.FRENTE,
+    max_profundidade: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return lot_trace_service.lot_trace_service.trace(db, lote_id=lote_id, direcao=direcao, max_profundidade=max_profundidade)
+
+@router.get("/{lote_id}/rastreio/export", summary="Exportar o rastreio de um lote (CSV para relatório de recolha)")
+def export_lot_trace_endpoint(
+    lote_id: uuid.UUID,
+    direcao: lot_trace_schemas.DirecaoRastreio = lot_trace_schemas.DirecaoRastreio.FRENTE,
+    max_profundidade: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    service = lot_trace_service.lot_trace_service
+    rastreio = service.trace(db, lote_id=lote_id, direcao=direcao, max_profundidade=max_profundidade)
+    return Response(
+        content=service.export_csv(rastreio),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="rastreio_{lote_id}_{direcao.value}.csv"'},
+    )
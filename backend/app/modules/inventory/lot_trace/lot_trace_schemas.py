@@ -0,0 +1,58 @@
+# backend/app/modules/inventory/lot_trace/lot_trace_schemas.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+from decimal import Decimal
+from datetime import datetime
+import enum
+import uuid
+
+# --- Schemas de Rastreabilidade de Lotes ---
+
+class DirecaoRastreio(str, enum.Enum):
+    FRENTE = "frente"  # Em que lotes (produtos) foi usado este lote
+    TRAS = "tras"      # De que lotes (matérias-primas) é feito este lote
+
+class LoteRastreioNo(BaseModel):
+    lote_id: uuid.UUID
+    lote: str
+    variante_produto_id: uuid.UUID
+    variante_referencia: str
+    data_de_expiracao: Optional[datetime] = None
+    profundidade: int  # 0 = lote pesquisado
+
+class LoteRastreioLigacao(BaseModel):
+    lote_consumido_id: uuid.UUID
+    lote_produzido_id: uuid.UUID
+    ordem_producao_id: uuid.UUID
+    ordem_producao: str
+    quantidade: Decimal
+
+class LoteStock(BaseModel):
+    lote_id: uuid.UUID
+    local_id: uuid.UUID
+    local: str
+    quantidade: Decimal
+
+class LoteSaida(BaseModel):
+    lote_id: uuid.UUID
+    referencia: str  # Documento de origem (ex: OP, guia de saída)
+    data_movimento: datetime
+    quantidade: Decimal
+
+class LoteManutencao(BaseModel):
+    lote_id: uuid.UUID
+    work_order_id: uuid.UUID
+    wo_number: str
+    asset_id: uuid.UUID
+    internal_tag: str
+    quantity_used: Decimal
+
+class LoteRastreio(BaseModel):
+    lote_id: uuid.UUID
+    direcao: DirecaoRastreio
+    lotes: List[LoteRastreioNo]
+    ligacoes: List[LoteRastreioLigacao]
+    stock: List[LoteStock]
+    saidas: List[LoteSaida]
+    manutencao: List[LoteManutencao]
@@ -0,0 +1,198 @@
+# backend/app/modules/inventory/lot_trace/lot_trace_service.py
+
+import csv
+import io
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from . import lot_trace_schemas
+from .lot_trace_crud import lot_trace_crud, LigacaoLote
+
+DirecaoRastreio = lot_trace_schemas.DirecaoRastreio
+# {lote vizinho: {ordem de produção: quantidade}}
+Vizinhos = Dict[uuid.UUID, Dict[uuid.UUID, Decimal]]
+
+# Reconstrói o índice completo ao fim deste tempo (remove ligações que
+# deixaram de existir, ex: lote de uma OP corrigido)
+LOT_TRACE_INDEX_MAX_AGE_SECONDS = 600
+
+# A marca de água recua esta margem: 'now()' é a hora de início da
+# transação, e as alterações de transações que começaram antes mas só
+# confirmaram depois da leitura têm de ser apanhadas na seguinte.
+# Reler uma ordem duas vezes é inofensivo (as ligações são substituídas).
+LOT_TRACE_WATERMARK_MARGIN_SECONDS = 120
+
+
+class LotGenealogyIndex:
+    """
+    Índice de adjacência (por processo) da genealogia de lotes, nos dois sentidos.
+
+    - A primeira leitura carrega todas as ligações numa única query.
+    - As leituras seguintes são incrementais: só as ordens alteradas (ou com
+      consumos lançados) desde a última marca de água são relidas e as suas
+      ligações substituídas no índice.
+    - Os rastreios percorrem o índice em memória, com qualquer profundidade.
+    """
+
+    def __init__(self, *, max_age_seconds: float = LOT_TRACE_INDEX_MAX_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        self.loaded_at: Optional[float] = None
+        self.watermark: Optional[datetime] = None
+        self.by_order: Dict[uuid.UUID, List[Tuple[uuid.UUID, uuid.UUID, Decimal]]] = {}
+        self.forward: Dict[uuid.UUID, Vizinhos] = {}
+        self.backward: Dict[uuid.UUID, Vizinhos] = {}
+        self.lock = threading.Lock()
+
+    def is_stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.max_age_seconds
+
+    def _link(self, ordem_id: uuid.UUID, consumido: uuid.UUID, produzido: uuid.UUID, quantidade: Decimal) -> None:
+        self.forward.setdefault(consumido, {}).setdefault(produzido, {})[ordem_id] = quantidade
+        self.backward.setdefault(produzido, {}).setdefault(consumido, {})[ordem_id] = quantidade
+
+    def _unlink(self, ordem_id: uuid.UUID, consumido: uuid.UUID, produzido: uuid.UUID) -> None:
+        for index, a, b in ((self.forward, consumido, produzido), (self.backward, produzido, consumido)):
+            orders = index.get(a, {}).get(b)
+            if orders is None:
+                continue
+            orders.pop(ordem_id, None)
+            if not orders:
+                del index[a][b]
+                if not index[a]:
+                    del index[a]
+
+    def load(self, edges: Iterable[LigacaoLote], watermark: datetime) -> None:
+        self.by_order, self.forward, self.backward = {}, {}, {}
+        self.apply(edges, (), watermark)
+        self.loaded_at = time.monotonic()
+
+    def apply(self, edges: Iterable[LigacaoLote], ordem_ids: Iterable[uuid.UUID], watermark: datetime) -> None:
+        """Substitui as ligações de 'ordem_ids' pelas de 'edges' (já relidas)."""
+        for ordem_id in ordem_ids:
+            for consumido, produzido, _ in self.by_order.pop(ordem_id, ()):
+                self._unlink(ordem_id, consumido, produzido)
+        for ordem_id, consumido, produzido, quantidade in edges:
+            self.by_order.setdefault(ordem_id, []).append((consumido, produzido, quantidade))
+            self._link(ordem_id, consumido, produzido, quantidade)
+        self.watermark = watermark
+
+    def walk(self, lote_id: uuid.UUID, direcao: DirecaoRastreio, max_profundidade: Optional[int] = None):
+        """
+        Percurso em largura a partir de 'lote_id'. Devolve a profundidade
+        mínima de cada lote alcançado e as ligações percorridas
+        (consumido, produzido, ordem, quantidade).
+        """
+        index = self.forward if direcao == DirecaoRastreio.FRENTE else self.backward
+        depth = {lote_id: 0}
+        links: List[LigacaoLote] = []
+        queue = deque([lote_id])
+        while queue:
+            atual = queue.popleft()
+            if max_profundidade is not None and depth[atual] >= max_profundidade:
+                continue
+            for vizinho, orders in index.get(atual, {}).items():
+                for ordem_id, quantidade in orders.items():
+                    consumido, produzido = (atual, vizinho) if direcao == DirecaoRastreio.FRENTE else (vizinho, atual)
+                    links.append((consumido, produzido, ordem_id, quantidade))
+                if vizinho not in depth:
+                    depth[vizinho] = depth[atual] + 1
+                    queue.append(vizinho)
+        return depth, links
+
+
+class LotTraceService:
+    def __init__(self, index: LotGenealogyIndex):
+        self.index = index
+
+    def refresh(self, db: Session) -> None:
+        """Carrega o índice (se vazio ou antigo) ou aplica as alterações desde a última leitura."""
+        with self.index.lock:
+            watermark = lot_trace_crud.get_db_now(db) - timedelta(seconds=LOT_TRACE_WATERMARK_MARGIN_SECONDS)
+            if self.index.is_stale():
+                self.index.load(lot_trace_crud.get_edges(db), watermark)
+                return
+            changed = lot_trace_crud.get_orders_changed_since(db, self.index.watermark)
+            if changed:
+                self.index.apply(lot_trace_crud.get_edges(db, changed), changed, watermark)
+            else:
+                self.index.watermark = watermark
+
+    def trace(
+        self,
+        db: Session,
+        *,
+        lote_id: uuid.UUID,
+        direcao: DirecaoRastreio,
+        max_profundidade: Optional[int] = None,
+    ) -> lot_trace_schemas.LoteRastreio:
+        """
+        Rastreio completo de um lote: lotes relacionados (em qualquer
+        profundidade), as ordens que os ligam e, para todos eles, o stock
+        atual, as saídas e as aplicações em manutenção.
+        """
+        self.refresh(db)
+        with self.index.lock:
+            depth, links = self.index.walk(lote_id, direcao, max_profundidade)
+
+        lots = lot_trace_crud.get_lots(db, depth.keys())
+        if lote_id not in lots:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Lote não encontrado.")
+        ordens = lot_trace_crud.get_order_references(db, {ordem_id for _, _, ordem_id, _ in links})
+        lote_ids = list(lots)
+
+        return lot_trace_schemas.LoteRastreio(
+            lote_id=lote_id,
+            direcao=direcao,
+            lotes=sorted(
+                (lot_trace_schemas.LoteRastreioNo(**lots[id_], profundidade=nivel) for id_, nivel in depth.items() if id_ in lots),
+                key=lambda no: (no.profundidade, no.lote),
+            ),
+            ligacoes=[
+                lot_trace_schemas.LoteRastreioLigacao(
+                    lote_consumido_id=consumido,
+                    lote_produzido_id=produzido,
+                    ordem_producao_id=ordem_id,
+                    ordem_producao=ordens.get(ordem_id, ""),
+                    quantidade=quantidade,
+                )
+                for consumido, produzido, ordem_id, quantidade in links
+            ],
+            stock=lot_trace_crud.get_stock(db, lote_ids),
+            saidas=lot_trace_crud.get_exits(db, lote_ids),
+            manutencao=lot_trace_crud.get_maintenance_usage(db, lote_ids),
+        )
+
+    def export_csv(self, rastreio: lot_trace_schemas.LoteRastreio) -> str:
+        """Relatório de recolha (recall) em CSV (';'), uma linha por ocorrência."""
+        lotes = {no.lote_id: no for no in rastreio.lotes}
+        output = io.StringIO()
+        writer = csv.writer(output, delimiter=";")
+        writer.writerow(["tipo", "lote", "variante", "profundidade", "documento", "quantidade", "data"])
+
+        def row(tipo, lote_id, documento, quantidade, data=None):
+            no = lotes[lote_id]
+            writer.writerow([tipo, no.lote, no.variante_referencia, no.profundidade, documento, quantidade, data.isoformat() if data else ""])
+
+        for no in rastreio.lotes:
+            row("lote", no.lote_id, "", "", no.data_de_expiracao)
+        for ligacao in rastreio.ligacoes:
+            consumido = lotes[ligacao.lote_consumido_id].lote
+            row("producao", ligacao.lote_produzido_id, f"{ligacao.ordem_producao} (consumiu {consumido})", ligacao.quantidade)
+        for saldo in rastreio.stock:
+            row("stock", saldo.lote_id, saldo.local, saldo.quantidade)
+        for saida in rastreio.saidas:
+            row("saida", saida.lote_id, saida.referencia, saida.quantidade, saida.data_movimento)
+        for uso in rastreio.manutencao:
+            row("manutencao", uso.lote_id, f"{uso.wo_number} ({uso.internal_tag})", uso.quantity_used)
+        return output.getvalue()
+
+
+lot_trace_service = LotTraceService(LotGenealogyIndex())
@@ -3,7 +3,10 @@
 from sqlalchemy.orm import Session, joinedload
 from typing import List, Optional
 
+from sqlalchemy import func
+
 from ....core.crud_base import CRUDBase
+from ....core.typeahead import TypeaheadSource
 from .... import models
 from . import products_schemas
 
@@ -32,3 +35,12 @@ class CRUDProduto(CRUDBase[models.Produto, products_schemas.ProdutoCreate, produ
 
 produto_crud = CRUDProduto(models.Produto)
 
+# Seletor de variantes (referência + nome exibido ou nome), com índices de trigramas
+variante_typeahead = TypeaheadSource(
+    models.VarianteProduto,
+    code=models.VarianteProduto.referencia,
+    label=func.coalesce(models.VarianteProduto.nome_exibido, models.VarianteProduto.nome),
+    search=(models.VarianteProduto.nome_exibido, models.VarianteProduto.nome),
+    criteria=(models.VarianteProduto.is_active == True,),
+)
+
@@ -1,12 +1,13 @@
 # backend/app/modules/inventory/products/products_router.py
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import uuid
 
 from . import products_schemas, products_service
 from ....core.dependencies import get_db, require_permission
+from ....core.typeahead import TypeaheadItem
 from .... import models
 
 router = APIRouter(
@@ -37,6 +38,15 @@ def read_produtos_endpoint(
         db, skip=skip, limit=limit, is_active=is_active, search=search, sort_by=sort_by, sort_order=sort_order
     )
 
+@router.get("/variantes/typeahead", response_model=List[TypeaheadItem], summary="Pesquisa rápida de variantes (seletor)")
+def typeahead_variantes_endpoint(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return products_service.product_service.typeahead_variantes(db, q=q, limit=limit)
+
 @router.get("/{id}", response_model=products_schemas.Produto)
 def read_produto_endpoint(
     id: uuid.UUID,
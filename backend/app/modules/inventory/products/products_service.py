@@ -50,5 +50,8 @@ class ProductService:
         db_produto = self.get_by_id(db, produto_id)
         return products_crud.produto_crud.update_status(db, db_obj=db_produto, is_active=is_active)
 
+    def typeahead_variantes(self, db: Session, *, q: Optional[str], limit: int) -> List[dict]:
+        return products_crud.variante_typeahead.search(db, q, limit=limit)
+
 product_service = ProductService()
 
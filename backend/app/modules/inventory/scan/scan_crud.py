@@ -0,0 +1,75 @@
+# backend/app/modules/inventory/scan/scan_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, literal, union_all, or_
+from sqlalchemy.sql import Select
+from typing import Collection, Dict, List, Optional, Tuple
+import uuid
+
+from .... import models
+from .scan_schemas import TipoCodigo
+
+
+class CRUDScan:
+    """
+    Consultas de resolução de códigos: código de barras do Local, TAG do
+    Ativo e referência da Variante, numa única query (UNION ALL).
+    Os códigos são comparados em minúsculas (índices funcionais lower()).
+    Locais e variantes inativos não são resolvidos.
+    """
+
+    def _codes_select(
+        self,
+        codigos: Optional[Collection[str]] = None,
+        ids: Optional[Dict[TipoCodigo, Collection[uuid.UUID]]] = None,
+    ) -> Select:
+        sources = [
+            (TipoCodigo.LOCAL, models.Local.id, models.Local.barcode, (models.Local.is_active == True,)),
+            (TipoCodigo.ATIVO, models.Asset.id, models.Asset.internal_tag, ()),
+            (
+                TipoCodigo.VARIANTE, models.VarianteProduto.id, models.VarianteProduto.referencia,
+                (models.VarianteProduto.is_active == True,),
+            ),
+        ]
+        selects = []
+        for tipo, id_column, code_column, criteria in sources:
+            stmt = select(
+                func.lower(code_column).label("codigo"),
+                literal(tipo.value).label("tipo"),
+                id_column.label("id"),
+            ).where(code_column.isnot(None), *criteria)
+            if codigos is not None or ids is not None:
+                filtros = []
+                if codigos:
+                    filtros.append(func.lower(code_column).in_(codigos))
+                if ids and ids.get(tipo):
+                    filtros.append(id_column.in_(ids[tipo]))
+                if not filtros:
+                    continue
+                stmt = stmt.where(or_(*filtros))
+            selects.append(stmt)
+        return union_all(*selects)
+
+    def get_all(self, db: Session) -> List[Tuple[str, str, uuid.UUID]]:
+        """Todos os códigos ativos (para aquecer o índice em memória)."""
+        return [tuple(row) for row in db.execute(self._codes_select())]
+
+    def lookup(
+        self,
+        db: Session,
+        *,
+        codigos: Collection[str] = (),
+        ids: Optional[Dict[TipoCodigo, Collection[uuid.UUID]]] = None,
+    ) -> List[Tuple[str, str, uuid.UUID]]:
+        """
+        Numa única query: resolve os códigos (já em minúsculas) que não
+        estavam em memória e relê, por ID, as entidades que o mapa em memória
+        devolveu (código atual, se ainda existirem e estiverem ativas).
+        """
+        if not codigos and not any((ids or {}).values()):
+            return []
+        return [tuple(row) for row in db.execute(self._codes_select(codigos, ids))]
+
+
+# Instância única (singleton)
+scan_crud = CRUDScan()
@@ -0,0 +1,22 @@
+# backend/app/modules/inventory/scan/scan_router.py
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List
+
+from . import scan_schemas, scan_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/inventory/scan",
+    tags=["Inventário - Leitura de Códigos"]
+)
+
+@router.post("/resolve", response_model=List[scan_schemas.ScanResultado], summary="Resolver códigos lidos (locais, ativos e variantes) em lote")
+def resolve_codes_endpoint(
+    pedido: scan_schemas.ScanPedido,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return scan_service.scan_service.resolve(db, pedido=pedido)
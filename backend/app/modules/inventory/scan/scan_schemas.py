@@ -0,0 +1,25 @@
+# backend/app/modules/inventory/scan/scan_schemas.py
+
+from pydantic import BaseModel, Field
+from typing import List
+import enum
+import uuid
+
+# --- Schemas de Leitura de Códigos (Scanner) ---
+
+class TipoCodigo(str, enum.Enum):
+    LOCAL = "LOCAL"        # Local.barcode
+    ATIVO = "ATIVO"        # Asset.internal_tag
+    VARIANTE = "VARIANTE"  # VarianteProduto.referencia
+
+class ScanPedido(BaseModel):
+    codigos: List[str] = Field(..., min_length=1, max_length=500)
+
+class ScanCorrespondencia(BaseModel):
+    tipo: TipoCodigo
+    id: uuid.UUID
+
+class ScanResultado(BaseModel):
+    """Um código lido e as entidades a que corresponde (vazio se não existir)."""
+    codigo: str
+    correspondencias: List[ScanCorrespondencia] = []
@@ -0,0 +1,156 @@
+# backend/app/modules/inventory/scan/scan_service.py
+
+import threading
+import time
+import uuid
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from . import scan_schemas
+from .scan_crud import scan_crud
+
+TipoCodigo = scan_schemas.TipoCodigo
+Correspondencia = Tuple[TipoCodigo, uuid.UUID]
+
+# Recarrega o índice completo ao fim deste tempo (alterações feitas
+# noutros workers ou fora dos serviços, ex: importações). As
+# correspondências devolvidas são sempre confirmadas na BD.
+SCAN_INDEX_MAX_AGE_SECONDS = 600
+
+
+def normalize_code(codigo: Optional[str]) -> Optional[str]:
+    """Os códigos são comparados sem espaços nas pontas e em minúsculas."""
+    if codigo is None:
+        return None
+    codigo = codigo.strip().lower()
+    return codigo or None
+
+
+class ScanIndex:
+    """
+    Mapa em memória (por processo) código -> entidades (tipo, id).
+
+    - 'warm()' carrega todos os códigos numa única query.
+    - 'put()'/'discard()' são chamados pelos serviços de Locais e Ativos
+      depois de gravar (write-through), para que o mapa siga as alterações.
+    - Um código ausente não é guardado como "inexistente": a próxima
+      leitura volta a consultar a BD.
+    """
+
+    def __init__(self, *, max_age_seconds: float = SCAN_INDEX_MAX_AGE_SECONDS):
+        self.max_age_seconds = max_age_seconds
+        self._codes: Dict[str, Tuple[Correspondencia, ...]] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_stale(self) -> bool:
+        return self._loaded_at is None or time.monotonic() - self._loaded_at > self.max_age_seconds
+
+    def load(self, rows: Iterable[Tuple[str, str, uuid.UUID]]) -> int:
+        codes: Dict[str, Tuple[Correspondencia, ...]] = {}
+        for codigo, tipo, entity_id in rows:
+            codes[codigo] = codes.get(codigo, ()) + ((TipoCodigo(tipo), entity_id),)
+        with self._lock:
+            self._codes = codes
+            self._loaded_at = time.monotonic()
+        return len(codes)
+
+    def get(self, codigo: str) -> Optional[Tuple[Correspondencia, ...]]:
+        return self._codes.get(codigo)
+
+    def put(self, codigo: Optional[str], tipo: TipoCodigo, entity_id: uuid.UUID) -> None:
+        codigo = normalize_code(codigo)
+        if not codigo:
+            return
+        with self._lock:
+            current = tuple(match for match in self._codes.get(codigo, ()) if match != (tipo, entity_id))
+            self._codes[codigo] = current + ((tipo, entity_id),)
+
+    def replace(self, codigo: str, matches: Tuple[Correspondencia, ...]) -> None:
+        with self._lock:
+            if matches:
+                self._codes[codigo] = matches
+            else:
+                self._codes.pop(codigo, None)
+
+    def discard(self, codigo: Optional[str], tipo: TipoCodigo, entity_id: uuid.UUID) -> None:
+        codigo = normalize_code(codigo)
+        if not codigo:
+            return
+        with self._lock:
+            remaining = tuple(match for match in self._codes.get(codigo, ()) if match != (tipo, entity_id))
+            if remaining:
+                self._codes[codigo] = remaining
+            else:
+                self._codes.pop(codigo, None)
+
+
+class ScanService:
+    def __init__(self, index: ScanIndex):
+        self.index = index
+
+    def warm(self, db: Session) -> int:
+        """Carrega todos os códigos para memória (arranque da aplicação)."""
+        return self.index.load(scan_crud.get_all(db))
+
+    def record_change(
+        self,
+        tipo: TipoCodigo,
+        entity_id: uuid.UUID,
+        *,
+        old_code: Optional[str],
+        new_code: Optional[str],
+        active: bool = True,
+    ) -> None:
+        """Write-through: chamado pelos serviços depois de criar/alterar/remover (ou desativar)."""
+        if not active or normalize_code(old_code) != normalize_code(new_code):
+            self.index.discard(old_code, tipo, entity_id)
+        if active:
+            self.index.put(new_code, tipo, entity_id)
+
+    def resolve(self, db: Session, *, pedido: scan_schemas.ScanPedido) -> List[scan_schemas.ScanResultado]:
+        """
+        Resolve um lote de códigos numa única query: os que não estão no
+        mapa em memória são procurados pelo código; os que estão são
+        confirmados pelo ID (podem ter sido alterados, desativados ou
+        removidos noutro worker). O mapa é corrigido com o resultado.
+        """
+        if self.index.is_stale:
+            self.warm(db)
+
+        normalized = [normalize_code(codigo) for codigo in pedido.codigos]
+        wanted = {codigo for codigo in normalized if codigo}
+        missing = set()
+        ids: Dict[TipoCodigo, set] = {}
+        for codigo in wanted:
+            matches = self.index.get(codigo)
+            if matches is None:
+                missing.add(codigo)
+            for tipo, entity_id in matches or ():
+                ids.setdefault(tipo, set()).add(entity_id)
+
+        fresh: Dict[str, Tuple[Correspondencia, ...]] = {}
+        for codigo, tipo, entity_id in scan_crud.lookup(db, codigos=missing, ids=ids):
+            fresh[codigo] = fresh.get(codigo, ()) + ((TipoCodigo(tipo), entity_id),)
+        for codigo in wanted:
+            self.index.replace(codigo, fresh.get(codigo, ()))
+        for codigo, matches in fresh.items():
+            if codigo not in wanted:
+                # Entidade cujo código mudou noutro worker: fica com o código atual
+                self.index.replace(codigo, matches)
+
+        return [
+            scan_schemas.ScanResultado(
+                codigo=original,
+                correspondencias=[
+                    scan_schemas.ScanCorrespondencia(tipo=tipo, id=entity_id)
+                    for tipo, entity_id in (fresh.get(codigo, ()) if codigo else ())
+                ],
+            )
+            for original, codigo in zip(pedido.codigos, normalized)
+        ]
+
+
+scan_service = ScanService(ScanIndex())
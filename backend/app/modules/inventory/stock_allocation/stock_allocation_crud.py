@@ -0,0 +1,89 @@
+# backend/app/modules/inventory/stock_allocation/stock_allocation_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, or_
+from typing import Any, Collection, Dict, List
+from decimal import Decimal
+import uuid
+
+from .... import models
+from ..locations.locations_crud import local_crud
+
+class CRUDAlocacao:
+    """Leitura dos saldos candidatos para a alocação FEFO."""
+
+    def get_candidates(
+        self,
+        db: Session,
+        *,
+        variante_ids: List[uuid.UUID],
+        local_id: uuid.UUID,
+        incluir_sublocais: bool = True,
+        excluir_expirados: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Saldos positivos das variantes no local (ou subárvore), ordenados
+        por variante e data de expiração do lote (FEFO; sem lote/sem data no fim).
+        Leitura sem bloqueio: só os saldos escolhidos são bloqueados depois
+        (ver 'lock_rows').
+        """
+        saldo = models.SaldoEstoque
+        lote = models.Lote
+        stmt = (
+            select(
+                saldo.id.label("saldo_id"),
+                saldo.variante_produto_id,
+                saldo.lote_id,
+                lote.nome.label("lote_nome"),
+                lote.data_de_expiracao,
+                saldo.local_id,
+                saldo.quantidade,
+            )
+            .outerjoin(lote, lote.id == saldo.lote_id)
+            .where(
+                saldo.variante_produto_id.in_(variante_ids),
+                saldo.quantidade > 0,
+            )
+            .order_by(
+                saldo.variante_produto_id,
+                lote.data_de_expiracao.asc().nulls_last(),
+                lote.nome,
+                saldo.quantidade.desc(),
+            )
+        )
+        if incluir_sublocais:
+            stmt = stmt.where(
+                saldo.local_id.in_(
+                    select(models.Local.id).where(
+                        models.Local.id.in_(local_crud.subtree_ids(local_id)),
+                        models.Local.local_sucata == False,
+                    )
+                )
+            )
+        else:
+            stmt = stmt.where(saldo.local_id == local_id)
+        if excluir_expirados:
+            stmt = stmt.where(or_(lote.data_de_expiracao.is_(None), lote.data_de_expiracao >= func.now()))
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def lock_rows(
+        self, db: Session, *, saldo_ids: Collection[uuid.UUID], skip_locked: bool = True
+    ) -> Dict[uuid.UUID, Decimal]:
+        """
+        Bloqueia (FOR UPDATE) apenas os saldos indicados até ao fim da
+        transação e devolve a quantidade atual de cada um. Com 'skip_locked'
+        os saldos já bloqueados por outra transação são saltados (ficam fora
+        do resultado) em vez de esperar por eles.
+        """
+        if not saldo_ids:
+            return {}
+        saldo = models.SaldoEstoque
+        stmt = (
+            select(saldo.id, saldo.quantidade)
+            .where(saldo.id.in_(list(saldo_ids)))
+            .order_by(saldo.id)
+            .with_for_update(skip_locked=skip_locked)
+        )
+        return dict(db.execute(stmt).all())
+
+alocacao_crud = CRUDAlocacao()
@@ -0,0 +1,43 @@
+# backend/app/modules/inventory/stock_allocation/stock_allocation_router.py
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List
+import uuid
+
+from . import stock_allocation_schemas, stock_allocation_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/inventory/alocacoes",
+    tags=["Inventário - Alocação de Lotes"]
+)
+
+@router.post("/fefo", response_model=List[stock_allocation_schemas.AlocacaoItem], summary="Simular alocação FEFO")
+def preview_alocacao_endpoint(
+    pedido: stock_allocation_schemas.AlocacaoPedido,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_allocation_service.alocacao_service.preview(db, pedido=pedido)
+
+@router.get("/fefo/plano-pm/{pm_plan_id}", response_model=List[stock_allocation_schemas.AlocacaoItem], summary="Simular alocação FEFO da lista de peças de um plano de PM")
+def preview_alocacao_pm_endpoint(
+    pm_plan_id: uuid.UUID,
+    local_id: uuid.UUID,
+    excluir_expirados: bool = True,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_allocation_service.alocacao_service.preview_pm_plan(
+        db, pm_plan_id=pm_plan_id, local_id=local_id, excluir_expirados=excluir_expirados
+    )
+
+@router.post("/saida", response_model=List[stock_allocation_schemas.AlocacaoItem], summary="Alocar (FEFO) e dar saída de stock")
+def issue_alocacao_endpoint(
+    pedido: stock_allocation_schemas.AlocacaoSaidaPedido,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_allocation_service.alocacao_service.issue(db, pedido=pedido, usuario_id=current_user.id)
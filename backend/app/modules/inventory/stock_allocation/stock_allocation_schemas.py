@@ -0,0 +1,43 @@
+# backend/app/modules/inventory/stock_allocation/stock_allocation_schemas.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
+import uuid
+
+# --- Schemas de Alocação FEFO ---
+
+class AlocacaoItemPedido(BaseModel):
+    variante_produto_id: uuid.UUID
+    # Se indicado, a quantidade sai apenas deste lote (validado contra o saldo)
+    lote_id: Optional[uuid.UUID] = None
+    quantidade: Decimal = Field(..., gt=0)
+    # Custo unitário registado nos movimentos de saída deste item (opcional)
+    preco_un: Optional[Decimal] = Field(None, ge=0)
+
+class AlocacaoPedido(BaseModel):
+    """Pedido de alocação de várias variantes a partir de um local de origem."""
+    local_id: uuid.UUID
+    incluir_sublocais: bool = True
+    excluir_expirados: bool = True
+    itens: List[AlocacaoItemPedido] = Field(..., min_length=1, max_length=1000)
+
+class AlocacaoSaidaPedido(AlocacaoPedido):
+    """Aloca e dá saída do stock (movimentos 'Concluído' sem destino)."""
+    referencia: str = Field(..., max_length=100)
+
+class AlocacaoLinha(BaseModel):
+    lote_id: Optional[uuid.UUID] = None
+    lote_nome: Optional[str] = None
+    data_de_expiracao: Optional[datetime] = None
+    local_id: uuid.UUID
+    quantidade: Decimal
+
+class AlocacaoItem(BaseModel):
+    variante_produto_id: uuid.UUID
+    lote_id: Optional[uuid.UUID] = None
+    quantidade_pedida: Decimal
+    quantidade_alocada: Decimal
+    quantidade_em_falta: Decimal
+    linhas: List[AlocacaoLinha] = []
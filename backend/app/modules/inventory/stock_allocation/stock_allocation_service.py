@@ -0,0 +1,258 @@
+# backend/app/modules/inventory/stock_allocation/stock_allocation_service.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select
+from fastapi import HTTPException, status
+from typing import Dict, List, Optional, Set
+from decimal import Decimal
+import uuid
+
+from .... import models
+from ....models.inventory.stock_movement_model import MOVIMENTO_CONCLUIDO
+from . import stock_allocation_crud, stock_allocation_schemas
+from ..stock_availability.stock_availability_service import disponibilidade_service
+from ..stock_balances.stock_balances_crud import saldo_estoque_crud
+from ..stock_balances.stock_balances_service import utc_now
+from ..stock_movements.stock_movements_crud import movimento_crud
+
+class AlocacaoService:
+    """
+    Alocação de lotes FEFO (First-Expired, First-Out) sobre os saldos.
+    Todas as variantes de um pedido são resolvidas com uma única query.
+    """
+
+    def allocate_items(
+        self,
+        db: Session,
+        *,
+        local_id: uuid.UUID,
+        itens: List[stock_allocation_schemas.AlocacaoItemPedido],
+        incluir_sublocais: bool = True,
+        excluir_expirados: bool = True,
+        lock: bool = False,
+    ) -> List[stock_allocation_schemas.AlocacaoItem]:
+        """
+        Distribui cada item pelos saldos candidatos (já ordenados por
+        expiração). Os itens com lote indicado são servidos primeiro, para que
+        a alocação FEFO dos restantes não consuma esse lote. O resultado segue
+        a ordem de 'itens'. Usar 'lock=True' apenas dentro da transação que
+        vai dar saída do stock.
+        """
+        candidatos = stock_allocation_crud.alocacao_crud.get_candidates(
+            db,
+            variante_ids=list({item.variante_produto_id for item in itens}),
+            local_id=local_id,
+            incluir_sublocais=incluir_sublocais,
+            excluir_expirados=excluir_expirados,
+        )
+        if not lock:
+            return self._distribute(itens, candidatos)
+        return self._distribute_locked(db, itens, candidatos)
+
+    def _distribute_locked(
+        self, db: Session, itens: List[stock_allocation_schemas.AlocacaoItemPedido], candidatos: List[dict]
+    ) -> List[stock_allocation_schemas.AlocacaoItem]:
+        """
+        Bloqueia apenas os saldos que a alocação usa (FOR UPDATE SKIP LOCKED):
+        pedidos concorrentes da mesma variante não esperam uns pelos outros,
+        saltam os saldos em uso e passam ao lote seguinte. Depois de cada
+        bloqueio a distribuição é refeita com as quantidades atuais, até usar
+        só saldos bloqueados. Se ainda faltar stock e houver saldos saltados,
+        uma última passagem espera pelos bloqueios desses saldos.
+        """
+        crud = stock_allocation_crud.alocacao_crud
+
+        def atuais(linhas: List[dict], bloqueados: Dict[uuid.UUID, Decimal]) -> List[dict]:
+            return [{**linha, "quantidade": bloqueados.get(linha["saldo_id"], linha["quantidade"])} for linha in linhas]
+
+        bloqueados: Dict[uuid.UUID, Decimal] = {}
+        saltados: Set[uuid.UUID] = set()
+        while True:
+            usados: Set[uuid.UUID] = set()
+            livres = [candidato for candidato in candidatos if candidato["saldo_id"] not in saltados]
+            resultado = self._distribute(itens, atuais(livres, bloqueados), usados)
+            por_bloquear = usados - bloqueados.keys()
+            if not por_bloquear:
+                break
+            obtidos = crud.lock_rows(db, saldo_ids=por_bloquear)
+            bloqueados.update(obtidos)
+            saltados |= por_bloquear - obtidos.keys()
+
+        if saltados and any(item.quantidade_em_falta > 0 for item in resultado):
+            # Os saldos saltados (bloqueados por outra transação) podem ser os
+            # únicos com stock: espera por esses e redistribui.
+            bloqueados.update(crud.lock_rows(db, saldo_ids=saltados, skip_locked=False))
+            bloqueadas = [candidato for candidato in candidatos if candidato["saldo_id"] in bloqueados]
+            resultado = self._distribute(itens, atuais(bloqueadas, bloqueados))
+        return resultado
+
+    @staticmethod
+    def _distribute(
+        itens: List[stock_allocation_schemas.AlocacaoItemPedido],
+        candidatos: List[dict],
+        usados: Optional[Set[uuid.UUID]] = None,
+    ) -> List[stock_allocation_schemas.AlocacaoItem]:
+        """
+        Distribui os itens pelos saldos candidatos (já em ordem FEFO).
+        Se indicado, 'usados' recebe os IDs dos saldos escolhidos.
+        """
+        por_variante: Dict[uuid.UUID, List[dict]] = {}
+        for candidato in candidatos:
+            por_variante.setdefault(candidato["variante_produto_id"], []).append(dict(candidato))
+
+        resultado: Dict[int, stock_allocation_schemas.AlocacaoItem] = {}
+        ordem = sorted(range(len(itens)), key=lambda index: itens[index].lote_id is None)
+        for index in ordem:
+            item = itens[index]
+            falta = Decimal(item.quantidade)
+            linhas = []
+            for candidato in por_variante.get(item.variante_produto_id, []):
+                if falta <= 0:
+                    break
+                if candidato["quantidade"] <= 0 or (item.lote_id and candidato["lote_id"] != item.lote_id):
+                    continue
+                quantidade = min(falta, candidato["quantidade"])
+                candidato["quantidade"] -= quantidade
+                if usados is not None:
+                    usados.add(candidato["saldo_id"])
+                linhas.append(stock_allocation_schemas.AlocacaoLinha(
+                    lote_id=candidato["lote_id"],
+                    lote_nome=candidato["lote_nome"],
+                    data_de_expiracao=candidato["data_de_expiracao"],
+                    local_id=candidato["local_id"],
+                    quantidade=quantidade,
+                ))
+                falta -= quantidade
+            resultado[index] = stock_allocation_schemas.AlocacaoItem(
+                variante_produto_id=item.variante_produto_id,
+                lote_id=item.lote_id,
+                quantidade_pedida=item.quantidade,
+                quantidade_alocada=item.quantidade - falta,
+                quantidade_em_falta=falta,
+                linhas=linhas,
+            )
+        return [resultado[index] for index in range(len(itens))]
+
+    def issue_items(
+        self,
+        db: Session,
+        *,
+        referencia: str,
+        local_id: uuid.UUID,
+        itens: List[stock_allocation_schemas.AlocacaoItemPedido],
+        usuario_id: Optional[uuid.UUID],
+        incluir_sublocais: bool = True,
+        excluir_expirados: bool = True,
+        exclude_work_order_id: Optional[uuid.UUID] = None,
+    ) -> List[stock_allocation_schemas.AlocacaoItem]:
+        """
+        Aloca (com bloqueio dos saldos) e lança a saída no livro razão: um
+        movimento por linha alocada, num único INSERT, mais os deltas de
+        saldo. NÃO faz commit; levanta 400 se algum item não tiver stock.
+
+        A saída não pode consumir stock reservado por OS em aberto: o
+        disponível (físico - reservado) é verificado antes da alocação.
+        Só as reservas de 'exclude_work_order_id' (a OS que consome as suas
+        próprias peças) ficam de fora. Esta verificação é uma leitura sem
+        bloqueio, para que saídas concorrentes não se serializem; o stock
+        físico fica protegido pelo bloqueio dos saldos efetivamente alocados.
+        """
+        quantidades: Dict[uuid.UUID, Decimal] = {}
+        for item in itens:
+            quantidades[item.variante_produto_id] = quantidades.get(item.variante_produto_id, Decimal(0)) + item.quantidade
+        disponibilidade_service.ensure_available(
+            db,
+            local_id=local_id,
+            quantidades=quantidades,
+            incluir_sublocais=incluir_sublocais,
+            exclude_work_order_id=exclude_work_order_id,
+            lock=False,
+        )
+        alocacao = self.allocate_items(
+            db,
+            local_id=local_id,
+            itens=itens,
+            incluir_sublocais=incluir_sublocais,
+            excluir_expirados=excluir_expirados,
+            lock=True,
+        )
+        em_falta = [
+            f"{item.variante_produto_id}" + (f" (lote {item.lote_id})" if item.lote_id else "")
+            for item in alocacao if item.quantidade_em_falta > 0
+        ]
+        if em_falta:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Stock disponível insuficiente para: {', '.join(em_falta)}."
+            )
+        agora = utc_now()
+        rows = [
+            {
+                "referencia": referencia,
+                "variante_produto_id": item.variante_produto_id,
+                "lote_id": linha.lote_id,
+                "local_origem_id": linha.local_id,
+                "local_destino_id": None,
+                "qtd_prevista": linha.quantidade,
+                "qtd_realizada": linha.quantidade,
+                "preco_un": pedido.preco_un,
+                "status": MOVIMENTO_CONCLUIDO,
+                "data_movimento": agora,
+                "usuario_id": usuario_id,
+            }
+            for pedido, item in zip(itens, alocacao)
+            for linha in item.linhas
+        ]
+        if rows:
+            movimentos = movimento_crud.create_many(db, rows=rows)
+            saldo_estoque_crud.apply_deltas(db, saldo_estoque_crud.deltas_from_movements(movimentos))
+        return alocacao
+
+    def preview(self, db: Session, *, pedido: stock_allocation_schemas.AlocacaoPedido) -> List[stock_allocation_schemas.AlocacaoItem]:
+        """Simula a alocação (sem bloquear nem alterar stock)."""
+        return self.allocate_items(
+            db,
+            local_id=pedido.local_id,
+            itens=pedido.itens,
+            incluir_sublocais=pedido.incluir_sublocais,
+            excluir_expirados=pedido.excluir_expirados,
+        )
+
+    def preview_pm_plan(
+        self, db: Session, *, pm_plan_id: uuid.UUID, local_id: uuid.UUID, excluir_expirados: bool
+    ) -> List[stock_allocation_schemas.AlocacaoItem]:
+        """Simula a alocação de toda a lista de peças de um plano de PM."""
+        partes = db.execute(
+            select(models.PMRequiredPart.product_variant_id, models.PMRequiredPart.quantity_required)
+            .where(models.PMRequiredPart.pm_plan_id == pm_plan_id)
+        ).all()
+        if not partes:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Plano de PM sem lista de peças (ou inexistente).")
+        itens = [
+            stock_allocation_schemas.AlocacaoItemPedido(variante_produto_id=variante_id, quantidade=quantidade)
+            for variante_id, quantidade in partes
+            if quantidade and quantidade > 0
+        ]
+        return self.allocate_items(db, local_id=local_id, itens=itens, excluir_expirados=excluir_expirados)
+
+    def issue(
+        self, db: Session, *, pedido: stock_allocation_schemas.AlocacaoSaidaPedido, usuario_id: uuid.UUID
+    ) -> List[stock_allocation_schemas.AlocacaoItem]:
+        """Aloca e dá saída do stock numa única transação."""
+        try:
+            alocacao = self.issue_items(
+                db,
+                referencia=pedido.referencia,
+                local_id=pedido.local_id,
+                itens=pedido.itens,
+                usuario_id=usuario_id,
+                incluir_sublocais=pedido.incluir_sublocais,
+                excluir_expirados=pedido.excluir_expirados,
+            )
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return alocacao
+
+alocacao_service = AlocacaoService()
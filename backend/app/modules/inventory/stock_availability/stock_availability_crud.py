@@ -0,0 +1,133 @@
+# backend/app/modules/inventory/stock_availability/stock_availability_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.sql import Select, Subquery
+from typing import Any, Dict, List, Optional
+import uuid
+
+from .... import models
+from ....models.maintenance.work_order_model import OPEN_WORK_ORDER_STATUSES
+from ..locations.locations_crud import local_crud
+
+class CRUDDisponibilidade:
+    """
+    Disponibilidade = stock físico (saldos) - reservas.
+
+    As reservas não são guardadas numa tabela própria: são as peças
+    planeadas (WorkOrderPartUsage) de OS em aberto, ainda não lançadas.
+    Assim, uma reserva é libertada automaticamente quando a OS é concluída
+    ou cancelada, sem passos de sincronização.
+    """
+
+    def reserved_quantity(self):
+        """
+        Quantidade que uma linha de peças ainda retém do stock:
+        o maior entre planeado e usado, menos o que já saiu no livro razão.
+        """
+        part = models.WorkOrderPartUsage
+        return func.greatest(part.quantity_planned, part.quantity_used) - part.quantity_posted
+
+    def reserved_subquery(
+        self,
+        *,
+        variante_ids,
+        local_ids: Optional[Select] = None,
+        exclude_part_id: Optional[uuid.UUID] = None,
+        exclude_work_order_id: Optional[uuid.UUID] = None,
+    ) -> Subquery:
+        part = models.WorkOrderPartUsage
+        wo = models.WorkOrder
+        stmt = (
+            select(
+                part.product_variant_id.label("variante_produto_id"),
+                func.sum(self.reserved_quantity()).label("reservado"),
+            )
+            .join(wo, wo.id == part.work_order_id)
+            .where(
+                wo.status.in_(OPEN_WORK_ORDER_STATUSES),
+                part.product_variant_id.in_(variante_ids),
+            )
+            .group_by(part.product_variant_id)
+        )
+        if local_ids is not None:
+            stmt = stmt.where(part.location_id.in_(local_ids))
+        if exclude_part_id:
+            stmt = stmt.where(part.id != exclude_part_id)
+        if exclude_work_order_id:
+            stmt = stmt.where(part.work_order_id != exclude_work_order_id)
+        return stmt.subquery("reservas")
+
+    def on_hand_subquery(self, *, variante_ids, local_ids: Optional[Select] = None) -> Subquery:
+        saldo = models.SaldoEstoque
+        stmt = (
+            select(saldo.variante_produto_id, func.sum(saldo.quantidade).label("fisico"))
+            .join(models.Local, models.Local.id == saldo.local_id)
+            .where(models.Local.local_sucata == False, saldo.variante_produto_id.in_(variante_ids))
+            .group_by(saldo.variante_produto_id)
+        )
+        if local_ids is not None:
+            stmt = stmt.where(saldo.local_id.in_(local_ids))
+        return stmt.subquery("fisico")
+
+    def get_availability(
+        self,
+        db: Session,
+        *,
+        variante_ids: List[uuid.UUID],
+        local_id: Optional[uuid.UUID] = None,
+        incluir_sublocais: bool = True,
+        exclude_part_id: Optional[uuid.UUID] = None,
+        exclude_work_order_id: Optional[uuid.UUID] = None,
+    ) -> List[Dict[str, Any]]:
+        """Físico, reservado e disponível de todas as variantes numa única query agrupada."""
+        local_ids = self._local_ids(local_id, incluir_sublocais) if local_id else None
+        fisico_sq = self.on_hand_subquery(variante_ids=variante_ids, local_ids=local_ids)
+        reservas_sq = self.reserved_subquery(
+            variante_ids=variante_ids,
+            local_ids=local_ids,
+            exclude_part_id=exclude_part_id,
+            exclude_work_order_id=exclude_work_order_id,
+        )
+        fisico = func.coalesce(fisico_sq.c.fisico, 0)
+        reservado = func.coalesce(reservas_sq.c.reservado, 0)
+        stmt = (
+            select(
+                models.VarianteProduto.id.label("variante_produto_id"),
+                models.VarianteProduto.referencia,
+                fisico.label("quantidade_fisica"),
+                reservado.label("quantidade_reservada"),
+                (fisico - reservado).label("quantidade_disponivel"),
+            )
+            .outerjoin(fisico_sq, fisico_sq.c.variante_produto_id == models.VarianteProduto.id)
+            .outerjoin(reservas_sq, reservas_sq.c.variante_produto_id == models.VarianteProduto.id)
+            .where(models.VarianteProduto.id.in_(variante_ids))
+            .order_by(models.VarianteProduto.referencia)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def lock_balances(self, db: Session, *, variante_ids: List[uuid.UUID], local_id: uuid.UUID) -> None:
+        """
+        Bloqueia (FOR UPDATE) os saldos das variantes no local até ao fim da
+        transação, para que duas reservas concorrentes sobre o mesmo stock
+        sejam verificadas uma de cada vez.
+        """
+        saldo = models.SaldoEstoque
+        db.execute(
+            select(saldo.id)
+            .where(
+                saldo.variante_produto_id.in_(variante_ids),
+                saldo.local_id.in_(self._local_ids(local_id, True)),
+            )
+            .order_by(saldo.id)
+            .with_for_update()
+        ).all()
+
+    @staticmethod
+    def _local_ids(local_id: uuid.UUID, incluir_sublocais: bool) -> Select:
+        """IDs do local (e sublocais); o mesmo SELECT é partilhado pelas subqueries."""
+        if incluir_sublocais:
+            return local_crud.subtree_ids(local_id)
+        return select(models.Local.id).where(models.Local.id == local_id)
+
+disponibilidade_crud = CRUDDisponibilidade()
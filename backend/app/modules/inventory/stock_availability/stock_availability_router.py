@@ -0,0 +1,22 @@
+# backend/app/modules/inventory/stock_availability/stock_availability_router.py
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List
+
+from . import stock_availability_schemas, stock_availability_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/inventory/disponibilidade",
+    tags=["Inventário - Disponibilidade"]
+)
+
+@router.post("/", response_model=List[stock_availability_schemas.Disponibilidade], summary="Stock físico, reservado e disponível de várias variantes")
+def read_disponibilidade_endpoint(
+    consulta: stock_availability_schemas.DisponibilidadeConsulta,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_availability_service.disponibilidade_service.get_availability(db, consulta=consulta)
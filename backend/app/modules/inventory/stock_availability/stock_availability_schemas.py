@@ -0,0 +1,21 @@
+# backend/app/modules/inventory/stock_availability/stock_availability_schemas.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from decimal import Decimal
+import uuid
+
+# --- Schemas de Disponibilidade ---
+
+class DisponibilidadeConsulta(BaseModel):
+    variante_ids: List[uuid.UUID] = Field(..., min_length=1, max_length=5000)
+    local_id: Optional[uuid.UUID] = None
+    incluir_sublocais: bool = True
+
+class Disponibilidade(BaseModel):
+    """Stock físico, reservado (OS em aberto) e disponível de uma variante."""
+    variante_produto_id: uuid.UUID
+    referencia: str
+    quantidade_fisica: Decimal
+    quantidade_reservada: Decimal
+    quantidade_disponivel: Decimal
@@ -0,0 +1,66 @@
+# backend/app/modules/inventory/stock_availability/stock_availability_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Dict, List, Optional
+from decimal import Decimal
+import uuid
+
+from . import stock_availability_crud, stock_availability_schemas
+
+class DisponibilidadeService:
+    def get_availability(
+        self, db: Session, *, consulta: stock_availability_schemas.DisponibilidadeConsulta
+    ) -> List[dict]:
+        return stock_availability_crud.disponibilidade_crud.get_availability(
+            db,
+            variante_ids=list(dict.fromkeys(consulta.variante_ids)),
+            local_id=consulta.local_id,
+            incluir_sublocais=consulta.incluir_sublocais,
+        )
+
+    def ensure_available(
+        self,
+        db: Session,
+        *,
+        local_id: uuid.UUID,
+        quantidades: Dict[uuid.UUID, Decimal],
+        incluir_sublocais: bool = True,
+        exclude_part_id: Optional[uuid.UUID] = None,
+        exclude_work_order_id: Optional[uuid.UUID] = None,
+        lock: bool = True,
+    ) -> None:
+        """
+        Garante que o local tem disponível (físico - reservado) para as
+        quantidades pedidas. Levanta 400 se faltar stock.
+        'exclude_work_order_id' ignora as reservas dessa OS (a OS que consome
+        o que ela própria reservou).
+
+        Com 'lock=True' (novas reservas) bloqueia os saldos envolvidos até ao
+        commit da transação. As saídas usam 'lock=False' e bloqueiam apenas
+        os saldos que alocam.
+        """
+        crud = stock_availability_crud.disponibilidade_crud
+        variante_ids = list(quantidades)
+        if lock:
+            crud.lock_balances(db, variante_ids=variante_ids, local_id=local_id)
+        linhas = crud.get_availability(
+            db,
+            variante_ids=variante_ids,
+            local_id=local_id,
+            incluir_sublocais=incluir_sublocais,
+            exclude_part_id=exclude_part_id,
+            exclude_work_order_id=exclude_work_order_id,
+        )
+        em_falta = [
+            f"{linha['referencia']} (pedido {quantidades[linha['variante_produto_id']]}, disponível {linha['quantidade_disponivel']})"
+            for linha in linhas
+            if Decimal(quantidades[linha["variante_produto_id"]]) > linha["quantidade_disponivel"]
+        ]
+        if em_falta:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Stock disponível insuficiente: {'; '.join(em_falta)}."
+            )
+
+disponibilidade_service = DisponibilidadeService()
@@ -0,0 +1,352 @@
+# backend/app/modules/inventory/stock_balances/stock_balances_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, func, union_all, literal, and_, DateTime
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql import Select
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from datetime import datetime
+from decimal import Decimal
+import uuid
+
+from .... import models
+from ....models.inventory.stock_movement_model import MOVIMENTO_CONCLUIDO
+from ..locations.locations_crud import local_crud
+
+# Chave de um saldo: (variante, lote, local)
+SaldoKey = Tuple[uuid.UUID, Optional[uuid.UUID], uuid.UUID]
+
+# Número máximo de linhas por instrução de upsert
+UPSERT_BATCH_SIZE = 2000
+
+class CRUDSaldoEstoque:
+    """
+    Acesso a dados da tabela de saldos (SaldoEstoque).
+    Os métodos de escrita NÃO fazem commit: são chamados dentro da
+    transação que grava os movimentos no livro razão.
+    """
+
+    # --- Escrita incremental ---
+
+    @staticmethod
+    def deltas_from_movements(movimentos: Iterable[Any]) -> Dict[SaldoKey, Decimal]:
+        """
+        Converte movimentos concluídos em deltas de saldo:
+        + quantidade no destino, - quantidade na origem.
+        Aceita objetos ou linhas com os atributos do livro razão.
+        """
+        deltas: Dict[SaldoKey, Decimal] = {}
+        for mov in movimentos:
+            quantidade = mov.qtd_realizada
+            if not quantidade:
+                continue
+            if mov.local_destino_id:
+                key = (mov.variante_produto_id, mov.lote_id, mov.local_destino_id)
+                deltas[key] = deltas.get(key, Decimal(0)) + Decimal(quantidade)
+            if mov.local_origem_id:
+                key = (mov.variante_produto_id, mov.lote_id, mov.local_origem_id)
+                deltas[key] = deltas.get(key, Decimal(0)) - Decimal(quantidade)
+        return deltas
+
+    def apply_deltas(self, db: Session, deltas: Dict[SaldoKey, Decimal]) -> None:
+        """
+        Aplica os deltas com INSERT ... ON CONFLICT DO UPDATE multi-linha
+        (upsert em massa, em lotes de UPSERT_BATCH_SIZE). As chaves são ordenadas para que transações
+        concorrentes bloqueiem as linhas sempre pela mesma ordem.
+        """
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "variante_produto_id": variante_id,
+                "lote_id": lote_id,
+                "local_id": local_id,
+                "quantidade": quantidade,
+            }
+            for (variante_id, lote_id, local_id), quantidade in sorted(
+                deltas.items(), key=lambda item: tuple(str(part) for part in item[0])
+            )
+            if quantidade
+        ]
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(models.SaldoEstoque).values(rows[start:start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_saldos_estoque_variante_lote_local",
+                set_={
+                    "quantidade": models.SaldoEstoque.quantidade + stmt.excluded.quantidade,
+                    "updated_at": func.now(),
+                },
+            )
+            db.execute(stmt)
+
+    # --- Reconstrução / verificação a partir do livro razão ---
+
+    @staticmethod
+    def ledger_balances_select(*extra_filters) -> Select:
+        """
+        SELECT (variante, lote, local, quantidade) calculado a partir dos
+        movimentos concluídos do livro razão. 'extra_filters' são aplicados
+        a cada movimento (ex: data_movimento <= X).
+        """
+        mov = models.MovimentacaoLivroRazao
+        base_filters = (mov.status == MOVIMENTO_CONCLUIDO, mov.qtd_realizada.isnot(None), *extra_filters)
+        entradas = select(
+            mov.variante_produto_id.label("variante_produto_id"),
+            mov.lote_id.label("lote_id"),
+            mov.local_destino_id.label("local_id"),
+            mov.qtd_realizada.label("quantidade"),
+        ).where(mov.local_destino_id.isnot(None), *base_filters)
+        saidas = select(
+            mov.variante_produto_id,
+            mov.lote_id,
+            mov.local_origem_id,
+            -mov.qtd_realizada,
+        ).where(mov.local_origem_id.isnot(None), *base_filters)
+        movimentos = union_all(entradas, saidas).subquery("movimentos")
+        return select(
+            movimentos.c.variante_produto_id,
+            movimentos.c.lote_id,
+            movimentos.c.local_id,
+            func.sum(movimentos.c.quantidade).label("quantidade"),
+        ).group_by(
+            movimentos.c.variante_produto_id, movimentos.c.lote_id, movimentos.c.local_id
+        )
+
+    def rebuild(self, db: Session) -> int:
+        """Recalcula todos os saldos a partir do livro razão (NÃO faz commit)."""
+        db.execute(delete(models.SaldoEstoque))
+        ledger = self.ledger_balances_select().subquery("razao")
+        db.execute(
+            pg_insert(models.SaldoEstoque).from_select(
+                ["id", "variante_produto_id", "lote_id", "local_id", "quantidade"],
+                select(
+                    func.gen_random_uuid(),
+                    ledger.c.variante_produto_id,
+                    ledger.c.lote_id,
+                    ledger.c.local_id,
+                    ledger.c.quantidade,
+                ),
+            )
+        )
+        return db.scalar(select(func.count()).select_from(models.SaldoEstoque))
+
+    def verify(self, db: Session, *, limit: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Compara a tabela de saldos com o livro razão (FULL OUTER JOIN)
+        e devolve as chaves em que os valores divergem.
+        """
+        saldo = models.SaldoEstoque
+        ledger = self.ledger_balances_select().subquery("razao")
+        same_key = and_(
+            saldo.variante_produto_id == ledger.c.variante_produto_id,
+            saldo.local_id == ledger.c.local_id,
+            saldo.lote_id.is_not_distinct_from(ledger.c.lote_id),
+        )
+        quantidade_saldo = func.coalesce(saldo.quantidade, 0)
+        quantidade_razao = func.coalesce(ledger.c.quantidade, 0)
+        stmt = (
+            select(
+                func.coalesce(saldo.variante_produto_id, ledger.c.variante_produto_id).label("variante_produto_id"),
+                func.coalesce(saldo.lote_id, ledger.c.lote_id).label("lote_id"),
+                func.coalesce(saldo.local_id, ledger.c.local_id).label("local_id"),
+                quantidade_saldo.label("quantidade_saldo"),
+                quantidade_razao.label("quantidade_razao"),
+            )
+            .select_from(saldo)
+            .join(ledger, same_key, full=True)
+            .where(quantidade_saldo != quantidade_razao)
+            .limit(limit)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    # --- Fechos periódicos e saldos históricos ---
+
+    def latest_checkpoint(self, db: Session, *, until: Optional[datetime] = None) -> Optional[datetime]:
+        """Data do fecho mais recente (opcionalmente, o mais recente com data <= 'until')."""
+        stmt = select(func.max(models.SaldoEstoqueFecho.data_fecho))
+        if until is not None:
+            stmt = stmt.where(models.SaldoEstoqueFecho.data_fecho <= until)
+        return db.scalar(stmt)
+
+    def get_checkpoints(self, db: Session) -> List[Dict[str, Any]]:
+        fecho = models.SaldoEstoqueFecho
+        stmt = (
+            select(fecho.data_fecho, func.count().label("linhas"))
+            .group_by(fecho.data_fecho)
+            .order_by(fecho.data_fecho.desc())
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def as_of_select(self, *, checkpoint: Optional[datetime], as_of: datetime) -> Select:
+        """
+        SELECT (variante, lote, local, quantidade) no instante 'as_of'
+        (movimentos com data_movimento < as_of): parte das linhas do fecho
+        'checkpoint' e soma apenas os movimentos em [checkpoint, as_of),
+        lidos pelo índice de 'data_movimento'.
+        """
+        mov = models.MovimentacaoLivroRazao
+        if checkpoint is None:
+            return self.ledger_balances_select(mov.data_movimento < as_of)
+
+        fecho = models.SaldoEstoqueFecho
+        base = select(
+            fecho.variante_produto_id, fecho.lote_id, fecho.local_id, fecho.quantidade
+        ).where(fecho.data_fecho == checkpoint)
+        desde_fecho = self.ledger_balances_select(mov.data_movimento >= checkpoint, mov.data_movimento < as_of)
+        partes = union_all(base, desde_fecho).subquery("partes")
+        return select(
+            partes.c.variante_produto_id,
+            partes.c.lote_id,
+            partes.c.local_id,
+            func.sum(partes.c.quantidade).label("quantidade"),
+        ).group_by(partes.c.variante_produto_id, partes.c.lote_id, partes.c.local_id)
+
+    def create_checkpoint(self, db: Session, *, data_fecho: datetime) -> int:
+        """
+        Grava o fecho de 'data_fecho' a partir do fecho anterior mais os
+        movimentos desde então (NÃO faz commit). Saldos a zero não são guardados.
+        """
+        anterior = self.latest_checkpoint(db, until=data_fecho)
+        saldos = self.as_of_select(checkpoint=anterior, as_of=data_fecho).subquery("saldos")
+        result = db.execute(
+            pg_insert(models.SaldoEstoqueFecho).from_select(
+                ["id", "data_fecho", "variante_produto_id", "lote_id", "local_id", "quantidade"],
+                select(
+                    func.gen_random_uuid(),
+                    literal(data_fecho, DateTime),
+                    saldos.c.variante_produto_id,
+                    saldos.c.lote_id,
+                    saldos.c.local_id,
+                    saldos.c.quantidade,
+                ).where(saldos.c.quantidade != 0),
+            )
+        )
+        return result.rowcount
+
+    def first_movement_date(self, db: Session) -> Optional[datetime]:
+        return db.scalar(select(func.min(models.MovimentacaoLivroRazao.data_movimento)))
+
+    def get_as_of(
+        self,
+        db: Session,
+        *,
+        as_of: datetime,
+        variante_produto_id: Optional[uuid.UUID] = None,
+        local_id: Optional[uuid.UUID] = None,
+        lote_id: Optional[uuid.UUID] = None,
+        incluir_sublocais: bool = True,
+        incluir_zerados: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Saldos no instante 'as_of', com os mesmos filtros de 'get_multi'."""
+        checkpoint = self.latest_checkpoint(db, until=as_of)
+        saldo = self.as_of_select(checkpoint=checkpoint, as_of=as_of).subquery("saldo_historico")
+        stmt = (
+            select(
+                saldo.c.variante_produto_id,
+                models.VarianteProduto.referencia,
+                saldo.c.lote_id,
+                models.Lote.nome.label("lote_nome"),
+                saldo.c.local_id,
+                models.Local.nome.label("local_nome"),
+                saldo.c.quantidade,
+            )
+            .join(models.VarianteProduto, models.VarianteProduto.id == saldo.c.variante_produto_id)
+            .join(models.Local, models.Local.id == saldo.c.local_id)
+            .outerjoin(models.Lote, models.Lote.id == saldo.c.lote_id)
+        )
+        if variante_produto_id:
+            stmt = stmt.where(saldo.c.variante_produto_id == variante_produto_id)
+        if lote_id:
+            stmt = stmt.where(saldo.c.lote_id == lote_id)
+        if local_id:
+            stmt = stmt.where(self._local_filter(local_id, incluir_sublocais, column=saldo.c.local_id))
+        if not incluir_zerados:
+            stmt = stmt.where(saldo.c.quantidade != 0)
+        stmt = stmt.order_by(models.VarianteProduto.referencia, models.Local.nome).offset(skip).limit(limit)
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    # --- Consultas ---
+
+    def get_multi(
+        self,
+        db: Session,
+        *,
+        variante_produto_id: Optional[uuid.UUID] = None,
+        local_id: Optional[uuid.UUID] = None,
+        lote_id: Optional[uuid.UUID] = None,
+        incluir_sublocais: bool = True,
+        incluir_zerados: bool = False,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Lista saldos por variante / lote / local (ou subárvore de locais)."""
+        saldo = models.SaldoEstoque
+        stmt = (
+            select(
+                saldo.variante_produto_id,
+                models.VarianteProduto.referencia,
+                saldo.lote_id,
+                models.Lote.nome.label("lote_nome"),
+                saldo.local_id,
+                models.Local.nome.label("local_nome"),
+                saldo.quantidade,
+            )
+            .join(models.VarianteProduto, models.VarianteProduto.id == saldo.variante_produto_id)
+            .join(models.Local, models.Local.id == saldo.local_id)
+            .outerjoin(models.Lote, models.Lote.id == saldo.lote_id)
+        )
+        if variante_produto_id:
+            stmt = stmt.where(saldo.variante_produto_id == variante_produto_id)
+        if lote_id:
+            stmt = stmt.where(saldo.lote_id == lote_id)
+        if local_id:
+            stmt = stmt.where(self._local_filter(local_id, incluir_sublocais))
+        if not incluir_zerados:
+            stmt = stmt.where(saldo.quantidade != 0)
+        stmt = stmt.order_by(models.VarianteProduto.referencia, models.Local.nome).offset(skip).limit(limit)
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_totals(
+        self,
+        db: Session,
+        *,
+        variante_ids: List[uuid.UUID],
+        local_id: Optional[uuid.UUID] = None,
+        incluir_sublocais: bool = True,
+    ) -> Dict[uuid.UUID, Decimal]:
+        """Saldo total por variante para uma lista de variantes (uma query)."""
+        saldo = models.SaldoEstoque
+        stmt = (
+            select(saldo.variante_produto_id, func.sum(saldo.quantidade))
+            .where(saldo.variante_produto_id.in_(variante_ids))
+            .group_by(saldo.variante_produto_id)
+        )
+        if local_id:
+            stmt = stmt.where(self._local_filter(local_id, incluir_sublocais))
+        return dict(db.execute(stmt).all())
+
+    def on_hand_subquery(self, variante_ids=None, *, excluir_sucata: bool = True):
+        """
+        Subquery (variante_produto_id, on_hand) com o stock total por variante,
+        para ser usada em joins por outras fatias (ex: previsão de peças).
+        """
+        saldo = models.SaldoEstoque
+        stmt = select(
+            saldo.variante_produto_id,
+            func.sum(saldo.quantidade).label("on_hand"),
+        ).group_by(saldo.variante_produto_id)
+        if excluir_sucata:
+            stmt = stmt.join(models.Local, models.Local.id == saldo.local_id).where(models.Local.local_sucata == False)
+        if variante_ids is not None:
+            stmt = stmt.where(saldo.variante_produto_id.in_(variante_ids))
+        return stmt.subquery("stock_on_hand")
+
+    @staticmethod
+    def _local_filter(local_id: uuid.UUID, incluir_sublocais: bool, *, column=None):
+        column = models.SaldoEstoque.local_id if column is None else column
+        if incluir_sublocais:
+            return column.in_(local_crud.subtree_ids(local_id))
+        return column == local_id
+
+saldo_estoque_crud = CRUDSaldoEstoque()
@@ -0,0 +1,110 @@
+# backend/app/modules/inventory/stock_balances/stock_balances_router.py
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import datetime
+import uuid
+
+from . import stock_balances_schemas, stock_balances_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/inventory/saldos",
+    tags=["Inventário - Saldos de Stock"]
+)
+
+@router.get("/", response_model=List[stock_balances_schemas.SaldoEstoque], summary="Listar saldos de stock")
+def read_saldos_endpoint(
+    db: Session = Depends(get_db),
+    variante_produto_id: Optional[uuid.UUID] = None,
+    local_id: Optional[uuid.UUID] = None,
+    lote_id: Optional[uuid.UUID] = None,
+    incluir_sublocais: bool = True,
+    incluir_zerados: bool = False,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_balances_service.saldo_estoque_service.get_all(
+        db,
+        variante_produto_id=variante_produto_id,
+        local_id=local_id,
+        lote_id=lote_id,
+        incluir_sublocais=incluir_sublocais,
+        incluir_zerados=incluir_zerados,
+        skip=skip,
+        limit=limit,
+    )
+
+@router.get("/historico", response_model=List[stock_balances_schemas.SaldoEstoque], summary="Saldos numa data passada")
+def read_saldos_historico_endpoint(
+    data: datetime,
+    db: Session = Depends(get_db),
+    variante_produto_id: Optional[uuid.UUID] = None,
+    local_id: Optional[uuid.UUID] = None,
+    lote_id: Optional[uuid.UUID] = None,
+    incluir_sublocais: bool = True,
+    incluir_zerados: bool = False,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    """Saldos no instante 'data' (considera os movimentos anteriores a essa data/hora)."""
+    return stock_balances_service.saldo_estoque_service.get_as_of(
+        db,
+        data=data,
+        variante_produto_id=variante_produto_id,
+        local_id=local_id,
+        lote_id=lote_id,
+        incluir_sublocais=incluir_sublocais,
+        incluir_zerados=incluir_zerados,
+        skip=skip,
+        limit=limit,
+    )
+
+@router.get("/fechos", response_model=List[stock_balances_schemas.SaldoFecho], summary="Listar fechos de saldos")
+def read_fechos_endpoint(
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_balances_service.saldo_estoque_service.get_checkpoints(db)
+
+@router.post("/fechos", response_model=stock_balances_schemas.SaldoFecho, summary="Criar um fecho de saldos")
+def create_fecho_endpoint(
+    obj_in: stock_balances_schemas.SaldoFechoCreate,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_balances_service.saldo_estoque_service.create_checkpoint(db, obj_in=obj_in)
+
+@router.post("/fechos/mensais", response_model=List[stock_balances_schemas.SaldoFecho], summary="Criar os fechos mensais em falta")
+def create_fechos_mensais_endpoint(
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_balances_service.saldo_estoque_service.create_monthly_checkpoints(db)
+
+@router.post("/consulta", response_model=List[stock_balances_schemas.SaldoVarianteTotal], summary="Saldos totais de uma lista de variantes")
+def read_saldos_totais_endpoint(
+    consulta: stock_balances_schemas.SaldoConsulta,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_balances_service.saldo_estoque_service.get_totals(db, consulta=consulta)
+
+@router.post("/rebuild", response_model=stock_balances_schemas.SaldoReconstrucao, summary="Reconstruir os saldos a partir do livro razão")
+def rebuild_saldos_endpoint(
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_balances_service.saldo_estoque_service.rebuild(db)
+
+@router.get("/verify", response_model=List[stock_balances_schemas.SaldoDivergencia], summary="Comparar os saldos com o livro razão")
+def verify_saldos_endpoint(
+    db: Session = Depends(get_db),
+    limit: int = Query(1000, ge=1, le=10000),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_balances_service.saldo_estoque_service.verify(db, limit=limit)
@@ -0,0 +1,55 @@
+# backend/app/modules/inventory/stock_balances/stock_balances_schemas.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
+import uuid
+
+# --- Schemas de Saldo de Stock ---
+
+class SaldoEstoque(BaseModel):
+    """Saldo atual de uma variante num local (e lote, se aplicável)."""
+    variante_produto_id: uuid.UUID
+    referencia: str
+    lote_id: Optional[uuid.UUID] = None
+    lote_nome: Optional[str] = None
+    local_id: uuid.UUID
+    local_nome: str
+    quantidade: Decimal
+
+    class Config:
+        from_attributes = True
+
+class SaldoVarianteTotal(BaseModel):
+    """Saldo total de uma variante (somado em todos os locais/lotes filtrados)."""
+    variante_produto_id: uuid.UUID
+    quantidade: Decimal
+
+class SaldoConsulta(BaseModel):
+    """Consulta em massa: saldos totais de uma lista de variantes."""
+    variante_ids: List[uuid.UUID] = Field(..., min_length=1, max_length=5000)
+    local_id: Optional[uuid.UUID] = None
+    incluir_sublocais: bool = True
+
+class SaldoDivergencia(BaseModel):
+    """Diferença entre a tabela de saldos e o livro razão (verificação)."""
+    variante_produto_id: uuid.UUID
+    lote_id: Optional[uuid.UUID] = None
+    local_id: uuid.UUID
+    quantidade_saldo: Decimal
+    quantidade_razao: Decimal
+
+class SaldoReconstrucao(BaseModel):
+    """Resultado de uma reconstrução completa dos saldos."""
+    saldos: int
+
+# --- Schemas de Fechos (checkpoints) ---
+
+class SaldoFechoCreate(BaseModel):
+    """Cria um fecho de saldos na data indicada (movimentos anteriores a essa data)."""
+    data_fecho: datetime
+
+class SaldoFecho(BaseModel):
+    data_fecho: datetime
+    linhas: int
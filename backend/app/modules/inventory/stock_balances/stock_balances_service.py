@@ -0,0 +1,158 @@
+# backend/app/modules/inventory/stock_balances/stock_balances_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import List, Optional
+from datetime import datetime, timezone
+import uuid
+
+from . import stock_balances_crud, stock_balances_schemas
+
+class SaldoEstoqueService:
+    def get_all(
+        self,
+        db: Session,
+        *,
+        variante_produto_id: Optional[uuid.UUID],
+        local_id: Optional[uuid.UUID],
+        lote_id: Optional[uuid.UUID],
+        incluir_sublocais: bool,
+        incluir_zerados: bool,
+        skip: int,
+        limit: int,
+    ) -> List[dict]:
+        return stock_balances_crud.saldo_estoque_crud.get_multi(
+            db,
+            variante_produto_id=variante_produto_id,
+            local_id=local_id,
+            lote_id=lote_id,
+            incluir_sublocais=incluir_sublocais,
+            incluir_zerados=incluir_zerados,
+            skip=skip,
+            limit=limit,
+        )
+
+    def get_totals(self, db: Session, *, consulta: stock_balances_schemas.SaldoConsulta) -> List[stock_balances_schemas.SaldoVarianteTotal]:
+        """Saldos totais de uma lista de variantes; as variantes sem saldo vêm com 0."""
+        variante_ids = list(dict.fromkeys(consulta.variante_ids))
+        totals = stock_balances_crud.saldo_estoque_crud.get_totals(
+            db,
+            variante_ids=variante_ids,
+            local_id=consulta.local_id,
+            incluir_sublocais=consulta.incluir_sublocais,
+        )
+        return [
+            stock_balances_schemas.SaldoVarianteTotal(variante_produto_id=variante_id, quantidade=totals.get(variante_id, 0))
+            for variante_id in variante_ids
+        ]
+
+    def rebuild(self, db: Session) -> stock_balances_schemas.SaldoReconstrucao:
+        """Reconstrói todos os saldos a partir do livro razão, numa única transação."""
+        try:
+            saldos = stock_balances_crud.saldo_estoque_crud.rebuild(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return stock_balances_schemas.SaldoReconstrucao(saldos=saldos)
+
+    def verify(self, db: Session, *, limit: int) -> List[dict]:
+        return stock_balances_crud.saldo_estoque_crud.verify(db, limit=limit)
+
+    # --- Saldos históricos ---
+
+    def get_as_of(
+        self,
+        db: Session,
+        *,
+        data: datetime,
+        variante_produto_id: Optional[uuid.UUID],
+        local_id: Optional[uuid.UUID],
+        lote_id: Optional[uuid.UUID],
+        incluir_sublocais: bool,
+        incluir_zerados: bool,
+        skip: int,
+        limit: int,
+    ) -> List[dict]:
+        return stock_balances_crud.saldo_estoque_crud.get_as_of(
+            db,
+            as_of=to_ledger_datetime(data),
+            variante_produto_id=variante_produto_id,
+            local_id=local_id,
+            lote_id=lote_id,
+            incluir_sublocais=incluir_sublocais,
+            incluir_zerados=incluir_zerados,
+            skip=skip,
+            limit=limit,
+        )
+
+    def get_checkpoints(self, db: Session) -> List[dict]:
+        return stock_balances_crud.saldo_estoque_crud.get_checkpoints(db)
+
+    def create_checkpoint(self, db: Session, *, obj_in: stock_balances_schemas.SaldoFechoCreate) -> stock_balances_schemas.SaldoFecho:
+        """
+        Os fechos só podem ser criados por ordem cronológica e até ao momento
+        atual: um fecho no meio dos existentes ou no futuro ficaria incoerente.
+        """
+        data_fecho = to_ledger_datetime(obj_in.data_fecho)
+        if data_fecho > utc_now():
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A data do fecho não pode estar no futuro.")
+        ultimo = stock_balances_crud.saldo_estoque_crud.latest_checkpoint(db)
+        if ultimo is not None and data_fecho <= ultimo:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Já existe um fecho em {ultimo.isoformat()}; os novos fechos têm de ser posteriores."
+            )
+        return self._create_checkpoints(db, [data_fecho])[0]
+
+    def create_monthly_checkpoints(self, db: Session) -> List[stock_balances_schemas.SaldoFecho]:
+        """
+        Cria os fechos mensais em falta (dia 1 de cada mês, 00:00) desde o
+        último fecho (ou o primeiro movimento) até ao mês atual.
+        """
+        crud = stock_balances_crud.saldo_estoque_crud
+        ultimo = crud.latest_checkpoint(db)
+        inicio = ultimo or crud.first_movement_date(db)
+        if inicio is None:
+            return []
+
+        datas = []
+        data_fecho = next_month_start(inicio)
+        limite = utc_now()
+        while data_fecho <= limite:
+            datas.append(data_fecho)
+            data_fecho = next_month_start(data_fecho)
+        return self._create_checkpoints(db, datas)
+
+    def _create_checkpoints(self, db: Session, datas: List[datetime]) -> List[stock_balances_schemas.SaldoFecho]:
+        fechos = []
+        try:
+            # Cada fecho parte do anterior, pelo que o custo é o dos movimentos do período
+            for data_fecho in datas:
+                linhas = stock_balances_crud.saldo_estoque_crud.create_checkpoint(db, data_fecho=data_fecho)
+                fechos.append(stock_balances_schemas.SaldoFecho(data_fecho=data_fecho, linhas=linhas))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return fechos
+
+
+# --- Funções auxiliares de datas ---
+# As datas do livro razão são guardadas sem fuso horário (UTC).
+
+def utc_now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+def to_ledger_datetime(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def next_month_start(value: datetime) -> datetime:
+    """Primeiro dia do mês seguinte a 'value', às 00:00."""
+    if value.month == 12:
+        return datetime(value.year + 1, 1, 1)
+    return datetime(value.year, value.month + 1, 1)
+
+saldo_estoque_service = SaldoEstoqueService()
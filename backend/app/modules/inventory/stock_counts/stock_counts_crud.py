@@ -0,0 +1,221 @@
+# backend/app/modules/inventory/stock_counts/stock_counts_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, update, func, literal, case
+from sqlalchemy.dialects.postgresql import UUID, insert as pg_insert
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import uuid
+
+from ....core.crud_base import CRUDBase
+from .... import models
+from ....models.inventory.stock_count_model import CONTAGEM_EM_CONTAGEM, CONTAGEM_APROVADA
+from ....models.inventory.stock_movement_model import MOVIMENTO_CONCLUIDO
+from ..locations.locations_crud import local_crud
+from ..stock_balances.stock_balances_crud import saldo_estoque_crud, UPSERT_BATCH_SIZE
+from . import stock_counts_schemas
+
+class CRUDContagem(CRUDBase[models.ContagemInventario, stock_counts_schemas.ContagemCreate, stock_counts_schemas.ContagemUpdate]):
+    """
+    Contagens de inventário. As operações sobre as linhas são todas
+    set-based (INSERT ... SELECT, upsert multi-linha, UPDATE ... RETURNING),
+    para que contagens com dezenas de milhares de linhas não passem pelo ORM
+    linha a linha. Os métodos de linhas NÃO fazem commit.
+    """
+
+    def get_by_referencia(self, db: Session, *, referencia: str) -> Optional[models.ContagemInventario]:
+        return db.query(self.model).filter(self.model.referencia == referencia).first()
+
+    def create_with_responsavel(
+        self, db: Session, *, obj_in: stock_counts_schemas.ContagemCreate, responsavel_id: uuid.UUID
+    ) -> models.ContagemInventario:
+        db_obj = self.model(**obj_in.model_dump(), responsavel_id=responsavel_id)
+        db.add(db_obj)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def get_multi_filtered(
+        self, db: Session, *, status: Optional[str] = None, skip: int = 0, limit: int = 100
+    ) -> List[models.ContagemInventario]:
+        query = db.query(self.model)
+        if status:
+            query = query.filter(self.model.status == status)
+        return query.order_by(self.model.data_contagem.desc()).offset(skip).limit(limit).all()
+
+    def get_line_totals(self, db: Session, *, contagem_id: uuid.UUID) -> Dict[str, int]:
+        linha = models.ContagemInventarioLinha
+        stmt = select(
+            func.count().label("total_linhas"),
+            func.count().filter(linha.quantidade_contada.isnot(None)).label("linhas_contadas"),
+            func.count().filter(linha.diferenca != 0).label("linhas_com_diferenca"),
+        ).where(linha.contagem_id == contagem_id)
+        return dict(db.execute(stmt).mappings().one())
+
+    # --- Linhas ---
+
+    def snapshot_lines(self, db: Session, *, contagem: models.ContagemInventario, as_of: Optional[datetime]) -> int:
+        """
+        Cria as linhas da contagem com a quantidade do sistema de toda a
+        subárvore do local, numa única instrução INSERT ... SELECT.
+        Com 'as_of', usa os saldos históricos (fecho + movimentos); sem ele,
+        os saldos atuais.
+        """
+        if as_of is not None:
+            checkpoint = saldo_estoque_crud.latest_checkpoint(db, until=as_of)
+            saldos = saldo_estoque_crud.as_of_select(checkpoint=checkpoint, as_of=as_of).subquery("saldos")
+        else:
+            saldos = select(
+                models.SaldoEstoque.variante_produto_id,
+                models.SaldoEstoque.lote_id,
+                models.SaldoEstoque.local_id,
+                models.SaldoEstoque.quantidade,
+            ).subquery("saldos")
+
+        linha = models.ContagemInventarioLinha
+        result = db.execute(
+            pg_insert(linha).from_select(
+                ["id", "contagem_id", "variante_produto_id", "lote_id", "local_id", "quantidade_sistema"],
+                select(
+                    func.gen_random_uuid(),
+                    literal(contagem.id, UUID(as_uuid=True)),
+                    saldos.c.variante_produto_id,
+                    saldos.c.lote_id,
+                    saldos.c.local_id,
+                    saldos.c.quantidade,
+                ).where(
+                    saldos.c.local_id.in_(local_crud.subtree_ids(contagem.local_id)),
+                    saldos.c.quantidade != 0,
+                ),
+            ).on_conflict_do_nothing(constraint="uq_contagem_inventario_linhas_chave")
+        )
+        return result.rowcount
+
+    def upsert_counts(self, db: Session, *, contagem_id: uuid.UUID, linhas: List[stock_counts_schemas.ContagemLinhaInput]) -> None:
+        """
+        Regista as quantidades contadas com upserts multi-linha (em lotes).
+        As linhas que não existiam (stock encontrado sem saldo no sistema)
+        são criadas com quantidade_sistema = 0. A diferença é calculada em SQL.
+        """
+        linha = models.ContagemInventarioLinha
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "contagem_id": contagem_id,
+                "variante_produto_id": item.variante_produto_id,
+                "lote_id": item.lote_id,
+                "local_id": item.local_id,
+                "quantidade_sistema": 0,
+                "quantidade_contada": item.quantidade_contada,
+                "diferenca": item.quantidade_contada,
+            }
+            for item in linhas
+        ]
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(linha).values(rows[start:start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                constraint="uq_contagem_inventario_linhas_chave",
+                set_={
+                    "quantidade_contada": stmt.excluded.quantidade_contada,
+                    "diferenca": stmt.excluded.quantidade_contada - linha.quantidade_sistema,
+                },
+            )
+            db.execute(stmt)
+
+    def get_lines(
+        self,
+        db: Session,
+        *,
+        contagem_id: uuid.UUID,
+        apenas_divergencias: bool = False,
+        apenas_por_contar: bool = False,
+        skip: int = 0,
+        limit: int = 500,
+    ) -> List[Dict[str, Any]]:
+        linha = models.ContagemInventarioLinha
+        stmt = (
+            select(
+                linha.id,
+                linha.variante_produto_id,
+                models.VarianteProduto.referencia,
+                linha.lote_id,
+                models.Lote.nome.label("lote_nome"),
+                linha.local_id,
+                models.Local.nome.label("local_nome"),
+                linha.quantidade_sistema,
+                linha.quantidade_contada,
+                linha.diferenca,
+            )
+            .join(models.VarianteProduto, models.VarianteProduto.id == linha.variante_produto_id)
+            .join(models.Local, models.Local.id == linha.local_id)
+            .outerjoin(models.Lote, models.Lote.id == linha.lote_id)
+            .where(linha.contagem_id == contagem_id)
+        )
+        if apenas_divergencias:
+            stmt = stmt.where(linha.diferenca != 0)
+        if apenas_por_contar:
+            stmt = stmt.where(linha.quantidade_contada.is_(None))
+        stmt = stmt.order_by(models.Local.nome, models.VarianteProduto.referencia).offset(skip).limit(limit)
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def existing_locais_in_subtree(self, db: Session, *, local_id: uuid.UUID, ids: set) -> set:
+        """IDs de 'ids' que pertencem à subárvore do local (uma query)."""
+        return set(db.scalars(
+            select(models.Local.id).where(
+                models.Local.id.in_(ids),
+                models.Local.id.in_(local_crud.subtree_ids(local_id)),
+            )
+        ))
+
+    # --- Aprovação ---
+
+    def mark_approved(self, db: Session, *, contagem_id: uuid.UUID, aprovador_id: uuid.UUID) -> bool:
+        """
+        Passa a contagem de 'Em Contagem' a 'Aprovada' (UPDATE condicional).
+        Devolve False se outro pedido já a tiver aprovado entretanto.
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id == contagem_id, self.model.status == CONTAGEM_EM_CONTAGEM)
+            .values(status=CONTAGEM_APROVADA, aprovador_id=aprovador_id, data_aprovacao=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        return db.execute(stmt).rowcount == 1
+
+    def post_adjustments(
+        self, db: Session, *, contagem: models.ContagemInventario, usuario_id: uuid.UUID, data_movimento: datetime
+    ) -> List[Any]:
+        """
+        Lança no livro razão um movimento de ajuste por cada linha com diferença,
+        num único INSERT ... SELECT ... RETURNING:
+        sobra -> entrada no local da linha; falta -> saída do local da linha.
+        """
+        linha = models.ContagemInventarioLinha
+        mov = models.MovimentacaoLivroRazao
+        sobra = linha.diferenca > 0
+        result = db.execute(
+            insert(mov).from_select(
+                [
+                    "id", "referencia", "qtd_prevista", "qtd_realizada", "status", "data_movimento",
+                    "variante_produto_id", "lote_id", "local_origem_id", "local_destino_id", "usuario_id",
+                ],
+                select(
+                    func.gen_random_uuid(),
+                    literal(contagem.referencia),
+                    func.abs(linha.diferenca),
+                    func.abs(linha.diferenca),
+                    literal(MOVIMENTO_CONCLUIDO),
+                    literal(data_movimento),
+                    linha.variante_produto_id,
+                    linha.lote_id,
+                    case((sobra, None), else_=linha.local_id),
+                    case((sobra, linha.local_id), else_=None),
+                    literal(usuario_id, UUID(as_uuid=True)),
+                ).where(linha.contagem_id == contagem.id, linha.diferenca != 0),
+            ).returning(
+                mov.variante_produto_id, mov.lote_id, mov.local_origem_id, mov.local_destino_id, mov.qtd_realizada
+            )
+        )
+        return result.all()
+
+contagem_crud = CRUDContagem(models.ContagemInventario)
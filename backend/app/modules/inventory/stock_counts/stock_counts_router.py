@@ -0,0 +1,81 @@
+# backend/app/modules/inventory/stock_counts/stock_counts_router.py
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+import uuid
+
+from . import stock_counts_schemas, stock_counts_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/inventory/contagens",
+    tags=["Inventário - Contagens"]
+)
+
+@router.post("/", response_model=stock_counts_schemas.Contagem, status_code=status.HTTP_201_CREATED, summary="Criar uma contagem de inventário")
+def create_contagem_endpoint(
+    obj_in: stock_counts_schemas.ContagemCreate,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_counts_service.contagem_service.create(db, obj_in=obj_in, responsavel_id=current_user.id)
+
+@router.get("/", response_model=List[stock_counts_schemas.Contagem], summary="Listar contagens de inventário")
+def read_contagens_endpoint(
+    db: Session = Depends(get_db),
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100,
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_counts_service.contagem_service.get_all(db, status=status, skip=skip, limit=limit)
+
+@router.get("/{id}", response_model=stock_counts_schemas.ContagemResumo, summary="Obter uma contagem (com totais)")
+def read_contagem_endpoint(
+    id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_counts_service.contagem_service.get_summary(db, contagem_id=id)
+
+@router.get("/{id}/linhas", response_model=List[stock_counts_schemas.ContagemLinha], summary="Listar as linhas de uma contagem")
+def read_contagem_linhas_endpoint(
+    id: uuid.UUID,
+    db: Session = Depends(get_db),
+    apenas_divergencias: bool = False,
+    apenas_por_contar: bool = False,
+    skip: int = 0,
+    limit: int = Query(500, ge=1, le=5000),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_counts_service.contagem_service.get_lines(
+        db, contagem_id=id, apenas_divergencias=apenas_divergencias,
+        apenas_por_contar=apenas_por_contar, skip=skip, limit=limit,
+    )
+
+@router.post("/{id}/snapshot", response_model=stock_counts_schemas.ContagemSnapshotResult, summary="Gerar as linhas com as quantidades do sistema")
+def snapshot_contagem_endpoint(
+    id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_counts_service.contagem_service.snapshot(db, contagem_id=id)
+
+@router.put("/{id}/linhas", response_model=stock_counts_schemas.Contagem, summary="Registar quantidades contadas (em massa)")
+def update_contagem_linhas_endpoint(
+    id: uuid.UUID,
+    obj_in: stock_counts_schemas.ContagemLinhasUpdate,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_counts_service.contagem_service.register_counts(db, contagem_id=id, obj_in=obj_in)
+
+@router.post("/{id}/aprovar", response_model=stock_counts_schemas.ContagemAprovacaoResult, summary="Aprovar a contagem e lançar os ajustes")
+def approve_contagem_endpoint(
+    id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_counts_service.contagem_service.approve(db, contagem_id=id, aprovador_id=current_user.id)
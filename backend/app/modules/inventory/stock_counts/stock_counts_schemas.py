@@ -0,0 +1,68 @@
+# backend/app/modules/inventory/stock_counts/stock_counts_schemas.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+from decimal import Decimal
+import uuid
+
+# --- Schemas de Contagem de Inventário ---
+
+class ContagemBase(BaseModel):
+    referencia: str = Field(..., max_length=50)
+    data_contagem: datetime
+    local_id: uuid.UUID
+
+class ContagemCreate(ContagemBase):
+    pass
+
+class ContagemUpdate(BaseModel):
+    data_contagem: Optional[datetime] = None
+
+class Contagem(ContagemBase):
+    id: uuid.UUID
+    status: str
+    data_aprovacao: Optional[datetime] = None
+    responsavel_id: uuid.UUID
+    aprovador_id: Optional[uuid.UUID] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class ContagemResumo(Contagem):
+    """Contagem com os totais das linhas (calculados numa única query)."""
+    total_linhas: int = 0
+    linhas_contadas: int = 0
+    linhas_com_diferenca: int = 0
+
+# --- Schemas de Linhas ---
+
+class ContagemLinha(BaseModel):
+    id: uuid.UUID
+    variante_produto_id: uuid.UUID
+    referencia: str
+    lote_id: Optional[uuid.UUID] = None
+    lote_nome: Optional[str] = None
+    local_id: uuid.UUID
+    local_nome: str
+    quantidade_sistema: Decimal
+    quantidade_contada: Optional[Decimal] = None
+    diferenca: Optional[Decimal] = None
+
+class ContagemLinhaInput(BaseModel):
+    """Quantidade contada de um item; se a linha não existir (stock não previsto), é criada."""
+    variante_produto_id: uuid.UUID
+    lote_id: Optional[uuid.UUID] = None
+    local_id: uuid.UUID
+    quantidade_contada: Decimal = Field(..., ge=0)
+
+class ContagemLinhasUpdate(BaseModel):
+    linhas: List[ContagemLinhaInput] = Field(..., min_length=1, max_length=20000)
+
+class ContagemSnapshotResult(BaseModel):
+    linhas: int
+
+class ContagemAprovacaoResult(BaseModel):
+    contagem: Contagem
+    movimentos_ajuste: int
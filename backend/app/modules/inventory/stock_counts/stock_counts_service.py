@@ -0,0 +1,155 @@
+# backend/app/modules/inventory/stock_counts/stock_counts_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import List, Optional
+import uuid
+
+from .... import models
+from ....models.inventory.stock_count_model import CONTAGEM_EM_ABERTO, CONTAGEM_EM_CONTAGEM
+from . import stock_counts_crud, stock_counts_schemas
+from ..stock_balances.stock_balances_crud import saldo_estoque_crud
+from ..stock_balances.stock_balances_service import utc_now, to_ledger_datetime
+from ..stock_movements.stock_movements_crud import movimento_crud
+
+class ContagemService:
+    """
+    Fluxo de contagem de inventário:
+    1. Criar a contagem ('Em Aberto') para um local.
+    2. Snapshot: gera as linhas com as quantidades do sistema na data da contagem ('Em Contagem').
+    3. Registar as quantidades contadas (em massa).
+    4. Aprovar: lança os ajustes no livro razão e atualiza os saldos ('Aprovada').
+    """
+
+    def get_by_id(self, db: Session, contagem_id: uuid.UUID) -> models.ContagemInventario:
+        db_obj = stock_counts_crud.contagem_crud.get(db, id=contagem_id)
+        if not db_obj:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contagem de inventário não encontrada")
+        return db_obj
+
+    def get_summary(self, db: Session, contagem_id: uuid.UUID) -> stock_counts_schemas.ContagemResumo:
+        db_obj = self.get_by_id(db, contagem_id)
+        totals = stock_counts_crud.contagem_crud.get_line_totals(db, contagem_id=contagem_id)
+        return stock_counts_schemas.ContagemResumo(
+            **stock_counts_schemas.Contagem.model_validate(db_obj).model_dump(), **totals
+        )
+
+    def get_all(self, db: Session, *, status: Optional[str], skip: int, limit: int) -> List[models.ContagemInventario]:
+        return stock_counts_crud.contagem_crud.get_multi_filtered(db, status=status, skip=skip, limit=limit)
+
+    def create(
+        self, db: Session, *, obj_in: stock_counts_schemas.ContagemCreate, responsavel_id: uuid.UUID
+    ) -> models.ContagemInventario:
+        if stock_counts_crud.contagem_crud.get_by_referencia(db, referencia=obj_in.referencia):
+            raise HTTPException(status_code=400, detail=f"Já existe uma contagem com a referência '{obj_in.referencia}'.")
+        if not db.get(models.Local, obj_in.local_id):
+            raise HTTPException(status_code=400, detail=f"Local com id '{obj_in.local_id}' não encontrado.")
+        obj_in = obj_in.model_copy(update={"data_contagem": to_ledger_datetime(obj_in.data_contagem)})
+        return stock_counts_crud.contagem_crud.create_with_responsavel(db, obj_in=obj_in, responsavel_id=responsavel_id)
+
+    def get_lines(
+        self,
+        db: Session,
+        *,
+        contagem_id: uuid.UUID,
+        apenas_divergencias: bool,
+        apenas_por_contar: bool,
+        skip: int,
+        limit: int,
+    ) -> List[dict]:
+        self.get_by_id(db, contagem_id)
+        return stock_counts_crud.contagem_crud.get_lines(
+            db,
+            contagem_id=contagem_id,
+            apenas_divergencias=apenas_divergencias,
+            apenas_por_contar=apenas_por_contar,
+            skip=skip,
+            limit=limit,
+        )
+
+    def snapshot(self, db: Session, *, contagem_id: uuid.UUID) -> stock_counts_schemas.ContagemSnapshotResult:
+        contagem = self._get_with_status(db, contagem_id, CONTAGEM_EM_ABERTO)
+        as_of = contagem.data_contagem if contagem.data_contagem < utc_now() else None
+        try:
+            linhas = stock_counts_crud.contagem_crud.snapshot_lines(db, contagem=contagem, as_of=as_of)
+            contagem.status = CONTAGEM_EM_CONTAGEM
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return stock_counts_schemas.ContagemSnapshotResult(linhas=linhas)
+
+    def register_counts(
+        self, db: Session, *, contagem_id: uuid.UUID, obj_in: stock_counts_schemas.ContagemLinhasUpdate
+    ) -> models.ContagemInventario:
+        contagem = self._get_with_status(db, contagem_id, CONTAGEM_EM_CONTAGEM)
+        self._validate_lines(db, contagem, obj_in.linhas)
+        try:
+            stock_counts_crud.contagem_crud.upsert_counts(db, contagem_id=contagem.id, linhas=obj_in.linhas)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        db.refresh(contagem)
+        return contagem
+
+    def approve(
+        self, db: Session, *, contagem_id: uuid.UUID, aprovador_id: uuid.UUID
+    ) -> stock_counts_schemas.ContagemAprovacaoResult:
+        contagem = self._get_with_status(db, contagem_id, CONTAGEM_EM_CONTAGEM)
+        crud = stock_counts_crud.contagem_crud
+        totals = crud.get_line_totals(db, contagem_id=contagem.id)
+        por_contar = totals["total_linhas"] - totals["linhas_contadas"]
+        if por_contar:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Ainda existem {por_contar} linha(s) por contar."
+            )
+
+        try:
+            if not crud.mark_approved(db, contagem_id=contagem.id, aprovador_id=aprovador_id):
+                raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A contagem já foi aprovada.")
+            ajustes = crud.post_adjustments(db, contagem=contagem, usuario_id=aprovador_id, data_movimento=utc_now())
+            saldo_estoque_crud.apply_deltas(db, saldo_estoque_crud.deltas_from_movements(ajustes))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        db.refresh(contagem)
+        return stock_counts_schemas.ContagemAprovacaoResult(contagem=contagem, movimentos_ajuste=len(ajustes))
+
+    def _get_with_status(self, db: Session, contagem_id: uuid.UUID, expected: str) -> models.ContagemInventario:
+        contagem = self.get_by_id(db, contagem_id)
+        if contagem.status != expected:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Operação inválida: a contagem está '{contagem.status}' (esperado '{expected}')."
+            )
+        return contagem
+
+    def _validate_lines(
+        self, db: Session, contagem: models.ContagemInventario, linhas: List[stock_counts_schemas.ContagemLinhaInput]
+    ) -> None:
+        """Valida as referências de todas as linhas com uma query por tabela."""
+        chaves = [(linha.variante_produto_id, linha.lote_id, linha.local_id) for linha in linhas]
+        if len(set(chaves)) != len(chaves):
+            raise HTTPException(status_code=400, detail="Existem linhas repetidas (mesma variante, lote e local).")
+
+        erros = []
+        variantes = {linha.variante_produto_id for linha in linhas}
+        lotes = {linha.lote_id for linha in linhas if linha.lote_id}
+        locais = {linha.local_id for linha in linhas}
+
+        missing = variantes - movimento_crud.existing_ids(db, models.VarianteProduto, variantes)
+        if missing:
+            erros.append(f"Variante(s) de produto não encontrada(s): {', '.join(sorted(map(str, missing)))}.")
+        missing = lotes - movimento_crud.existing_ids(db, models.Lote, lotes)
+        if missing:
+            erros.append(f"Lote(s) não encontrado(s): {', '.join(sorted(map(str, missing)))}.")
+        missing = locais - stock_counts_crud.contagem_crud.existing_locais_in_subtree(db, local_id=contagem.local_id, ids=locais)
+        if missing:
+            erros.append(f"Local(is) fora do âmbito da contagem: {', '.join(sorted(map(str, missing)))}.")
+        if erros:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=" ".join(erros))
+
+contagem_service = ContagemService()
@@ -0,0 +1,75 @@
+# backend/app/modules/inventory/stock_movements/stock_movements_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, insert, update, func, or_
+from typing import Any, Dict, List, Optional, Set
+from datetime import datetime
+import uuid
+
+from .... import models
+from ....models.inventory.stock_movement_model import MOVIMENTO_PLANEADO, MOVIMENTO_CONCLUIDO
+
+class CRUDMovimento:
+    """
+    Acesso a dados do livro razão. O razão é 'append-only': os movimentos
+    só são inseridos ou passam de 'Planeado' a 'Concluído'.
+    Nenhum método faz commit (a transação é gerida pelo serviço).
+    """
+    model = models.MovimentacaoLivroRazao
+
+    def get_multi(
+        self,
+        db: Session,
+        *,
+        referencia: Optional[str] = None,
+        variante_produto_id: Optional[uuid.UUID] = None,
+        local_id: Optional[uuid.UUID] = None,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[models.MovimentacaoLivroRazao]:
+        stmt = select(self.model)
+        if referencia:
+            stmt = stmt.where(self.model.referencia == referencia)
+        if variante_produto_id:
+            stmt = stmt.where(self.model.variante_produto_id == variante_produto_id)
+        if local_id:
+            stmt = stmt.where(or_(self.model.local_origem_id == local_id, self.model.local_destino_id == local_id))
+        if status:
+            stmt = stmt.where(self.model.status == status)
+        stmt = stmt.order_by(self.model.data_movimento.desc()).offset(skip).limit(limit)
+        return list(db.scalars(stmt))
+
+    def create_many(self, db: Session, *, rows: List[Dict[str, Any]]) -> List[models.MovimentacaoLivroRazao]:
+        """Insere todos os movimentos num único INSERT multi-linha (com RETURNING)."""
+        return list(db.scalars(insert(self.model).returning(self.model), rows))
+
+    def complete_many(
+        self, db: Session, *, ids: List[uuid.UUID], data_movimento: datetime
+    ) -> List[models.MovimentacaoLivroRazao]:
+        """
+        Passa os movimentos 'Planeado' indicados a 'Concluído' num único UPDATE,
+        com a 'data_movimento' indicada (UTC sem fuso, como o resto do razão).
+        Devolve apenas os que mudaram de estado (os já concluídos são ignorados).
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.id.in_(ids), self.model.status == MOVIMENTO_PLANEADO)
+            .values(
+                status=MOVIMENTO_CONCLUIDO,
+                qtd_realizada=func.coalesce(self.model.qtd_realizada, self.model.qtd_prevista),
+                data_movimento=data_movimento,
+            )
+            .returning(self.model)
+            .execution_options(synchronize_session=False)
+        )
+        return list(db.scalars(stmt))
+
+    @staticmethod
+    def existing_ids(db: Session, model, ids: Set[uuid.UUID]) -> Set[uuid.UUID]:
+        """IDs de 'ids' que existem na tabela de 'model' (uma query por tabela)."""
+        if not ids:
+            return set()
+        return set(db.scalars(select(model.id).where(model.id.in_(ids))))
+
+movimento_crud = CRUDMovimento()
@@ -0,0 +1,47 @@
+# backend/app/modules/inventory/stock_movements/stock_movements_router.py
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+from typing import List, Optional
+import uuid
+
+from . import stock_movements_schemas, stock_movements_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/inventory/movimentos",
+    tags=["Inventário - Movimentos de Stock"]
+)
+
+@router.get("/", response_model=List[stock_movements_schemas.Movimento], summary="Listar movimentos do livro razão")
+def read_movimentos_endpoint(
+    db: Session = Depends(get_db),
+    referencia: Optional[str] = None,
+    variante_produto_id: Optional[uuid.UUID] = None,
+    local_id: Optional[uuid.UUID] = None,
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    current_user: models.Usuario = Depends(require_permission("inventory:read"))
+):
+    return stock_movements_service.movimento_service.get_all(
+        db, referencia=referencia, variante_produto_id=variante_produto_id,
+        local_id=local_id, status=status, skip=skip, limit=limit,
+    )
+
+@router.post("/", response_model=List[stock_movements_schemas.Movimento], status_code=status.HTTP_201_CREATED, summary="Lançar movimentos (em lote)")
+def create_movimentos_endpoint(
+    obj_in: stock_movements_schemas.MovimentoLoteCreate,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_movements_service.movimento_service.post_movements(db, obj_in=obj_in, usuario_id=current_user.id)
+
+@router.post("/concluir", response_model=List[stock_movements_schemas.Movimento], summary="Concluir movimentos planeados")
+def complete_movimentos_endpoint(
+    obj_in: stock_movements_schemas.MovimentoConcluir,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("inventory:admin"))
+):
+    return stock_movements_service.movimento_service.complete_movements(db, obj_in=obj_in)
@@ -0,0 +1,56 @@
+# backend/app/modules/inventory/stock_movements/stock_movements_schemas.py
+
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Literal, Optional
+from datetime import datetime
+from decimal import Decimal
+import uuid
+
+from ....models.inventory.stock_movement_model import MOVIMENTO_PLANEADO, MOVIMENTO_CONCLUIDO
+
+# --- Schemas de Movimentação (Livro Razão) ---
+
+class MovimentoBase(BaseModel):
+    referencia: str = Field(..., max_length=100)
+    variante_produto_id: uuid.UUID
+    lote_id: Optional[uuid.UUID] = None
+    local_origem_id: Optional[uuid.UUID] = None
+    local_destino_id: Optional[uuid.UUID] = None
+    qtd_prevista: Optional[Decimal] = None
+    qtd_realizada: Optional[Decimal] = None
+    preco_un: Optional[Decimal] = None
+
+class MovimentoCreate(MovimentoBase):
+    status: Literal[MOVIMENTO_PLANEADO, MOVIMENTO_CONCLUIDO] = MOVIMENTO_CONCLUIDO
+    data_movimento: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def check_movimento(self):
+        if not self.local_origem_id and not self.local_destino_id:
+            raise ValueError("O movimento precisa de um local de origem e/ou de destino.")
+        if self.local_origem_id and self.local_origem_id == self.local_destino_id:
+            raise ValueError("Os locais de origem e destino devem ser diferentes.")
+        if self.status == MOVIMENTO_CONCLUIDO and (self.qtd_realizada is None or self.qtd_realizada <= 0):
+            raise ValueError("Um movimento concluído precisa de uma quantidade realizada positiva.")
+        return self
+
+class MovimentoLoteCreate(BaseModel):
+    """Lançamento em lote: todos os movimentos são gravados na mesma transação."""
+    movimentos: List[MovimentoCreate] = Field(..., min_length=1, max_length=5000)
+
+class MovimentoConcluir(BaseModel):
+    """
+    Conclui movimentos planeados. Se 'qtd_realizada' não estiver definida
+    no movimento, é usada a 'qtd_prevista'.
+    """
+    ids: List[uuid.UUID] = Field(..., min_length=1, max_length=5000)
+
+class Movimento(MovimentoBase):
+    id: uuid.UUID
+    status: str
+    data_movimento: datetime
+    usuario_id: Optional[uuid.UUID] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
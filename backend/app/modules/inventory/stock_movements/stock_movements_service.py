@@ -0,0 +1,125 @@
+# backend/app/modules/inventory/stock_movements/stock_movements_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import List, Optional
+from datetime import datetime
+import uuid
+
+from .... import models
+from ....models.inventory.stock_movement_model import MOVIMENTO_CONCLUIDO
+from . import stock_movements_crud, stock_movements_schemas
+from ..stock_balances.stock_balances_crud import saldo_estoque_crud
+from ..stock_balances.stock_balances_service import utc_now, to_ledger_datetime
+
+class MovimentoService:
+    """
+    Lançamento de movimentos no livro razão.
+
+    Cada lançamento (ou conclusão) de movimentos 'Concluído' aplica os
+    deltas correspondentes na tabela de saldos na MESMA transação, pelo que
+    os saldos nunca ficam desalinhados do razão.
+    """
+
+    def get_all(
+        self,
+        db: Session,
+        *,
+        referencia: Optional[str],
+        variante_produto_id: Optional[uuid.UUID],
+        local_id: Optional[uuid.UUID],
+        status: Optional[str],
+        skip: int,
+        limit: int,
+    ) -> List[models.MovimentacaoLivroRazao]:
+        return stock_movements_crud.movimento_crud.get_multi(
+            db,
+            referencia=referencia,
+            variante_produto_id=variante_produto_id,
+            local_id=local_id,
+            status=status,
+            skip=skip,
+            limit=limit,
+        )
+
+    def post_movements(
+        self, db: Session, *, obj_in: stock_movements_schemas.MovimentoLoteCreate, usuario_id: uuid.UUID
+    ) -> List[models.MovimentacaoLivroRazao]:
+        self._validate_foreign_keys(db, obj_in.movimentos)
+
+        agora = utc_now()
+        rows = [
+            {
+                **movimento.model_dump(exclude={"data_movimento"}),
+                "data_movimento": to_ledger_datetime(movimento.data_movimento) if movimento.data_movimento else agora,
+                "usuario_id": usuario_id,
+            }
+            for movimento in obj_in.movimentos
+        ]
+        self._check_closed_period(db, min(row["data_movimento"] for row in rows))
+        try:
+            movimentos = stock_movements_crud.movimento_crud.create_many(db, rows=rows)
+            concluidos = [mov for mov in movimentos if mov.status == MOVIMENTO_CONCLUIDO]
+            saldo_estoque_crud.apply_deltas(db, saldo_estoque_crud.deltas_from_movements(concluidos))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return movimentos
+
+    def complete_movements(
+        self, db: Session, *, obj_in: stock_movements_schemas.MovimentoConcluir
+    ) -> List[models.MovimentacaoLivroRazao]:
+        agora = utc_now()
+        self._check_closed_period(db, agora)
+        try:
+            movimentos = stock_movements_crud.movimento_crud.complete_many(
+                db, ids=list(set(obj_in.ids)), data_movimento=agora
+            )
+            sem_quantidade = [str(mov.id) for mov in movimentos if not mov.qtd_realizada or mov.qtd_realizada <= 0]
+            if sem_quantidade:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"Movimentos sem quantidade realizada ou prevista: {', '.join(sem_quantidade)}"
+                )
+            saldo_estoque_crud.apply_deltas(db, saldo_estoque_crud.deltas_from_movements(movimentos))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return movimentos
+
+    def _check_closed_period(self, db: Session, data_movimento: datetime) -> None:
+        """Não são aceites movimentos com data anterior ao último fecho de saldos."""
+        ultimo_fecho = saldo_estoque_crud.latest_checkpoint(db)
+        if ultimo_fecho is not None and data_movimento < ultimo_fecho:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Período já fechado: não são aceites movimentos anteriores a {ultimo_fecho.isoformat()}."
+            )
+
+    def _validate_foreign_keys(self, db: Session, movimentos: List[stock_movements_schemas.MovimentoCreate]) -> None:
+        """Valida todas as referências do lote com uma query por tabela."""
+        crud = stock_movements_crud.movimento_crud
+        variantes = {mov.variante_produto_id for mov in movimentos}
+        lotes = {mov.lote_id for mov in movimentos if mov.lote_id}
+        locais = {
+            local_id
+            for mov in movimentos
+            for local_id in (mov.local_origem_id, mov.local_destino_id)
+            if local_id
+        }
+
+        missing = []
+        for label, model, ids in (
+            ("Variante(s) de produto", models.VarianteProduto, variantes),
+            ("Lote(s)", models.Lote, lotes),
+            ("Local(is)", models.Local, locais),
+        ):
+            missing_ids = ids - crud.existing_ids(db, model, ids)
+            if missing_ids:
+                missing.append(f"{label} não encontrado(s): {', '.join(sorted(map(str, missing_ids)))}.")
+        if missing:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=" ".join(missing))
+
+movimento_service = MovimentoService()
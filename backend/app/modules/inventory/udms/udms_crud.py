@@ -1,8 +1,9 @@
 # backend/app/modules/inventory/udms/udms_crud.py
 
 from sqlalchemy.orm import Session, joinedload, with_loader_criteria, selectinload
-from sqlalchemy import or_, asc, desc, func, inspect, String, Text, and_
-from typing import List, Optional
+from sqlalchemy import or_, asc, desc, func, inspect, String, Text, and_, select, update, case
+from typing import List, Optional, Tuple
+from decimal import Decimal
 
 from ....core.crud_base import CRUDBase
 from .... import models
@@ -111,5 +112,27 @@ class CRUDUdm(CRUDBase[models.Udm, udms_schemas.UdmCreate, udms_schemas.UdmUpdat
         db.refresh(db_obj)
         return db_obj
 
+    def get_conversion_rows(self, db: Session) -> List[Tuple[str, str, Decimal]]:
+        """(id, categoria_udm_id, proporcao_combinada) de todas as UDMs, numa só query."""
+        stmt = select(self.model.id, self.model.categoria_udm_id, self.model.proporcao_combinada)
+        return [tuple(row) for row in db.execute(stmt)]
+
+    def rescale_category(self, db: Session, *, categoria_udm_id: str, new_ref_udm_id: str, factor: Decimal) -> None:
+        """
+        Recalcula as proporções de toda a categoria num único UPDATE:
+        a nova referência fica com 1 e as restantes são divididas por 'factor'.
+        NÃO faz commit.
+        """
+        stmt = (
+            update(self.model)
+            .where(self.model.categoria_udm_id == categoria_udm_id)
+            .values(proporcao_combinada=case(
+                (self.model.id == new_ref_udm_id, 1),
+                else_=self.model.proporcao_combinada / factor,
+            ))
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(stmt)
+
 categoria_udm_crud = CRUDCategoriaUdm(models.CategoriaUdm)
 udm_crud = CRUDUdm(models.Udm)
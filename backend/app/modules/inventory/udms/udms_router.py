@@ -52,6 +52,10 @@ def create_udm_endpoint(obj_in: udms_schemas.UdmCreate, db: Session = Depends(ge
 def read_udm_endpoint(db: Session = Depends(get_db), skip: int = 0, limit: int = 100, search: Optional[str] = None, sort_by: Optional[str] = None, sort_order: str = "asc", is_active: Optional[bool] = None, current_user: models.Usuario = Depends(require_permission("inventory:read"))):
     return udms_service.udm_service.get_all_udm(db, skip=skip, limit=limit, search=search, sort_by=sort_by, sort_order=sort_order, is_active=is_active)
     
+@router_udm.post("/converter", response_model=List[udms_schemas.ConversaoUdmResultado], summary="Converter quantidades entre Unidades de Medida (em lote)")
+def convert_udm_endpoint(pedido: udms_schemas.ConversaoUdmPedido, db: Session = Depends(get_db), current_user: models.Usuario = Depends(require_permission("inventory:read"))):
+    return udms_service.conversao_udm_service.convert_request(db, pedido=pedido)
+
 @router_udm.put("/{id}", response_model=udms_schemas.Udm, summary="Atualizar uma Unidade de Medida")
 def update_udm_endpoint(id: str, obj_in: udms_schemas.UdmUpdate, db: Session = Depends(get_db), current_user: models.Usuario = Depends(require_permission("inventory:admin"))):
     return udms_service.udm_service.update_udm(db, id=id, obj_in=obj_in)
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from decimal import Decimal
 
 # --- Schemas de Unidade de Medida (Udm) ---
 
@@ -52,5 +53,18 @@ class UdmUpdate(BaseModel):
     proporcao_combinada: Optional[float] = Field(None, gt=0, description="Nova proporção (deve ser > 0)")
     categoria_udm_id: Optional[str] = Field(None, description="ID da nova categoria para mover a UDM")
 
+# --- Schemas de Conversão de Quantidades ---
+
+class ConversaoUdmItem(BaseModel):
+    quantidade: Decimal
+    udm_origem_id: str
+    udm_destino_id: str
+
+class ConversaoUdmPedido(BaseModel):
+    itens: List[ConversaoUdmItem] = Field(..., min_length=1, max_length=10000)
+
+class ConversaoUdmResultado(ConversaoUdmItem):
+    quantidade_convertida: Decimal
+
 # Garante que referências forward ('CategoriaUdm') sejam resolvidas
 CategoriaUdm.model_rebuild()
@@ -2,11 +2,22 @@
 
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+from decimal import Decimal
 
 from .... import models
+from ....core.cache import MemoryCache, invalidate_on_commit
 from . import udms_crud, udms_schemas
 
+# --- CACHE DA MATRIZ DE CONVERSÃO ---
+# A matriz (por categoria) fica em memória até que uma UDM ou categoria
+# seja alterada e confirmada.
+udm_conversion_cache = MemoryCache(maxsize=1)
+invalidate_on_commit(udm_conversion_cache, models.Udm, models.CategoriaUdm)
+
+# {udm_id: (categoria_udm_id, {udm_destino_id: fator})}
+MatrizConversao = Dict[str, Tuple[str, Dict[str, Decimal]]]
+
 class UdmService:
     def get_all_categorias_udm(self, db: Session, *, skip: int, limit: int, is_active: Optional[bool], search: Optional[str], sort_by: Optional[str], sort_order: str) -> List[models.CategoriaUdm]:
         return udms_crud.categoria_udm_crud.get_multi(db, skip=skip, limit=limit, is_active=is_active, search=search, sort_by=sort_by, sort_order=sort_order)
@@ -50,11 +61,14 @@ class UdmService:
         if db_category.unidade_referencia_id == new_ref_udm_id:
             raise HTTPException(status_code=400, detail="Esta UDM já é a referência.")
         try:
-            conversion_factor = new_ref_udm.proporcao_combinada
-            for udm in db_category.udms:
-                udm.proporcao_combinada = udm.proporcao_combinada / conversion_factor
-            new_ref_udm.proporcao_combinada = 1.0
+            udms_crud.udm_crud.rescale_category(
+                db,
+                categoria_udm_id=category_id,
+                new_ref_udm_id=new_ref_udm_id,
+                factor=new_ref_udm.proporcao_combinada
+            )
             db_category.unidade_referencia_id = new_ref_udm_id
+            # O commit expira a sessão: as UDMs são recarregadas já recalculadas
             db.commit()
             db.refresh(db_category)
             return db_category
@@ -98,3 +112,64 @@ class UdmService:
         return udms_crud.udm_crud.update_status(db, db_obj=db_udm, is_active=is_active)
 
 udm_service = UdmService()
+
+
+class ConversaoUdmService:
+    """
+    Conversão de quantidades entre UDMs da mesma categoria.
+
+    A matriz de fatores (origem -> destino) de todas as categorias é
+    calculada uma vez a partir das proporções e guardada em cache; cada
+    conversão passa a ser uma consulta a um dicionário, sem ir à BD.
+    """
+
+    def get_matrix(self, db: Session) -> MatrizConversao:
+        return udm_conversion_cache.get_or_set("matriz", lambda: self._build_matrix(db))
+
+    def _build_matrix(self, db: Session) -> MatrizConversao:
+        # quantidade_destino = quantidade * proporcao(origem) / proporcao(destino)
+        por_categoria: Dict[str, Dict[str, Decimal]] = {}
+        for udm_id, categoria_id, proporcao in udms_crud.udm_crud.get_conversion_rows(db):
+            por_categoria.setdefault(categoria_id, {})[udm_id] = Decimal(proporcao)
+        matriz: MatrizConversao = {}
+        for categoria_id, proporcoes in por_categoria.items():
+            for origem, p_origem in proporcoes.items():
+                matriz[origem] = (
+                    categoria_id,
+                    {destino: p_origem / p_destino for destino, p_destino in proporcoes.items()},
+                )
+        return matriz
+
+    def convert_many(self, db: Session, itens: Iterable[Tuple[Decimal, str, str]]) -> List[Decimal]:
+        """
+        Converte em lote pares (quantidade, udm_origem, udm_destino).
+        Levanta 400 se alguma UDM não existir ou as categorias forem diferentes.
+        """
+        matriz = self.get_matrix(db)
+        resultado = []
+        for quantidade, origem, destino in itens:
+            linha = matriz.get(origem)
+            if linha is None or destino not in matriz:
+                raise HTTPException(status_code=400, detail=f"UDM '{origem if linha is None else destino}' não encontrada.")
+            fator = linha[1].get(destino)
+            if fator is None:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Não é possível converter '{origem}' em '{destino}': pertencem a categorias diferentes."
+                )
+            resultado.append(Decimal(quantidade) * fator)
+        return resultado
+
+    def convert(self, db: Session, *, quantidade: Decimal, udm_origem_id: str, udm_destino_id: str) -> Decimal:
+        return self.convert_many(db, [(quantidade, udm_origem_id, udm_destino_id)])[0]
+
+    def convert_request(self, db: Session, *, pedido: udms_schemas.ConversaoUdmPedido) -> List[udms_schemas.ConversaoUdmResultado]:
+        convertidas = self.convert_many(
+            db, [(item.quantidade, item.udm_origem_id, item.udm_destino_id) for item in pedido.itens]
+        )
+        return [
+            udms_schemas.ConversaoUdmResultado(**item.model_dump(), quantidade_convertida=quantidade)
+            for item, quantidade in zip(pedido.itens, convertidas)
+        ]
+
+conversao_udm_service = ConversaoUdmService()
@@ -7,7 +7,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_db
+from app.core.dependency_guard import DependencyGuard, BlockingRelation
 from app.models.maintenance.asset_category_model import AssetCategory
+from app.models.maintenance.asset_model import Asset
 from .asset_categories_crud import asset_category_crud
 from .asset_categories_schemas import AssetCategoryCreate, AssetCategoryRead, AssetCategoryUpdate
 
@@ -16,6 +18,12 @@ router = APIRouter(
     tags=["Maintenance - Asset Categories"],
 )
 
+# Relações que impedem a eliminação de uma Categoria (verificadas com EXISTS)
+asset_category_delete_guard = DependencyGuard(
+    "a categoria",
+    BlockingRelation(Asset.category_id, "Existem ativos associados a ela."),
+)
+
 @router.post("/", response_model=AssetCategoryRead, status_code=status.HTTP_201_CREATED)
 def create_asset_category(
     category_in: AssetCategoryCreate, 
@@ -108,10 +116,6 @@ def delete_asset_category(
         )
 
     # Lógica de negócio: não permitir exclusão se houver ativos associados
-    if db_category.assets:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Não é possível deletar a categoria, pois existem ativos associados a ela.",
-        )
+    asset_category_delete_guard.check(db, category_id)
 
     return asset_category_crud.remove(db=db, id=category_id)
@@ -1,13 +1,25 @@
 # File: backend/app/modules/maintenance/assets/assets_crud.py
 
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Union
 import uuid
 from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy import select, func, asc, desc
 
 from app.core.crud_base import CRUDBase
+from app.core.typeahead import TypeaheadSource
 from app.models.maintenance.asset_model import Asset
 from .assets_schemas import AssetCreate, AssetUpdate
+from .hierarchy.asset_hierarchy_crud import asset_hierarchy_crud
+from app.modules.inventory.locations.locations_crud import local_crud
+
+# Seletor de ativos (TAG + nome), com índices de trigramas
+asset_typeahead = TypeaheadSource(
+    Asset,
+    code=Asset.internal_tag,
+    label=Asset.name,
+    search=(Asset.name,),
+)
+
 
 class CRUDAsset(CRUDBase[Asset, AssetCreate, AssetUpdate]):
     """Classe CRUD específica para o modelo Asset."""
@@ -35,14 +47,24 @@ class CRUDAsset(CRUDBase[Asset, AssetCreate, AssetUpdate]):
         limit: int = 100,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
-        sort_order: str = "asc"
+        sort_order: str = "asc",
+        subtree_of: Optional[uuid.UUID] = None,
+        location_subtree_of: Optional[uuid.UUID] = None
     ) -> List[Asset]:
         """
         Obtém múltiplos ativos com otimização de carregamento (Eager Loading)
         e funcionalidades de pesquisa e ordenação.
+        'subtree_of' limita o resultado aos ativos na subárvore desse ativo.
+        'location_subtree_of' limita aos ativos nesse local ou num dos seus sublocais.
         """
         statement = select(self.model)
 
+        # Filtro de hierarquia (tabela de fecho, uma única subquery indexada)
+        if subtree_of:
+            statement = statement.where(self.model.id.in_(asset_hierarchy_crud.subtree_ids(subtree_of)))
+        if location_subtree_of:
+            statement = statement.where(self.model.location_id.in_(local_crud.subtree_ids(location_subtree_of)))
+
         # Filtro de pesquisa (no campo 'name' e 'internal_tag')
         if search:
             statement = statement.where(
@@ -77,6 +99,40 @@ class CRUDAsset(CRUDBase[Asset, AssetCreate, AssetUpdate]):
         result = db.scalars(statement).all()
         return list(result)
 
+    def create(self, db: Session, *, obj_in: AssetCreate) -> Asset:
+        """
+        Cria o ativo e regista-o na tabela de fecho da hierarquia,
+        na mesma transação.
+        """
+        db_obj = self.model(**obj_in.model_dump())
+        db.add(db_obj)
+        db.flush()  # Garante o INSERT do ativo antes das linhas de fecho
+        asset_hierarchy_crud.insert_node(db, asset_id=db_obj.id, parent_id=db_obj.parent_asset_id)
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
+    def update(self, db: Session, *, db_obj: Asset, obj_in: Union[AssetUpdate, Dict[str, Any]]) -> Asset:
+        """
+        Atualiza o ativo e, se o pai mudou, move a sua subárvore na
+        tabela de fecho, na mesma transação.
+        (A validação de ciclos é feita no 'service'.)
+        """
+        update_data = obj_in if isinstance(obj_in, dict) else obj_in.model_dump(exclude_unset=True)
+        old_parent_id = db_obj.parent_asset_id
+
+        for field in update_data:
+            if hasattr(db_obj, field):
+                setattr(db_obj, field, update_data[field])
+
+        if db_obj.parent_asset_id != old_parent_id:
+            db.flush()
+            asset_hierarchy_crud.move_subtree(db, asset_id=db_obj.id, new_parent_id=db_obj.parent_asset_id)
+
+        db.commit()
+        db.refresh(db_obj)
+        return db_obj
+
     def get_by_internal_tag(self, db: Session, *, internal_tag: str) -> Optional[Asset]:
         """
         Busca um ativo pela sua 'internal_tag' (case-insensitive).
@@ -6,11 +6,18 @@ from fastapi import APIRouter, Depends, Query, Path, Body, status
 
 from sqlalchemy.orm import Session
 from app.core.dependencies import get_db, get_current_active_user
+from app.core.typeahead import TypeaheadItem
 from app.models.administration.user_model import Usuario
 
 # Importa os schemas e o serviço da fatia "Assets"
 from .assets_schemas import AssetRead, AssetCreate, AssetUpdate
 from .assets_service import asset_service, AssetService
+# Sub-fatia de Hierarquia (subárvore / antecessores)
+from .hierarchy.asset_hierarchy_router import router as hierarchy_router
+# Sub-fatia de Importação em massa
+from .importer.asset_import_router import router as import_router
+# Sub-fatia de Resumo (ecrã de detalhe)
+from .summary.asset_summary_router import router as summary_router
 
 # --- CORREÇÃO AQUI ---
 # Alterado de "/maintenance/assets" para "/assets".
@@ -22,6 +29,14 @@ router = APIRouter(
 )
 # --- FIM DA CORREÇÃO ---
 
+# --- INCLUSÃO (SUB-FATIA DE HIERARQUIA) ---
+# Incluída antes das rotas '/{asset_id}' para que os caminhos estáticos
+# da hierarquia não sejam capturados por elas.
+router.include_router(hierarchy_router)
+router.include_router(import_router)
+router.include_router(summary_router)
+# --- FIM DA INCLUSÃO ---
+
 @router.post(
     "/",
     response_model=AssetRead,
@@ -55,7 +70,9 @@ def read_assets(
     limit: int = Query(100, ge=1, le=500, description="Número máximo de registos a retornar"),
     search: Optional[str] = Query(None, description="Pesquisa em campos de texto (nome, tag, serial, descrição)"),
     sort_by: Optional[str] = Query(None, description="Campo para ordenar (ex: 'name', 'location.name')"),
-    sort_order: str = Query("asc", description="Ordem de ordenação: 'asc' ou 'desc'")
+    sort_order: str = Query("asc", description="Ordem de ordenação: 'asc' ou 'desc'"),
+    subtree_of: Optional[uuid.UUID] = Query(None, description="Apenas ativos na subárvore deste Ativo (inclui o próprio)"),
+    location_subtree_of: Optional[uuid.UUID] = Query(None, description="Apenas ativos neste Local ou nos seus sublocais")
 ):
     """
     Obtém uma lista de ativos com filtros de paginação, busca e ordenação.
@@ -69,10 +86,29 @@ def read_assets(
         limit=limit, 
         search=search, 
         sort_by=sort_by, 
-        sort_order=sort_order
+        sort_order=sort_order,
+        subtree_of=subtree_of,
+        location_subtree_of=location_subtree_of
     )
 
 
+@router.get(
+    "/typeahead",
+    response_model=List[TypeaheadItem],
+    summary="Pesquisa rápida de Ativos (seletor)"
+)
+def typeahead_assets(
+    db: Session = Depends(get_db),
+    q: str = Query(..., min_length=1, description="Início da TAG ou parte do nome"),
+    limit: int = Query(10, ge=1, le=50, description="Número máximo de resultados")
+):
+    """
+    Devolve apenas id, TAG e nome dos primeiros ativos que correspondem
+    a 'q' (TAG exata e por prefixo primeiro), para os seletores da UI.
+    """
+    return asset_service.typeahead_assets(db=db, q=q, limit=limit)
+
+
 @router.get(
     "/{asset_id}",
     response_model=AssetRead,
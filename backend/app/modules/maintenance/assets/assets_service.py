@@ -6,14 +6,28 @@ from typing import List, Optional
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
+from app.core.dependency_guard import DependencyGuard, BlockingRelation
 from app.models.maintenance.asset_model import Asset
-from .assets_crud import crud_asset, CRUDAsset
+from app.models.maintenance.work_order_model import WorkOrder
+from app.models.maintenance.pm_plan_model import PMPlan
+from .assets_crud import crud_asset, CRUDAsset, asset_typeahead
 from .assets_schemas import AssetCreate, AssetUpdate
+from .hierarchy.asset_hierarchy_crud import asset_hierarchy_crud
 
 # Importamos os CRUDS de outras fatias para validar as Chaves Estrangeiras (FKs)
 from app.modules.inventory.locations.locations_crud import local_crud
 from app.modules.maintenance.manufacturers.manufacturers_crud import manufacturer_crud
 from app.modules.maintenance.asset_categories.asset_categories_crud import asset_category_crud
+from app.modules.inventory.scan.scan_service import scan_service, TipoCodigo
+
+# Relações que impedem a eliminação de um Ativo (verificadas com EXISTS)
+asset_delete_guard = DependencyGuard(
+    "o ativo",
+    BlockingRelation(WorkOrder.asset_id, "Ele possui Ordens de Serviço associadas."),
+    BlockingRelation(Asset.parent_asset_id, "Ele possui sub-ativos (ativos filhos) associados. Mova os sub-ativos primeiro."),
+    BlockingRelation(PMPlan.asset_id, "Ele está associado a Planos de Manutenção Preventiva."),
+)
+
 
 class AssetService:
     """
@@ -47,7 +61,9 @@ class AssetService:
         limit: int = 100,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
-        sort_order: str = "asc"
+        sort_order: str = "asc",
+        subtree_of: Optional[uuid.UUID] = None,
+        location_subtree_of: Optional[uuid.UUID] = None
     ) -> List[Asset]:
         """
         Busca uma lista de ativos, aplicando filtros de paginação e busca.
@@ -59,9 +75,15 @@ class AssetService:
             limit=limit, 
             search=search, 
             sort_by=sort_by, 
-            sort_order=sort_order
+            sort_order=sort_order,
+            subtree_of=subtree_of,
+            location_subtree_of=location_subtree_of
         )
 
+    def typeahead_assets(self, db: Session, *, q: Optional[str], limit: int = 10) -> List[dict]:
+        """Seletor compacto (id, TAG, nome) para os formulários da UI."""
+        return asset_typeahead.search(db, q, limit=limit)
+
     def create_asset(self, db: Session, *, obj_in: AssetCreate) -> Asset:
         """
         Cria um novo ativo após validar os dados de entrada.
@@ -89,8 +111,10 @@ class AssetService:
                                     category_id=obj_in.category_id,
                                     parent_asset_id=obj_in.parent_asset_id)
         
-        # 3. Criação no banco
-        return self.crud_asset.create(db=db, obj_in=obj_in)
+        # 3. Criação no banco (e registo da TAG no mapa do scanner)
+        db_asset = self.crud_asset.create(db=db, obj_in=obj_in)
+        scan_service.record_change(TipoCodigo.ATIVO, db_asset.id, old_code=None, new_code=db_asset.internal_tag)
+        return db_asset
 
     def update_asset(self, db: Session, *, asset_id: uuid.UUID, obj_in: AssetUpdate) -> Asset:
         """
@@ -126,13 +150,20 @@ class AssetService:
                                     parent_asset_id=update_data.get("parent_asset_id"),
                                     current_asset_id=asset_id) # Passa o ID atual para evitar auto-referência
         
-        # 4. Atualização no banco
-        return self.crud_asset.update(db=db, db_obj=db_asset, obj_in=update_data)
+        # 4. Atualização no banco (e da TAG no mapa do scanner)
+        old_tag = db_asset.internal_tag
+        db_asset = self.crud_asset.update(db=db, db_obj=db_asset, obj_in=update_data)
+        scan_service.record_change(TipoCodigo.ATIVO, db_asset.id, old_code=old_tag, new_code=db_asset.internal_tag)
+        return db_asset
 
     def delete_asset(self, db: Session, *, asset_id: uuid.UUID) -> Asset:
         """
         Remove um ativo.
         """
+        # --- LÓGICA DE NEGÓCIO CRÍTICA (Proteção de Exclusão) ---
+        # Uma única query EXISTS (sem carregar as listas de OS, filhos e PMs)
+        asset_delete_guard.check(db, asset_id)
+
         db_asset = self.crud_asset.get(db, id=asset_id) 
         
         if not db_asset:
@@ -140,30 +171,12 @@ class AssetService:
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Ativo não encontrado",
             )
-
-        # --- LÓGICA DE NEGÓCIO CRÍTICA (Proteção de Exclusão) ---
-        
-        if db_asset.work_orders:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Não é possível eliminar o ativo. Ele possui Ordens de Serviço associadas."
-            )
-
-        if db_asset.child_assets:
-             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Não é possível eliminar o ativo. Ele possui sub-ativos (ativos filhos) associados. Mova os sub-ativos primeiro."
-            )
-        
-        if db_asset.pm_plans:
-             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Não é possível eliminar o ativo. Ele está associado a Planos de Manutenção Preventiva."
-            )
         
+        old_tag = db_asset.internal_tag
         deleted_asset = self.crud_asset.remove(db=db, id=asset_id)
         if not deleted_asset:
             raise HTTPException(status_code=404, detail="Ativo não encontrado para remoção.")
+        scan_service.index.discard(old_tag, TipoCodigo.ATIVO, asset_id)
             
         return deleted_asset
 
@@ -220,5 +233,14 @@ class AssetService:
                     detail=f"Ativo Pai (parent) com ID {parent_asset_id} não encontrado."
                 )
 
+            # Deteção de ciclos: o novo pai não pode estar na subárvore do ativo
+            if current_asset_id and asset_hierarchy_crud.is_descendant(
+                db, ancestor_id=current_asset_id, descendant_id=parent_asset_id
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Hierarquia cíclica: o Ativo Pai escolhido é um descendente deste ativo."
+                )
+
 # Instância única do serviço para ser usada pelos routers
 asset_service = AssetService(crud_asset)
\ No newline at end of file
@@ -0,0 +1,204 @@
+# File: backend/app/modules/maintenance/assets/hierarchy/asset_hierarchy_crud.py
+
+import uuid
+from typing import List, Optional, Any, Dict
+
+from sqlalchemy import select, insert, delete, exists, literal, true, func
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy.sql import Select
+
+from app.models.maintenance.asset_model import Asset
+from app.models.maintenance.asset_closure_model import AssetClosure
+from app.models.maintenance.work_order_model import WorkOrder, OPEN_WORK_ORDER_STATUSES
+
+
+class CRUDAssetHierarchy:
+    """
+    Manutenção e consulta da tabela de fecho (AssetClosure) da hierarquia
+    de Ativos.
+
+    Os métodos de escrita NÃO fazem commit: são chamados pelo CRUDAsset
+    dentro da mesma transação que cria/atualiza o ativo.
+    """
+
+    # --- ESCRITA (chamada pelo CRUDAsset) ---
+
+    def insert_node(self, db: Session, *, asset_id: uuid.UUID, parent_id: Optional[uuid.UUID]) -> None:
+        """
+        Regista um novo ativo na hierarquia: a linha (ativo, ativo, 0) e
+        uma linha por cada antecessor do pai (profundidade + 1).
+        """
+        db.execute(insert(AssetClosure).values(ancestor_id=asset_id, descendant_id=asset_id, depth=0))
+        if parent_id:
+            db.execute(
+                insert(AssetClosure).from_select(
+                    ["ancestor_id", "descendant_id", "depth"],
+                    select(
+                        AssetClosure.ancestor_id,
+                        literal(asset_id),
+                        AssetClosure.depth + 1,
+                    ).where(AssetClosure.descendant_id == parent_id),
+                )
+            )
+
+    def move_subtree(self, db: Session, *, asset_id: uuid.UUID, new_parent_id: Optional[uuid.UUID]) -> None:
+        """
+        Move a subárvore de 'asset_id' para debaixo de 'new_parent_id'
+        (ou para a raiz, se None), com duas instruções em bloco:
+        1. Remove as ligações entre os antecessores antigos e a subárvore.
+        2. Liga cada antecessor do novo pai a cada nó da subárvore.
+        """
+        subtree_ids = select(AssetClosure.descendant_id).where(AssetClosure.ancestor_id == asset_id)
+
+        db.execute(
+            delete(AssetClosure)
+            .where(
+                AssetClosure.descendant_id.in_(subtree_ids),
+                AssetClosure.ancestor_id.not_in(subtree_ids),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        if new_parent_id:
+            supertree = aliased(AssetClosure)
+            subtree = aliased(AssetClosure)
+            db.execute(
+                insert(AssetClosure).from_select(
+                    ["ancestor_id", "descendant_id", "depth"],
+                    select(
+                        supertree.ancestor_id,
+                        subtree.descendant_id,
+                        supertree.depth + subtree.depth + 1,
+                    )
+                    .select_from(supertree)
+                    .join(subtree, true())
+                    .where(
+                        supertree.descendant_id == new_parent_id,
+                        subtree.ancestor_id == asset_id,
+                    ),
+                )
+            )
+
+    # --- LEITURA ---
+
+    def subtree_ids(self, ancestor_id: uuid.UUID, *, include_self: bool = True) -> Select:
+        """
+        SELECT com os IDs de todos os ativos na subárvore de 'ancestor_id'.
+        Usado como filtro 'IN (...)' nas listagens de ativos e OS.
+        """
+        stmt = select(AssetClosure.descendant_id).where(AssetClosure.ancestor_id == ancestor_id)
+        if not include_self:
+            stmt = stmt.where(AssetClosure.depth > 0)
+        return stmt
+
+    def is_descendant(self, db: Session, *, ancestor_id: uuid.UUID, descendant_id: uuid.UUID) -> bool:
+        """Verifica (EXISTS) se 'descendant_id' está na subárvore de 'ancestor_id'."""
+        stmt = select(
+            exists().where(
+                AssetClosure.ancestor_id == ancestor_id,
+                AssetClosure.descendant_id == descendant_id,
+            )
+        )
+        return bool(db.scalar(stmt))
+
+    def get_subtree(
+        self, db: Session, *, asset_id: uuid.UUID, max_depth: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Lista os descendentes de 'asset_id' (excluindo o próprio),
+        ordenados por profundidade e nome.
+        """
+        stmt = (
+            select(
+                Asset.id,
+                Asset.name,
+                Asset.internal_tag,
+                Asset.status,
+                Asset.parent_asset_id,
+                AssetClosure.depth,
+            )
+            .join(AssetClosure, AssetClosure.descendant_id == Asset.id)
+            .where(AssetClosure.ancestor_id == asset_id, AssetClosure.depth > 0)
+            .order_by(AssetClosure.depth, Asset.name)
+        )
+        if max_depth is not None:
+            stmt = stmt.where(AssetClosure.depth <= max_depth)
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_ancestors(self, db: Session, *, asset_id: uuid.UUID) -> List[Dict[str, Any]]:
+        """
+        Lista os antecessores de 'asset_id' (excluindo o próprio),
+        da raiz até ao pai direto.
+        """
+        stmt = (
+            select(
+                Asset.id,
+                Asset.name,
+                Asset.internal_tag,
+                Asset.status,
+                Asset.parent_asset_id,
+                AssetClosure.depth,
+            )
+            .join(AssetClosure, AssetClosure.ancestor_id == Asset.id)
+            .where(AssetClosure.descendant_id == asset_id, AssetClosure.depth > 0)
+            .order_by(AssetClosure.depth.desc())
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_tree_rows(
+        self, db: Session, *, root_id: Optional[uuid.UUID] = None, max_depth: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Obtém, numa única query, todos os nós da árvore (ou da subárvore
+        de 'root_id') até 'max_depth', com a profundidade relativa à raiz,
+        o número de filhos diretos e o número de OS em aberto de cada nó.
+
+        As linhas vêm ordenadas por profundidade, para que a árvore possa
+        ser montada numa única passagem.
+        """
+        if root_id:
+            anchor_filter = AssetClosure.ancestor_id == root_id
+        else:
+            # Árvore completa: parte de todas as raízes (ativos sem pai)
+            roots = select(Asset.id).where(Asset.parent_asset_id.is_(None))
+            anchor_filter = AssetClosure.ancestor_id.in_(roots)
+
+        # Contagens correlacionadas: só para os nós devolvidos (a PK da
+        # tabela de fecho e o índice de 'WorkOrder.asset_id' servem cada uma)
+        child_closure = aliased(AssetClosure)
+        children_count = (
+            select(func.count())
+            .where(child_closure.ancestor_id == Asset.id, child_closure.depth == 1)
+            .correlate(Asset)
+            .scalar_subquery()
+        )
+        open_wos = (
+            select(func.count())
+            .where(WorkOrder.asset_id == Asset.id, WorkOrder.status.in_(OPEN_WORK_ORDER_STATUSES))
+            .correlate(Asset)
+            .scalar_subquery()
+        )
+
+        stmt = (
+            select(
+                Asset.id,
+                Asset.name,
+                Asset.internal_tag,
+                Asset.status,
+                Asset.is_critical,
+                Asset.parent_asset_id,
+                AssetClosure.depth,
+                children_count.label("children_count"),
+                open_wos.label("open_work_orders"),
+            )
+            .join(AssetClosure, AssetClosure.descendant_id == Asset.id)
+            .where(anchor_filter)
+            .order_by(AssetClosure.depth, Asset.name)
+        )
+        if max_depth is not None:
+            stmt = stmt.where(AssetClosure.depth <= max_depth)
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+# Instância única (singleton)
+asset_hierarchy_crud = CRUDAssetHierarchy()
@@ -0,0 +1,77 @@
+# File: backend/app/modules/maintenance/assets/hierarchy/asset_hierarchy_router.py
+
+import uuid
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Path, Query, Request, Response, status
+
+from sqlalchemy.orm import Session
+from app.core.dependencies import get_db, get_current_active_user
+
+from .asset_hierarchy_service import asset_hierarchy_service
+from .asset_hierarchy_schemas import AssetHierarchyNode, AssetTreeRead
+
+# Este router é "aninhado" dentro do assets_router (sem 'prefix').
+# Deve ser incluído ANTES das rotas '/{asset_id}' do router pai.
+router = APIRouter(
+    tags=["Maintenance - Assets"],
+    dependencies=[Depends(get_current_active_user)]
+)
+
+
+@router.get(
+    "/tree",
+    response_model=AssetTreeRead,
+    summary="Obter a árvore de Ativos"
+)
+def read_asset_tree(
+    request: Request,
+    root_id: Optional[uuid.UUID] = Query(None, description="Raiz da árvore (ou 'expand_cursor' de um nó). Padrão: árvore completa"),
+    max_depth: Optional[int] = Query(None, ge=0, description="Profundidade máxima a partir da raiz (0 = apenas a raiz)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Obtém a hierarquia de ativos já aninhada (numa única query), com o
+    número de filhos e de OS em aberto por nó.
+
+    - Com 'max_depth', os nós cortados trazem 'has_more' e um
+      'expand_cursor' para carregar o ramo sob demanda.
+    - A resposta traz um 'ETag'; se o cliente enviar 'If-None-Match'
+      com o mesmo valor e a árvore não mudou, recebe 304 (sem corpo).
+    """
+    etag, body = asset_hierarchy_service.get_tree(db=db, root_id=root_id, max_depth=max_depth)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+@router.get(
+    "/{asset_id}/subtree",
+    response_model=List[AssetHierarchyNode],
+    summary="Listar a subárvore de um Ativo"
+)
+def read_asset_subtree(
+    asset_id: uuid.UUID = Path(..., description="ID do Ativo (raiz da subárvore)"),
+    max_depth: Optional[int] = Query(None, ge=1, description="Profundidade máxima (1 = apenas filhos diretos)"),
+    db: Session = Depends(get_db)
+):
+    """
+    Obtém todos os descendentes de um ativo numa única query
+    (tabela de fecho), ordenados por profundidade e nome.
+    """
+    return asset_hierarchy_service.get_subtree(db=db, asset_id=asset_id, max_depth=max_depth)
+
+
+@router.get(
+    "/{asset_id}/ancestors",
+    response_model=List[AssetHierarchyNode],
+    summary="Listar os antecessores de um Ativo"
+)
+def read_asset_ancestors(
+    asset_id: uuid.UUID = Path(..., description="ID do Ativo"),
+    db: Session = Depends(get_db)
+):
+    """
+    Obtém o caminho completo de um ativo até à raiz da hierarquia,
+    ordenado da raiz para o pai direto (útil para 'breadcrumbs').
+    """
+    return asset_hierarchy_service.get_ancestors(db=db, asset_id=asset_id)
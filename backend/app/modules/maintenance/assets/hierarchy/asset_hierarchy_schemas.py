@@ -0,0 +1,48 @@
+# File: backend/app/modules/maintenance/assets/hierarchy/asset_hierarchy_schemas.py
+
+import uuid
+from typing import Optional, List
+from pydantic import BaseModel, ConfigDict
+
+from app.models.maintenance.asset_model import AssetStatus
+
+
+class AssetHierarchyNode(BaseModel):
+    """Ativo numa consulta de hierarquia (subárvore ou antecessores)."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    internal_tag: str
+    status: AssetStatus
+    parent_asset_id: Optional[uuid.UUID] = None
+    # Distância ao ativo consultado (1 = filho/pai direto)
+    depth: int
+
+
+class AssetTreeNode(BaseModel):
+    """Nó da árvore de Ativos (com os filhos aninhados)."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    internal_tag: str
+    status: AssetStatus
+    is_critical: Optional[bool] = None
+    parent_asset_id: Optional[uuid.UUID] = None
+    depth: int
+    children_count: int
+    open_work_orders: int
+    # True quando o nó tem filhos que não foram incluídos (limite de profundidade)
+    has_more: bool = False
+    # Cursor para expandir o nó: enviar como 'root_id' no mesmo endpoint
+    expand_cursor: Optional[str] = None
+    children: List["AssetTreeNode"] = []
+
+
+class AssetTreeRead(BaseModel):
+    """Resposta do endpoint da árvore de Ativos."""
+    root_id: Optional[uuid.UUID] = None
+    max_depth: Optional[int] = None
+    total_nodes: int
+    nodes: List[AssetTreeNode]
@@ -0,0 +1,93 @@
+# File: backend/app/modules/maintenance/assets/hierarchy/asset_hierarchy_service.py
+
+import hashlib
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.cache import MemoryCache, invalidate_on_commit
+from app.models.maintenance.asset_model import Asset
+from app.models.maintenance.asset_closure_model import AssetClosure
+from app.models.maintenance.work_order_model import WorkOrder
+from .asset_hierarchy_crud import asset_hierarchy_crud, CRUDAssetHierarchy
+from .asset_hierarchy_schemas import AssetHierarchyNode, AssetTreeNode, AssetTreeRead
+
+# --- CACHE DA ÁRVORE ---
+# Guarda o JSON já serializado e o respetivo ETag, por (raiz, profundidade).
+# É invalidado quando ativos, a hierarquia ou as OS (contagens) mudam.
+asset_tree_cache = MemoryCache(maxsize=64)
+invalidate_on_commit(asset_tree_cache, Asset, AssetClosure, WorkOrder)
+
+
+class AssetHierarchyService:
+    """
+    Camada de Serviço para as consultas de hierarquia de Ativos.
+    """
+
+    def __init__(self, crud_hierarchy: CRUDAssetHierarchy):
+        self.crud_hierarchy = crud_hierarchy
+
+    def _ensure_asset_exists(self, db: Session, asset_id: uuid.UUID) -> None:
+        # Todo o ativo tem a linha (ativo, ativo, 0) na tabela de fecho
+        if not self.crud_hierarchy.is_descendant(db, ancestor_id=asset_id, descendant_id=asset_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Ativo não encontrado",
+            )
+
+    def get_subtree(
+        self, db: Session, *, asset_id: uuid.UUID, max_depth: Optional[int] = None
+    ) -> List[AssetHierarchyNode]:
+        """Retorna todos os descendentes de um ativo (404 se não existir)."""
+        self._ensure_asset_exists(db, asset_id)
+        rows = self.crud_hierarchy.get_subtree(db, asset_id=asset_id, max_depth=max_depth)
+        return [AssetHierarchyNode(**row) for row in rows]
+
+    def get_ancestors(self, db: Session, *, asset_id: uuid.UUID) -> List[AssetHierarchyNode]:
+        """Retorna o caminho da raiz até ao pai direto de um ativo."""
+        self._ensure_asset_exists(db, asset_id)
+        rows = self.crud_hierarchy.get_ancestors(db, asset_id=asset_id)
+        return [AssetHierarchyNode(**row) for row in rows]
+
+    def get_tree(
+        self, db: Session, *, root_id: Optional[uuid.UUID] = None, max_depth: Optional[int] = None
+    ) -> Tuple[str, bytes]:
+        """
+        Devolve a árvore (completa ou a partir de 'root_id') já serializada
+        em JSON, juntamente com o seu ETag.
+        """
+        if root_id:
+            self._ensure_asset_exists(db, root_id)
+
+        def build() -> Tuple[str, bytes]:
+            rows = self.crud_hierarchy.get_tree_rows(db, root_id=root_id, max_depth=max_depth)
+
+            # Montagem numa única passagem: as linhas vêm ordenadas por
+            # profundidade, logo o pai de cada nó já foi processado.
+            nodes: Dict[uuid.UUID, AssetTreeNode] = {}
+            roots: List[AssetTreeNode] = []
+            for row in rows:
+                node = AssetTreeNode(**row)
+                if max_depth is not None and node.depth == max_depth and node.children_count:
+                    node.has_more = True
+                    node.expand_cursor = str(node.id)
+                nodes[node.id] = node
+                if node.depth == 0:
+                    roots.append(node)
+                else:
+                    nodes[node.parent_asset_id].children.append(node)
+
+            tree = AssetTreeRead(
+                root_id=root_id, max_depth=max_depth, total_nodes=len(nodes), nodes=roots
+            )
+            body = tree.model_dump_json().encode()
+            etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+            return etag, body
+
+        return asset_tree_cache.get_or_set(("tree", root_id, max_depth), build)
+
+
+# Instância única do serviço
+asset_hierarchy_service = AssetHierarchyService(asset_hierarchy_crud)
@@ -0,0 +1,98 @@
+# File: backend/app/modules/maintenance/assets/importer/asset_import_crud.py
+
+import uuid
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import select, insert, func
+from sqlalchemy.orm import Session
+
+from app.models.maintenance.asset_model import Asset
+from app.models.maintenance.asset_closure_model import AssetClosure
+from app.models.maintenance.manufacturer_model import Manufacturer
+from app.models.maintenance.asset_category_model import AssetCategory
+from app.models.inventory.location_model import Local
+
+
+class CRUDAssetImport:
+    """
+    Acesso a dados da importação em massa de Ativos:
+    - Carrega de uma só vez os mapas de referência (FKs e chaves únicas).
+    - Escreve os ativos e a tabela de fecho em lotes (multi-row INSERT).
+    """
+
+    def load_manufacturers(self, db: Session) -> Dict[str, uuid.UUID]:
+        """Mapa nome (minúsculas) -> ID dos fabricantes ativos."""
+        stmt = select(func.lower(Manufacturer.name), Manufacturer.id).where(Manufacturer.is_active == True)
+        return dict(db.execute(stmt).all())
+
+    def load_categories(self, db: Session) -> Dict[str, uuid.UUID]:
+        """Mapa nome (minúsculas) -> ID das categorias de ativo."""
+        stmt = select(func.lower(AssetCategory.name), AssetCategory.id)
+        return dict(db.execute(stmt).all())
+
+    def load_locations(
+        self, db: Session
+    ) -> Tuple[Dict[str, Set[uuid.UUID]], Dict[str, Set[uuid.UUID]]]:
+        """
+        Mapas código de barras (minúsculas) -> IDs e nome (minúsculas) -> IDs
+        dos locais ativos, em separado. Cada chave guarda todos os locais que
+        lhe correspondem, para que o serviço possa recusar as ambíguas.
+        """
+        barcodes: Dict[str, Set[uuid.UUID]] = defaultdict(set)
+        names: Dict[str, Set[uuid.UUID]] = defaultdict(set)
+        stmt = select(Local.id, Local.nome, Local.barcode).where(Local.is_active == True)
+        for local_id, nome, barcode in db.execute(stmt):
+            names[nome.lower()].add(local_id)
+            if barcode:
+                barcodes[barcode.lower()].add(local_id)
+        return dict(barcodes), dict(names)
+
+    def load_existing_tags(self, db: Session) -> Dict[str, uuid.UUID]:
+        """Mapa TAG interna (minúsculas) -> ID de todos os ativos existentes."""
+        stmt = select(func.lower(Asset.internal_tag), Asset.id)
+        return dict(db.execute(stmt).all())
+
+    def load_existing_serials(self, db: Session) -> Set[str]:
+        """Conjunto dos números de série (minúsculas) já registados."""
+        stmt = select(func.lower(Asset.serial_number)).where(Asset.serial_number.isnot(None))
+        return set(db.scalars(stmt).all())
+
+    def load_ancestors(
+        self, db: Session, asset_ids: Iterable[uuid.UUID]
+    ) -> Dict[uuid.UUID, List[Tuple[uuid.UUID, int]]]:
+        """
+        Para cada ativo existente em 'asset_ids', devolve a lista
+        (antecessor, profundidade) da tabela de fecho, incluindo o próprio.
+        """
+        ids = list(asset_ids)
+        ancestors: Dict[uuid.UUID, List[Tuple[uuid.UUID, int]]] = defaultdict(list)
+        if not ids:
+            return ancestors
+        stmt = select(AssetClosure.descendant_id, AssetClosure.ancestor_id, AssetClosure.depth).where(
+            AssetClosure.descendant_id.in_(ids)
+        )
+        for descendant_id, ancestor_id, depth in db.execute(stmt):
+            ancestors[descendant_id].append((ancestor_id, depth))
+        return ancestors
+
+    def bulk_insert(
+        self,
+        db: Session,
+        *,
+        assets: List[Dict[str, Any]],
+        closure_rows: List[Dict[str, Any]],
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        Insere os ativos e as linhas de fecho em lotes, pela ordem recebida
+        (os pais vêm sempre antes dos filhos). NÃO faz commit.
+        """
+        for start in range(0, len(assets), batch_size):
+            db.execute(insert(Asset), assets[start:start + batch_size])
+        for start in range(0, len(closure_rows), batch_size):
+            db.execute(insert(AssetClosure), closure_rows[start:start + batch_size])
+
+
+# Instância única (singleton)
+asset_import_crud = CRUDAssetImport()
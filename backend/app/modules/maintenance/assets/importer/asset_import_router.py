@@ -0,0 +1,41 @@
+# File: backend/app/modules/maintenance/assets/importer/asset_import_router.py
+
+from fastapi import APIRouter, Depends, File, Query, UploadFile
+
+from sqlalchemy.orm import Session
+from app.core.dependencies import get_db, get_current_active_user
+
+from .asset_import_service import asset_import_service
+from .asset_import_schemas import AssetImportResult
+
+# Este router é "aninhado" dentro do assets_router (sem 'prefix').
+router = APIRouter(
+    tags=["Maintenance - Assets"],
+    dependencies=[Depends(get_current_active_user)]
+)
+
+
+@router.post(
+    "/import",
+    response_model=AssetImportResult,
+    summary="Importar Ativos em massa (CSV/XLSX)"
+)
+def import_assets(
+    file: UploadFile = File(..., description="Ficheiro .csv (',' ou ';') ou .xlsx"),
+    dry_run: bool = Query(False, description="Apenas validar, sem gravar"),
+    skip_invalid: bool = Query(False, description="Importar as linhas válidas mesmo que existam erros"),
+    db: Session = Depends(get_db)
+):
+    """
+    Importa ativos a partir de um ficheiro com cabeçalho. Colunas:
+    internal_tag e name (obrigatórias), description, serial_number, status,
+    is_critical, purchase_date, installation_date, warranty_expiry_date,
+    manufacturer (nome), category (nome), location (nome ou código de barras)
+    e parent_tag (TAG do ativo pai, existente ou no próprio ficheiro).
+
+    Devolve um relatório com os erros por linha. Por defeito, qualquer erro
+    cancela a importação completa.
+    """
+    return asset_import_service.import_assets(
+        db=db, upload=file, dry_run=dry_run, skip_invalid=skip_invalid
+    )
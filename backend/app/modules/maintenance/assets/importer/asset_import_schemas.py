@@ -0,0 +1,22 @@
+# File: backend/app/modules/maintenance/assets/importer/asset_import_schemas.py
+
+from typing import Optional, List
+from pydantic import BaseModel
+
+
+class AssetImportRowError(BaseModel):
+    """Erro de validação de uma linha do ficheiro importado."""
+    # Número da linha no ficheiro (a linha 1 é o cabeçalho)
+    row: int
+    internal_tag: Optional[str] = None
+    field: Optional[str] = None
+    message: str
+
+
+class AssetImportResult(BaseModel):
+    """Relatório da importação em massa de Ativos."""
+    total_rows: int
+    valid_rows: int
+    imported: int
+    dry_run: bool
+    errors: List[AssetImportRowError] = []
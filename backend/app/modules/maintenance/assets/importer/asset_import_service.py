@@ -0,0 +1,392 @@
+# File: backend/app/modules/maintenance/assets/importer/asset_import_service.py
+
+import csv
+import io
+import uuid
+from collections import defaultdict, deque
+from datetime import date, datetime
+from itertools import chain
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, UploadFile, status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models.maintenance.asset_model import AssetStatus
+from .asset_import_crud import asset_import_crud, CRUDAssetImport
+from .asset_import_schemas import AssetImportResult, AssetImportRowError
+
+# Colunas reconhecidas no ficheiro (cabeçalho, sem distinção de maiúsculas).
+# 'manufacturer', 'category' e 'location' são nomes (ou código de barras,
+# no caso do local - um valor que corresponda a mais do que um local é
+# recusado como ambíguo); 'parent_tag' é a TAG interna do ativo pai, que pode
+# já existir na base de dados ou estar noutra linha do mesmo ficheiro.
+IMPORT_COLUMNS = (
+    "internal_tag", "name", "description", "serial_number", "status", "is_critical",
+    "purchase_date", "installation_date", "warranty_expiry_date",
+    "manufacturer", "category", "location", "parent_tag",
+)
+REQUIRED_COLUMNS = ("internal_tag", "name")
+TRUE_VALUES = {"1", "true", "sim", "s", "yes", "y", "x", "verdadeiro"}
+BATCH_SIZE = 1000
+# Codificações aceites no CSV, pela ordem em que são tentadas
+CSV_ENCODINGS = ("utf-8-sig", "cp1252")
+
+
+class _ImportRow:
+    """Linha válida (já convertida) à espera de ser inserida."""
+    __slots__ = ("row", "tag", "parent_tag", "parent_key", "values")
+
+    def __init__(self, row: int, tag: str, parent_tag: Optional[str], values: Dict[str, Any]):
+        self.row = row
+        self.tag = tag
+        self.parent_tag = parent_tag
+        self.parent_key = parent_tag.lower() if parent_tag else None
+        self.values = values
+
+
+class AssetImportService:
+    """
+    Importação em massa de Ativos a partir de CSV ou XLSX.
+
+    Em vez de chamar 'AssetService.create_asset' por linha (2 verificações
+    de unicidade + até 4 FKs + commit/refresh por ativo), carrega todos os
+    mapas de referência uma única vez, valida as linhas em memória, ordena
+    a hierarquia (pais antes dos filhos) e escreve em lotes numa transação.
+    """
+
+    def __init__(self, crud: CRUDAssetImport):
+        self.crud = crud
+
+    # --- LEITURA DO FICHEIRO (streaming) ---
+
+    def _iter_rows(self, upload: UploadFile) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        filename = (upload.filename or "").lower()
+        if filename.endswith(".xlsx"):
+            raw_rows = self._iter_xlsx(upload.file)
+        elif filename.endswith(".csv"):
+            raw_rows = self._iter_csv(upload.file)
+        else:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Formato de ficheiro não suportado. Use .csv ou .xlsx."
+            )
+
+        header = next(raw_rows, None)
+        if not header:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="O ficheiro está vazio.")
+        columns = [str(col or "").strip().lower() for col in header]
+        missing = [col for col in REQUIRED_COLUMNS if col not in columns]
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Colunas obrigatórias em falta: {', '.join(missing)}."
+            )
+
+        for row_number, values in enumerate(raw_rows, start=2):
+            if not any(value not in (None, "") for value in values):
+                continue  # Ignora linhas vazias
+            yield row_number, dict(zip(columns, values))
+
+    def _iter_csv(self, binary_file) -> Iterator[List[Any]]:
+        text = io.StringIO(self._decode_csv(binary_file.read()), newline="")
+        first_line = text.readline()
+        # O Excel em português exporta CSV com ';' como separador
+        delimiter = ";" if first_line.count(";") > first_line.count(",") else ","
+        yield from csv.reader(chain([first_line], text), delimiter=delimiter)
+
+    @staticmethod
+    def _decode_csv(content: bytes) -> str:
+        """UTF-8 (com ou sem BOM) e, em alternativa, Windows-1252 (o padrão do Excel em português)."""
+        for encoding in CSV_ENCODINGS:
+            try:
+                return content.decode(encoding)
+            except UnicodeDecodeError:
+                pass
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Não foi possível ler o CSV: grave o ficheiro com a codificação UTF-8."
+        )
+
+    def _iter_xlsx(self, binary_file) -> Iterator[List[Any]]:
+        try:
+            # Dependência opcional: só é necessária para importar XLSX
+            from openpyxl import load_workbook
+        except ImportError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A importação de XLSX requer o pacote 'openpyxl'. Use um ficheiro .csv."
+            )
+        workbook = load_workbook(binary_file, read_only=True, data_only=True)
+        try:
+            for values in workbook.active.iter_rows(values_only=True):
+                yield list(values)
+        finally:
+            workbook.close()
+
+    # --- CONVERSÃO DE VALORES ---
+
+    @staticmethod
+    def _text(value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        text = str(value).strip()
+        return text or None
+
+    @staticmethod
+    def _datetime(value: Any) -> Optional[datetime]:
+        if value in (None, ""):
+            return None
+        if isinstance(value, datetime):
+            return value
+        if isinstance(value, date):
+            return datetime(value.year, value.month, value.day)
+        text = str(value).strip()
+        for fmt in ("%d/%m/%Y", "%d-%m-%Y"):
+            try:
+                return datetime.strptime(text, fmt)
+            except ValueError:
+                pass
+        return datetime.fromisoformat(text)  # Levanta ValueError se inválida
+
+    # --- IMPORTAÇÃO ---
+
+    def import_assets(
+        self,
+        db: Session,
+        *,
+        upload: UploadFile,
+        dry_run: bool = False,
+        skip_invalid: bool = False,
+    ) -> AssetImportResult:
+        """
+        Valida e importa os ativos do ficheiro.
+
+        - 'dry_run': apenas valida e devolve o relatório.
+        - 'skip_invalid': importa as linhas válidas mesmo que existam erros
+          (por defeito, qualquer erro cancela a importação completa).
+        """
+        # 1. Mapas de referência, carregados uma única vez
+        manufacturers = self.crud.load_manufacturers(db)
+        categories = self.crud.load_categories(db)
+        location_barcodes, location_names = self.crud.load_locations(db)
+        existing_tags = self.crud.load_existing_tags(db)
+        existing_serials = self.crud.load_existing_serials(db)
+
+        errors: List[AssetImportRowError] = []
+        rows: Dict[str, _ImportRow] = {}
+        invalid_tags = set()
+        file_serials = set()
+        total_rows = 0
+
+        # 2. Validação linha a linha, só em memória
+        for row_number, raw in self._iter_rows(upload):
+            total_rows += 1
+            tag = self._text(raw.get("internal_tag"))
+
+            def add_error(message: str, field: Optional[str] = None):
+                errors.append(AssetImportRowError(row=row_number, internal_tag=tag, field=field, message=message))
+
+            if not tag:
+                add_error("A TAG Interna é obrigatória.", "internal_tag")
+                continue
+            key = tag.lower()
+            error_count = len(errors)
+
+            if key in existing_tags:
+                add_error(f"Já existe um ativo com a TAG Interna '{tag}'.", "internal_tag")
+            elif key in rows or key in invalid_tags:
+                add_error(f"A TAG Interna '{tag}' está repetida no ficheiro.", "internal_tag")
+
+            name = self._text(raw.get("name"))
+            if not name:
+                add_error("O nome é obrigatório.", "name")
+
+            serial_number = self._text(raw.get("serial_number"))
+            if serial_number:
+                serial_key = serial_number.lower()
+                if serial_key in existing_serials:
+                    add_error(f"Já existe um ativo com o Número de Série '{serial_number}'.", "serial_number")
+                elif serial_key in file_serials:
+                    add_error(f"O Número de Série '{serial_number}' está repetido no ficheiro.", "serial_number")
+                file_serials.add(serial_key)
+
+            asset_status = AssetStatus.OPERATIONAL
+            status_text = self._text(raw.get("status"))
+            if status_text:
+                try:
+                    asset_status = AssetStatus[status_text.upper()]
+                except KeyError:
+                    add_error(f"Status inválido '{status_text}'.", "status")
+
+            dates: Dict[str, Optional[datetime]] = {}
+            for field in ("purchase_date", "installation_date", "warranty_expiry_date"):
+                try:
+                    dates[field] = self._datetime(raw.get(field))
+                except ValueError:
+                    add_error(f"Data inválida '{raw.get(field)}'.", field)
+
+            references: Dict[str, Optional[uuid.UUID]] = {}
+            for field, target, lookup, label in (
+                ("manufacturer", "manufacturer_id", manufacturers, "Fabricante"),
+                ("category", "category_id", categories, "Categoria"),
+            ):
+                reference = self._text(raw.get(field))
+                references[target] = lookup.get(reference.lower()) if reference else None
+                if reference and references[target] is None:
+                    add_error(f"{label} '{reference}' não encontrado.", field)
+
+            references["location_id"] = None
+            location = self._text(raw.get("location"))
+            if location:
+                location_key = location.lower()
+                candidates = location_barcodes.get(location_key, set()) | location_names.get(location_key, set())
+                if not candidates:
+                    add_error(f"Local '{location}' não encontrado.", "location")
+                elif len(candidates) > 1:
+                    add_error(
+                        f"Local '{location}' é ambíguo: corresponde a {len(candidates)} locais "
+                        "(por nome ou código de barras).",
+                        "location",
+                    )
+                else:
+                    references["location_id"] = next(iter(candidates))
+
+            parent_tag = self._text(raw.get("parent_tag"))
+            parent_key = parent_tag.lower() if parent_tag else None
+            if parent_key == key:
+                add_error("Um ativo não pode ser pai de si mesmo.", "parent_tag")
+
+            if len(errors) > error_count:
+                if key not in rows:
+                    invalid_tags.add(key)
+                continue
+
+            rows[key] = _ImportRow(row_number, tag, parent_tag, {
+                "id": uuid.uuid4(),
+                "name": name,
+                "description": self._text(raw.get("description")),
+                "serial_number": serial_number,
+                "internal_tag": tag,
+                "status": asset_status,
+                "is_critical": str(raw.get("is_critical") or "").strip().lower() in TRUE_VALUES,
+                **dates,
+                **references,
+                "parent_asset_id": None,
+            })
+
+        # 3. Hierarquia: resolve os pais e ordena (pais antes dos filhos)
+        order = self._resolve_hierarchy(rows, existing_tags, invalid_tags, errors)
+
+        errors.sort(key=lambda error: error.row)
+        result = AssetImportResult(
+            total_rows=total_rows,
+            valid_rows=len(order),
+            imported=0,
+            dry_run=dry_run,
+            errors=errors,
+        )
+        if dry_run or not order or (errors and not skip_invalid):
+            return result
+
+        # 4. Escrita em lotes (ativos + tabela de fecho) numa única transação
+        assets, closure_rows = self._build_inserts(db, order)
+        try:
+            self.crud.bulk_insert(db, assets=assets, closure_rows=closure_rows, batch_size=BATCH_SIZE)
+            db.commit()
+        except IntegrityError as exc:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"A importação foi cancelada por um conflito na base de dados: {exc.orig}"
+            )
+
+        result.imported = len(assets)
+        return result
+
+    def _resolve_hierarchy(
+        self,
+        rows: Dict[str, _ImportRow],
+        existing_tags: Dict[str, uuid.UUID],
+        invalid_tags: set,
+        errors: List[AssetImportRowError],
+    ) -> List[_ImportRow]:
+        """
+        Liga cada linha ao seu pai (existente ou do próprio ficheiro) e devolve
+        as linhas válidas em ordem topológica (BFS a partir das raízes).
+        Linhas em ciclos ou debaixo de um pai inválido são reportadas como erro.
+        """
+        children_of: Dict[str, List[str]] = defaultdict(list)
+        queue = deque()
+        rejected = set()
+
+        for key, item in rows.items():
+            if not item.parent_key:
+                queue.append(key)
+            elif item.parent_key in rows:
+                children_of[item.parent_key].append(key)
+            elif item.parent_key in existing_tags:
+                item.values["parent_asset_id"] = existing_tags[item.parent_key]
+                queue.append(key)
+            else:
+                rejected.add(key)
+                message = (
+                    f"O Ativo Pai '{item.parent_tag}' tem erros neste ficheiro."
+                    if item.parent_key in invalid_tags
+                    else f"Ativo Pai '{item.parent_tag}' não encontrado."
+                )
+                errors.append(AssetImportRowError(row=item.row, internal_tag=item.tag, field="parent_tag", message=message))
+
+        order: List[_ImportRow] = []
+        while queue:
+            item = rows[queue.popleft()]
+            order.append(item)
+            for child_key in children_of[item.tag.lower()]:
+                rows[child_key].values["parent_asset_id"] = item.values["id"]
+                queue.append(child_key)
+
+        if len(order) + len(rejected) < len(rows):
+            placed = {item.tag.lower() for item in order} | rejected
+            for key, item in rows.items():
+                if key not in placed:
+                    errors.append(AssetImportRowError(
+                        row=item.row, internal_tag=item.tag, field="parent_tag",
+                        message="Hierarquia inválida: ciclo no ficheiro ou Ativo Pai com erros."
+                    ))
+        return order
+
+    def _build_inserts(
+        self, db: Session, order: List[_ImportRow]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Prepara as linhas dos ativos e da tabela de fecho. Os antecessores
+        de pais já existentes são lidos numa única query; os dos pais do
+        ficheiro são derivados em memória (a ordem é topológica).
+        """
+        new_ids = {item.values["id"] for item in order}
+        existing_parents = {
+            item.values["parent_asset_id"] for item in order
+            if item.values["parent_asset_id"] and item.values["parent_asset_id"] not in new_ids
+        }
+        ancestors = self.crud.load_ancestors(db, existing_parents)
+
+        assets: List[Dict[str, Any]] = []
+        closure_rows: List[Dict[str, Any]] = []
+        for item in order:
+            asset_id = item.values["id"]
+            parent_id = item.values["parent_asset_id"]
+            lineage = [(asset_id, 0)]
+            if parent_id:
+                lineage.extend((ancestor_id, depth + 1) for ancestor_id, depth in ancestors[parent_id])
+            ancestors[asset_id] = lineage
+
+            assets.append(item.values)
+            closure_rows.extend(
+                {"ancestor_id": ancestor_id, "descendant_id": asset_id, "depth": depth}
+                for ancestor_id, depth in lineage
+            )
+        return assets, closure_rows
+
+
+# Instância única do serviço
+asset_import_service = AssetImportService(asset_import_crud)
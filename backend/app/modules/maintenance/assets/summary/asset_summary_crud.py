@@ -0,0 +1,118 @@
+# File: backend/app/modules/maintenance/assets/summary/asset_summary_crud.py
+
+import uuid
+from typing import Any, Dict, Optional
+
+from sqlalchemy import select, func, desc, true, literal_column
+from sqlalchemy.orm import Session, aliased
+
+from app.models.maintenance.asset_model import Asset
+from app.models.maintenance.asset_meter_model import AssetMeter, AssetMeterReading
+from app.models.maintenance.asset_spare_parts_model import AssetSparePart
+from app.models.maintenance.pm_plan_model import PMPlan
+from app.models.maintenance.work_order_model import (
+    WorkOrder, WorkOrderStatus, WorkOrderType, OPEN_WORK_ORDER_STATUSES
+)
+
+
+class CRUDAssetSummary:
+    """
+    Resumo agregado de um Ativo: uma única instrução SQL com subqueries
+    escalares (contagens, datas, somas) em vez de carregar as listas de
+    OS, PMs, medidores e peças do ativo.
+    """
+
+    def get_summary(self, db: Session, *, asset_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        children = aliased(Asset)
+
+        children_count = (
+            select(func.count()).where(children.parent_asset_id == Asset.id).scalar_subquery()
+        )
+
+        # Contagem das OS em aberto por status (uma só passagem com FILTER)
+        open_by_status = (
+            select(func.json_build_object(*[
+                arg
+                for wo_status in OPEN_WORK_ORDER_STATUSES
+                for arg in (wo_status.value, func.count().filter(WorkOrder.status == wo_status))
+            ]))
+            .where(WorkOrder.asset_id == Asset.id, WorkOrder.status.in_(OPEN_WORK_ORDER_STATUSES))
+            .scalar_subquery()
+        )
+
+        last_pm_date = (
+            select(func.max(WorkOrder.completed_at))
+            .where(
+                WorkOrder.asset_id == Asset.id,
+                WorkOrder.wo_type == WorkOrderType.PREVENTIVE,
+                WorkOrder.status == WorkOrderStatus.COMPLETED,
+            )
+            .scalar_subquery()
+        )
+
+        downtime = (
+            select(func.coalesce(func.sum(WorkOrder.downtime_hours), 0))
+            .where(WorkOrder.asset_id == Asset.id)
+            .scalar_subquery()
+        )
+
+        active_pm_plans = (
+            select(func.count()).where(PMPlan.asset_id == Asset.id, PMPlan.is_active == True).scalar_subquery()
+        )
+        next_pm_date = (
+            select(func.min(PMPlan.next_due_date))
+            .where(PMPlan.asset_id == Asset.id, PMPlan.is_active == True)
+            .scalar_subquery()
+        )
+
+        spare_parts_count = (
+            select(func.count()).where(AssetSparePart.asset_id == Asset.id).scalar_subquery()
+        )
+
+        # Última leitura de cada medidor ativo (LATERAL ... LIMIT 1)
+        latest = (
+            select(AssetMeterReading.reading_value, AssetMeterReading.reading_date)
+            .where(AssetMeterReading.meter_id == AssetMeter.id)
+            .order_by(desc(AssetMeterReading.reading_date))
+            .limit(1)
+            .lateral("latest_reading")
+        )
+        meters = (
+            select(func.coalesce(
+                func.json_agg(func.json_build_object(
+                    "meter_id", AssetMeter.id,
+                    "name", AssetMeter.name,
+                    "udm_id", AssetMeter.udm_id,
+                    "last_reading", latest.c.reading_value,
+                    "last_reading_date", latest.c.reading_date,
+                )),
+                literal_column("'[]'::json"),
+            ))
+            .select_from(AssetMeter)
+            .outerjoin(latest, true())
+            .where(AssetMeter.asset_id == Asset.id, AssetMeter.is_active == True)
+            .scalar_subquery()
+        )
+
+        stmt = select(
+            Asset.id,
+            Asset.name,
+            Asset.internal_tag,
+            Asset.status,
+            Asset.is_critical,
+            children_count.label("children_count"),
+            open_by_status.label("open_work_orders_by_status"),
+            last_pm_date.label("last_pm_date"),
+            active_pm_plans.label("active_pm_plans"),
+            next_pm_date.label("next_pm_date"),
+            spare_parts_count.label("spare_parts_count"),
+            downtime.label("downtime_hours_to_date"),
+            meters.label("meters"),
+        ).where(Asset.id == asset_id)
+
+        row = db.execute(stmt).mappings().first()
+        return dict(row) if row else None
+
+
+# Instância única (singleton)
+asset_summary_crud = CRUDAssetSummary()
@@ -0,0 +1,33 @@
+# File: backend/app/modules/maintenance/assets/summary/asset_summary_router.py
+
+import uuid
+from fastapi import APIRouter, Depends, Path
+
+from sqlalchemy.orm import Session
+from app.core.dependencies import get_db, get_current_active_user
+
+from .asset_summary_service import asset_summary_service
+from .asset_summary_schemas import AssetSummaryRead
+
+# Este router é "aninhado" dentro do assets_router (sem 'prefix').
+router = APIRouter(
+    tags=["Maintenance - Assets"],
+    dependencies=[Depends(get_current_active_user)]
+)
+
+
+@router.get(
+    "/{asset_id}/summary",
+    response_model=AssetSummaryRead,
+    summary="Obter o resumo de um Ativo"
+)
+def read_asset_summary(
+    asset_id: uuid.UUID = Path(..., description="ID do Ativo"),
+    db: Session = Depends(get_db)
+):
+    """
+    Obtém, numa única query, o resumo usado no ecrã de detalhe do ativo:
+    OS em aberto por status, última e próxima PM, últimas leituras dos
+    medidores, número de peças sobressalentes e horas de paragem acumuladas.
+    """
+    return asset_summary_service.get_summary(db=db, asset_id=asset_id)
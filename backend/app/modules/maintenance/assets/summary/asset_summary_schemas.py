@@ -0,0 +1,42 @@
+# File: backend/app/modules/maintenance/assets/summary/asset_summary_schemas.py
+
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional
+from pydantic import BaseModel, ConfigDict
+
+from app.models.maintenance.asset_model import AssetStatus
+
+
+class AssetMeterSummary(BaseModel):
+    """Última leitura de um medidor ativo do ativo."""
+    meter_id: uuid.UUID
+    name: str
+    udm_id: str
+    last_reading: Optional[float] = None
+    last_reading_date: Optional[datetime] = None
+
+
+class AssetSummaryRead(BaseModel):
+    """Resumo do ativo para o ecrã de detalhe (calculado numa única query)."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    internal_tag: str
+    status: AssetStatus
+    is_critical: Optional[bool] = None
+    children_count: int
+
+    # OS em aberto, por status (OPEN, IN_PROGRESS, ON_HOLD)
+    open_work_orders: int
+    open_work_orders_by_status: Dict[str, int]
+
+    # Manutenção Preventiva
+    active_pm_plans: int
+    last_pm_date: Optional[datetime] = None  # Última OS preventiva concluída
+    next_pm_date: Optional[datetime] = None  # Próximo vencimento dos planos ativos
+
+    spare_parts_count: int
+    downtime_hours_to_date: float
+    meters: List[AssetMeterSummary] = []
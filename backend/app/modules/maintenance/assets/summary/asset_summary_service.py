@@ -0,0 +1,36 @@
+# File: backend/app/modules/maintenance/assets/summary/asset_summary_service.py
+
+import uuid
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from .asset_summary_crud import asset_summary_crud, CRUDAssetSummary
+from .asset_summary_schemas import AssetSummaryRead
+
+
+class AssetSummaryService:
+    """
+    Camada de Serviço para o resumo do Ativo.
+    """
+
+    def __init__(self, crud_summary: CRUDAssetSummary):
+        self.crud_summary = crud_summary
+
+    def get_summary(self, db: Session, *, asset_id: uuid.UUID) -> AssetSummaryRead:
+        """Obtém o resumo do ativo numa única query (404 se não existir)."""
+        row = self.crud_summary.get_summary(db, asset_id=asset_id)
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Ativo não encontrado",
+            )
+        by_status = row["open_work_orders_by_status"] or {}
+        return AssetSummaryRead(
+            **row,
+            open_work_orders=sum(by_status.values()),
+        )
+
+
+# Instância única do serviço
+asset_summary_service = AssetSummaryService(asset_summary_crud)
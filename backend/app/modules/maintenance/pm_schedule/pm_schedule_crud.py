@@ -0,0 +1,275 @@
+# File: backend/app/modules/maintenance/pm_schedule/pm_schedule_crud.py
+
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, func, cast, Date, Float, String, Integer
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Subquery
+
+from app.models.maintenance.pm_plan_model import PMPlan, PMTriggerType
+from app.models.maintenance.pm_task_list_model import PMTask
+from app.models.maintenance.pm_parts_list_model import PMRequiredPart
+from app.models.maintenance.asset_model import Asset
+from app.models.maintenance.maintenance_team_model import MaintenanceTeam
+from app.models.maintenance.technician_model import Technician
+from app.models.administration.user_model import Usuario
+from app.models.inventory.product_model import VarianteProduto
+from app.modules.inventory.stock_balances.stock_balances_crud import saldo_estoque_crud
+from .pm_schedule_schemas import PMProjectionGroupBy, PMDemandPeriod
+
+
+class CRUDPMSchedule:
+    """
+    Consultas de leitura para a projeção do calendário de PMs.
+
+    Em vez de iterar os planos em Python (somando 'interval_days' num ciclo),
+    todas as ocorrências são geradas numa única query no PostgreSQL com
+    'generate_series', para todos os planos ao mesmo tempo.
+    """
+
+    def occurrences_subquery(
+        self,
+        *,
+        start: datetime,
+        end: datetime,
+        team_id: Optional[uuid.UUID] = None,
+        technician_id: Optional[uuid.UUID] = None,
+        asset_id: Optional[uuid.UUID] = None,
+    ) -> Subquery:
+        """
+        Constrói a subquery com uma linha por ocorrência projetada em [start, end).
+
+        Para cada plano ativo do tipo CALENDAR, com âncora
+        A = coalesce(next_due_date, start_date) e passo P = interval_days:
+            ocorrência k  ->  A + k * P,   k >= 0
+        Os índices k que caem na janela são calculados diretamente
+        (k0 = ceil((start - A) / P), k1 = ceil((end - A) / P) - 1),
+        e o 'generate_series(k0, k1)' expande-os numa única passagem.
+        """
+        anchor = func.coalesce(PMPlan.next_due_date, PMPlan.start_date)
+        step_seconds = PMPlan.interval_days * 86400
+
+        def seconds_from_anchor(ts: datetime):
+            return func.extract("epoch", ts - anchor)
+
+        first_k = func.greatest(0, func.ceil(seconds_from_anchor(start) / step_seconds))
+        last_k = func.ceil(seconds_from_anchor(end) / step_seconds) - 1
+
+        # Horas de mão de obra estimadas por ocorrência (soma das tarefas do plano)
+        labor_hours = (
+            select(func.coalesce(func.sum(PMTask.estimated_time_minutes), 0) / 60.0)
+            .where(PMTask.pm_plan_id == PMPlan.id)
+            .correlate(PMPlan)
+            .scalar_subquery()
+        )
+
+        plans = select(
+            PMPlan.id.label("pm_plan_id"),
+            PMPlan.plan_number,
+            PMPlan.title,
+            PMPlan.asset_id,
+            PMPlan.assigned_to_team_id,
+            PMPlan.assigned_to_technician_id,
+            anchor.label("anchor"),
+            PMPlan.interval_days,
+            cast(labor_hours, Float).label("estimated_labor_hours"),
+            func.generate_series(cast(first_k, Integer), cast(last_k, Integer), type_=Integer).label("k"),
+        ).where(
+            PMPlan.is_active == True,
+            PMPlan.trigger_type == PMTriggerType.CALENDAR,
+            PMPlan.interval_days > 0,
+        )
+
+        if team_id:
+            plans = plans.where(PMPlan.assigned_to_team_id == team_id)
+        if technician_id:
+            plans = plans.where(PMPlan.assigned_to_technician_id == technician_id)
+        if asset_id:
+            plans = plans.where(PMPlan.asset_id == asset_id)
+
+        plans = plans.subquery("pm_plans_expanded")
+
+        return select(
+            plans.c.pm_plan_id,
+            plans.c.plan_number,
+            plans.c.title,
+            plans.c.asset_id,
+            plans.c.assigned_to_team_id,
+            plans.c.assigned_to_technician_id,
+            (plans.c.anchor + plans.c.k * func.make_interval(0, 0, 0, plans.c.interval_days)).label("due_date"),
+            plans.c.estimated_labor_hours,
+        ).subquery("pm_occurrences")
+
+    def get_occurrences(
+        self,
+        db: Session,
+        *,
+        start: datetime,
+        end: datetime,
+        team_id: Optional[uuid.UUID] = None,
+        technician_id: Optional[uuid.UUID] = None,
+        asset_id: Optional[uuid.UUID] = None,
+        skip: int = 0,
+        limit: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """Lista as ocorrências projetadas, ordenadas por data de vencimento."""
+        occ = self.occurrences_subquery(
+            start=start, end=end, team_id=team_id, technician_id=technician_id, asset_id=asset_id
+        )
+        stmt = (
+            select(occ)
+            .order_by(occ.c.due_date, occ.c.plan_number)
+            .offset(skip)
+            .limit(limit)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_projection(
+        self,
+        db: Session,
+        *,
+        start: datetime,
+        end: datetime,
+        group_by: PMProjectionGroupBy,
+        team_id: Optional[uuid.UUID] = None,
+        technician_id: Optional[uuid.UUID] = None,
+        asset_id: Optional[uuid.UUID] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Agrega as ocorrências projetadas (contagem e horas estimadas)
+        pela dimensão pedida, também numa única query.
+        """
+        occ = self.occurrences_subquery(
+            start=start, end=end, team_id=team_id, technician_id=technician_id, asset_id=asset_id
+        )
+
+        if group_by == PMProjectionGroupBy.TEAM:
+            key = occ.c.assigned_to_team_id
+            label = MaintenanceTeam.name
+            source = occ.outerjoin(MaintenanceTeam, MaintenanceTeam.id == key)
+        elif group_by == PMProjectionGroupBy.TECHNICIAN:
+            key = occ.c.assigned_to_technician_id
+            label = Usuario.usuario
+            source = (
+                occ.outerjoin(Technician, Technician.id == key)
+                .outerjoin(Usuario, Usuario.id == Technician.user_id)
+            )
+        elif group_by == PMProjectionGroupBy.ASSET:
+            key = occ.c.asset_id
+            label = Asset.internal_tag
+            source = occ.join(Asset, Asset.id == key)
+        else:
+            key = None
+            label = cast(cast(func.date_trunc("week", occ.c.due_date), Date), String)
+            source = occ
+
+        columns = [
+            label.label("label"),
+            func.count().label("occurrences"),
+            func.coalesce(func.sum(occ.c.estimated_labor_hours), 0).label("estimated_labor_hours"),
+            func.min(occ.c.due_date).label("first_due_date"),
+            func.max(occ.c.due_date).label("last_due_date"),
+        ]
+        group_columns = [label]
+        if key is not None:
+            columns.insert(0, key.label("key"))
+            group_columns.insert(0, key)
+
+        stmt = (
+            select(*columns)
+            .select_from(source)
+            .group_by(*group_columns)
+            .order_by(func.min(occ.c.due_date))
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def _on_hand_subquery(self, variant_ids) -> Subquery:
+        """
+        Stock físico atual por variante (tabela de saldos), excluindo os
+        locais de sucata. Limitado às variantes de 'variant_ids' (uma subquery).
+        """
+        return saldo_estoque_crud.on_hand_subquery(variant_ids)
+
+    def get_parts_demand(
+        self,
+        db: Session,
+        *,
+        start: datetime,
+        end: datetime,
+        period: PMDemandPeriod,
+        team_id: Optional[uuid.UUID] = None,
+        technician_id: Optional[uuid.UUID] = None,
+        asset_id: Optional[uuid.UUID] = None,
+        variante_produto_id: Optional[uuid.UUID] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Previsão de consumo de peças das PMs projetadas, numa única query:
+        ocorrências x peças obrigatórias (PMRequiredPart), agregadas por
+        variante e período, com a necessidade acumulada (window function)
+        comparada com o stock atual.
+        """
+        occ = self.occurrences_subquery(
+            start=start, end=end, team_id=team_id, technician_id=technician_id, asset_id=asset_id
+        )
+        period_start = cast(func.date_trunc(period.value, occ.c.due_date), Date)
+
+        # Uma linha por (plano, variante): um plano pode listar a mesma
+        # variante mais do que uma vez, e cada ocorrência só conta uma vez
+        parts = (
+            select(
+                PMRequiredPart.pm_plan_id,
+                PMRequiredPart.product_variant_id,
+                func.sum(PMRequiredPart.quantity_required).label("quantity_required"),
+            )
+            .group_by(PMRequiredPart.pm_plan_id, PMRequiredPart.product_variant_id)
+        )
+        if variante_produto_id:
+            parts = parts.where(PMRequiredPart.product_variant_id == variante_produto_id)
+        parts = parts.subquery("pm_plan_parts")
+
+        demand = (
+            select(
+                parts.c.product_variant_id.label("variante_produto_id"),
+                period_start.label("period_start"),
+                func.count().label("occurrences"),
+                func.sum(parts.c.quantity_required).label("quantity_required"),
+            )
+            .select_from(occ.join(parts, parts.c.pm_plan_id == occ.c.pm_plan_id))
+            .group_by(parts.c.product_variant_id, period_start)
+            .subquery("pm_parts_demand")
+        )
+
+        on_hand_sq = self._on_hand_subquery(select(demand.c.variante_produto_id))
+        on_hand = func.coalesce(on_hand_sq.c.on_hand, 0)
+        cumulative = func.sum(demand.c.quantity_required).over(
+            partition_by=demand.c.variante_produto_id,
+            order_by=demand.c.period_start,
+        )
+
+        stmt = (
+            select(
+                demand.c.variante_produto_id,
+                VarianteProduto.referencia,
+                VarianteProduto.nome,
+                demand.c.period_start,
+                demand.c.occurrences,
+                demand.c.quantity_required,
+                cumulative.label("cumulative_required"),
+                on_hand.label("on_hand"),
+                (on_hand - cumulative).label("projected_balance"),
+                # Parte da necessidade deste período que o stock já não cobre
+                func.greatest(
+                    0, func.least(demand.c.quantity_required, cumulative - on_hand)
+                ).label("shortage_quantity"),
+            )
+            .join(VarianteProduto, VarianteProduto.id == demand.c.variante_produto_id)
+            .outerjoin(on_hand_sq, on_hand_sq.c.variante_produto_id == demand.c.variante_produto_id)
+            .order_by(VarianteProduto.referencia, demand.c.period_start)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+# Instância única (singleton) usada pelo serviço
+pm_schedule_crud = CRUDPMSchedule()
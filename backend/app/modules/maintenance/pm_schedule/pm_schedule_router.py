@@ -0,0 +1,108 @@
+# File: backend/app/modules/maintenance/pm_schedule/pm_schedule_router.py
+
+import uuid
+from datetime import date
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_db, get_current_active_user
+
+from .pm_schedule_schemas import (
+    PMOccurrenceRead,
+    PMProjectionRead,
+    PMProjectionGroupBy,
+    PMPartsDemandRead,
+    PMDemandPeriod,
+)
+from .pm_schedule_service import pm_schedule_service
+
+router = APIRouter(
+    prefix="/pm-schedule",
+    tags=["Manutenção - Calendário de PMs"],
+    dependencies=[Depends(get_current_active_user)]
+)
+
+
+@router.get(
+    "/occurrences",
+    response_model=List[PMOccurrenceRead],
+    summary="Listar ocorrências futuras de PMs"
+)
+def read_pm_occurrences(
+    db: Session = Depends(get_db),
+    date_from: Optional[date] = Query(None, description="Início da janela (padrão: hoje)"),
+    date_to: Optional[date] = Query(None, description="Fim da janela, inclusivo (padrão: início + 90 dias)"),
+    team_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Equipa"),
+    technician_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Técnico"),
+    asset_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Ativo"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=10000),
+):
+    """
+    Projeta as ocorrências futuras de todos os Planos de PM ativos
+    baseados em calendário (CALENDAR), ordenadas por data de vencimento.
+    O horizonte máximo é de 366 dias.
+    """
+    return pm_schedule_service.get_occurrences(
+        db, date_from=date_from, date_to=date_to,
+        team_id=team_id, technician_id=technician_id, asset_id=asset_id,
+        skip=skip, limit=limit,
+    )
+
+
+@router.get(
+    "/projection",
+    response_model=PMProjectionRead,
+    summary="Projeção agregada de carga de PMs"
+)
+def read_pm_projection(
+    db: Session = Depends(get_db),
+    group_by: PMProjectionGroupBy = Query(PMProjectionGroupBy.WEEK, description="Agrupar por: team, technician, asset ou week"),
+    date_from: Optional[date] = Query(None, description="Início da janela (padrão: hoje)"),
+    date_to: Optional[date] = Query(None, description="Fim da janela, inclusivo (padrão: início + 90 dias)"),
+    team_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Equipa"),
+    technician_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Técnico"),
+    asset_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Ativo"),
+):
+    """
+    Agrega as ocorrências projetadas por equipa, técnico, ativo ou semana,
+    com a contagem de ocorrências e as horas de mão de obra estimadas
+    (soma do tempo estimado das tarefas de cada plano).
+
+    O resultado fica em cache até que um Plano de PM ou as suas tarefas mudem.
+    """
+    return pm_schedule_service.get_projection(
+        db, group_by=group_by, date_from=date_from, date_to=date_to,
+        team_id=team_id, technician_id=technician_id, asset_id=asset_id,
+    )
+
+
+@router.get(
+    "/parts-demand",
+    response_model=PMPartsDemandRead,
+    summary="Previsão de consumo de peças das PMs"
+)
+def read_pm_parts_demand(
+    db: Session = Depends(get_db),
+    period: PMDemandPeriod = Query(PMDemandPeriod.WEEK, description="Período: day, week ou month"),
+    date_from: Optional[date] = Query(None, description="Início da janela (padrão: hoje)"),
+    date_to: Optional[date] = Query(None, description="Fim da janela, inclusivo (padrão: início + 90 dias)"),
+    team_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Equipa"),
+    technician_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Técnico"),
+    asset_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Ativo"),
+    variante_produto_id: Optional[uuid.UUID] = Query(None, description="Filtrar por Variante de Produto"),
+):
+    """
+    Multiplica as ocorrências projetadas das PMs pelas peças obrigatórias
+    de cada plano e agrega a necessidade por variante e período.
+
+    Cada linha compara a necessidade acumulada com o stock atual; a lista
+    'shortages' resume, por variante, a quantidade em falta e o primeiro
+    período em que o stock deixa de ser suficiente.
+    """
+    return pm_schedule_service.get_parts_demand(
+        db, period=period, date_from=date_from, date_to=date_to,
+        team_id=team_id, technician_id=technician_id, asset_id=asset_id,
+        variante_produto_id=variante_produto_id,
+    )
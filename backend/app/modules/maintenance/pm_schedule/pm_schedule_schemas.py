@@ -0,0 +1,102 @@
+# File: backend/app/modules/maintenance/pm_schedule/pm_schedule_schemas.py
+
+import enum
+import uuid
+from datetime import date, datetime
+from typing import Optional, List
+from pydantic import BaseModel, ConfigDict
+
+
+class PMProjectionGroupBy(str, enum.Enum):
+    """Dimensões disponíveis para agregar a projeção de PMs."""
+    TEAM = "team"
+    TECHNICIAN = "technician"
+    ASSET = "asset"
+    WEEK = "week"
+
+
+class PMOccurrenceRead(BaseModel):
+    """Uma ocorrência futura (projetada) de um Plano de PM por calendário."""
+    model_config = ConfigDict(from_attributes=True)
+
+    pm_plan_id: uuid.UUID
+    plan_number: str
+    title: str
+    asset_id: uuid.UUID
+    assigned_to_team_id: Optional[uuid.UUID] = None
+    assigned_to_technician_id: Optional[uuid.UUID] = None
+    due_date: datetime
+    # Soma do 'estimated_time_minutes' das tarefas do plano, em horas.
+    estimated_labor_hours: float
+
+
+class PMProjectionBucket(BaseModel):
+    """Linha agregada da projeção (por equipa, técnico, ativo ou semana)."""
+    model_config = ConfigDict(from_attributes=True)
+
+    # ID da entidade agrupada (None para 'week' ou para PMs sem atribuição)
+    key: Optional[uuid.UUID] = None
+    # Nome da equipa, utilizador do técnico, TAG do ativo ou início da semana
+    label: Optional[str] = None
+    occurrences: int
+    estimated_labor_hours: float
+    first_due_date: datetime
+    last_due_date: datetime
+
+
+class PMProjectionRead(BaseModel):
+    """Resposta do endpoint de projeção."""
+    date_from: date
+    date_to: date
+    group_by: PMProjectionGroupBy
+    total_occurrences: int
+    total_labor_hours: float
+    buckets: List[PMProjectionBucket]
+
+
+# --- Schemas da Previsão de Peças (Demanda de PMs) ---
+
+class PMDemandPeriod(str, enum.Enum):
+    """Granularidade dos períodos da previsão de peças."""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
+
+class PMPartsDemandLine(BaseModel):
+    """Necessidade de uma variante num período, comparada com o stock."""
+    model_config = ConfigDict(from_attributes=True)
+
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    period_start: date
+    occurrences: int
+    quantity_required: float
+    # Necessidade acumulada desde o início da janela até este período
+    cumulative_required: float
+    on_hand: float
+    # Stock projetado no fim do período (on_hand - cumulative_required)
+    projected_balance: float
+    shortage_quantity: float
+
+
+class PMPartsShortage(BaseModel):
+    """Resumo de falta por variante, para a equipa de compras."""
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    total_required: float
+    on_hand: float
+    shortage_quantity: float
+    # Primeiro período em que o stock atual deixa de cobrir a necessidade
+    first_shortage_period: date
+
+
+class PMPartsDemandRead(BaseModel):
+    """Resposta do endpoint de previsão de peças."""
+    date_from: date
+    date_to: date
+    period: PMDemandPeriod
+    lines: List[PMPartsDemandLine]
+    shortages: List[PMPartsShortage]
@@ -0,0 +1,198 @@
+# File: backend/app/modules/maintenance/pm_schedule/pm_schedule_service.py
+
+import uuid
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.core.cache import MemoryCache, invalidate_on_commit
+from app.models.maintenance.pm_plan_model import PMPlan
+from app.models.maintenance.pm_task_list_model import PMTask
+from app.models.maintenance.pm_parts_list_model import PMRequiredPart
+from app.models.inventory.stock_balance_model import SaldoEstoque
+from .pm_schedule_crud import pm_schedule_crud, CRUDPMSchedule
+from .pm_schedule_schemas import (
+    PMDemandPeriod,
+    PMOccurrenceRead,
+    PMPartsDemandLine,
+    PMPartsDemandRead,
+    PMPartsShortage,
+    PMProjectionBucket,
+    PMProjectionGroupBy,
+    PMProjectionRead,
+)
+
+# Janela padrão e máxima da projeção
+DEFAULT_HORIZON_DAYS = 90
+MAX_HORIZON_DAYS = 366
+
+# --- CACHE DA PROJEÇÃO ---
+# Os resultados ficam em memória até que um Plano de PM (ou as suas
+# tarefas, que definem as horas estimadas) seja alterado e confirmado.
+pm_schedule_cache = MemoryCache(maxsize=128)
+invalidate_on_commit(pm_schedule_cache, PMPlan, PMTask)
+
+# A previsão de peças depende também das listas de peças e do stock.
+pm_parts_demand_cache = MemoryCache(maxsize=64)
+invalidate_on_commit(pm_parts_demand_cache, PMPlan, PMRequiredPart, SaldoEstoque)
+
+
+class PMScheduleService:
+    """
+    Camada de Serviço para a projeção do calendário de Manutenção Preventiva.
+    """
+
+    def __init__(self, crud: CRUDPMSchedule):
+        self.crud = crud
+
+    def _resolve_window(
+        self, date_from: Optional[date], date_to: Optional[date]
+    ) -> Tuple[date, date, datetime, datetime]:
+        """
+        Normaliza a janela pedida (padrão: hoje + 90 dias) e valida o horizonte.
+        Retorna as datas e o intervalo [início, fim) em UTC.
+        """
+        date_from = date_from or date.today()
+        date_to = date_to or (date_from + timedelta(days=DEFAULT_HORIZON_DAYS))
+
+        if date_to < date_from:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="A data final deve ser igual ou posterior à data inicial.",
+            )
+        if (date_to - date_from).days > MAX_HORIZON_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"O horizonte da projeção não pode exceder {MAX_HORIZON_DAYS} dias.",
+            )
+
+        start = datetime.combine(date_from, time.min, tzinfo=timezone.utc)
+        end = datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=timezone.utc)
+        return date_from, date_to, start, end
+
+    def get_occurrences(
+        self,
+        db: Session,
+        *,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        team_id: Optional[uuid.UUID] = None,
+        technician_id: Optional[uuid.UUID] = None,
+        asset_id: Optional[uuid.UUID] = None,
+        skip: int = 0,
+        limit: int = 1000,
+    ) -> List[PMOccurrenceRead]:
+        """Lista as ocorrências futuras de PMs por calendário na janela pedida."""
+        date_from, date_to, start, end = self._resolve_window(date_from, date_to)
+        cache_key = ("occurrences", date_from, date_to, team_id, technician_id, asset_id, skip, limit)
+
+        def load() -> List[PMOccurrenceRead]:
+            rows = self.crud.get_occurrences(
+                db, start=start, end=end,
+                team_id=team_id, technician_id=technician_id, asset_id=asset_id,
+                skip=skip, limit=limit,
+            )
+            return [PMOccurrenceRead(**row) for row in rows]
+
+        return pm_schedule_cache.get_or_set(cache_key, load)
+
+    def get_projection(
+        self,
+        db: Session,
+        *,
+        group_by: PMProjectionGroupBy,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        team_id: Optional[uuid.UUID] = None,
+        technician_id: Optional[uuid.UUID] = None,
+        asset_id: Optional[uuid.UUID] = None,
+    ) -> PMProjectionRead:
+        """
+        Agrega a projeção por equipa, técnico, ativo ou semana,
+        com o número de ocorrências e as horas de mão de obra estimadas.
+        """
+        date_from, date_to, start, end = self._resolve_window(date_from, date_to)
+        cache_key = ("projection", date_from, date_to, group_by, team_id, technician_id, asset_id)
+
+        def load() -> PMProjectionRead:
+            rows = self.crud.get_projection(
+                db, start=start, end=end, group_by=group_by,
+                team_id=team_id, technician_id=technician_id, asset_id=asset_id,
+            )
+            buckets = [PMProjectionBucket(**row) for row in rows]
+            return PMProjectionRead(
+                date_from=date_from,
+                date_to=date_to,
+                group_by=group_by,
+                total_occurrences=sum(b.occurrences for b in buckets),
+                total_labor_hours=round(sum(b.estimated_labor_hours for b in buckets), 2),
+                buckets=buckets,
+            )
+
+        return pm_schedule_cache.get_or_set(cache_key, load)
+
+    def get_parts_demand(
+        self,
+        db: Session,
+        *,
+        period: PMDemandPeriod,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        team_id: Optional[uuid.UUID] = None,
+        technician_id: Optional[uuid.UUID] = None,
+        asset_id: Optional[uuid.UUID] = None,
+        variante_produto_id: Optional[uuid.UUID] = None,
+    ) -> PMPartsDemandRead:
+        """
+        Calcula a necessidade de peças das PMs projetadas por variante e
+        período, e resume as faltas face ao stock atual.
+        """
+        date_from, date_to, start, end = self._resolve_window(date_from, date_to)
+        cache_key = (date_from, date_to, period, team_id, technician_id, asset_id, variante_produto_id)
+
+        def load() -> PMPartsDemandRead:
+            rows = self.crud.get_parts_demand(
+                db, start=start, end=end, period=period,
+                team_id=team_id, technician_id=technician_id, asset_id=asset_id,
+                variante_produto_id=variante_produto_id,
+            )
+            lines = [PMPartsDemandLine(**row) for row in rows]
+
+            # Resumo por variante (as linhas já vêm agregadas e ordenadas)
+            shortages: Dict[uuid.UUID, PMPartsShortage] = {}
+            totals: Dict[uuid.UUID, float] = {}
+            for line in lines:
+                totals[line.variante_produto_id] = line.cumulative_required
+                if line.shortage_quantity <= 0:
+                    continue
+                shortage = shortages.get(line.variante_produto_id)
+                if shortage is None:
+                    shortages[line.variante_produto_id] = PMPartsShortage(
+                        variante_produto_id=line.variante_produto_id,
+                        referencia=line.referencia,
+                        nome=line.nome,
+                        total_required=0,
+                        on_hand=line.on_hand,
+                        shortage_quantity=line.shortage_quantity,
+                        first_shortage_period=line.period_start,
+                    )
+                else:
+                    shortage.shortage_quantity += line.shortage_quantity
+            for variant_id, shortage in shortages.items():
+                shortage.total_required = totals[variant_id]
+
+            return PMPartsDemandRead(
+                date_from=date_from,
+                date_to=date_to,
+                period=period,
+                lines=lines,
+                shortages=list(shortages.values()),
+            )
+
+        return pm_parts_demand_cache.get_or_set(cache_key, load)
+
+
+# Instância única (singleton) do serviço
+pm_schedule_service = PMScheduleService(pm_schedule_crud)
@@ -11,6 +11,7 @@ from .assets.assets_router import router as assets_router
 from .work_orders.work_orders_router import router as work_orders_router
 # --- FIM DA NOVA IMPORTAÇÃO ---
 from .failure_analysis.failure_analysis_router import router as rca_router
+from .pm_schedule.pm_schedule_router import router as pm_schedule_router
 
 # Router principal do módulo de Manutenção
 maintenance_router = APIRouter()
@@ -25,5 +26,6 @@ maintenance_router.include_router(assets_router)
 maintenance_router.include_router(work_orders_router)
 # --- FIM DA NOVA INCLUSÃO ---
 maintenance_router.include_router(rca_router)
+maintenance_router.include_router(pm_schedule_router)
 
 # (Próximos passos incluirão: work_orders_router, pm_plans_router, etc.)
\ No newline at end of file
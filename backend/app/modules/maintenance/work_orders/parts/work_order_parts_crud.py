@@ -3,10 +3,12 @@
 import uuid
 from typing import List, Optional
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import select, asc
+from sqlalchemy import select, asc, update, func
 
 from app.core.crud_base import CRUDBase
 from app.models.maintenance.work_order_parts_model import WorkOrderPartUsage
+from app.models.maintenance.work_order_model import WorkOrder
+from app.models.inventory.product_model import VarianteProduto
 from .work_order_parts_schemas import (
     WorkOrderPartUsageCreate, 
     WorkOrderPartUsageUpdate
@@ -36,7 +38,7 @@ class CRUDWorkOrderPartUsage(CRUDBase[WorkOrderPartUsage, WorkOrderPartUsageCrea
             self.model.work_order_id == work_order_id
         ).options(
             joinedload(self.model.created_by_user),
-            joinedload(self.model.product) # Otimização: carrega os dados do produto
+            joinedload(self.model.product_variant) # Otimização: carrega os dados da variante
         )
         return db.scalars(statement).first()
 
@@ -54,7 +56,7 @@ class CRUDWorkOrderPartUsage(CRUDBase[WorkOrderPartUsage, WorkOrderPartUsageCrea
             .where(self.model.work_order_id == work_order_id)\
             .options(
                 joinedload(self.model.created_by_user),
-                joinedload(self.model.product) # Otimização: carrega os dados do produto
+                joinedload(self.model.product_variant) # Otimização: carrega os dados da variante
             )\
             .order_by(asc(self.model.created_at))
             
@@ -88,6 +90,63 @@ class CRUDWorkOrderPartUsage(CRUDBase[WorkOrderPartUsage, WorkOrderPartUsageCrea
         db.refresh(db_obj)
         return db_obj
     
+    def get_pending_postings(
+        self,
+        db: Session,
+        *,
+        work_order_id: uuid.UUID
+    ) -> List[WorkOrderPartUsage]:
+        """
+        Linhas da OS com consumo ainda por lançar no livro razão
+        (quantity_used > quantity_posted), com a variante já carregada.
+        As linhas ficam bloqueadas (FOR UPDATE) até ao commit, para que
+        dois lançamentos concorrentes não saiam duas vezes do stock.
+        """
+        statement = select(self.model)\
+            .where(
+                self.model.work_order_id == work_order_id,
+                self.model.quantity_used > self.model.quantity_posted
+            )\
+            .options(joinedload(self.model.product_variant))\
+            .order_by(asc(self.model.created_at))\
+            .with_for_update(of=self.model)
+        return db.scalars(statement).all()
+
+    def get_work_orders_with_pending(
+        self,
+        db: Session,
+        *,
+        statuses: List
+    ) -> List[WorkOrder]:
+        """OS (nos status indicados) com pelo menos uma linha por lançar."""
+        pending = select(self.model.work_order_id).where(
+            self.model.quantity_used > self.model.quantity_posted
+        )
+        statement = select(WorkOrder)\
+            .where(WorkOrder.id.in_(pending), WorkOrder.status.in_(statuses))\
+            .order_by(WorkOrder.wo_number)
+        return db.scalars(statement).all()
+
+    def mark_posted(self, db: Session, *, part_usage_ids: List[uuid.UUID]) -> None:
+        """
+        Marca as linhas como lançadas num único UPDATE ... FROM: o consumo
+        passa a 'quantity_posted' e, se a linha não tiver custo unitário,
+        fica com o custo padrão da variante. NÃO faz commit.
+        """
+        if not part_usage_ids:
+            return
+        statement = update(self.model)\
+            .where(
+                self.model.id.in_(part_usage_ids),
+                self.model.product_variant_id == VarianteProduto.id
+            )\
+            .values(
+                quantity_posted=self.model.quantity_used,
+                unit_cost=func.coalesce(self.model.unit_cost, VarianteProduto.custo_padrao)
+            )\
+            .execution_options(synchronize_session=False)
+        db.execute(statement)
+
     # Nota: O método 'update' do CRUDBase genérico será usado
     # para editar o consumo (se a regra de negócio permitir).
     
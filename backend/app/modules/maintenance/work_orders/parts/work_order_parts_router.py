@@ -70,6 +70,30 @@ def create_part_usage_for_work_order(
     )
 
 
+@router.post(
+    "/post-consumption",
+    response_model=List[WorkOrderPartUsageRead],
+    summary="Lançar o consumo de peças no stock"
+)
+def post_parts_consumption(
+    wo_id: uuid.UUID = Path(..., description="ID da Ordem de Serviço (pai)"),
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_active_user)
+):
+    """
+    Lança no livro razão de stock, em lote, as quantidades utilizadas
+    ainda não lançadas (referência = Nº da OS), com atualização dos saldos.
+
+    Normalmente isto acontece ao concluir a OS; este endpoint permite
+    lançar antes (ex: OS longas). Levanta 400 se faltar stock ou local.
+    """
+    return work_order_part_usage_service.post_consumption(
+        db=db,
+        work_order_id=wo_id,
+        current_user=current_user
+    )
+
+
 @router.put(
     "/{part_usage_id}",
     response_model=WorkOrderPartUsageRead,
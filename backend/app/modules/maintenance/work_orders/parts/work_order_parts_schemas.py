@@ -3,24 +3,26 @@
 import uuid
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 # Importa o schema mínimo partilhado
 from ..work_orders_shared_schemas import UserReadMinimal
 
-# (Nota: Futuramente, poderemos importar um 'ProductReadMinimal'
-#  do módulo de inventário para exibir o nome/código do produto)
-
 
 # --- Schemas de WorkOrderPartUsage (Consumo de Peças) ---
 
 class WorkOrderPartUsageBase(BaseModel):
     """Schema base com os campos essenciais para o consumo de uma peça."""
     
-    # O ID do Produto (do módulo de Inventário)
-    product_id: uuid.UUID 
-    
-    quantity_used: float = Field(..., gt=0, description="Quantidade utilizada (ex: 2.5).")
+    # A Variante do Produto (item de stock do módulo de Inventário)
+    product_variant_id: uuid.UUID
+
+    # Lote (opcional) e Local de onde a peça sai
+    lot_id: Optional[uuid.UUID] = None
+    location_id: Optional[uuid.UUID] = None
+
+    quantity_planned: float = Field(0, ge=0, description="Quantidade planeada (fica reservada enquanto a OS está em aberto).")
+    quantity_used: float = Field(0, ge=0, description="Quantidade utilizada (ex: 2.5).")
 
 
 class WorkOrderPartUsageCreate(WorkOrderPartUsageBase):
@@ -34,9 +36,20 @@ class WorkOrderPartUsageUpdate(BaseModel):
     Schema para atualizar um consumo de peça.
     (Normalmente, apenas a quantidade é editável).
     """
-    # Não permitimos a alteração do 'product_id';
+    # Não permitimos a alteração do 'product_variant_id';
     # O utilizador deve apagar e registar novamente.
-    quantity_used: Optional[float] = Field(None, gt=0, description="Nova quantidade utilizada.")
+    lot_id: Optional[uuid.UUID] = None
+    location_id: Optional[uuid.UUID] = None
+    quantity_planned: Optional[float] = Field(None, ge=0, description="Nova quantidade planeada.")
+    quantity_used: Optional[float] = Field(None, ge=0, description="Nova quantidade utilizada.")
+
+    @model_validator(mode="after")
+    def check_quantities(self):
+        # Omitir uma quantidade mantém-na; enviá-la a null não é permitido
+        nulls = [field for field in ("quantity_planned", "quantity_used") if field in self.model_fields_set and getattr(self, field) is None]
+        if nulls:
+            raise ValueError(f"As quantidades não podem ser nulas: {', '.join(nulls)}.")
+        return self
     
     
 class WorkOrderPartUsageRead(WorkOrderPartUsageBase):
@@ -45,10 +58,9 @@ class WorkOrderPartUsageRead(WorkOrderPartUsageBase):
     
     id: uuid.UUID
     work_order_id: uuid.UUID
+    quantity_posted: float = Field(0, description="Quantidade já lançada no livro razão de stock.")
+    unit_cost: Optional[float] = None
     created_at: datetime
     
     # Relações: Quem registou o consumo
-    created_by_user: Optional[UserReadMinimal] = None
-    
-    # (Futuramente, adicionaremos 'product: ProductReadMinimal = None'
-    #  quando a fatia de Inventário estiver pronta para essa integração)
\ No newline at end of file
+    created_by_user: Optional[UserReadMinimal] = None
\ No newline at end of file
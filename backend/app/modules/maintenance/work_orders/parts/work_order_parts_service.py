@@ -1,12 +1,17 @@
 # File: backend/app/modules/maintenance/work_orders/parts/work_order_parts_service.py
 
 import uuid
+from decimal import Decimal
 from typing import List, Optional
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
 from app.models.maintenance.work_order_parts_model import WorkOrderPartUsage
+from app.models.maintenance.work_order_model import WorkOrder, OPEN_WORK_ORDER_STATUSES
 from app.models.administration.user_model import Usuario
+from app.models.inventory.product_model import VarianteProduto
+from app.models.inventory.lot_model import Lote
+from app.models.inventory.location_model import Local
 
 # Importa o CRUD e Schemas desta sub-fatia
 from .work_order_parts_crud import crud_work_order_part_usage, CRUDWorkOrderPartUsage
@@ -20,10 +25,8 @@ from .work_order_parts_schemas import (
 from ..work_orders_service import work_order_service
 
 # --- VALIDAÇÃO INTER-MODULAR ---
-# --- CORREÇÃO DE IMPORTAÇÃO ---
-# O nome da instância no módulo de inventário é 'produto_crud'
-from app.modules.inventory.products.products_crud import produto_crud
-# --- FIM DA CORREÇÃO ---
+# Disponibilidade de stock (físico - reservas) do módulo de inventário
+from app.modules.inventory.stock_availability.stock_availability_service import disponibilidade_service
 
 
 class WorkOrderPartUsageService:
@@ -67,23 +70,61 @@ class WorkOrderPartUsageService:
         self, 
         db: Session, 
         *, 
-        product_id: uuid.UUID
+        product_variant_id: Optional[uuid.UUID] = None,
+        lot_id: Optional[uuid.UUID] = None,
+        location_id: Optional[uuid.UUID] = None
     ):
-        """Helper privado para validar o Produto (Peça)."""
-        if product_id:
-            # --- CORREÇÃO DE USO ---
-            product = produto_crud.get(db, id=product_id)
-            # --- FIM DA CORREÇÃO ---
-            if not product:
+        """Helper privado para validar a Variante (Peça), o Lote e o Local."""
+        if product_variant_id:
+            variant = db.get(VarianteProduto, product_variant_id)
+            if not variant:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
-                    detail=f"Produto (Peça) com ID {product_id} não encontrado no inventário."
+                    detail=f"Variante de produto (Peça) com ID {product_variant_id} não encontrada no inventário."
                 )
-            if not product.is_active: # Respeita o soft-delete do produto
+            if not variant.is_active: # Respeita o soft-delete da variante
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Não é possível consumir o Produto '{product.name}', pois ele está inativo."
+                    detail=f"Não é possível consumir a peça '{variant.referencia}', pois ela está inativa."
                 )
+        if lot_id:
+            lot = db.get(Lote, lot_id)
+            if not lot:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Lote com ID {lot_id} não encontrado.")
+            if product_variant_id and lot.variante_produto_id != product_variant_id:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"O lote '{lot.nome}' não pertence à peça indicada."
+                )
+        if location_id and not db.get(Local, location_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Local com ID {location_id} não encontrado.")
+
+    def _ensure_reservation(
+        self,
+        db: Session,
+        *,
+        work_order: WorkOrder,
+        product_variant_id: uuid.UUID,
+        location_id: Optional[uuid.UUID],
+        quantity_planned: float,
+        quantity_used: float,
+        quantity_posted: float = 0,
+        part_usage_id: Optional[uuid.UUID] = None
+    ):
+        """
+        Numa OS em aberto, a quantidade planeada fica reservada: verifica
+        que o local ainda tem disponível o que a linha vai reter
+        (max(planeado, usado) - já lançado), descontando as outras reservas.
+        """
+        quantity = max(Decimal(str(quantity_planned)), Decimal(str(quantity_used))) - Decimal(str(quantity_posted or 0))
+        if work_order.status not in OPEN_WORK_ORDER_STATUSES or not location_id or quantity <= 0:
+            return
+        disponibilidade_service.ensure_available(
+            db,
+            local_id=location_id,
+            quantidades={product_variant_id: quantity},
+            exclude_part_id=part_usage_id,
+        )
 
     def get_parts_for_wo(
         self, 
@@ -116,12 +157,27 @@ class WorkOrderPartUsageService:
         O 'created_by_user_id' é preenchido automaticamente.
         """
         # 1. Valida se a OS "pai" existe
-        work_order_service.get_work_order(db, wo_id=work_order_id)
+        db_wo = work_order_service.get_work_order(db, wo_id=work_order_id)
         
-        # 2. Valida o Produto (Peça)
-        self._validate_foreign_keys(db, product_id=obj_in.product_id)
+        # 2. Valida a Peça, o Lote e o Local
+        self._validate_foreign_keys(
+            db,
+            product_variant_id=obj_in.product_variant_id,
+            lot_id=obj_in.lot_id,
+            location_id=obj_in.location_id
+        )
+
+        # 3. Reserva (verifica a disponibilidade se a OS estiver em aberto)
+        self._ensure_reservation(
+            db,
+            work_order=db_wo,
+            product_variant_id=obj_in.product_variant_id,
+            location_id=obj_in.location_id,
+            quantity_planned=obj_in.quantity_planned,
+            quantity_used=obj_in.quantity_used
+        )
         
-        # 3. Cria o registo de consumo
+        # 4. Cria o registo de consumo
         return self.crud_part_usage.create_part_usage(
             db=db,
             obj_in=obj_in,
@@ -149,8 +205,42 @@ class WorkOrderPartUsageService:
         
         # 2. Converte o schema de update para dict
         update_data = obj_in.model_dump(exclude_unset=True)
+
+        # O consumo já lançado no livro razão não pode ser reduzido nem mudar de origem
+        if db_part.quantity_posted:
+            if update_data.get("quantity_used", db_part.quantity_used) < db_part.quantity_posted:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail=f"A quantidade utilizada não pode ser inferior à já lançada em stock ({db_part.quantity_posted})."
+                )
+            if any(
+                field in update_data and update_data[field] != getattr(db_part, field)
+                for field in ("lot_id", "location_id")
+            ):
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="Não é possível alterar o lote ou o local de um consumo já lançado em stock."
+                )
+
+        # 3. Valida o Lote/Local e a nova reserva
+        self._validate_foreign_keys(
+            db,
+            product_variant_id=db_part.product_variant_id,
+            lot_id=update_data.get("lot_id"),
+            location_id=update_data.get("location_id")
+        )
+        self._ensure_reservation(
+            db,
+            work_order=db_part.work_order,
+            product_variant_id=db_part.product_variant_id,
+            location_id=update_data.get("location_id", db_part.location_id),
+            quantity_planned=update_data.get("quantity_planned", db_part.quantity_planned),
+            quantity_used=update_data.get("quantity_used", db_part.quantity_used),
+            quantity_posted=db_part.quantity_posted,
+            part_usage_id=db_part.id
+        )
         
-        # 3. Aplica a atualização
+        # 4. Aplica a atualização
         return self.crud_part_usage.update(
             db=db, 
             db_obj=db_part, 
@@ -174,9 +264,35 @@ class WorkOrderPartUsageService:
             part_usage_id=part_usage_id
         )
         
+        if db_part.quantity_posted:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Não é possível eliminar um consumo já lançado em stock."
+            )
+
         # 2. Remove o registo
         return self.crud_part_usage.remove(db=db, id=db_part.id)
 
+    def post_consumption(
+        self,
+        db: Session,
+        *,
+        work_order_id: uuid.UUID,
+        current_user: Usuario
+    ) -> List[WorkOrderPartUsageRead]:
+        """
+        Lança já (sem esperar pela conclusão da OS) o consumo pendente
+        das peças no livro razão, numa única transação.
+        """
+        db_wo = work_order_service.get_work_order(db, wo_id=work_order_id)
+        try:
+            work_order_service.post_parts_consumption(db, db_wo, usuario_id=current_user.id)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return self.crud_part_usage.get_multi_by_work_order(db=db, work_order_id=work_order_id)
+
 # Instância única do serviço
 # --- CORREÇÃO DE NOME DE INSTÂNCIA ---
 # (O nome da classe CRUD é CRUDWorkOrderPartUsage)
@@ -10,6 +10,8 @@ from app.core.crud_base import CRUDBase
 from app.models.maintenance.work_order_model import WorkOrder
 from app.models.administration.user_model import Usuario
 from app.models.maintenance.asset_model import Asset # Necessário para a busca
+from app.modules.maintenance.assets.hierarchy.asset_hierarchy_crud import asset_hierarchy_crud
+from app.modules.inventory.locations.locations_crud import local_crud
 from .work_orders_schemas import WorkOrderCreate, WorkOrderUpdate
 
 class CRUDWorkOrder(CRUDBase[WorkOrder, WorkOrderCreate, WorkOrderUpdate]):
@@ -45,13 +47,17 @@ class CRUDWorkOrder(CRUDBase[WorkOrder, WorkOrderCreate, WorkOrderUpdate]):
         is_active: Optional[bool] = None, # O modelo WorkOrder não usa soft-delete
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
-        sort_order: str = "asc"
+        sort_order: str = "asc",
+        subtree_of: Optional[uuid.UUID] = None,
+        location_subtree_of: Optional[uuid.UUID] = None
     ) -> List[WorkOrder]:
         """
         Obtém uma lista de Ordens de Serviço, com otimização (Eager Loading)
         para as relações mais comuns da listagem e busca personalizada.
         
         Sobrescreve o get_multi base para adicionar otimizações.
+        'subtree_of' limita o resultado às OS de ativos na subárvore desse ativo.
+        'location_subtree_of' limita às OS de ativos nesse local ou nos seus sublocais.
         """
         
         # Inicia a query otimizada (apenas relações da listagem)
@@ -61,6 +67,17 @@ class CRUDWorkOrder(CRUDBase[WorkOrder, WorkOrderCreate, WorkOrderUpdate]):
             joinedload(self.model.assigned_to_team),
         )
         
+        # Filtro de hierarquia de ativos (tabela de fecho)
+        if subtree_of:
+            query = query.filter(self.model.asset_id.in_(asset_hierarchy_crud.subtree_ids(subtree_of)))
+
+        # Filtro por local (tabela de fecho dos locais, via Asset.location_id)
+        if location_subtree_of:
+            assets_in_location = select(Asset.id).where(
+                Asset.location_id.in_(local_crud.subtree_ids(location_subtree_of))
+            )
+            query = query.filter(self.model.asset_id.in_(assets_in_location))
+
         # Lógica de Pesquisa (Customizada para WorkOrder)
         if search:
             # Garante o JOIN em Asset para a busca
@@ -64,7 +64,9 @@ def read_work_orders(
     limit: int = Query(100, ge=1, le=500, description="Número máximo de registos a retornar"),
     search: Optional[str] = Query(None, description="Pesquisa (Nº OS, Título, Nome do Ativo, TAG do Ativo)"),
     sort_by: Optional[str] = Query(None, description="Campo para ordenar (ex: 'wo_number', 'asset.name')"),
-    sort_order: str = Query("desc", description="Ordem: 'asc' ou 'desc' (padrão 'desc' por data de criação)")
+    sort_order: str = Query("desc", description="Ordem: 'asc' ou 'desc' (padrão 'desc' por data de criação)"),
+    subtree_of: Optional[uuid.UUID] = Query(None, description="Apenas OS de ativos na subárvore deste Ativo"),
+    location_subtree_of: Optional[uuid.UUID] = Query(None, description="Apenas OS de ativos neste Local ou nos seus sublocais")
 ):
     """
     Obtém uma lista de Ordens de Serviço com paginação, busca e ordenação.
@@ -76,7 +78,9 @@ def read_work_orders(
         limit=limit, 
         search=search, 
         sort_by=sort_by, 
-        sort_order=sort_order
+        sort_order=sort_order,
+        subtree_of=subtree_of,
+        location_subtree_of=location_subtree_of
     )
 
 
@@ -108,7 +112,8 @@ def read_work_order(
 def update_work_order(
     wo_id: uuid.UUID = Path(..., description="ID da Ordem de Serviço a atualizar"),
     wo_in: WorkOrderUpdate = Body(...),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    current_user: Usuario = Depends(get_current_active_user)
 ):
     """
     Atualiza os detalhes de uma Ordem de Serviço existente.
@@ -116,8 +121,11 @@ def update_work_order(
     O 'service' irá:
     - Validar FKs (Ativo, Técnico, Equipa) se forem alterados.
     - Gerir automaticamente o campo 'completed_at' se o status for 'COMPLETED'.
+    - Ao concluir a OS, lançar o consumo de peças no livro razão (saída de stock).
     """
-    return work_order_service.update_work_order(db=db, wo_id=wo_id, obj_in=wo_in)
+    return work_order_service.update_work_order(
+        db=db, wo_id=wo_id, obj_in=wo_in, current_user=current_user
+    )
 
 
 @router.delete(
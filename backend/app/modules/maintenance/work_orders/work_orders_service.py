@@ -2,12 +2,13 @@
 
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from decimal import Decimal
+from typing import Dict, List, Optional
 
 from fastapi import HTTPException, status
 from sqlalchemy.orm import Session
 
-from app.models.maintenance.work_order_model import WorkOrder, WorkOrderStatus
+from app.models.maintenance.work_order_model import WorkOrder, WorkOrderStatus, OPEN_WORK_ORDER_STATUSES
 from app.models.maintenance.asset_model import AssetStatus
 from app.models.administration.user_model import Usuario
 from .work_orders_crud import crud_work_order, CRUDWorkOrder
@@ -19,6 +20,10 @@ from app.modules.maintenance.assets.assets_crud import crud_asset
 from app.modules.maintenance.technicians.technicians_crud import technician_crud
 from app.modules.maintenance.teams.teams_crud import maintenance_team_crud
 # --- FIM DA CORREÇÃO ---
+from app.modules.inventory.stock_availability.stock_availability_service import disponibilidade_service
+from app.modules.inventory.stock_allocation.stock_allocation_service import alocacao_service
+from app.modules.inventory.stock_allocation.stock_allocation_schemas import AlocacaoItemPedido
+from .parts.work_order_parts_crud import crud_work_order_part_usage
 
 
 class WorkOrderService:
@@ -51,7 +56,9 @@ class WorkOrderService:
         limit: int = 100,
         search: Optional[str] = None,
         sort_by: Optional[str] = None,
-        sort_order: str = "asc"
+        sort_order: str = "asc",
+        subtree_of: Optional[uuid.UUID] = None,
+        location_subtree_of: Optional[uuid.UUID] = None
     ) -> List[WorkOrder]:
         """
         Busca uma lista de Ordens de Serviço, aplicando filtros.
@@ -64,7 +71,9 @@ class WorkOrderService:
             is_active=None, # Ignora o filtro de soft-delete
             search=search,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            subtree_of=subtree_of,
+            location_subtree_of=location_subtree_of
         )
 
     def create_work_order(
@@ -97,10 +106,13 @@ class WorkOrderService:
         db: Session, 
         *, 
         wo_id: uuid.UUID, 
-        obj_in: WorkOrderUpdate
+        obj_in: WorkOrderUpdate,
+        current_user: Optional[Usuario] = None
     ) -> WorkOrder:
         """
         Atualiza uma Ordem de Serviço existente.
+        Ao concluir a OS, o consumo de peças por lançar sai do stock
+        na mesma transação da mudança de status.
         """
         # 1. Busca o objeto existente (já trata 404)
         db_wo = self.get_work_order(db, wo_id=wo_id)
@@ -125,6 +137,16 @@ class WorkOrderService:
             elif new_status != WorkOrderStatus.COMPLETED and db_wo.completed_at:
                 update_data["completed_at"] = None
 
+            # Ao abrir a OS, as peças planeadas passam a ficar reservadas
+            if new_status in OPEN_WORK_ORDER_STATUSES and db_wo.status not in OPEN_WORK_ORDER_STATUSES:
+                self._ensure_parts_available(db, db_wo)
+
+            # Ao concluir a OS, o consumo real é lançado no livro razão
+            if new_status == WorkOrderStatus.COMPLETED and db_wo.status != WorkOrderStatus.COMPLETED:
+                self.post_parts_consumption(
+                    db, db_wo, usuario_id=current_user.id if current_user else None
+                )
+
         # 4. Atualização no banco
         return self.crud_work_order.update(db=db, db_obj=db_wo, obj_in=update_data)
 
@@ -150,6 +172,113 @@ class WorkOrderService:
              
         return deleted_wo 
 
+    def _ensure_parts_available(self, db: Session, db_wo: WorkOrder) -> None:
+        """
+        Verifica (uma consulta por local de origem) que as peças planeadas
+        da OS estão disponíveis antes de passarem a contar como reservas.
+        O que já foi lançado no livro razão já saiu do stock e não conta.
+        """
+        by_location: Dict[uuid.UUID, Dict[uuid.UUID, Decimal]] = {}
+        for part in db_wo.parts_used:
+            quantity = Decimal(str(max(part.quantity_planned, part.quantity_used))) - Decimal(str(part.quantity_posted or 0))
+            if not part.location_id or quantity <= 0:
+                continue
+            quantities = by_location.setdefault(part.location_id, {})
+            quantities[part.product_variant_id] = quantities.get(part.product_variant_id, Decimal(0)) + quantity
+        for location_id, quantities in by_location.items():
+            disponibilidade_service.ensure_available(db, local_id=location_id, quantidades=quantities)
+
+    def post_parts_consumption(
+        self,
+        db: Session,
+        db_wo: WorkOrder,
+        *,
+        usuario_id: Optional[uuid.UUID] = None
+    ) -> int:
+        """
+        Lança no livro razão (em lote) o consumo de peças ainda por lançar
+        da OS: por local de origem (linhas com e sem lote indicado à parte),
+        um único INSERT de movimentos de saída
+        (referência = Nº da OS) com a atualização dos saldos, e no fim um
+        único UPDATE que marca as linhas como lançadas.
+
+        NÃO faz commit (corre na transação de quem chama). Retorna o número
+        de linhas lançadas; levanta 400 se faltar o local ou o stock.
+        """
+        pending = crud_work_order_part_usage.get_pending_postings(db, work_order_id=db_wo.id)
+        if not pending:
+            return 0
+
+        sem_local = [part.product_variant.referencia for part in pending if not part.location_id]
+        if sem_local:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Indique o local de origem das peças antes de lançar o consumo: {', '.join(sem_local)}."
+            )
+
+        by_location: Dict[uuid.UUID, list] = {}
+        for part in pending:
+            by_location.setdefault(part.location_id, []).append(part)
+
+        for location_id, parts in by_location.items():
+            # Linhas com lote indicado: as peças já foram aplicadas, um lote
+            # expirado não impede o lançamento. Sem lote, a alocação FEFO
+            # continua a saltar os lotes expirados.
+            for com_lote in (True, False):
+                grupo = [part for part in parts if (part.lot_id is not None) == com_lote]
+                if not grupo:
+                    continue
+                alocacao_service.issue_items(
+                    db,
+                    referencia=db_wo.wo_number,
+                    local_id=location_id,
+                    itens=[
+                        AlocacaoItemPedido(
+                            variante_produto_id=part.product_variant_id,
+                            lote_id=part.lot_id,
+                            quantidade=Decimal(str(part.quantity_used)) - Decimal(str(part.quantity_posted)),
+                            # O custo da linha (ou o custo padrão da variante) segue para o movimento
+                            preco_un=Decimal(str(part.unit_cost))
+                            if part.unit_cost is not None else part.product_variant.custo_padrao,
+                        )
+                        for part in grupo
+                    ],
+                    usuario_id=usuario_id,
+                    # As peças saem das reservas da própria OS
+                    exclude_work_order_id=db_wo.id,
+                    excluir_expirados=not com_lote,
+                )
+
+        crud_work_order_part_usage.mark_posted(db, part_usage_ids=[part.id for part in pending])
+        return len(pending)
+
+    def flush_parts_consumption(
+        self,
+        db: Session,
+        *,
+        usuario_id: Optional[uuid.UUID] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Lançamento periódico: lança o consumo pendente das OS em curso
+        (e de OS concluídas com linhas ainda por lançar), uma transação
+        por OS. Uma OS com erro (ex: falta de stock) não impede as outras.
+        """
+        statuses = list(OPEN_WORK_ORDER_STATUSES) + [WorkOrderStatus.COMPLETED]
+        wo_numbers = [
+            (wo.id, wo.wo_number)
+            for wo in crud_work_order_part_usage.get_work_orders_with_pending(db, statuses=statuses)
+        ]
+        result: Dict[str, List[str]] = {"lancadas": [], "falhadas": []}
+        for wo_id, wo_number in wo_numbers:
+            try:
+                self.post_parts_consumption(db, db.get(WorkOrder, wo_id), usuario_id=usuario_id)
+                db.commit()
+                result["lancadas"].append(wo_number)
+            except HTTPException as exc:
+                db.rollback()
+                result["falhadas"].append(f"{wo_number}: {exc.detail}")
+        return result
+
     def _validate_foreign_keys(
         self,
         db: Session,
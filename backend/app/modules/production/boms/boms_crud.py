@@ -0,0 +1,206 @@
+# backend/app/modules/production/boms/boms_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, or_, and_
+from typing import Any, Collection, Dict, List, Optional, Tuple
+from decimal import Decimal
+import uuid
+
+from .... import models
+
+# (bom_id, qtd_producao, ((componente_variante_id, qtd), ...))
+BomRow = Tuple[uuid.UUID, Decimal, Tuple[Tuple[uuid.UUID, Decimal], ...]]
+
+
+class CRUDBomGraph:
+    """
+    Leitura em lote do grafo de listas de materiais (BOM).
+
+    Em vez de percorrer 'bom.componentes' pelo ORM (uma query por nível e
+    por componente), o grafo é carregado por níveis: cada nível são duas
+    queries 'IN' (BOMs aplicáveis às variantes da fronteira e os seus
+    componentes), independentemente do número de componentes.
+    """
+
+    def _applicable_boms_subquery(self, variante_ids: Optional[Collection[uuid.UUID]] = None):
+        """
+        BOM ativa usada por cada variante (coluna 'rn' == 1): a da própria
+        variante, ou a do produto (sem variante) se não houver; em empate,
+        a mais antiga. Sem 'variante_ids', cobre todas as variantes.
+        """
+        variante, bom = models.VarianteProduto, models.Bom
+        rank = func.row_number().over(
+            partition_by=variante.id,
+            order_by=(bom.variante_produto_id.is_(None), bom.created_at, bom.id),
+        )
+        candidates = (
+            select(
+                variante.id.label("variante_id"),
+                bom.id.label("bom_id"),
+                bom.qtd_producao,
+                rank.label("rn"),
+            )
+            .join(bom, and_(
+                bom.produto_id == variante.produto_id,
+                or_(bom.variante_produto_id == variante.id, bom.variante_produto_id.is_(None)),
+            ))
+            .where(bom.is_active == True)
+        )
+        if variante_ids is not None:
+            candidates = candidates.where(variante.id.in_(variante_ids))
+        return candidates.subquery("boms_aplicaveis")
+
+    def get_applicable_boms(self, db: Session, variante_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Tuple[uuid.UUID, Decimal]]:
+        """BOM aplicável (bom_id, qtd_producao) a cada uma das variantes."""
+        if not variante_ids:
+            return {}
+        candidates = self._applicable_boms_subquery(variante_ids)
+        stmt = select(candidates.c.variante_id, candidates.c.bom_id, candidates.c.qtd_producao).where(candidates.c.rn == 1)
+        return {row.variante_id: (row.bom_id, row.qtd_producao) for row in db.execute(stmt)}
+
+    def get_variants_with_bom(self, db: Session) -> List[uuid.UUID]:
+        """Todas as variantes que têm uma BOM aplicável (produtos fabricados)."""
+        candidates = self._applicable_boms_subquery()
+        return list(db.scalars(select(candidates.c.variante_id).where(candidates.c.rn == 1)))
+
+    def get_all_edges(self, db: Session) -> List[Tuple[uuid.UUID, Decimal, uuid.UUID, Decimal]]:
+        """
+        Todas as ligações pai -> componente das BOMs aplicáveis, numa só query:
+        (variante pai, qtd_producao, variante componente, qtd).
+        Base do índice inverso (onde é usado).
+        """
+        candidates = self._applicable_boms_subquery()
+        componente = models.BomComponente
+        stmt = (
+            select(candidates.c.variante_id, candidates.c.qtd_producao, componente.componente_variante_id, componente.qtd)
+            .join(componente, componente.bom_id == candidates.c.bom_id)
+            .where(candidates.c.rn == 1)
+        )
+        return [tuple(row) for row in db.execute(stmt)]
+
+    def get_components(self, db: Session, bom_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, List[Tuple[uuid.UUID, Decimal]]]:
+        """Componentes (variante, qtd) de várias BOMs numa só query."""
+        if not bom_ids:
+            return {}
+        componente = models.BomComponente
+        stmt = (
+            select(componente.bom_id, componente.componente_variante_id, componente.qtd)
+            .where(componente.bom_id.in_(bom_ids))
+            .order_by(componente.bom_id, componente.componente_variante_id)
+        )
+        components: Dict[uuid.UUID, List[Tuple[uuid.UUID, Decimal]]] = {}
+        for bom_id, variante_id, qtd in db.execute(stmt):
+            components.setdefault(bom_id, []).append((variante_id, qtd))
+        return components
+
+    def load_graph(self, db: Session, variante_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, BomRow]:
+        """
+        Carrega o grafo completo abaixo de 'variante_ids', nível a nível.
+        Devolve {variante_id: (bom_id, qtd_producao, componentes)} apenas
+        para as variantes que têm BOM (as restantes são materiais de compra).
+        """
+        graph: Dict[uuid.UUID, BomRow] = {}
+        seen = set(variante_ids)
+        frontier = set(variante_ids)
+        while frontier:
+            boms = self.get_applicable_boms(db, frontier)
+            components = self.get_components(db, [bom_id for bom_id, _ in boms.values()])
+            frontier = set()
+            for variante_id, (bom_id, qtd_producao) in boms.items():
+                rows = tuple(components.get(bom_id, ()))
+                graph[variante_id] = (bom_id, qtd_producao, rows)
+                for componente_id, _ in rows:
+                    if componente_id not in seen:
+                        seen.add(componente_id)
+                        frontier.add(componente_id)
+        return graph
+
+    def load_boms(self, db: Session, bom_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, BomRow]:
+        """BOMs indicadas explicitamente (ex: a BOM de cada OP), ativas ou não: {bom_id: BomRow}."""
+        if not bom_ids:
+            return {}
+        bom = models.Bom
+        qtds = dict(db.execute(select(bom.id, bom.qtd_producao).where(bom.id.in_(bom_ids))).all())
+        components = self.get_components(db, list(qtds))
+        return {bom_id: (bom_id, qtd_producao, tuple(components.get(bom_id, ()))) for bom_id, qtd_producao in qtds.items()}
+
+    def load_graph_with_boms(
+        self, db: Session, variante_ids: Collection[uuid.UUID], bom_ids: Collection[uuid.UUID]
+    ) -> Tuple[Dict[uuid.UUID, BomRow], Dict[uuid.UUID, BomRow]]:
+        """
+        Grafo das BOMs aplicáveis abaixo de 'variante_ids' e dos componentes
+        das BOMs 'bom_ids', mais essas BOMs: (grafo, {bom_id: BomRow}).
+        """
+        explicit = self.load_boms(db, bom_ids)
+        roots = set(variante_ids)
+        roots.update(componente_id for _, _, rows in explicit.values() for componente_id, _ in rows)
+        return self.load_graph(db, roots), explicit
+
+    def get_variant_labels(self, db: Session, variante_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Tuple[str, str]]:
+        """(referencia, nome) das variantes, numa só query."""
+        if not variante_ids:
+            return {}
+        variante = models.VarianteProduto
+        stmt = select(
+            variante.id, variante.referencia, func.coalesce(variante.nome_exibido, variante.nome)
+        ).where(variante.id.in_(variante_ids))
+        return {row[0]: (row[1], row[2]) for row in db.execute(stmt)}
+
+
+    def get_variant_products(self, db: Session, variante_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, uuid.UUID]:
+        """Produto (produto_id) de cada variante, numa só query."""
+        if not variante_ids:
+            return {}
+        variante = models.VarianteProduto
+        stmt = select(variante.id, variante.produto_id).where(variante.id.in_(variante_ids))
+        return dict(db.execute(stmt).all())
+
+    # --- CONSUMIDORES (ONDE É USADO) ---
+
+    def get_open_production_orders(self, db: Session, variante_ids: Collection[uuid.UUID]) -> List[Dict[str, Any]]:
+        """Ordens de produção ainda não realizadas que produzem alguma das variantes."""
+        if not variante_ids:
+            return []
+        ordem = models.OrdemProducao
+        stmt = (
+            select(ordem.id, ordem.referencia, ordem.variante_produto_id, ordem.status, ordem.qtd_programada, ordem.datahora_programada)
+            .where(ordem.variante_produto_id.in_(variante_ids), ordem.datahora_realizado.is_(None))
+            .order_by(ordem.datahora_programada.asc().nulls_last(), ordem.referencia)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_pm_plan_usage(self, db: Session, variante_ids: Collection[uuid.UUID]) -> List[Dict[str, Any]]:
+        """Planos de PM ativos cuja lista de peças inclui alguma das variantes."""
+        if not variante_ids:
+            return []
+        peca, plano = models.PMRequiredPart, models.PMPlan
+        stmt = (
+            select(
+                plano.id.label("pm_plan_id"), plano.plan_number, plano.title, plano.asset_id,
+                peca.product_variant_id.label("variante_produto_id"), peca.quantity_required,
+            )
+            .join(plano, plano.id == peca.pm_plan_id)
+            .where(peca.product_variant_id.in_(variante_ids), plano.is_active == True)
+            .order_by(plano.plan_number)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_asset_spare_part_usage(self, db: Session, produto_ids: Collection[uuid.UUID]) -> List[Dict[str, Any]]:
+        """Ativos que têm algum dos produtos na sua lista de peças de reserva."""
+        if not produto_ids:
+            return []
+        peca, ativo = models.AssetSparePart, models.Asset
+        stmt = (
+            select(
+                ativo.id.label("asset_id"), ativo.internal_tag, ativo.name,
+                peca.product_id.label("produto_id"), peca.quantity_required,
+            )
+            .join(ativo, ativo.id == peca.asset_id)
+            .where(peca.product_id.in_(produto_ids), peca.is_active == True)
+            .order_by(ativo.internal_tag)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+# Instância única (singleton)
+bom_graph_crud = CRUDBomGraph()
@@ -0,0 +1,38 @@
+# backend/app/modules/production/boms/boms_router.py
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from decimal import Decimal
+import uuid
+
+from . import boms_schemas, boms_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/production/boms",
+    tags=["Produção - Listas de Materiais"]
+)
+
+@router.get("/explosao/{variante_id}", response_model=boms_schemas.BomExplosao, summary="Explodir a lista de materiais (multinível) de uma variante")
+def explode_bom_endpoint(
+    variante_id: uuid.UUID,
+    quantidade: Decimal = Query(Decimal(1), gt=0),
+    modo: boms_schemas.ModoExplosao = boms_schemas.ModoExplosao.PLANO,
+    max_niveis: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("production:read"))
+):
+    return boms_service.bom_explosion_service.explode(
+        db, variante_id=variante_id, quantidade=quantidade, modo=modo, max_niveis=max_niveis
+    )
+
+
+@router.get("/onde-usado/{variante_id}", response_model=boms_schemas.WhereUsed, summary="Onde é usada uma variante (BOM inversa, manutenção incluída)")
+def where_used_endpoint(
+    variante_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("production:read"))
+):
+    return boms_service.where_used_service.where_used(db, variante_id=variante_id)
@@ -0,0 +1,84 @@
+# backend/app/modules/production/boms/boms_schemas.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+from decimal import Decimal
+from datetime import datetime
+import enum
+import uuid
+
+# --- Schemas de Explosão de BOM ---
+
+class ModoExplosao(str, enum.Enum):
+    PLANO = "plano"          # Uma linha por variante, com a quantidade total
+    INDENTADO = "indentado"  # A árvore completa, linha a linha (ordem em profundidade)
+
+class BomExplosaoLinha(BaseModel):
+    """
+    Uma necessidade da explosão. No modo 'plano', 'nivel' é o nível mais
+    baixo em que a variante aparece (low-level code) e 'pai_variante_id' vem vazio.
+    """
+    nivel: int
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    quantidade: Decimal
+    subconjunto: bool  # True se a variante tem a sua própria BOM
+    pai_variante_id: Optional[uuid.UUID] = None
+
+class BomExplosao(BaseModel):
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    bom_id: uuid.UUID
+    quantidade: Decimal
+    modo: ModoExplosao
+    linhas: List[BomExplosaoLinha]
+
+# --- Schemas de "Onde é Usado" (BOM inversa) ---
+
+class WhereUsedPai(BaseModel):
+    """
+    Variante que usa o componente, direta (nivel 1) ou indiretamente.
+    'quantidade' é a quantidade acumulada do componente por 1 unidade do pai.
+    """
+    nivel: int
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    quantidade: Decimal
+
+class WhereUsedOrdemProducao(BaseModel):
+    id: uuid.UUID
+    referencia: str
+    status: str
+    variante_produto_id: uuid.UUID
+    qtd_programada: Optional[Decimal] = None
+    datahora_programada: Optional[datetime] = None
+    quantidade_componente: Optional[Decimal] = None  # qtd_programada x quantidade acumulada
+
+class WhereUsedPlanoPM(BaseModel):
+    pm_plan_id: uuid.UUID
+    plan_number: str
+    title: str
+    asset_id: uuid.UUID
+    variante_produto_id: uuid.UUID  # A própria variante ou um conjunto que a contém
+    quantity_required: Decimal
+    quantidade_componente: Decimal
+
+class WhereUsedAtivo(BaseModel):
+    asset_id: uuid.UUID
+    internal_tag: str
+    name: str
+    produto_id: uuid.UUID  # O produto do componente ou de um conjunto que o contém
+    quantity_required: Decimal
+    direto: bool
+
+class WhereUsed(BaseModel):
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    pais: List[WhereUsedPai]
+    ordens_producao: List[WhereUsedOrdemProducao]
+    planos_pm: List[WhereUsedPlanoPM]
+    ativos: List[WhereUsedAtivo]
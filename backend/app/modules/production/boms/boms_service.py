@@ -0,0 +1,320 @@
+# backend/app/modules/production/boms/boms_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Collection, Dict, Hashable, List, Optional, Tuple
+from decimal import Decimal
+import uuid
+
+from .... import models
+from ....core.cache import MemoryCache, invalidate_on_commit
+from . import boms_schemas
+from .boms_crud import bom_graph_crud, BomRow
+
+# --- CACHE DOS GRAFOS DE BOM ---
+# Cada grafo guarda também as explosões unitárias já calculadas; tudo é
+# descartado quando uma BOM ou um componente é alterado e confirmado.
+bom_graph_cache = MemoryCache(maxsize=256)
+invalidate_on_commit(bom_graph_cache, models.Bom, models.BomComponente)
+
+# --- ÍNDICE INVERSO (ONDE É USADO) ---
+# Um único índice para todo o catálogo. Também depende das variantes: uma
+# BOM de produto (sem variante) aplica-se a cada nova variante do produto.
+where_used_cache = MemoryCache(maxsize=1)
+invalidate_on_commit(where_used_cache, models.Bom, models.BomComponente, models.VarianteProduto)
+WHERE_USED_INDEX_KEY = "where_used"
+
+# (nivel relativo, variante, pai, quantidade por unidade do topo, tem BOM)
+LinhaIndentada = Tuple[int, uuid.UUID, uuid.UUID, Decimal, bool]
+
+
+class BomStructureError(ValueError):
+    """A estrutura de produto não pode ser explodida (ex: qtd_producao a zero)."""
+
+
+class BomCycleError(BomStructureError):
+    """A estrutura de produto contém um ciclo (ex: A -> B -> A)."""
+
+    def __init__(self, path: Tuple[uuid.UUID, ...]):
+        self.path = path
+        super().__init__("ciclo " + " -> ".join(str(variante_id) for variante_id in path))
+
+
+class BomGraph:
+    """
+    Grafo de BOMs já carregado, com a explosão memorizada por variante.
+
+    A explosão de cada subconjunto é calculada uma única vez por unidade
+    e reaproveitada (multiplicada pelo fator) em todos os pais onde
+    aparece; assim, milhares de nós custam uma passagem em memória.
+    Fator de um componente: qtd / qtd_producao da BOM do pai.
+
+    O caminho percorrido ('path') é passado como argumento (e não guardado
+    na instância) porque o mesmo grafo em cache é partilhado entre pedidos.
+    """
+
+    def __init__(self, boms: Dict[uuid.UUID, BomRow], explicit_boms: Optional[Dict[uuid.UUID, BomRow]] = None):
+        self.boms = boms
+        # BOMs por ID: as aplicáveis e as indicadas explicitamente (ex: a BOM de cada OP)
+        self.by_bom_id: Dict[uuid.UUID, BomRow] = {row[0]: row for row in boms.values()}
+        self.by_bom_id.update(explicit_boms or {})
+        self._flat: Dict[Hashable, Dict[uuid.UUID, Tuple[Decimal, int]]] = {}
+        self._indented: Dict[uuid.UUID, Tuple[LinhaIndentada, ...]] = {}
+
+    def _row(self, variante_id: uuid.UUID, bom_id: Optional[uuid.UUID] = None) -> Optional[BomRow]:
+        if bom_id is not None:
+            return self.by_bom_id.get(bom_id)
+        return self.boms.get(variante_id)
+
+    def has_bom(self, variante_id: uuid.UUID, bom_id: Optional[uuid.UUID] = None) -> bool:
+        return self._row(variante_id, bom_id) is not None
+
+    def components(self, variante_id: uuid.UUID, bom_id: Optional[uuid.UUID] = None):
+        """
+        (componente, quantidade por unidade do pai) da BOM de 'variante_id':
+        a aplicável ou, com 'bom_id', essa BOM em concreto.
+        """
+        row = self._row(variante_id, bom_id)
+        if row is None:
+            raise KeyError(bom_id if bom_id is not None else variante_id)
+        _, qtd_producao, rows = row
+        if not qtd_producao or qtd_producao <= 0:
+            raise BomStructureError(f"a BOM da variante {variante_id} tem qtd_producao <= 0")
+        for componente_id, qtd in rows:
+            yield componente_id, Decimal(qtd) / Decimal(qtd_producao)
+
+    @staticmethod
+    def _enter(path: Tuple[uuid.UUID, ...], variante_id: uuid.UUID) -> Tuple[uuid.UUID, ...]:
+        if variante_id in path:
+            raise BomCycleError(path[path.index(variante_id):] + (variante_id,))
+        return path + (variante_id,)
+
+    def unit_requirements(
+        self, variante_id: uuid.UUID, path: Tuple[uuid.UUID, ...] = (), bom_id: Optional[uuid.UUID] = None
+    ) -> Dict[uuid.UUID, Tuple[Decimal, int]]:
+        """
+        Necessidades totais (todas as profundidades) para 1 unidade de
+        'variante_id': {variante: (quantidade, nível mais baixo)}.
+        Com 'bom_id', o primeiro nível vem dessa BOM; os subconjuntos usam
+        sempre a sua BOM aplicável.
+        """
+        key = variante_id if bom_id is None else (variante_id, bom_id)
+        cached = self._flat.get(key)
+        if cached is not None:
+            return cached
+        path = self._enter(path, variante_id)
+        totals: Dict[uuid.UUID, Tuple[Decimal, int]] = {}
+        for componente_id, fator in self.components(variante_id, bom_id):
+            quantidade, nivel = totals.get(componente_id, (Decimal(0), 0))
+            totals[componente_id] = (quantidade + fator, max(nivel, 1))
+            if self.has_bom(componente_id):
+                for sub_id, (sub_quantidade, sub_nivel) in self.unit_requirements(componente_id, path).items():
+                    quantidade, nivel = totals.get(sub_id, (Decimal(0), 0))
+                    totals[sub_id] = (quantidade + fator * sub_quantidade, max(nivel, sub_nivel + 1))
+        self._flat[key] = totals
+        return totals
+
+    def unit_tree(self, variante_id: uuid.UUID, path: Tuple[uuid.UUID, ...] = ()) -> Tuple[LinhaIndentada, ...]:
+        """Árvore (ordem em profundidade) para 1 unidade de 'variante_id'."""
+        cached = self._indented.get(variante_id)
+        if cached is not None:
+            return cached
+        path = self._enter(path, variante_id)
+        rows: List[LinhaIndentada] = []
+        for componente_id, fator in self.components(variante_id):
+            sub_bom = self.has_bom(componente_id)
+            rows.append((1, componente_id, variante_id, fator, sub_bom))
+            if sub_bom:
+                rows.extend(
+                    (nivel + 1, sub_id, pai_id, fator * quantidade, tem_bom)
+                    for nivel, sub_id, pai_id, quantidade, tem_bom in self.unit_tree(componente_id, path)
+                )
+        result = tuple(rows)
+        self._indented[variante_id] = result
+        return result
+
+
+class WhereUsedIndex:
+    """
+    Índice inverso das BOMs: {componente: ((pai, quantidade por unidade do pai), ...)}.
+
+    Construído a partir de uma única query com todas as ligações; os
+    ascendentes de cada componente (com a quantidade acumulada) são
+    calculados uma vez e memorizados, como na explosão.
+    """
+
+    def __init__(self, edges):
+        parents: Dict[uuid.UUID, List[Tuple[uuid.UUID, Decimal]]] = {}
+        for pai_id, qtd_producao, componente_id, qtd in edges:
+            if not qtd_producao or qtd_producao <= 0:
+                raise BomStructureError(f"a BOM da variante {pai_id} tem qtd_producao <= 0")
+            parents.setdefault(componente_id, []).append((pai_id, Decimal(qtd) / Decimal(qtd_producao)))
+        self.parents = {componente_id: tuple(rows) for componente_id, rows in parents.items()}
+        self._ancestors: Dict[uuid.UUID, Dict[uuid.UUID, Tuple[Decimal, int]]] = {}
+
+    def ancestors(self, variante_id: uuid.UUID, path: Tuple[uuid.UUID, ...] = ()) -> Dict[uuid.UUID, Tuple[Decimal, int]]:
+        """
+        Todos os pais diretos e indiretos de 'variante_id':
+        {pai: (quantidade acumulada por unidade do pai, nível mais alto)}.
+        """
+        cached = self._ancestors.get(variante_id)
+        if cached is not None:
+            return cached
+        path = BomGraph._enter(path, variante_id)
+        totals: Dict[uuid.UUID, Tuple[Decimal, int]] = {}
+        for pai_id, fator in self.parents.get(variante_id, ()):
+            quantidade, nivel = totals.get(pai_id, (Decimal(0), 0))
+            totals[pai_id] = (quantidade + fator, max(nivel, 1))
+            for avo_id, (avo_quantidade, avo_nivel) in self.ancestors(pai_id, path).items():
+                quantidade, nivel = totals.get(avo_id, (Decimal(0), 0))
+                totals[avo_id] = (quantidade + fator * avo_quantidade, max(nivel, avo_nivel + 1))
+        self._ancestors[variante_id] = totals
+        return totals
+
+
+class BomExplosionService:
+    def get_graph(
+        self, db: Session, variante_ids: Collection[uuid.UUID], bom_ids: Collection[uuid.UUID] = ()
+    ) -> BomGraph:
+        """
+        Grafo de BOMs abaixo de 'variante_ids' e das BOMs 'bom_ids' indicadas
+        explicitamente (em cache até à próxima alteração).
+        """
+        key = (tuple(sorted(variante_ids)), tuple(sorted(bom_ids)))
+        return bom_graph_cache.get_or_set(
+            key, lambda: BomGraph(*bom_graph_crud.load_graph_with_boms(db, variante_ids, bom_ids))
+        )
+
+    def explode(
+        self,
+        db: Session,
+        *,
+        variante_id: uuid.UUID,
+        quantidade: Decimal,
+        modo: boms_schemas.ModoExplosao,
+        max_niveis: Optional[int] = None,
+    ) -> boms_schemas.BomExplosao:
+        graph = self.get_graph(db, [variante_id])
+        if not graph.has_bom(variante_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="A variante não tem uma lista de materiais (BOM) ativa.")
+
+        try:
+            if modo == boms_schemas.ModoExplosao.PLANO:
+                rows = [
+                    (nivel, componente_id, None, quantidade * unitaria, graph.has_bom(componente_id))
+                    for componente_id, (unitaria, nivel) in graph.unit_requirements(variante_id).items()
+                ]
+                rows.sort(key=lambda row: row[0])
+            else:
+                rows = [
+                    (nivel, componente_id, pai_id, quantidade * unitaria, tem_bom)
+                    for nivel, componente_id, pai_id, unitaria, tem_bom in graph.unit_tree(variante_id)
+                ]
+        except BomStructureError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Não é possível explodir a estrutura de produto: {exc}."
+            )
+        if max_niveis is not None:
+            rows = [row for row in rows if row[0] <= max_niveis]
+
+        labels = bom_graph_crud.get_variant_labels(db, {variante_id} | {row[1] for row in rows})
+        referencia, nome = labels[variante_id]
+        return boms_schemas.BomExplosao(
+            variante_produto_id=variante_id,
+            referencia=referencia,
+            nome=nome,
+            bom_id=graph.boms[variante_id][0],
+            quantidade=quantidade,
+            modo=modo,
+            linhas=[
+                boms_schemas.BomExplosaoLinha(
+                    nivel=nivel,
+                    variante_produto_id=componente_id,
+                    referencia=labels[componente_id][0],
+                    nome=labels[componente_id][1],
+                    quantidade=linha_quantidade,
+                    subconjunto=tem_bom,
+                    pai_variante_id=pai_id,
+                )
+                for nivel, componente_id, pai_id, linha_quantidade, tem_bom in rows
+            ],
+        )
+
+
+
+class WhereUsedService:
+    def get_index(self, db: Session) -> WhereUsedIndex:
+        """Índice inverso (em cache até à próxima alteração de BOMs ou variantes)."""
+        return where_used_cache.get_or_set(WHERE_USED_INDEX_KEY, lambda: WhereUsedIndex(bom_graph_crud.get_all_edges(db)))
+
+    def where_used(self, db: Session, *, variante_id: uuid.UUID) -> boms_schemas.WhereUsed:
+        """
+        Onde é usada uma variante: conjuntos que a contêm (diretos e indiretos),
+        ordens de produção abertas desses conjuntos, planos de PM e ativos
+        (peças de reserva) que a usam, por si ou através de um conjunto.
+        """
+        try:
+            ancestors = self.get_index(db).ancestors(variante_id)
+        except BomStructureError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Não é possível percorrer a estrutura de produto: {exc}."
+            )
+
+        labels = bom_graph_crud.get_variant_labels(db, {variante_id} | set(ancestors))
+        if variante_id not in labels:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Variante de produto não encontrada.")
+
+        # Quantidade do componente por unidade de cada consumidor (1 para a própria variante)
+        per_unit = {pai_id: quantidade for pai_id, (quantidade, _) in ancestors.items()}
+        per_unit[variante_id] = Decimal(1)
+        produtos = bom_graph_crud.get_variant_products(db, per_unit.keys())
+        produto_direto = produtos[variante_id]
+
+        ordens = [
+            boms_schemas.WhereUsedOrdemProducao(
+                **ordem,
+                quantidade_componente=(
+                    ordem["qtd_programada"] * per_unit[ordem["variante_produto_id"]]
+                    if ordem["qtd_programada"] is not None else None
+                ),
+            )
+            for ordem in bom_graph_crud.get_open_production_orders(db, ancestors.keys())
+        ]
+        planos = [
+            boms_schemas.WhereUsedPlanoPM(
+                **plano, quantidade_componente=plano["quantity_required"] * per_unit[plano["variante_produto_id"]]
+            )
+            for plano in bom_graph_crud.get_pm_plan_usage(db, per_unit.keys())
+        ]
+        ativos = [
+            boms_schemas.WhereUsedAtivo(**ativo, direto=ativo["produto_id"] == produto_direto)
+            for ativo in bom_graph_crud.get_asset_spare_part_usage(db, set(produtos.values()))
+        ]
+
+        referencia, nome = labels[variante_id]
+        return boms_schemas.WhereUsed(
+            variante_produto_id=variante_id,
+            referencia=referencia,
+            nome=nome,
+            pais=sorted(
+                (
+                    boms_schemas.WhereUsedPai(
+                        nivel=nivel,
+                        variante_produto_id=pai_id,
+                        referencia=labels[pai_id][0],
+                        nome=labels[pai_id][1],
+                        quantidade=quantidade,
+                    )
+                    for pai_id, (quantidade, nivel) in ancestors.items()
+                ),
+                key=lambda pai: (pai.nivel, pai.referencia),
+            ),
+            ordens_producao=ordens,
+            planos_pm=planos,
+            ativos=ativos,
+        )
+
+bom_explosion_service = BomExplosionService()
+where_used_service = WhereUsedService()
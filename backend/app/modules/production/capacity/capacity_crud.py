@@ -0,0 +1,83 @@
+# backend/app/modules/production/capacity/capacity_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, case, cast, Float
+from typing import Any, Dict, List, Optional
+from datetime import date
+import uuid
+
+from .... import models
+
+
+class CRUDCapacity:
+    """
+    Leituras para a carga dos centros de trabalho.
+
+    As horas necessárias de cada ordem são calculadas no PostgreSQL:
+    - com 'Bom.duracao' (tempo de um lote de 'qtd_producao'):
+        horas = duracao x quantidade em falta / qtd_producao
+    - senão, com a capacidade do centro:
+        horas = quantidade em falta / capacidade_por_hora
+    Se nenhum dos dois estiver definido, 'horas' vem a NULL.
+    """
+
+    def hours_expression(self, quantity=None):
+        """
+        Horas para produzir 'quantity' (por omissão, a quantidade em falta da
+        ordem). Requer 'boms' e 'centros_trabalho' no FROM da query.
+        """
+        ordem, bom, centro = models.OrdemProducao, models.Bom, models.CentroTrabalho
+        if quantity is None:
+            quantity = func.greatest(func.coalesce(ordem.qtd_programada, 0) - func.coalesce(ordem.qtd_realizada, 0), 0)
+        by_duration = func.extract("epoch", bom.duracao) / 3600.0 * quantity / func.nullif(bom.qtd_producao, 0)
+        by_capacity = quantity / func.nullif(centro.capacidade_por_hora, 0)
+        return cast(case((bom.duracao.is_not(None), by_duration), else_=by_capacity), Float)
+
+    def _open_orders_select(self, centro_trabalho_id: Optional[uuid.UUID]):
+        ordem, bom, centro = models.OrdemProducao, models.Bom, models.CentroTrabalho
+        stmt = (
+            select(
+                ordem.id.label("ordem_id"),
+                ordem.referencia,
+                ordem.centro_trabalho_id,
+                centro.nome.label("centro_trabalho"),
+                ordem.datahora_programada,
+                self.hours_expression().label("horas"),
+            )
+            .join(centro, centro.id == ordem.centro_trabalho_id)
+            .join(bom, bom.id == ordem.bom_id)
+            .where(ordem.datahora_realizado.is_(None))
+        )
+        if centro_trabalho_id:
+            stmt = stmt.where(ordem.centro_trabalho_id == centro_trabalho_id)
+        return stmt
+
+    def get_open_orders(self, db: Session, *, centro_trabalho_id: Optional[uuid.UUID] = None) -> List[Dict[str, Any]]:
+        """Ordens em aberto com centro de trabalho e as horas necessárias."""
+        stmt = self._open_orders_select(centro_trabalho_id).order_by(
+            models.OrdemProducao.datahora_programada.asc().nulls_first(), models.OrdemProducao.referencia
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_load_orders(
+        self,
+        db: Session,
+        *,
+        end: date,
+        centro_trabalho_id: Optional[uuid.UUID] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Ordens em aberto com data programada anterior a 'end', pela data.
+        Inclui as que começaram antes do período, cujas horas ainda podem
+        cair dentro dele quando são repartidas pelos dias úteis.
+        """
+        ordem = models.OrdemProducao
+        stmt = self._open_orders_select(centro_trabalho_id).where(
+            ordem.datahora_programada.is_not(None),
+            ordem.datahora_programada < end,
+        ).order_by(ordem.datahora_programada)
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+# Instância única (singleton)
+capacity_crud = CRUDCapacity()
@@ -0,0 +1,45 @@
+# backend/app/modules/production/capacity/capacity_router.py
+
+from fastapi import APIRouter, Depends, Query, Body
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from datetime import date, time
+import uuid
+
+from . import capacity_schemas, capacity_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/production/capacidade",
+    tags=["Produção - Capacidade"]
+)
+
+@router.get("/carga", response_model=List[capacity_schemas.CargaCentroDia], summary="Carga diária dos centros de trabalho (horas necessárias vs disponíveis)")
+def read_load_endpoint(
+    data_inicio: date,
+    data_fim: date,
+    horas_por_dia: float = Query(8, gt=0, le=24),
+    inicio_turno: time = time(8, 0),
+    incluir_fim_de_semana: bool = False,
+    centro_trabalho_id: Optional[uuid.UUID] = None,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("production:read"))
+):
+    return capacity_service.capacity_service.get_load(
+        db,
+        data_inicio=data_inicio,
+        data_fim=data_fim,
+        horas_por_dia=horas_por_dia,
+        inicio_turno=inicio_turno,
+        incluir_fim_de_semana=incluir_fim_de_semana,
+        centro_trabalho_id=centro_trabalho_id,
+    )
+
+@router.post("/programar", response_model=capacity_schemas.ProgramacaoResultado, summary="Propor datas de início com capacidade finita (programação para a frente)")
+def schedule_endpoint(
+    parametros: capacity_schemas.ProgramacaoParametros = Body(default_factory=capacity_schemas.ProgramacaoParametros),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("production:read"))
+):
+    return capacity_service.capacity_service.schedule(db, parametros=parametros)
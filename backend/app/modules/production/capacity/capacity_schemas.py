@@ -0,0 +1,45 @@
+# backend/app/modules/production/capacity/capacity_schemas.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import date, datetime, time
+import uuid
+
+# --- Schemas de Carga dos Centros de Trabalho ---
+
+class CargaCentroDia(BaseModel):
+    centro_trabalho_id: uuid.UUID
+    centro_trabalho: str
+    dia: date
+    ordens: int
+    sem_tempo: int  # Ordens sem 'Bom.duracao' nem capacidade do centro
+    horas_necessarias: float
+    horas_disponiveis: float
+    utilizacao: float  # horas_necessarias / horas_disponiveis
+    sobrecarga: bool
+
+# --- Schemas da Programação com Capacidade Finita ---
+
+class ProgramacaoParametros(BaseModel):
+    data_inicio: Optional[datetime] = None  # Padrão: agora
+    horas_por_dia: float = Field(8, gt=0, le=24)
+    inicio_turno: time = time(8, 0)
+    incluir_fim_de_semana: bool = False
+    centro_trabalho_id: Optional[uuid.UUID] = None
+    # Ordens programadas primeiro (na sua data, ou na primeira folga a seguir)
+    ordens_prioritarias: List[uuid.UUID] = []
+
+class ProgramacaoOrdem(BaseModel):
+    ordem_id: uuid.UUID
+    referencia: str
+    centro_trabalho_id: uuid.UUID
+    centro_trabalho: str
+    horas: float
+    datahora_programada: Optional[datetime] = None
+    inicio_proposto: datetime
+    fim_proposto: datetime
+    atraso_horas: float  # Horas úteis entre a data programada e o início proposto
+
+class ProgramacaoResultado(BaseModel):
+    ordens: List[ProgramacaoOrdem]
+    ordens_sem_tempo: List[uuid.UUID]  # Não programadas: sem horas calculáveis
@@ -0,0 +1,210 @@
+# backend/app/modules/production/capacity/capacity_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Dict, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta
+from bisect import bisect_left, bisect_right
+import math
+import uuid
+
+from . import capacity_schemas
+from .capacity_crud import capacity_crud
+
+
+class WorkCalendar:
+    """
+    Converte datas em 'horas úteis' desde o início do calendário (e vice-versa).
+
+    Cada dia útil contribui com 'horas_por_dia' a partir de 'inicio_turno';
+    no eixo de horas úteis a programação passa a ser um problema a uma
+    dimensão, sem ter de partir ordens nas mudanças de dia.
+    """
+
+    def __init__(self, start: datetime, *, horas_por_dia: float, inicio_turno: time, incluir_fim_de_semana: bool):
+        self.horas_por_dia = horas_por_dia
+        self.inicio_turno = inicio_turno
+        self.incluir_fim_de_semana = incluir_fim_de_semana
+        self.days: List[date] = []
+        self._next = start.date()
+        self.origin = self.to_axis(start)
+
+    def _is_working_day(self, day: date) -> bool:
+        return self.incluir_fim_de_semana or day.weekday() < 5
+
+    def _extend_to(self, day: date) -> None:
+        while not self.days or self.days[-1] < day:
+            if self._is_working_day(self._next):
+                self.days.append(self._next)
+            self._next += timedelta(days=1)
+
+    def _extend_count(self, count: int) -> None:
+        while len(self.days) <= count:
+            self._extend_to(self._next)
+
+    def to_axis(self, when: datetime) -> float:
+        day = when.date()
+        self._extend_to(day)
+        index = bisect_left(self.days, day)
+        if self.days[index] != day:
+            return index * self.horas_por_dia  # Dia não útil: início do próximo dia útil
+        within = (when - datetime.combine(day, self.inicio_turno)).total_seconds() / 3600
+        return index * self.horas_por_dia + min(max(within, 0.0), self.horas_por_dia)
+
+    def from_axis(self, hours: float, *, is_end: bool = False) -> datetime:
+        index, within = divmod(hours, self.horas_por_dia)
+        index = int(index)
+        if is_end and within == 0 and index > 0:
+            index, within = index - 1, self.horas_por_dia  # Fim no final do turno anterior
+        self._extend_count(index)
+        return datetime.combine(self.days[index], self.inicio_turno) + timedelta(hours=within)
+
+
+class CapacityTimeline:
+    """
+    Intervalos ocupados de um centro, ordenados e sem sobreposição
+    (duas listas paralelas, pesquisadas com bisect).
+    """
+
+    def __init__(self):
+        self.starts: List[float] = []
+        self.ends: List[float] = []
+
+    def first_fit(self, release: float, duration: float) -> float:
+        """Início mais cedo (>= release) de uma folga com pelo menos 'duration'."""
+        index = bisect_right(self.ends, release)
+        candidate = release
+        while index < len(self.starts) and self.starts[index] - candidate < duration:
+            candidate = max(candidate, self.ends[index])
+            index += 1
+        return candidate
+
+    def reserve(self, start: float, end: float) -> None:
+        index = bisect_left(self.starts, start)
+        self.starts.insert(index, start)
+        self.ends.insert(index, end)
+
+
+class CapacityService:
+    def get_load(
+        self,
+        db: Session,
+        *,
+        data_inicio: date,
+        data_fim: date,
+        horas_por_dia: float,
+        inicio_turno: time = time(8, 0),
+        incluir_fim_de_semana: bool = False,
+        centro_trabalho_id: Optional[uuid.UUID] = None,
+    ) -> List[capacity_schemas.CargaCentroDia]:
+        """
+        Carga (horas necessárias vs disponíveis) por centro e dia útil em
+        [data_inicio, data_fim), com as sobrecargas.
+
+        As horas de cada ordem são repartidas pelos dias úteis a partir da
+        data programada ('horas_por_dia' por dia, como se o centro só
+        tivesse essa ordem), em vez de caírem todas no dia de início. As
+        ordens sem horas calculáveis contam em 'sem_tempo' no dia de início.
+        """
+        if data_fim <= data_inicio:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="A data de fim deve ser posterior à data de início.")
+        orders = capacity_crud.get_load_orders(db, end=data_fim, centro_trabalho_id=centro_trabalho_id)
+        inicio = datetime.combine(data_inicio, time.min)
+        calendar = WorkCalendar(
+            min([inicio] + [ordem["datahora_programada"] for ordem in orders]),
+            horas_por_dia=horas_por_dia,
+            inicio_turno=inicio_turno,
+            incluir_fim_de_semana=incluir_fim_de_semana,
+        )
+
+        # (centro, dia) -> linha agregada
+        carga: Dict[Tuple[uuid.UUID, date], dict] = {}
+
+        def add(ordem: dict, dia: date, horas: float) -> None:
+            if not data_inicio <= dia < data_fim:
+                return
+            linha = carga.setdefault((ordem["centro_trabalho_id"], dia), {
+                "centro_trabalho_id": ordem["centro_trabalho_id"],
+                "centro_trabalho": ordem["centro_trabalho"],
+                "dia": dia,
+                "ordens": 0,
+                "sem_tempo": 0,
+                "horas_necessarias": 0.0,
+            })
+            linha["ordens"] += 1
+            if ordem["horas"] is None:
+                linha["sem_tempo"] += 1
+            linha["horas_necessarias"] += horas
+
+        for ordem in orders:
+            start = calendar.to_axis(ordem["datahora_programada"])
+            end = start + (ordem["horas"] or 0.0)
+            first = int(start // horas_por_dia)
+            if end <= start:
+                add(ordem, calendar.from_axis(first * horas_por_dia).date(), 0.0)
+                continue
+            for index in range(first, int(math.ceil(end / horas_por_dia))):
+                dia = calendar.from_axis(index * horas_por_dia).date()
+                if dia >= data_fim:
+                    break
+                horas = min(end, (index + 1) * horas_por_dia) - max(start, index * horas_por_dia)
+                add(ordem, dia, horas)
+
+        return [
+            capacity_schemas.CargaCentroDia(
+                **linha,
+                horas_disponiveis=horas_por_dia,
+                utilizacao=linha["horas_necessarias"] / horas_por_dia,
+                sobrecarga=linha["horas_necessarias"] > horas_por_dia,
+            )
+            for linha in sorted(carga.values(), key=lambda linha: (linha["centro_trabalho"], linha["dia"]))
+        ]
+
+    def schedule(self, db: Session, *, parametros: capacity_schemas.ProgramacaoParametros) -> capacity_schemas.ProgramacaoResultado:
+        """
+        Programação para a frente com capacidade finita: cada centro processa
+        uma ordem de cada vez; as ordens prioritárias entram primeiro e as
+        restantes por data programada, cada uma na primeira folga do centro
+        a partir da sua data (ou do início da programação). Apenas propõe
+        datas; nada é gravado.
+        """
+        calendar = WorkCalendar(
+            parametros.data_inicio or datetime.now(),
+            horas_por_dia=parametros.horas_por_dia,
+            inicio_turno=parametros.inicio_turno,
+            incluir_fim_de_semana=parametros.incluir_fim_de_semana,
+        )
+        orders = capacity_crud.get_open_orders(db, centro_trabalho_id=parametros.centro_trabalho_id)
+        prioridade = {ordem_id: posicao for posicao, ordem_id in enumerate(parametros.ordens_prioritarias)}
+        # Ordenação estável: as prioritárias (pela ordem pedida) à frente das restantes
+        orders.sort(key=lambda ordem: prioridade.get(ordem["ordem_id"], len(prioridade)))
+
+        timelines: Dict[uuid.UUID, CapacityTimeline] = {}
+        programadas, sem_tempo = [], []
+        for ordem in orders:
+            if ordem["horas"] is None:
+                sem_tempo.append(ordem["ordem_id"])
+                continue
+            due = calendar.to_axis(ordem["datahora_programada"]) if ordem["datahora_programada"] else calendar.origin
+            timeline = timelines.setdefault(ordem["centro_trabalho_id"], CapacityTimeline())
+            start = timeline.first_fit(max(due, calendar.origin), ordem["horas"])
+            end = start + ordem["horas"]
+            if ordem["horas"] > 0:
+                timeline.reserve(start, end)
+            programadas.append(capacity_schemas.ProgramacaoOrdem(
+                ordem_id=ordem["ordem_id"],
+                referencia=ordem["referencia"],
+                centro_trabalho_id=ordem["centro_trabalho_id"],
+                centro_trabalho=ordem["centro_trabalho"],
+                horas=ordem["horas"],
+                datahora_programada=ordem["datahora_programada"],
+                inicio_proposto=calendar.from_axis(start),
+                fim_proposto=calendar.from_axis(end, is_end=True),
+                atraso_horas=max(start - due, 0.0),
+            ))
+
+        programadas.sort(key=lambda ordem: (ordem.centro_trabalho, ordem.inicio_proposto))
+        return capacity_schemas.ProgramacaoResultado(ordens=programadas, ordens_sem_tempo=sem_tempo)
+
+
+capacity_service = CapacityService()
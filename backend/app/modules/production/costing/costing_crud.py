@@ -0,0 +1,113 @@
+# backend/app/modules/production/costing/costing_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, func
+from typing import Any, Collection, Dict, List, Optional
+from decimal import Decimal
+import uuid
+
+from .... import models
+from ....models.inventory.stock_movement_model import MOVIMENTO_CONCLUIDO
+from ..capacity.capacity_crud import capacity_crud
+
+
+class CRUDCosting:
+    """Leituras em lote (custos das variantes, ordens e consumos) para o custeio."""
+
+    def get_standard_costs(self, db: Session, variante_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Optional[Decimal]]:
+        """'custo_padrao' de cada variante, numa só query."""
+        if not variante_ids:
+            return {}
+        variante = models.VarianteProduto
+        return dict(db.execute(select(variante.id, variante.custo_padrao).where(variante.id.in_(variante_ids))).all())
+
+    def get_ledger_average_costs(self, db: Session, variante_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Decimal]:
+        """
+        Custo médio real por variante: média de 'preco_un' ponderada pela
+        quantidade, nas entradas concluídas vindas de fora (sem local de origem).
+        """
+        if not variante_ids:
+            return {}
+        mov = models.MovimentacaoLivroRazao
+        average = func.sum(mov.qtd_realizada * mov.preco_un) / func.nullif(func.sum(mov.qtd_realizada), 0)
+        stmt = (
+            select(mov.variante_produto_id, average.label("custo_medio"))
+            .where(
+                mov.variante_produto_id.in_(variante_ids),
+                mov.status == MOVIMENTO_CONCLUIDO,
+                mov.local_origem_id.is_(None),
+                mov.local_destino_id.is_not(None),
+                mov.preco_un.is_not(None),
+            )
+            .group_by(mov.variante_produto_id)
+        )
+        return {variante_id: custo for variante_id, custo in db.execute(stmt) if custo is not None}
+
+    def get_production_orders(
+        self,
+        db: Session,
+        *,
+        ordem_ids: Optional[Collection[uuid.UUID]] = None,
+        abertas_apenas: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """Ordens de produção com as horas (programadas e realizadas) e o custo/hora do centro."""
+        ordem, bom, centro = models.OrdemProducao, models.Bom, models.CentroTrabalho
+        stmt = (
+            select(
+                ordem.id.label("ordem_id"),
+                ordem.referencia,
+                ordem.status,
+                ordem.variante_produto_id,
+                ordem.bom_id,
+                ordem.qtd_programada,
+                ordem.qtd_realizada,
+                centro.custo_hora,
+                capacity_crud.hours_expression(func.coalesce(ordem.qtd_programada, 0)).label("horas_padrao"),
+                capacity_crud.hours_expression(func.coalesce(ordem.qtd_realizada, 0)).label("horas_reais"),
+            )
+            .join(bom, bom.id == ordem.bom_id)
+            .outerjoin(centro, centro.id == ordem.centro_trabalho_id)
+            .order_by(ordem.referencia)
+        )
+        if ordem_ids is not None:
+            stmt = stmt.where(ordem.id.in_(ordem_ids))
+        if abertas_apenas:
+            stmt = stmt.where(ordem.datahora_realizado.is_(None))
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_consumption_costs(self, db: Session, referencias: Collection[str]) -> Dict[str, Decimal]:
+        """
+        Custo real dos materiais consumidos por documento (referência da OP):
+        saídas concluídas valorizadas a 'preco_un' (ou ao custo padrão).
+        """
+        if not referencias:
+            return {}
+        mov, variante = models.MovimentacaoLivroRazao, models.VarianteProduto
+        valor = mov.qtd_realizada * func.coalesce(mov.preco_un, variante.custo_padrao, 0)
+        stmt = (
+            select(mov.referencia, func.sum(valor).label("custo"))
+            .join(variante, variante.id == mov.variante_produto_id)
+            .where(
+                mov.referencia.in_(referencias),
+                mov.status == MOVIMENTO_CONCLUIDO,
+                mov.local_origem_id.is_not(None),
+                mov.local_destino_id.is_(None),
+            )
+            .group_by(mov.referencia)
+        )
+        return dict(db.execute(stmt).all())
+
+    def update_standard_costs(self, db: Session, costs: Dict[uuid.UUID, Decimal]) -> int:
+        """Grava 'custo_padrao' em lote (um UPDATE executemany por chave primária)."""
+        if not costs:
+            return 0
+        db.execute(
+            update(models.VarianteProduto),
+            [{"id": variante_id, "custo_padrao": custo} for variante_id, custo in costs.items()],
+        )
+        db.commit()
+        return len(costs)
+
+
+# Instância única (singleton)
+costing_crud = CRUDCosting()
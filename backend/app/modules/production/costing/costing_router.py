@@ -0,0 +1,39 @@
+# backend/app/modules/production/costing/costing_router.py
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+import uuid
+
+from . import costing_schemas, costing_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/production/custos",
+    tags=["Produção - Custeio"]
+)
+
+@router.get("/variantes/{variante_id}", response_model=costing_schemas.CustoVariante, summary="Custo unitário rolado (padrão e real) de uma variante")
+def read_variant_cost_endpoint(
+    variante_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("production:read"))
+):
+    return costing_service.costing_service.get_variant_cost(db, variante_id=variante_id)
+
+@router.get("/ordens", response_model=List[costing_schemas.CustoOrdem], summary="Custo padrão e real das ordens de produção")
+def read_order_costs_endpoint(
+    ordem_ids: Optional[List[uuid.UUID]] = Query(None, description="Apenas estas ordens (padrão: todas)"),
+    abertas_apenas: bool = True,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("production:read"))
+):
+    return costing_service.costing_service.get_order_costs(db, ordem_ids=ordem_ids, abertas_apenas=abertas_apenas)
+
+@router.post("/recalcular-padrao", response_model=costing_schemas.RecalculoCustosResultado, summary="Recalcular em massa o custo padrão das variantes fabricadas")
+def recalculate_standard_costs_endpoint(
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("production:admin"))
+):
+    return costing_service.costing_service.recalculate_standard_costs(db)
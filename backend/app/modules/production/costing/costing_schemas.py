@@ -0,0 +1,56 @@
+# backend/app/modules/production/costing/costing_schemas.py
+
+from pydantic import BaseModel
+from typing import List, Optional
+from decimal import Decimal
+import uuid
+
+# --- Schemas de Custeio ---
+
+class CustoComponente(BaseModel):
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    quantidade: Decimal  # Por unidade do pai
+    custo_unitario_padrao: Decimal
+    custo_unitario_real: Decimal
+    custo_padrao: Decimal  # quantidade x custo unitário
+    custo_real: Decimal
+
+class CustoVariante(BaseModel):
+    """Custo unitário de materiais, rolado pela BOM (padrão e real)."""
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    bom_id: Optional[uuid.UUID] = None
+    custo_padrao: Decimal
+    custo_real: Decimal
+    componentes: List[CustoComponente]
+
+class CustoOrdem(BaseModel):
+    ordem_id: uuid.UUID
+    referencia: str
+    status: str
+    variante_produto_id: uuid.UUID
+    bom_id: uuid.UUID
+    qtd_programada: Optional[Decimal] = None
+    qtd_realizada: Optional[Decimal] = None
+    custo_hora: Optional[Decimal] = None
+    # Padrão: quantidade programada x custo rolado pela BOM da OP + horas x custo/hora do centro
+    custo_unitario_material: Decimal
+    custo_material_padrao: Decimal
+    horas_padrao: Optional[float] = None
+    custo_mao_obra_padrao: Optional[Decimal] = None
+    custo_total_padrao: Decimal
+    # Real: consumos lançados no razão com a referência da OP + horas realizadas
+    custo_material_real: Optional[Decimal] = None
+    horas_reais: Optional[float] = None
+    custo_mao_obra_real: Optional[Decimal] = None
+    custo_total_real: Optional[Decimal] = None
+
+class RecalculoCustosResultado(BaseModel):
+    variantes_calculadas: int
+    variantes_atualizadas: int
+    # Não atualizadas: o custo incluiria componentes sem custo padrão
+    variantes_incompletas: List[uuid.UUID] = []
+    componentes_sem_custo: List[uuid.UUID] = []
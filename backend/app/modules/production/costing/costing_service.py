@@ -0,0 +1,262 @@
+# backend/app/modules/production/costing/costing_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Collection, Dict, List, Optional, Set, Tuple
+from decimal import Decimal
+import uuid
+
+from .... import models
+from ....core.cache import MemoryCache, invalidate_on_commit
+from ..boms.boms_crud import bom_graph_crud
+from ..boms.boms_service import BomGraph, BomStructureError, bom_explosion_service
+from . import costing_schemas
+from .costing_crud import costing_crud
+
+# --- CACHE DOS CUSTOS ROLADOS ---
+# Chave: (variante, bom_id): a BOM aplicável ou a BOM indicada (ex: a da OP).
+# Uma nova BOM é uma nova chave; alterações a
+# BOMs, componentes ou custos padrão invalidam tudo. O custo real depende
+# também do razão, por isso tem o seu próprio cache.
+standard_cost_cache = MemoryCache(maxsize=4096)
+invalidate_on_commit(standard_cost_cache, models.Bom, models.BomComponente, models.VarianteProduto)
+actual_cost_cache = MemoryCache(maxsize=4096)
+invalidate_on_commit(
+    actual_cost_cache,
+    models.Bom, models.BomComponente, models.VarianteProduto, models.MovimentacaoLivroRazao,
+)
+
+ZERO = Decimal(0)
+
+# (variante, bom_id); bom_id None = BOM aplicável da variante
+CostKey = Tuple[uuid.UUID, Optional[uuid.UUID]]
+
+
+class CostRollup:
+    """
+    Custo unitário de materiais rolado de baixo para cima pela BOM.
+
+    Cada variante é calculada uma única vez (memorizada) e reaproveitada
+    por todos os pais e ordens que a usam. Variantes sem BOM valem o seu
+    custo de folha ('leaf_costs'); as que não o têm contam como zero e
+    ficam em 'missing', e as chaves cujo custo inclui alguma delas ficam em
+    'incomplete'. Com 'bom_id', o primeiro nível vem dessa BOM
+    (ex: a BOM da OP) e os subconjuntos usam a sua BOM aplicável.
+    """
+
+    def __init__(self, graph: BomGraph, leaf_costs: Dict[uuid.UUID, Optional[Decimal]]):
+        self.graph = graph
+        self.leaf_costs = leaf_costs
+        # (variante, bom_id), com bom_id None para a BOM aplicável
+        self.costs: Dict[CostKey, Decimal] = {}
+        self.missing = set()
+        self.incomplete: Set[CostKey] = set()
+
+    def unit_cost(
+        self, variante_id: uuid.UUID, path: Tuple[uuid.UUID, ...] = (), bom_id: Optional[uuid.UUID] = None
+    ) -> Decimal:
+        cached = self.costs.get((variante_id, bom_id))
+        if cached is not None:
+            return cached
+        if self.graph.has_bom(variante_id, bom_id):
+            path = BomGraph._enter(path, variante_id)
+            componentes = list(self.graph.components(variante_id, bom_id))
+            cost = sum((fator * self.unit_cost(componente_id, path) for componente_id, fator in componentes), ZERO)
+            if any((componente_id, None) in self.incomplete for componente_id, _ in componentes):
+                self.incomplete.add((variante_id, bom_id))
+        else:
+            cost = self.leaf_costs.get(variante_id)
+            if cost is None:
+                self.missing.add(variante_id)
+                self.incomplete.add((variante_id, bom_id))
+                cost = ZERO
+        self.costs[(variante_id, bom_id)] = cost
+        return cost
+
+
+class CostingService:
+    def _leaf_costs(self, db: Session, variante_ids: Collection[uuid.UUID]):
+        standard = costing_crud.get_standard_costs(db, variante_ids)
+        actual = dict(standard)
+        actual.update(costing_crud.get_ledger_average_costs(db, variante_ids))
+        return standard, actual
+
+    def _all_below(self, graph: BomGraph, keys: Collection[CostKey]) -> set:
+        below = {variante_id for variante_id, _ in keys}
+        for variante_id, bom_id in keys:
+            if graph.has_bom(variante_id, bom_id):
+                below.update(graph.unit_requirements(variante_id, bom_id=bom_id))
+        return below
+
+    def unit_costs(self, db: Session, variante_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Tuple[Decimal, Decimal]]:
+        """(custo padrão, custo real) unitário de cada variante, pela sua BOM aplicável."""
+        costs = self.bom_unit_costs(db, [(variante_id, None) for variante_id in variante_ids])
+        return {variante_id: cost for (variante_id, _), cost in costs.items()}
+
+    def bom_unit_costs(self, db: Session, keys: Collection[CostKey]) -> Dict[CostKey, Tuple[Decimal, Decimal]]:
+        """
+        (custo padrão, custo real) unitário de cada (variante, bom_id). As
+        chaves que não estão em cache são roladas de uma só vez, e todos os
+        subconjuntos calculados pelo caminho ficam também em cache.
+        """
+        keys = list(dict.fromkeys(keys))
+        graph = bom_explosion_service.get_graph(
+            db, {variante_id for variante_id, _ in keys}, {bom_id for _, bom_id in keys if bom_id}
+        )
+
+        def cache_key(key: CostKey) -> CostKey:
+            variante_id, bom_id = key
+            if bom_id is None and graph.has_bom(variante_id):
+                return (variante_id, graph.boms[variante_id][0])
+            return key
+
+        versions = (standard_cost_cache.version, actual_cost_cache.version)
+        result, pending = {}, []
+        for key in keys:
+            standard, actual = standard_cost_cache.get(cache_key(key)), actual_cost_cache.get(cache_key(key))
+            if standard is None or actual is None:
+                pending.append(key)
+            else:
+                result[key] = (standard, actual)
+        if not pending:
+            return result
+
+        try:
+            below = self._all_below(graph, pending)
+            standard_leaves, actual_leaves = self._leaf_costs(db, below)
+            standard_rollup, actual_rollup = CostRollup(graph, standard_leaves), CostRollup(graph, actual_leaves)
+            for variante_id, bom_id in pending:
+                result[(variante_id, bom_id)] = (
+                    standard_rollup.unit_cost(variante_id, bom_id=bom_id),
+                    actual_rollup.unit_cost(variante_id, bom_id=bom_id),
+                )
+        except BomStructureError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Não é possível calcular os custos: {exc}."
+            )
+
+        for key, cost in standard_rollup.costs.items():
+            standard_cost_cache.set(cache_key(key), cost, version=versions[0])
+        for key, cost in actual_rollup.costs.items():
+            actual_cost_cache.set(cache_key(key), cost, version=versions[1])
+        return result
+
+    def get_variant_cost(self, db: Session, *, variante_id: uuid.UUID) -> costing_schemas.CustoVariante:
+        """Custo unitário rolado de uma variante, com o detalhe dos componentes diretos."""
+        graph = bom_explosion_service.get_graph(db, [variante_id])
+        try:
+            componentes = list(graph.components(variante_id)) if graph.has_bom(variante_id) else []
+        except BomStructureError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Não é possível calcular os custos: {exc}.")
+
+        labels = bom_graph_crud.get_variant_labels(db, {variante_id} | {componente_id for componente_id, _ in componentes})
+        if variante_id not in labels:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Variante de produto não encontrada.")
+        costs = self.unit_costs(db, [variante_id] + [componente_id for componente_id, _ in componentes])
+
+        referencia, nome = labels[variante_id]
+        standard, actual = costs[variante_id]
+        return costing_schemas.CustoVariante(
+            variante_produto_id=variante_id,
+            referencia=referencia,
+            nome=nome,
+            bom_id=graph.boms[variante_id][0] if graph.has_bom(variante_id) else None,
+            custo_padrao=standard,
+            custo_real=actual,
+            componentes=[
+                costing_schemas.CustoComponente(
+                    variante_produto_id=componente_id,
+                    referencia=labels[componente_id][0],
+                    nome=labels[componente_id][1],
+                    quantidade=fator,
+                    custo_unitario_padrao=costs[componente_id][0],
+                    custo_unitario_real=costs[componente_id][1],
+                    custo_padrao=fator * costs[componente_id][0],
+                    custo_real=fator * costs[componente_id][1],
+                )
+                for componente_id, fator in componentes
+            ],
+        )
+
+    def get_order_costs(
+        self,
+        db: Session,
+        *,
+        ordem_ids: Optional[List[uuid.UUID]] = None,
+        abertas_apenas: bool = True,
+    ) -> List[costing_schemas.CustoOrdem]:
+        """
+        Custo padrão e real de várias ordens de produção. Materiais e horas
+        vêm da mesma BOM (a 'bom_id' da OP); os custos unitários de todas as
+        (variante, BOM) são rolados de uma vez e partilhados entre ordens.
+        """
+        orders = costing_crud.get_production_orders(db, ordem_ids=ordem_ids, abertas_apenas=abertas_apenas)
+        costs = self.bom_unit_costs(db, {(ordem["variante_produto_id"], ordem["bom_id"]) for ordem in orders})
+        consumption = costing_crud.get_consumption_costs(db, {ordem["referencia"] for ordem in orders})
+
+        def labor(horas: Optional[float], custo_hora: Optional[Decimal]) -> Optional[Decimal]:
+            if horas is None or custo_hora is None:
+                return None
+            return Decimal(str(horas)) * custo_hora
+
+        result = []
+        for ordem in orders:
+            unit_standard, _ = costs[(ordem["variante_produto_id"], ordem["bom_id"])]
+            material_padrao = Decimal(ordem["qtd_programada"] or 0) * unit_standard
+            mao_obra_padrao = labor(ordem["horas_padrao"], ordem["custo_hora"])
+            material_real = consumption.get(ordem["referencia"])
+            mao_obra_real = labor(ordem["horas_reais"], ordem["custo_hora"]) if ordem["qtd_realizada"] else None
+            total_real = (
+                (material_real or ZERO) + (mao_obra_real or ZERO)
+                if material_real is not None or mao_obra_real is not None else None
+            )
+            result.append(costing_schemas.CustoOrdem(
+                **ordem,
+                custo_unitario_material=unit_standard,
+                custo_material_padrao=material_padrao,
+                custo_mao_obra_padrao=mao_obra_padrao,
+                custo_total_padrao=material_padrao + (mao_obra_padrao or ZERO),
+                custo_material_real=material_real,
+                custo_mao_obra_real=mao_obra_real,
+                custo_total_real=total_real,
+            ))
+        return result
+
+    def recalculate_standard_costs(self, db: Session) -> costing_schemas.RecalculoCustosResultado:
+        """
+        Recálculo em massa: rola o custo padrão de todas as variantes
+        fabricadas (com BOM) e grava o novo 'custo_padrao' das que mudaram.
+        Deve correr depois de alterar custos de compra ou estruturas.
+        As variantes com algum componente sem custo padrão não são
+        atualizadas (o custo ficaria subavaliado) e são devolvidas à parte.
+        """
+        fabricadas = bom_graph_crud.get_variants_with_bom(db)
+        graph = BomGraph(bom_graph_crud.load_graph(db, fabricadas))
+        try:
+            below = self._all_below(graph, [(variante_id, None) for variante_id in fabricadas])
+            current = costing_crud.get_standard_costs(db, below)
+            rollup = CostRollup(graph, current)
+            novos = {variante_id: rollup.unit_cost(variante_id) for variante_id in fabricadas}
+        except BomStructureError as exc:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"Não é possível calcular os custos: {exc}.")
+
+        incompletas = [variante_id for variante_id in novos if (variante_id, None) in rollup.incomplete]
+        alterados = {
+            variante_id: custo
+            for variante_id, custo in novos.items()
+            if (variante_id, None) not in rollup.incomplete
+            and (current.get(variante_id) is None or current[variante_id] != custo.quantize(Decimal("0.0001")))
+        }
+        costing_crud.update_standard_costs(
+            db, {variante_id: custo.quantize(Decimal("0.0001")) for variante_id, custo in alterados.items()}
+        )
+        return costing_schemas.RecalculoCustosResultado(
+            variantes_calculadas=len(novos),
+            variantes_atualizadas=len(alterados),
+            variantes_incompletas=incompletas,
+            componentes_sem_custo=sorted(rollup.missing, key=str),
+        )
+
+
+costing_service = CostingService()
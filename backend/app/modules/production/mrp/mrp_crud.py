@@ -0,0 +1,80 @@
+# backend/app/modules/production/mrp/mrp_crud.py
+
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from typing import Any, Collection, Dict, List, Optional
+from decimal import Decimal
+import uuid
+
+from .... import models
+from ....models.purchasing.purchase_order_model import STATUS_OC_FECHADOS
+from ...inventory.stock_balances.stock_balances_crud import saldo_estoque_crud
+
+
+class CRUDMrp:
+    """
+    Leituras em lote para o cálculo de necessidades (MRP).
+
+    Cada fonte (ordens de produção, stock, compras em aberto) é lida numa
+    única query e devolvida como tuplos simples, sem instanciar objetos ORM.
+    """
+
+    def _orders_select(self):
+        ordem = models.OrdemProducao
+        return select(
+            ordem.id,
+            ordem.variante_produto_id,
+            ordem.bom_id,
+            ordem.qtd_programada,
+            ordem.qtd_realizada,
+            ordem.datahora_programada,
+            ordem.datahora_realizado,
+        )
+
+    def get_open_production_orders(self, db: Session) -> List[Dict[str, Any]]:
+        """Ordens de produção ainda não realizadas (o plano mestre do MRP)."""
+        stmt = self._orders_select().where(models.OrdemProducao.datahora_realizado.is_(None))
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_production_order(self, db: Session, ordem_id: uuid.UUID) -> Optional[Dict[str, Any]]:
+        row = db.execute(self._orders_select().where(models.OrdemProducao.id == ordem_id)).mappings().first()
+        return dict(row) if row else None
+
+    def get_on_hand(self, db: Session, variante_ids: Collection[uuid.UUID]) -> Dict[uuid.UUID, Decimal]:
+        """Stock atual (sem sucata) por variante."""
+        if not variante_ids:
+            return {}
+        on_hand = saldo_estoque_crud.on_hand_subquery(variante_ids)
+        return dict(db.execute(select(on_hand.c.variante_produto_id, on_hand.c.on_hand)).all())
+
+    def get_open_purchase_lines(self, db: Session, variante_ids: Collection[uuid.UUID]) -> List[Dict[str, Any]]:
+        """
+        Quantidades ainda por receber das ordens de compra em aberto
+        (recebimentos programados), por variante e data prevista de entrega.
+
+        Lê as linhas e não o resumo 'compras_em_aberto': o resumo agrega por
+        variante e fornecedor, sem a data de entrega, e o MRP precisa dela
+        para colocar cada recebimento no período certo.
+        """
+        if not variante_ids:
+            return []
+        linha, ordem = models.OrdemDeCompraLinha, models.OrdemDeCompra
+        stmt = (
+            select(
+                linha.variante_produto_id,
+                ordem.datahora_prev_entrega,
+                func.sum(linha.quantidade - linha.qtd_recebida).label("quantidade"),
+            )
+            .join(ordem, ordem.id == linha.ordem_de_compra_id)
+            .where(
+                linha.variante_produto_id.in_(variante_ids),
+                ordem.status.notin_(STATUS_OC_FECHADOS),
+                linha.quantidade > linha.qtd_recebida,
+            )
+            .group_by(linha.variante_produto_id, ordem.datahora_prev_entrega)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+# Instância única (singleton)
+mrp_crud = CRUDMrp()
@@ -0,0 +1,31 @@
+# backend/app/modules/production/mrp/mrp_router.py
+
+from fastapi import APIRouter, Depends, Body
+from sqlalchemy.orm import Session
+import uuid
+
+from . import mrp_schemas, mrp_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/production/mrp",
+    tags=["Produção - MRP"]
+)
+
+@router.post("/executar", response_model=mrp_schemas.MrpResultado, summary="Calcular necessidades (MRP) de todas as ordens de produção em aberto")
+def run_mrp_endpoint(
+    parametros: mrp_schemas.MrpParametros = Body(default_factory=mrp_schemas.MrpParametros),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("production:read"))
+):
+    return mrp_service.mrp_service.run(db, parametros=parametros)
+
+@router.post("/executar/ordem/{ordem_id}", response_model=mrp_schemas.MrpResultado, summary="Recalcular o MRP após a alteração de uma ordem de produção")
+def rerun_mrp_for_order_endpoint(
+    ordem_id: uuid.UUID,
+    parametros: mrp_schemas.MrpParametros = Body(default_factory=mrp_schemas.MrpParametros),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("production:read"))
+):
+    return mrp_service.mrp_service.rerun_for_order(db, ordem_id=ordem_id, parametros=parametros)
@@ -0,0 +1,49 @@
+# backend/app/modules/production/mrp/mrp_schemas.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from decimal import Decimal
+from datetime import date
+import enum
+import uuid
+
+# --- Schemas do Cálculo de Necessidades (MRP) ---
+
+class GranularidadeMrp(str, enum.Enum):
+    DIA = "dia"
+    SEMANA = "semana"  # Períodos de segunda a domingo
+
+class TipoSugestaoMrp(str, enum.Enum):
+    COMPRA = "compra"        # Variante sem BOM
+    PRODUCAO = "producao"    # Variante com BOM ativa
+
+class MrpParametros(BaseModel):
+    granularidade: GranularidadeMrp = GranularidadeMrp.SEMANA
+    data_inicio: Optional[date] = None  # Padrão: hoje
+    periodos: int = Field(12, ge=1, le=366)
+
+class MrpVariante(BaseModel):
+    """Registo MRP de uma variante; cada lista tem um valor por período."""
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    nivel: int  # Low-level code (0 = produto final)
+    stock_inicial: Decimal
+    necessidades_brutas: List[Decimal]
+    recebimentos_programados: List[Decimal]
+    stock_projetado: List[Decimal]
+    ordens_planeadas: List[Decimal]
+
+class MrpSugestao(BaseModel):
+    tipo: TipoSugestaoMrp
+    variante_produto_id: uuid.UUID
+    referencia: str
+    nome: str
+    periodo_inicio: date
+    quantidade: Decimal
+
+class MrpResultado(BaseModel):
+    granularidade: GranularidadeMrp
+    periodos: List[date]  # Início de cada período
+    variantes: List[MrpVariante]
+    sugestoes: List[MrpSugestao]
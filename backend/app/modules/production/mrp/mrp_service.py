@@ -0,0 +1,287 @@
+# backend/app/modules/production/mrp/mrp_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+import threading
+import uuid
+
+from .... import models
+from ....core.cache import MemoryCache, invalidate_on_commit
+from ..boms.boms_crud import bom_graph_crud
+from ..boms.boms_service import BomGraph, BomStructureError
+from . import mrp_schemas
+from .mrp_crud import mrp_crud
+
+# --- CACHE DA ÚLTIMA EXECUÇÃO ---
+# Guarda o estado completo de cada execução (por parâmetros) para permitir
+# recalcular apenas o que depende de uma ordem alterada. Alterações às
+# estruturas, ao stock ou às compras invalidam o estado; as alterações às
+# ordens de produção não, porque é isso que a re-execução incremental trata.
+mrp_run_cache = MemoryCache(maxsize=8, ttl_seconds=900)
+invalidate_on_commit(
+    mrp_run_cache,
+    models.Bom, models.BomComponente, models.VarianteProduto,
+    models.SaldoEstoque, models.OrdemDeCompra, models.OrdemDeCompraLinha,
+)
+
+ZERO = Decimal(0)
+
+
+class MrpRun:
+    """
+    Estado de uma execução MRP: um vetor (uma posição por período) por
+    variante para cada grandeza, em vez de objetos por necessidade.
+
+    - 'base_gross': necessidades diretas das ordens de produção em aberto.
+    - 'receipts': recebimentos programados (compras e as próprias OPs).
+    - 'gross' / 'projected' / 'planned': resultado do netting.
+
+    O netting corre por low-level code, de forma que as ordens planeadas
+    de um pai já estão calculadas quando os seus componentes são tratados.
+    Cada OP é explodida pela sua própria BOM ('bom_id'); as ordens
+    planeadas usam a BOM aplicável da variante.
+    Sem tempos de entrega definidos no modelo, as necessidades dos
+    componentes caem no mesmo período da ordem que as origina.
+    """
+
+    def __init__(self, graph: BomGraph, granularidade: mrp_schemas.GranularidadeMrp, data_inicio: date, periodos: int):
+        self.graph = graph
+        self.granularidade = granularidade
+        self.step = 7 if granularidade == mrp_schemas.GranularidadeMrp.SEMANA else 1
+        if self.step == 7:
+            data_inicio -= timedelta(days=data_inicio.weekday())
+        self.start = data_inicio
+        self.periodos = [data_inicio + timedelta(days=self.step * k) for k in range(periodos)]
+        self.lock = threading.Lock()
+
+        self.llc: Dict[uuid.UUID, int] = {}
+        self.parents: Dict[uuid.UUID, List[Tuple[uuid.UUID, Decimal]]] = {}
+        self.on_hand: Dict[uuid.UUID, Decimal] = {}
+        self.base_gross: Dict[uuid.UUID, List[Decimal]] = {}
+        self.receipts: Dict[uuid.UUID, List[Decimal]] = {}
+        self.gross: Dict[uuid.UUID, List[Decimal]] = {}
+        self.projected: Dict[uuid.UUID, List[Decimal]] = {}
+        self.planned: Dict[uuid.UUID, List[Decimal]] = {}
+        # ordem_id -> (variante, BOM, período, quantidade em falta) já lançada nos vetores
+        self.orders: Dict[uuid.UUID, Tuple[uuid.UUID, Optional[uuid.UUID], int, Decimal]] = {}
+
+    # --- Estrutura ---
+
+    def index_structure(self, roots: Iterable[Tuple[uuid.UUID, Optional[uuid.UUID]]]) -> None:
+        """
+        Calcula os low-level codes e o mapa de pais a partir dos pares
+        (variante, BOM da OP) (pode levantar BomStructureError).
+        """
+        for variante_id, bom_id in roots:
+            self.llc.setdefault(variante_id, 0)
+            for bom in (None, bom_id):
+                if self.graph.has_bom(variante_id, bom):
+                    for componente_id, (_, nivel) in self.graph.unit_requirements(variante_id, bom_id=bom).items():
+                        self.llc[componente_id] = max(self.llc.get(componente_id, 0), nivel)
+        for pai_id in self.graph.boms:
+            for componente_id, fator in self.graph.components(pai_id):
+                self.parents.setdefault(componente_id, []).append((pai_id, fator))
+
+    def affected_by(self, variante_id: uuid.UUID, bom_id: Optional[uuid.UUID] = None) -> Set[uuid.UUID]:
+        """A variante e tudo o que está abaixo dela na estrutura (aplicável e da BOM da OP)."""
+        affected = {variante_id}
+        for bom in (None, bom_id):
+            if self.graph.has_bom(variante_id, bom):
+                affected.update(self.graph.unit_requirements(variante_id, bom_id=bom))
+        return affected
+
+    # --- Vetores ---
+
+    def _vector(self, store: Dict[uuid.UUID, List[Decimal]], variante_id: uuid.UUID) -> List[Decimal]:
+        vector = store.get(variante_id)
+        if vector is None:
+            vector = store[variante_id] = [ZERO] * len(self.periodos)
+        return vector
+
+    def bucket_of(self, when: Optional[datetime]) -> Optional[int]:
+        """Período de uma data (atrasos vão para o primeiro; além do horizonte: None)."""
+        if when is None:
+            return 0
+        index = (when.date() - self.start).days // self.step
+        if index >= len(self.periodos):
+            return None
+        return max(index, 0)
+
+    def add_receipt(self, variante_id: uuid.UUID, when: Optional[datetime], quantidade: Decimal) -> None:
+        bucket = self.bucket_of(when)
+        if bucket is not None and quantidade:
+            self._vector(self.receipts, variante_id)[bucket] += quantidade
+
+    def _post_order(
+        self, variante_id: uuid.UUID, bom_id: Optional[uuid.UUID], bucket: int, quantidade: Decimal, sign: int
+    ) -> None:
+        self._vector(self.receipts, variante_id)[bucket] += sign * quantidade
+        if self.graph.has_bom(variante_id, bom_id):
+            for componente_id, fator in self.graph.components(variante_id, bom_id):
+                self._vector(self.base_gross, componente_id)[bucket] += sign * quantidade * fator
+
+    def add_order(self, ordem: Dict[str, Any]) -> None:
+        """Lança uma OP em aberto: recebimento da variante e consumo dos componentes diretos da sua BOM."""
+        if ordem["datahora_realizado"] is not None:
+            return
+        quantidade = max(Decimal(ordem["qtd_programada"] or 0) - Decimal(ordem["qtd_realizada"] or 0), ZERO)
+        bucket = self.bucket_of(ordem["datahora_programada"])
+        if bucket is None or not quantidade:
+            return
+        self._post_order(ordem["variante_produto_id"], ordem["bom_id"], bucket, quantidade, 1)
+        self.orders[ordem["id"]] = (ordem["variante_produto_id"], ordem["bom_id"], bucket, quantidade)
+
+    def remove_order(self, ordem_id: uuid.UUID) -> Optional[Tuple[uuid.UUID, Optional[uuid.UUID]]]:
+        """Retira o lançamento anterior de uma OP; devolve a (variante, BOM) que afetava."""
+        posted = self.orders.pop(ordem_id, None)
+        if posted is None:
+            return None
+        variante_id, bom_id, bucket, quantidade = posted
+        self._post_order(variante_id, bom_id, bucket, quantidade, -1)
+        return variante_id, bom_id
+
+    # --- Netting ---
+
+    def net(self, variantes: Iterable[uuid.UUID]) -> None:
+        """
+        Recalcula necessidades brutas, stock projetado e ordens planeadas
+        das 'variantes' (por ordem de low-level code).
+        """
+        zeros = [ZERO] * len(self.periodos)
+        for variante_id in sorted(variantes, key=lambda v: self.llc.get(v, 0)):
+            gross = list(self.base_gross.get(variante_id, zeros))
+            for pai_id, fator in self.parents.get(variante_id, ()):
+                planned = self.planned.get(pai_id)
+                if planned:
+                    gross = [g + fator * q for g, q in zip(gross, planned)]
+            receipts = self.receipts.get(variante_id, zeros)
+
+            available = self.on_hand.get(variante_id, ZERO)
+            projected, planned = [], []
+            for needed, incoming in zip(gross, receipts):
+                available += incoming - needed
+                shortage = -available if available < 0 else ZERO
+                available += shortage
+                projected.append(available)
+                planned.append(shortage)
+
+            self.gross[variante_id] = gross
+            self.projected[variante_id] = projected
+            self.planned[variante_id] = planned
+
+
+class MrpService:
+    def _cache_key(self, parametros: mrp_schemas.MrpParametros) -> Tuple:
+        return (parametros.granularidade, parametros.data_inicio or date.today(), parametros.periodos)
+
+    def _full_run(self, db: Session, parametros: mrp_schemas.MrpParametros) -> MrpRun:
+        orders = mrp_crud.get_open_production_orders(db)
+        roots = {(ordem["variante_produto_id"], ordem["bom_id"]) for ordem in orders}
+        graph = BomGraph(*bom_graph_crud.load_graph_with_boms(
+            db, {variante_id for variante_id, _ in roots}, {bom_id for _, bom_id in roots if bom_id}
+        ))
+        run = MrpRun(graph, parametros.granularidade, parametros.data_inicio or date.today(), parametros.periodos)
+        run.index_structure(roots)
+
+        variantes = set(run.llc)
+        run.on_hand = mrp_crud.get_on_hand(db, variantes)
+        for linha in mrp_crud.get_open_purchase_lines(db, variantes):
+            run.add_receipt(linha["variante_produto_id"], linha["datahora_prev_entrega"], linha["quantidade"])
+        for ordem in orders:
+            run.add_order(ordem)
+        run.net(variantes)
+        return run
+
+    def _run_or_400(self, func, *args):
+        try:
+            return func(*args)
+        except BomStructureError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Não é possível calcular as necessidades: {exc}."
+            )
+
+    def run(self, db: Session, *, parametros: mrp_schemas.MrpParametros) -> mrp_schemas.MrpResultado:
+        """Execução completa: todas as OPs em aberto, explodidas e 'netadas'."""
+        version = mrp_run_cache.version
+        state = self._run_or_400(self._full_run, db, parametros)
+        mrp_run_cache.set(self._cache_key(parametros), state, version=version)
+        return self._build_result(db, state)
+
+    def rerun_for_order(self, db: Session, *, ordem_id: uuid.UUID, parametros: mrp_schemas.MrpParametros) -> mrp_schemas.MrpResultado:
+        """
+        Re-execução incremental após a alteração de uma OP: retira o
+        lançamento anterior da ordem, lança o atual e recalcula apenas a
+        variante da ordem e o que está abaixo dela. Sem uma execução
+        anterior válida (ou se a ordem trouxer variantes ou BOMs novas),
+        faz a execução completa.
+        """
+        ordem = mrp_crud.get_production_order(db, ordem_id)
+        if not ordem:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ordem de produção não encontrada.")
+
+        state: Optional[MrpRun] = mrp_run_cache.get(self._cache_key(parametros))
+        if (
+            state is None
+            or not state.graph.has_bom(ordem["variante_produto_id"], ordem["bom_id"])
+            or not state.affected_by(ordem["variante_produto_id"], ordem["bom_id"]) <= state.llc.keys()
+        ):
+            return self.run(db, parametros=parametros)
+
+        with state.lock:
+            affected = state.affected_by(ordem["variante_produto_id"], ordem["bom_id"])
+            previous = state.remove_order(ordem_id)
+            if previous is not None:
+                affected |= state.affected_by(*previous)
+            state.add_order(ordem)
+            self._run_or_400(state.net, affected)
+            return self._build_result(db, state)
+
+    def _build_result(self, db: Session, state: MrpRun) -> mrp_schemas.MrpResultado:
+        labels = bom_graph_crud.get_variant_labels(db, state.llc.keys())
+        ordered = sorted(state.llc, key=lambda v: (state.llc[v], labels.get(v, ("", ""))[0]))
+
+        variantes, sugestoes = [], []
+        for variante_id in ordered:
+            referencia, nome = labels.get(variante_id, ("", ""))
+            planned = state.planned.get(variante_id, [])
+            variantes.append(mrp_schemas.MrpVariante(
+                variante_produto_id=variante_id,
+                referencia=referencia,
+                nome=nome,
+                nivel=state.llc[variante_id],
+                stock_inicial=state.on_hand.get(variante_id, ZERO),
+                necessidades_brutas=state.gross.get(variante_id, []),
+                recebimentos_programados=state.receipts.get(variante_id, [ZERO] * len(state.periodos)),
+                stock_projetado=state.projected.get(variante_id, []),
+                ordens_planeadas=planned,
+            ))
+            tipo = (
+                mrp_schemas.TipoSugestaoMrp.PRODUCAO if state.graph.has_bom(variante_id)
+                else mrp_schemas.TipoSugestaoMrp.COMPRA
+            )
+            sugestoes.extend(
+                mrp_schemas.MrpSugestao(
+                    tipo=tipo,
+                    variante_produto_id=variante_id,
+                    referencia=referencia,
+                    nome=nome,
+                    periodo_inicio=periodo,
+                    quantidade=quantidade,
+                )
+                for periodo, quantidade in zip(state.periodos, planned) if quantidade > 0
+            )
+
+        sugestoes.sort(key=lambda sugestao: (sugestao.periodo_inicio, sugestao.referencia))
+        return mrp_schemas.MrpResultado(
+            granularidade=state.granularidade,
+            periodos=state.periodos,
+            variantes=variantes,
+            sugestoes=sugestoes,
+        )
+
+
+mrp_service = MrpService()
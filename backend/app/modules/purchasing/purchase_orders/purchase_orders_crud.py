@@ -0,0 +1,234 @@
+# backend/app/modules/purchasing/purchase_orders/purchase_orders_crud.py
+
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select, update, delete, func, and_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql import Select
+from typing import Any, Collection, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+from decimal import Decimal
+import uuid
+
+from ....core.crud_base import CRUDBase
+from .... import models
+from ....models.purchasing.purchase_order_model import STATUS_OC_FECHADOS
+from . import purchase_orders_schemas
+
+# (variante, fornecedor) -> (quantidade, valor)
+EmAbertoKey = Tuple[uuid.UUID, uuid.UUID]
+EmAbertoDelta = Dict[EmAbertoKey, Tuple[Decimal, Decimal]]
+
+UPSERT_BATCH_SIZE = 1000
+ZERO = Decimal(0)
+
+
+class LinhaSnapshot(NamedTuple):
+    """Estado de uma linha antes de ser alterada (para o delta negativo)."""
+    variante_produto_id: uuid.UUID
+    quantidade: Decimal
+    qtd_recebida: Decimal
+    preco_unitario: Decimal
+
+    @classmethod
+    def of(cls, linha: models.OrdemDeCompraLinha) -> "LinhaSnapshot":
+        return cls(linha.variante_produto_id, linha.quantidade, linha.qtd_recebida or ZERO, linha.preco_unitario)
+
+
+class CRUDOrdemDeCompra(CRUDBase[models.OrdemDeCompra, purchase_orders_schemas.OrdemDeCompraCreate, purchase_orders_schemas.OrdemDeCompraUpdate]):
+
+    def get_with_lines(self, db: Session, id: uuid.UUID, *, for_update: bool = False) -> Optional[models.OrdemDeCompra]:
+        stmt = select(self.model).options(selectinload(self.model.linhas)).where(self.model.id == id)
+        if for_update:
+            stmt = stmt.with_for_update(of=self.model)
+        return db.scalars(stmt).first()
+
+    def get_by_referencia(self, db: Session, referencia: str) -> Optional[models.OrdemDeCompra]:
+        return db.scalars(select(self.model).where(self.model.referencia == referencia)).first()
+
+    def get_missing_variants(self, db: Session, variante_ids: Collection[uuid.UUID]) -> Set[uuid.UUID]:
+        """Variantes de 'variante_ids' que não existem (uma só query)."""
+        if not variante_ids:
+            return set()
+        variante = models.VarianteProduto
+        existing = set(db.scalars(select(variante.id).where(variante.id.in_(variante_ids))))
+        return set(variante_ids) - existing
+
+    def get_multi_filtered(
+        self,
+        db: Session,
+        *,
+        fornecedor_id: Optional[uuid.UUID] = None,
+        status: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[models.OrdemDeCompra]:
+        stmt = select(self.model).options(selectinload(self.model.linhas))
+        if fornecedor_id:
+            stmt = stmt.where(self.model.fornecedor_id == fornecedor_id)
+        if status:
+            stmt = stmt.where(self.model.status == status)
+        stmt = stmt.order_by(self.model.created_at.desc()).offset(skip).limit(limit)
+        return list(db.scalars(stmt))
+
+    # --- Quantidades em aberto (tabela derivada 'compras_em_aberto') ---
+
+    @staticmethod
+    def open_deltas(ordem: models.OrdemDeCompra, linhas: Iterable[Any], *, sign: int = 1) -> EmAbertoDelta:
+        """
+        Contribuição de 'linhas' (objetos ou snapshots com variante_produto_id,
+        quantidade, qtd_recebida, preco_unitario) para o resumo em aberto.
+        Para alterar uma linha: deltas do estado antigo com sign=-1 + do novo com sign=+1.
+        """
+        deltas: EmAbertoDelta = {}
+        if ordem.status in STATUS_OC_FECHADOS:
+            return deltas
+        for linha in linhas:
+            em_aberto = max(Decimal(linha.quantidade) - Decimal(linha.qtd_recebida or 0), ZERO)
+            if not em_aberto:
+                continue
+            key = (linha.variante_produto_id, ordem.fornecedor_id)
+            quantidade, valor = deltas.get(key, (ZERO, ZERO))
+            deltas[key] = (quantidade + sign * em_aberto, valor + sign * em_aberto * Decimal(linha.preco_unitario))
+        return deltas
+
+    @staticmethod
+    def merge_deltas(*parts: EmAbertoDelta) -> EmAbertoDelta:
+        merged: EmAbertoDelta = {}
+        for part in parts:
+            for key, (quantidade, valor) in part.items():
+                old_quantidade, old_valor = merged.get(key, (ZERO, ZERO))
+                merged[key] = (old_quantidade + quantidade, old_valor + valor)
+        return merged
+
+    def apply_open_deltas(self, db: Session, deltas: EmAbertoDelta) -> None:
+        """
+        Aplica os deltas com INSERT ... ON CONFLICT DO UPDATE multi-linha,
+        com as chaves ordenadas (bloqueios sempre pela mesma ordem). NÃO faz commit.
+        """
+        rows = [
+            {
+                "variante_produto_id": variante_id,
+                "fornecedor_id": fornecedor_id,
+                "qtd_em_aberto": quantidade,
+                "valor_em_aberto": valor,
+            }
+            for (variante_id, fornecedor_id), (quantidade, valor) in sorted(
+                deltas.items(), key=lambda item: tuple(str(part) for part in item[0])
+            )
+            if quantidade or valor
+        ]
+        resumo = models.CompraEmAberto
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = pg_insert(resumo).values(rows[start:start + UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[resumo.variante_produto_id, resumo.fornecedor_id],
+                set_={
+                    "qtd_em_aberto": resumo.qtd_em_aberto + stmt.excluded.qtd_em_aberto,
+                    "valor_em_aberto": resumo.valor_em_aberto + stmt.excluded.valor_em_aberto,
+                    "updated_at": func.now(),
+                },
+            )
+            db.execute(stmt)
+
+    @staticmethod
+    def lines_open_select() -> Select:
+        """(variante, fornecedor, quantidade, valor) em aberto, calculado a partir das linhas."""
+        linha, ordem = models.OrdemDeCompraLinha, models.OrdemDeCompra
+        em_aberto = linha.quantidade - linha.qtd_recebida
+        return (
+            select(
+                linha.variante_produto_id,
+                ordem.fornecedor_id,
+                func.sum(em_aberto).label("qtd_em_aberto"),
+                func.sum(em_aberto * linha.preco_unitario).label("valor_em_aberto"),
+            )
+            .join(ordem, ordem.id == linha.ordem_de_compra_id)
+            .where(ordem.status.notin_(STATUS_OC_FECHADOS), linha.quantidade > linha.qtd_recebida)
+            .group_by(linha.variante_produto_id, ordem.fornecedor_id)
+        )
+
+    def rebuild_open(self, db: Session) -> Tuple[int, int]:
+        """
+        Recalcula o resumo em aberto e o 'valor_total' de todas as ordens
+        a partir das linhas (NÃO faz commit).
+        """
+        db.execute(delete(models.CompraEmAberto))
+        linhas = self.lines_open_select().subquery("em_aberto")
+        result = db.execute(
+            pg_insert(models.CompraEmAberto).from_select(
+                ["variante_produto_id", "fornecedor_id", "qtd_em_aberto", "valor_em_aberto"],
+                select(linhas),
+            )
+        )
+        linha = models.OrdemDeCompraLinha
+        total = (
+            select(func.coalesce(func.sum(linha.quantidade * linha.preco_unitario), 0))
+            .where(linha.ordem_de_compra_id == self.model.id)
+            .scalar_subquery()
+        )
+        ordens = db.execute(update(self.model).values(valor_total=total).execution_options(synchronize_session=False))
+        return result.rowcount, ordens.rowcount
+
+    def verify_open(self, db: Session, *, limit: int = 1000) -> List[Dict[str, Any]]:
+        """Pares (variante, fornecedor) em que o resumo difere das linhas."""
+        resumo = models.CompraEmAberto
+        linhas = self.lines_open_select().subquery("em_aberto")
+        atual = select(resumo.variante_produto_id, resumo.fornecedor_id, resumo.qtd_em_aberto).subquery("resumo")
+        qtd_resumo = func.coalesce(atual.c.qtd_em_aberto, 0)
+        qtd_linhas = func.coalesce(linhas.c.qtd_em_aberto, 0)
+        stmt = (
+            select(
+                func.coalesce(atual.c.variante_produto_id, linhas.c.variante_produto_id).label("variante_produto_id"),
+                func.coalesce(atual.c.fornecedor_id, linhas.c.fornecedor_id).label("fornecedor_id"),
+                qtd_resumo.label("qtd_resumo"),
+                qtd_linhas.label("qtd_linhas"),
+            )
+            .select_from(atual.join(
+                linhas,
+                and_(
+                    atual.c.variante_produto_id == linhas.c.variante_produto_id,
+                    atual.c.fornecedor_id == linhas.c.fornecedor_id,
+                ),
+                full=True,
+            ))
+            .where(qtd_resumo != qtd_linhas)
+            .limit(limit)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+    def get_open(
+        self,
+        db: Session,
+        *,
+        variante_produto_id: Optional[uuid.UUID] = None,
+        fornecedor_id: Optional[uuid.UUID] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[models.CompraEmAberto]:
+        """Leitura direta do resumo (variante, fornecedor) com quantidade em aberto."""
+        resumo = models.CompraEmAberto
+        stmt = select(resumo).where(resumo.qtd_em_aberto != 0)
+        if variante_produto_id:
+            stmt = stmt.where(resumo.variante_produto_id == variante_produto_id)
+        if fornecedor_id:
+            stmt = stmt.where(resumo.fornecedor_id == fornecedor_id)
+        stmt = stmt.order_by(resumo.variante_produto_id, resumo.fornecedor_id).offset(skip).limit(limit)
+        return list(db.scalars(stmt))
+
+    def get_open_by_variant(self, db: Session, variante_ids: List[uuid.UUID]) -> List[Dict[str, Any]]:
+        """Totais em aberto por variante (todos os fornecedores), a partir do resumo."""
+        resumo = models.CompraEmAberto
+        stmt = (
+            select(
+                resumo.variante_produto_id,
+                func.sum(resumo.qtd_em_aberto).label("qtd_em_aberto"),
+                func.sum(resumo.valor_em_aberto).label("valor_em_aberto"),
+                func.count().label("fornecedores"),
+            )
+            .where(resumo.variante_produto_id.in_(variante_ids), resumo.qtd_em_aberto != 0)
+            .group_by(resumo.variante_produto_id)
+        )
+        return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+# Instância única (singleton)
+ordem_de_compra_crud = CRUDOrdemDeCompra(models.OrdemDeCompra)
@@ -0,0 +1,127 @@
+# backend/app/modules/purchasing/purchase_orders/purchase_orders_router.py
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Optional
+import uuid
+
+from . import purchase_orders_schemas, purchase_orders_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/compras",
+    tags=["Compras - Ordens de Compra"]
+)
+
+service = purchase_orders_service.ordem_de_compra_service
+
+# --- Quantidades em aberto (antes de '/ordens/{ordem_id}') ---
+
+@router.get("/em-aberto", response_model=List[purchase_orders_schemas.CompraEmAberto], summary="Quantidades encomendadas por receber (por variante e fornecedor)")
+def read_open_endpoint(
+    variante_produto_id: Optional[uuid.UUID] = None,
+    fornecedor_id: Optional[uuid.UUID] = None,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:read"))
+):
+    return service.get_open(db, variante_produto_id=variante_produto_id, fornecedor_id=fornecedor_id, skip=skip, limit=limit)
+
+@router.post("/em-aberto/consulta", response_model=List[purchase_orders_schemas.CompraEmAbertoVariante], summary="Totais por receber de uma lista de variantes")
+def read_open_by_variant_endpoint(
+    variante_ids: List[uuid.UUID],
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:read"))
+):
+    return service.get_open_by_variant(db, variante_ids=variante_ids)
+
+@router.post("/em-aberto/rebuild", response_model=purchase_orders_schemas.CompraEmAbertoReconstrucao, summary="Reconstruir o resumo em aberto e os totais a partir das linhas")
+def rebuild_open_endpoint(
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:admin"))
+):
+    return service.rebuild_open(db)
+
+@router.get("/em-aberto/verify", response_model=List[purchase_orders_schemas.CompraEmAbertoDivergencia], summary="Comparar o resumo em aberto com as linhas")
+def verify_open_endpoint(
+    limit: int = Query(1000, ge=1, le=10000),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:admin"))
+):
+    return service.verify_open(db, limit=limit)
+
+# --- Ordens de compra ---
+
+@router.post("/ordens", response_model=purchase_orders_schemas.OrdemDeCompra, summary="Criar uma ordem de compra (com linhas)")
+def create_order_endpoint(
+    ordem_in: purchase_orders_schemas.OrdemDeCompraCreate,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:admin"))
+):
+    return service.create(db, obj_in=ordem_in)
+
+@router.get("/ordens", response_model=List[purchase_orders_schemas.OrdemDeCompra], summary="Listar ordens de compra")
+def read_orders_endpoint(
+    fornecedor_id: Optional[uuid.UUID] = None,
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:read"))
+):
+    return service.get_all(db, fornecedor_id=fornecedor_id, status_filter=status, skip=skip, limit=limit)
+
+@router.get("/ordens/{ordem_id}", response_model=purchase_orders_schemas.OrdemDeCompra, summary="Obter uma ordem de compra")
+def read_order_endpoint(
+    ordem_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:read"))
+):
+    return service.get(db, ordem_id)
+
+@router.put("/ordens/{ordem_id}", response_model=purchase_orders_schemas.OrdemDeCompra, summary="Atualizar o cabeçalho de uma ordem de compra")
+def update_order_endpoint(
+    ordem_id: uuid.UUID,
+    ordem_in: purchase_orders_schemas.OrdemDeCompraUpdate,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:admin"))
+):
+    return service.update(db, ordem_id=ordem_id, obj_in=ordem_in)
+
+@router.post("/ordens/{ordem_id}/cancelar", response_model=purchase_orders_schemas.OrdemDeCompra, summary="Cancelar uma ordem de compra")
+def cancel_order_endpoint(
+    ordem_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:admin"))
+):
+    return service.cancel(db, ordem_id=ordem_id)
+
+@router.post("/ordens/{ordem_id}/linhas", response_model=purchase_orders_schemas.OrdemDeCompra, summary="Adicionar uma linha")
+def add_line_endpoint(
+    ordem_id: uuid.UUID,
+    linha_in: purchase_orders_schemas.OrdemDeCompraLinhaCreate,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:admin"))
+):
+    return service.add_line(db, ordem_id=ordem_id, linha_in=linha_in)
+
+@router.put("/ordens/{ordem_id}/linhas/{linha_id}", response_model=purchase_orders_schemas.OrdemDeCompra, summary="Alterar uma linha")
+def update_line_endpoint(
+    ordem_id: uuid.UUID,
+    linha_id: uuid.UUID,
+    linha_in: purchase_orders_schemas.OrdemDeCompraLinhaUpdate,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:admin"))
+):
+    return service.update_line(db, ordem_id=ordem_id, linha_id=linha_id, linha_in=linha_in)
+
+@router.delete("/ordens/{ordem_id}/linhas/{linha_id}", response_model=purchase_orders_schemas.OrdemDeCompra, summary="Eliminar uma linha (sem receções)")
+def delete_line_endpoint(
+    ordem_id: uuid.UUID,
+    linha_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:admin"))
+):
+    return service.delete_line(db, ordem_id=ordem_id, linha_id=linha_id)
@@ -0,0 +1,85 @@
+# backend/app/modules/purchasing/purchase_orders/purchase_orders_schemas.py
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from decimal import Decimal
+from datetime import datetime
+import uuid
+
+# --- Schemas das Linhas ---
+
+class OrdemDeCompraLinhaCreate(BaseModel):
+    variante_produto_id: uuid.UUID
+    quantidade: Decimal = Field(..., gt=0)
+    preco_unitario: Decimal = Field(..., ge=0)
+
+class OrdemDeCompraLinhaUpdate(BaseModel):
+    quantidade: Optional[Decimal] = Field(None, gt=0)
+    preco_unitario: Optional[Decimal] = Field(None, ge=0)
+
+class OrdemDeCompraLinha(BaseModel):
+    id: uuid.UUID
+    variante_produto_id: uuid.UUID
+    quantidade: Decimal
+    preco_unitario: Decimal
+    qtd_recebida: Decimal
+
+    class Config:
+        from_attributes = True
+
+# --- Schemas da Ordem de Compra ---
+
+class OrdemDeCompraCreate(BaseModel):
+    referencia: str
+    fornecedor_id: uuid.UUID
+    datahora_prev_entrega: Optional[datetime] = None
+    nfe: Optional[str] = None
+    documento_origem: Optional[str] = None
+    linhas: List[OrdemDeCompraLinhaCreate] = []
+
+class OrdemDeCompraUpdate(BaseModel):
+    datahora_prev_entrega: Optional[datetime] = None
+    nfe: Optional[str] = None
+    documento_origem: Optional[str] = None
+
+class OrdemDeCompra(BaseModel):
+    id: uuid.UUID
+    referencia: str
+    fornecedor_id: uuid.UUID
+    status: str
+    valor_total: Optional[Decimal] = None
+    datahora_prev_entrega: Optional[datetime] = None
+    nfe: Optional[str] = None
+    documento_origem: Optional[str] = None
+    created_at: datetime
+    linhas: List[OrdemDeCompraLinha] = []
+
+    class Config:
+        from_attributes = True
+
+# --- Schemas das Quantidades em Aberto ---
+
+class CompraEmAberto(BaseModel):
+    variante_produto_id: uuid.UUID
+    fornecedor_id: uuid.UUID
+    qtd_em_aberto: Decimal
+    valor_em_aberto: Decimal
+
+    class Config:
+        from_attributes = True
+
+class CompraEmAbertoVariante(BaseModel):
+    variante_produto_id: uuid.UUID
+    qtd_em_aberto: Decimal
+    valor_em_aberto: Decimal
+    fornecedores: int
+
+class CompraEmAbertoReconstrucao(BaseModel):
+    linhas: int  # Linhas (variante, fornecedor) recriadas
+    ordens: int  # Ordens com o valor total recalculado
+
+class CompraEmAbertoDivergencia(BaseModel):
+    variante_produto_id: uuid.UUID
+    fornecedor_id: uuid.UUID
+    qtd_resumo: Decimal
+    qtd_linhas: Decimal
@@ -0,0 +1,172 @@
+# backend/app/modules/purchasing/purchase_orders/purchase_orders_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Iterable, List, Optional
+import uuid
+
+from .... import models
+from ....models.purchasing.purchase_order_model import STATUS_OC_PENDENTE, STATUS_OC_CANCELADO, STATUS_OC_FECHADOS
+from . import purchase_orders_schemas
+from .purchase_orders_crud import ordem_de_compra_crud, LinhaSnapshot, ZERO
+
+
+class OrdemDeCompraService:
+    """
+    Ordens de compra e as suas linhas.
+
+    Cada alteração mantém, na mesma transação e por deltas:
+    - 'OrdemDeCompra.valor_total' (soma de quantidade x preco_unitario);
+    - o resumo 'compras_em_aberto' (quantidade por receber por variante e fornecedor).
+    """
+
+    def get(self, db: Session, ordem_id: uuid.UUID, *, for_update: bool = False) -> models.OrdemDeCompra:
+        db_ordem = ordem_de_compra_crud.get_with_lines(db, ordem_id, for_update=for_update)
+        if not db_ordem:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ordem de compra não encontrada.")
+        return db_ordem
+
+    def get_all(self, db: Session, *, fornecedor_id: Optional[uuid.UUID], status_filter: Optional[str], skip: int, limit: int) -> List[models.OrdemDeCompra]:
+        return ordem_de_compra_crud.get_multi_filtered(db, fornecedor_id=fornecedor_id, status=status_filter, skip=skip, limit=limit)
+
+    def _get_open_for_update(self, db: Session, ordem_id: uuid.UUID) -> models.OrdemDeCompra:
+        db_ordem = self.get(db, ordem_id, for_update=True)
+        if db_ordem.status in STATUS_OC_FECHADOS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"A ordem de compra está '{db_ordem.status}' e não pode ser alterada.")
+        return db_ordem
+
+    def _get_line(self, db_ordem: models.OrdemDeCompra, linha_id: uuid.UUID) -> models.OrdemDeCompraLinha:
+        for linha in db_ordem.linhas:
+            if linha.id == linha_id:
+                return linha
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Linha da ordem de compra não encontrada.")
+
+    def _validate_variants(self, db: Session, variante_ids: Iterable[uuid.UUID]) -> None:
+        missing = ordem_de_compra_crud.get_missing_variants(db, set(variante_ids))
+        if missing:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Variantes de produto não encontradas: {', '.join(sorted(str(v) for v in missing))}."
+            )
+
+    def _commit(self, db: Session, db_ordem: models.OrdemDeCompra) -> models.OrdemDeCompra:
+        try:
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return self.get(db, db_ordem.id)
+
+    # --- Ordem ---
+
+    def create(self, db: Session, *, obj_in: purchase_orders_schemas.OrdemDeCompraCreate) -> models.OrdemDeCompra:
+        if ordem_de_compra_crud.get_by_referencia(db, obj_in.referencia):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Já existe uma ordem de compra com esta referência.")
+        if not db.get(models.Fornecedor, obj_in.fornecedor_id):
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Fornecedor não encontrado.")
+        self._validate_variants(db, (linha.variante_produto_id for linha in obj_in.linhas))
+
+        db_ordem = models.OrdemDeCompra(
+            **obj_in.model_dump(exclude={"linhas"}),
+            status=STATUS_OC_PENDENTE,
+            valor_total=sum((linha.quantidade * linha.preco_unitario for linha in obj_in.linhas), ZERO),
+            linhas=[models.OrdemDeCompraLinha(**linha.model_dump(), qtd_recebida=ZERO) for linha in obj_in.linhas],
+        )
+        db.add(db_ordem)
+        db.flush()
+        ordem_de_compra_crud.apply_open_deltas(db, ordem_de_compra_crud.open_deltas(db_ordem, db_ordem.linhas))
+        return self._commit(db, db_ordem)
+
+    def update(self, db: Session, *, ordem_id: uuid.UUID, obj_in: purchase_orders_schemas.OrdemDeCompraUpdate) -> models.OrdemDeCompra:
+        """Atualiza os dados de cabeçalho (não afeta totais nem quantidades)."""
+        db_ordem = self._get_open_for_update(db, ordem_id)
+        for field, value in obj_in.model_dump(exclude_unset=True).items():
+            setattr(db_ordem, field, value)
+        return self._commit(db, db_ordem)
+
+    def cancel(self, db: Session, *, ordem_id: uuid.UUID) -> models.OrdemDeCompra:
+        """Cancela a ordem: o que faltava receber deixa de estar em aberto."""
+        db_ordem = self._get_open_for_update(db, ordem_id)
+        deltas = ordem_de_compra_crud.open_deltas(db_ordem, db_ordem.linhas, sign=-1)
+        db_ordem.status = STATUS_OC_CANCELADO
+        ordem_de_compra_crud.apply_open_deltas(db, deltas)
+        return self._commit(db, db_ordem)
+
+    # --- Linhas ---
+
+    def add_line(self, db: Session, *, ordem_id: uuid.UUID, linha_in: purchase_orders_schemas.OrdemDeCompraLinhaCreate) -> models.OrdemDeCompra:
+        db_ordem = self._get_open_for_update(db, ordem_id)
+        self._validate_variants(db, [linha_in.variante_produto_id])
+        db_linha = models.OrdemDeCompraLinha(**linha_in.model_dump(), qtd_recebida=ZERO)
+        db_ordem.linhas.append(db_linha)
+        db_ordem.valor_total = (db_ordem.valor_total or ZERO) + linha_in.quantidade * linha_in.preco_unitario
+        ordem_de_compra_crud.apply_open_deltas(db, ordem_de_compra_crud.open_deltas(db_ordem, [db_linha]))
+        return self._commit(db, db_ordem)
+
+    def update_line(
+        self,
+        db: Session,
+        *,
+        ordem_id: uuid.UUID,
+        linha_id: uuid.UUID,
+        linha_in: purchase_orders_schemas.OrdemDeCompraLinhaUpdate,
+    ) -> models.OrdemDeCompra:
+        db_ordem = self._get_open_for_update(db, ordem_id)
+        db_linha = self._get_line(db_ordem, linha_id)
+        if linha_in.quantidade is not None and linha_in.quantidade < (db_linha.qtd_recebida or ZERO):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"A quantidade não pode ser inferior à já recebida ({db_linha.qtd_recebida})."
+            )
+
+        antes = LinhaSnapshot.of(db_linha)
+        for field, value in linha_in.model_dump(exclude_unset=True, exclude_none=True).items():
+            setattr(db_linha, field, value)
+        depois = LinhaSnapshot.of(db_linha)
+
+        db_ordem.valor_total = (
+            (db_ordem.valor_total or ZERO)
+            - antes.quantidade * antes.preco_unitario
+            + depois.quantidade * depois.preco_unitario
+        )
+        ordem_de_compra_crud.apply_open_deltas(db, ordem_de_compra_crud.merge_deltas(
+            ordem_de_compra_crud.open_deltas(db_ordem, [antes], sign=-1),
+            ordem_de_compra_crud.open_deltas(db_ordem, [depois]),
+        ))
+        return self._commit(db, db_ordem)
+
+    def delete_line(self, db: Session, *, ordem_id: uuid.UUID, linha_id: uuid.UUID) -> models.OrdemDeCompra:
+        db_ordem = self._get_open_for_update(db, ordem_id)
+        db_linha = self._get_line(db_ordem, linha_id)
+        if db_linha.qtd_recebida:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Não é possível eliminar uma linha com quantidades já recebidas.")
+
+        db_ordem.valor_total = (db_ordem.valor_total or ZERO) - db_linha.quantidade * db_linha.preco_unitario
+        ordem_de_compra_crud.apply_open_deltas(db, ordem_de_compra_crud.open_deltas(db_ordem, [db_linha], sign=-1))
+        db_ordem.linhas.remove(db_linha)
+        db.delete(db_linha)
+        return self._commit(db, db_ordem)
+
+    # --- Quantidades em aberto ---
+
+    def get_open(self, db: Session, **filters) -> List[models.CompraEmAberto]:
+        return ordem_de_compra_crud.get_open(db, **filters)
+
+    def get_open_by_variant(self, db: Session, *, variante_ids: List[uuid.UUID]) -> List[dict]:
+        return ordem_de_compra_crud.get_open_by_variant(db, variante_ids)
+
+    def rebuild_open(self, db: Session) -> purchase_orders_schemas.CompraEmAbertoReconstrucao:
+        """Reconstrói o resumo em aberto e os totais das ordens, numa única transação."""
+        try:
+            linhas, ordens = ordem_de_compra_crud.rebuild_open(db)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return purchase_orders_schemas.CompraEmAbertoReconstrucao(linhas=linhas, ordens=ordens)
+
+    def verify_open(self, db: Session, *, limit: int) -> List[dict]:
+        return ordem_de_compra_crud.verify_open(db, limit=limit)
+
+
+ordem_de_compra_service = OrdemDeCompraService()
@@ -0,0 +1,88 @@
+# backend/app/modules/purchasing/receipts/receipts_crud.py
+
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import select, insert, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from typing import Any, Dict, List, Optional, Set, Tuple
+import uuid
+
+from .... import models
+
+class CRUDRececao:
+    """
+    Acesso a dados das receções de compra.
+    Nenhum método faz commit (a transação é gerida pelo serviço).
+    """
+    model = models.RececaoCompra
+
+    def get(self, db: Session, rececao_id: uuid.UUID) -> Optional[models.RececaoCompra]:
+        stmt = select(self.model).options(selectinload(self.model.linhas)).where(self.model.id == rececao_id)
+        return db.scalars(stmt).first()
+
+    def get_by_key(self, db: Session, chave_idempotencia: str) -> Optional[models.RececaoCompra]:
+        stmt = (
+            select(self.model)
+            .options(selectinload(self.model.linhas))
+            .where(self.model.chave_idempotencia == chave_idempotencia)
+        )
+        return db.scalars(stmt).first()
+
+    def get_by_order(self, db: Session, ordem_id: uuid.UUID, *, skip: int = 0, limit: int = 100) -> List[models.RececaoCompra]:
+        stmt = (
+            select(self.model)
+            .options(selectinload(self.model.linhas))
+            .where(self.model.ordem_de_compra_id == ordem_id)
+            .order_by(self.model.created_at.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return list(db.scalars(stmt))
+
+    def claim(self, db: Session, *, values: Dict[str, Any]) -> Optional[uuid.UUID]:
+        """
+        Insere o cabeçalho da receção. Com 'chave_idempotencia', usa
+        ON CONFLICT DO NOTHING: devolve None se a chave já existir (um pedido
+        concorrente com a mesma chave espera pelo commit do primeiro).
+        """
+        stmt = pg_insert(self.model).values(**values).returning(self.model.id)
+        if values.get("chave_idempotencia"):
+            stmt = stmt.on_conflict_do_nothing(index_elements=[self.model.chave_idempotencia])
+        return db.scalars(stmt).first()
+
+    def create_lines(self, db: Session, *, rows: List[Dict[str, Any]]) -> None:
+        """Insere todas as linhas da receção num único INSERT multi-linha."""
+        if rows:
+            db.execute(insert(models.RececaoCompraLinha), rows)
+
+    # --- Lotes ---
+
+    def get_lot_variants(self, db: Session, lote_ids: Set[uuid.UUID]) -> Dict[uuid.UUID, uuid.UUID]:
+        """{lote_id: variante_produto_id} dos lotes existentes em 'lote_ids'."""
+        if not lote_ids:
+            return {}
+        lote = models.Lote
+        return dict(db.execute(select(lote.id, lote.variante_produto_id).where(lote.id.in_(lote_ids))).all())
+
+    def get_lots_by_name(
+        self, db: Session, chaves: Set[Tuple[uuid.UUID, str]]
+    ) -> Dict[Tuple[uuid.UUID, str], models.Lote]:
+        """Lotes existentes por (variante, nome), numa só query (o primeiro criado, se houver repetidos)."""
+        if not chaves:
+            return {}
+        lote = models.Lote
+        stmt = (
+            select(lote)
+            .where(tuple_(lote.variante_produto_id, lote.nome).in_(list(chaves)))
+            .order_by(lote.created_at.desc())
+        )
+        return {(row.variante_produto_id, row.nome): row for row in db.scalars(stmt)}
+
+    def create_lots(self, db: Session, *, rows: List[Dict[str, Any]]) -> List[models.Lote]:
+        """Cria os lotes novos num único INSERT (com RETURNING)."""
+        if not rows:
+            return []
+        return list(db.scalars(insert(models.Lote).returning(models.Lote), rows))
+
+
+# Instância única (singleton)
+rececao_crud = CRUDRececao()
@@ -0,0 +1,49 @@
+# backend/app/modules/purchasing/receipts/receipts_router.py
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List
+import uuid
+
+from . import receipts_schemas, receipts_service
+from ....core.dependencies import get_db, require_permission
+from .... import models
+
+router = APIRouter(
+    prefix="/compras",
+    tags=["Compras - Receções"]
+)
+
+service = receipts_service.rececao_service
+
+@router.post("/ordens/{ordem_id}/rececoes", response_model=receipts_schemas.Rececao, summary="Receber uma ordem de compra (total ou parcial)")
+def receive_order_endpoint(
+    ordem_id: uuid.UUID,
+    pedido: receipts_schemas.RececaoPedido,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:admin"))
+):
+    """
+    Lança toda a receção numa única transação: movimentos de entrada no
+    livro razão, saldos, lotes, quantidades recebidas e status da OC.
+    Com 'chave_idempotencia', repetir o pedido devolve a receção original.
+    """
+    return service.receive(db, ordem_id=ordem_id, pedido=pedido, usuario_id=current_user.id)
+
+@router.get("/ordens/{ordem_id}/rececoes", response_model=List[receipts_schemas.Rececao], summary="Listar as receções de uma ordem de compra")
+def read_order_receipts_endpoint(
+    ordem_id: uuid.UUID,
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:read"))
+):
+    return service.get_by_order(db, ordem_id=ordem_id, skip=skip, limit=limit)
+
+@router.get("/rececoes/{rececao_id}", response_model=receipts_schemas.Rececao, summary="Obter uma receção")
+def read_receipt_endpoint(
+    rececao_id: uuid.UUID,
+    db: Session = Depends(get_db),
+    current_user: models.Usuario = Depends(require_permission("purchasing:read"))
+):
+    return service.get(db, rececao_id)
@@ -0,0 +1,67 @@
+# backend/app/modules/purchasing/receipts/receipts_schemas.py
+
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+from decimal import Decimal
+from datetime import datetime
+import uuid
+
+# --- Schemas do Pedido de Receção ---
+
+class RececaoLinhaPedido(BaseModel):
+    """
+    Quantidade recebida de uma linha da OC, num local de destino.
+    O lote pode ser indicado por ID (existente) ou por nome: neste caso é
+    reutilizado o lote da variante com esse nome ou criado um novo.
+    """
+    ordem_linha_id: uuid.UUID
+    quantidade: Decimal = Field(..., gt=0)
+    local_id: uuid.UUID
+    lote_id: Optional[uuid.UUID] = None
+    lote_nome: Optional[str] = Field(None, max_length=100)
+    data_de_expiracao: Optional[datetime] = None
+
+    @model_validator(mode="after")
+    def check_lote(self):
+        if self.lote_id and self.lote_nome:
+            raise ValueError("Indique o lote por ID ou por nome, não ambos.")
+        if self.data_de_expiracao and not self.lote_nome:
+            raise ValueError("A data de expiração só pode ser indicada com o nome do lote.")
+        return self
+
+class RececaoPedido(BaseModel):
+    """
+    Receção (total ou parcial) de uma OC. Repetir o pedido com a mesma
+    'chave_idempotencia' devolve a receção já lançada, sem a duplicar.
+    """
+    chave_idempotencia: Optional[str] = Field(None, min_length=1, max_length=100)
+    data_rececao: Optional[datetime] = None
+    nfe: Optional[str] = Field(None, max_length=100)
+    linhas: List[RececaoLinhaPedido] = Field(..., min_length=1, max_length=5000)
+
+# --- Schemas de Leitura ---
+
+class RececaoLinha(BaseModel):
+    id: uuid.UUID
+    ordem_linha_id: uuid.UUID
+    variante_produto_id: uuid.UUID
+    quantidade: Decimal
+    lote_id: Optional[uuid.UUID] = None
+    local_id: uuid.UUID
+    movimento_id: uuid.UUID
+
+    class Config:
+        from_attributes = True
+
+class Rececao(BaseModel):
+    id: uuid.UUID
+    ordem_de_compra_id: uuid.UUID
+    chave_idempotencia: Optional[str] = None
+    data_rececao: datetime
+    nfe: Optional[str] = None
+    usuario_id: Optional[uuid.UUID] = None
+    created_at: datetime
+    linhas: List[RececaoLinha] = []
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,244 @@
+# backend/app/modules/purchasing/receipts/receipts_service.py
+
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Dict, List, Optional, Tuple
+from decimal import Decimal
+from datetime import datetime
+import uuid
+
+from .... import models
+from ....models.inventory.stock_movement_model import MOVIMENTO_CONCLUIDO
+from ....models.purchasing.purchase_order_model import STATUS_OC_PARCIAL, STATUS_OC_RECEBIDO, STATUS_OC_FECHADOS
+from . import receipts_schemas
+from .receipts_crud import rececao_crud
+from ..purchase_orders.purchase_orders_crud import ordem_de_compra_crud, LinhaSnapshot
+from ...inventory.stock_balances.stock_balances_crud import saldo_estoque_crud
+from ...inventory.stock_balances.stock_balances_service import utc_now, to_ledger_datetime
+from ...inventory.stock_movements.stock_movements_crud import movimento_crud
+
+ZERO = Decimal(0)
+
+
+class RececaoService:
+    """
+    Receção de ordens de compra.
+
+    Toda a receção é lançada numa única transação, com a OC bloqueada:
+    um INSERT multi-linha para os movimentos de entrada no livro razão,
+    os deltas de saldo em lote (como em 'issue_items'), os lotes novos num
+    só INSERT, a 'qtd_recebida' das linhas, o status da OC e os deltas das
+    quantidades em aberto.
+    """
+
+    def get(self, db: Session, rececao_id: uuid.UUID) -> models.RececaoCompra:
+        rececao = rececao_crud.get(db, rececao_id)
+        if not rececao:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Receção não encontrada.")
+        return rececao
+
+    def get_by_order(self, db: Session, *, ordem_id: uuid.UUID, skip: int, limit: int) -> List[models.RececaoCompra]:
+        return rececao_crud.get_by_order(db, ordem_id, skip=skip, limit=limit)
+
+    def receive(
+        self, db: Session, *, ordem_id: uuid.UUID, pedido: receipts_schemas.RececaoPedido, usuario_id: uuid.UUID
+    ) -> models.RececaoCompra:
+        """Lança a receção (ou devolve a já lançada com a mesma chave de idempotência)."""
+        if pedido.chave_idempotencia:
+            existente = self._get_existing(db, ordem_id, pedido.chave_idempotencia)
+            if existente:
+                return existente
+        try:
+            rececao_id = self.post_receipt(db, ordem_id=ordem_id, pedido=pedido, usuario_id=usuario_id)
+            if rececao_id is None:
+                # Um pedido concorrente com a mesma chave foi confirmado primeiro
+                db.rollback()
+                return self._get_existing(db, ordem_id, pedido.chave_idempotencia)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        return self.get(db, rececao_id)
+
+    def _get_existing(self, db: Session, ordem_id: uuid.UUID, chave: str) -> Optional[models.RececaoCompra]:
+        rececao = rececao_crud.get_by_key(db, chave)
+        if rececao and rececao.ordem_de_compra_id != ordem_id:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A chave de idempotência já foi usada numa receção de outra ordem de compra."
+            )
+        return rececao
+
+    def post_receipt(
+        self, db: Session, *, ordem_id: uuid.UUID, pedido: receipts_schemas.RececaoPedido, usuario_id: Optional[uuid.UUID]
+    ) -> Optional[uuid.UUID]:
+        """
+        Valida e lança a receção. NÃO faz commit. Devolve o ID da receção,
+        ou None se a chave de idempotência já existir.
+        """
+        ordem = ordem_de_compra_crud.get_with_lines(db, ordem_id, for_update=True)
+        if not ordem:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Ordem de compra não encontrada.")
+
+        # A chave é reclamada logo após o bloqueio da OC e antes de validar:
+        # uma repetição que esperou pelo bloqueio encontra a receção original
+        # em vez de ser validada contra a OC já recebida.
+        data_rececao = to_ledger_datetime(pedido.data_rececao) if pedido.data_rececao else utc_now()
+        rececao_id = rececao_crud.claim(db, values={
+            "chave_idempotencia": pedido.chave_idempotencia,
+            "ordem_de_compra_id": ordem.id,
+            "data_rececao": data_rececao,
+            "nfe": pedido.nfe,
+            "usuario_id": usuario_id,
+        })
+        if rececao_id is None:
+            return None
+
+        if ordem.status in STATUS_OC_FECHADOS:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=f"A ordem de compra está '{ordem.status}' e não aceita receções.")
+        linhas_oc = self._validate(db, ordem, pedido)
+        self._check_closed_period(db, data_rececao)
+
+        lotes = self._resolve_lots(db, pedido, linhas_oc)
+        tocadas = {linha.ordem_linha_id: linhas_oc[linha.ordem_linha_id] for linha in pedido.linhas}
+        antes = ordem_de_compra_crud.open_deltas(ordem, [LinhaSnapshot.of(linha) for linha in tocadas.values()], sign=-1)
+
+        # Movimentos de entrada (IDs gerados aqui para ligar as linhas da receção)
+        movimentos, linhas_rececao = [], []
+        for linha in pedido.linhas:
+            linha_oc = linhas_oc[linha.ordem_linha_id]
+            lote_id = linha.lote_id or lotes.get((linha_oc.variante_produto_id, linha.lote_nome))
+            movimento_id = uuid.uuid4()
+            movimentos.append({
+                "id": movimento_id,
+                "referencia": ordem.referencia,
+                "variante_produto_id": linha_oc.variante_produto_id,
+                "lote_id": lote_id,
+                "local_origem_id": None,
+                "local_destino_id": linha.local_id,
+                "qtd_prevista": linha.quantidade,
+                "qtd_realizada": linha.quantidade,
+                "preco_un": linha_oc.preco_unitario,
+                "status": MOVIMENTO_CONCLUIDO,
+                "data_movimento": data_rececao,
+                "usuario_id": usuario_id,
+            })
+            linhas_rececao.append({
+                "rececao_id": rececao_id,
+                "ordem_linha_id": linha_oc.id,
+                "variante_produto_id": linha_oc.variante_produto_id,
+                "lote_id": lote_id,
+                "local_id": linha.local_id,
+                "quantidade": linha.quantidade,
+                "movimento_id": movimento_id,
+            })
+            linha_oc.qtd_recebida = (linha_oc.qtd_recebida or ZERO) + linha.quantidade
+
+        criados = movimento_crud.create_many(db, rows=movimentos)
+        saldo_estoque_crud.apply_deltas(db, saldo_estoque_crud.deltas_from_movements(criados))
+        rececao_crud.create_lines(db, rows=linhas_rececao)
+
+        completa = all((linha.qtd_recebida or ZERO) >= linha.quantidade for linha in ordem.linhas)
+        ordem.status = STATUS_OC_RECEBIDO if completa else STATUS_OC_PARCIAL
+        ordem.responsavel_receb_id = usuario_id
+        if pedido.nfe and not ordem.nfe:
+            ordem.nfe = pedido.nfe
+
+        depois = ordem_de_compra_crud.open_deltas(ordem, tocadas.values())
+        ordem_de_compra_crud.apply_open_deltas(db, ordem_de_compra_crud.merge_deltas(antes, depois))
+        return rececao_id
+
+    def _validate(
+        self, db: Session, ordem: models.OrdemDeCompra, pedido: receipts_schemas.RececaoPedido
+    ) -> Dict[uuid.UUID, models.OrdemDeCompraLinha]:
+        """
+        Valida toda a receção contra a OC já carregada (linhas e quantidades
+        por receber) e os locais e lotes indicados (uma query por tabela).
+        Levanta 400 com todos os problemas encontrados.
+        """
+        linhas_oc = {linha.id: linha for linha in ordem.linhas}
+        erros = []
+
+        desconhecidas = {linha.ordem_linha_id for linha in pedido.linhas} - linhas_oc.keys()
+        if desconhecidas:
+            erros.append(f"Linhas que não pertencem à ordem de compra: {', '.join(sorted(map(str, desconhecidas)))}.")
+
+        recebido: Dict[uuid.UUID, Decimal] = {}
+        for linha in pedido.linhas:
+            if linha.ordem_linha_id in linhas_oc:
+                recebido[linha.ordem_linha_id] = recebido.get(linha.ordem_linha_id, ZERO) + linha.quantidade
+        excedidas = [
+            f"{linha_id} (por receber {linhas_oc[linha_id].quantidade - (linhas_oc[linha_id].qtd_recebida or ZERO)}, recebido {quantidade})"
+            for linha_id, quantidade in recebido.items()
+            if quantidade > linhas_oc[linha_id].quantidade - (linhas_oc[linha_id].qtd_recebida or ZERO)
+        ]
+        if excedidas:
+            erros.append(f"Quantidade superior à que falta receber: {', '.join(excedidas)}.")
+
+        locais = {linha.local_id for linha in pedido.linhas}
+        locais_em_falta = locais - movimento_crud.existing_ids(db, models.Local, locais)
+        if locais_em_falta:
+            erros.append(f"Local(is) não encontrado(s): {', '.join(sorted(map(str, locais_em_falta)))}.")
+
+        lote_variantes = rececao_crud.get_lot_variants(db, {linha.lote_id for linha in pedido.linhas if linha.lote_id})
+        lotes_invalidos = sorted({
+            str(linha.lote_id)
+            for linha in pedido.linhas
+            if linha.lote_id and linha.ordem_linha_id in linhas_oc
+            and lote_variantes.get(linha.lote_id) != linhas_oc[linha.ordem_linha_id].variante_produto_id
+        })
+        if lotes_invalidos:
+            erros.append(f"Lote(s) inexistente(s) ou de outra variante: {', '.join(lotes_invalidos)}.")
+
+        if erros:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=" ".join(erros))
+        return linhas_oc
+
+    def _resolve_lots(
+        self,
+        db: Session,
+        pedido: receipts_schemas.RececaoPedido,
+        linhas_oc: Dict[uuid.UUID, models.OrdemDeCompraLinha],
+    ) -> Dict[Tuple[uuid.UUID, str], uuid.UUID]:
+        """
+        Lotes indicados por nome -> ID: reutiliza os existentes da variante
+        (completando a data de expiração, se faltar) e cria os restantes
+        num único INSERT.
+        """
+        expiracoes: Dict[Tuple[uuid.UUID, str], Optional[datetime]] = {}
+        for linha in pedido.linhas:
+            if linha.lote_nome:
+                chave = (linhas_oc[linha.ordem_linha_id].variante_produto_id, linha.lote_nome)
+                expiracoes[chave] = expiracoes.get(chave) or linha.data_de_expiracao
+        if not expiracoes:
+            return {}
+
+        existentes = rececao_crud.get_lots_by_name(db, set(expiracoes))
+        for chave, lote in existentes.items():
+            if expiracoes[chave] and not lote.data_de_expiracao:
+                lote.data_de_expiracao = to_ledger_datetime(expiracoes[chave])
+
+        novos = rececao_crud.create_lots(db, rows=[
+            {
+                "variante_produto_id": variante_id,
+                "nome": nome,
+                "data_de_expiracao": to_ledger_datetime(expiracao) if expiracao else None,
+            }
+            for (variante_id, nome), expiracao in sorted(expiracoes.items(), key=lambda item: (str(item[0][0]), item[0][1]))
+            if (variante_id, nome) not in existentes
+        ])
+        lotes = {chave: lote.id for chave, lote in existentes.items()}
+        lotes.update({(lote.variante_produto_id, lote.nome): lote.id for lote in novos})
+        return lotes
+
+    def _check_closed_period(self, db: Session, data_rececao: datetime) -> None:
+        """Não são aceites receções com data anterior ao último fecho de saldos."""
+        ultimo_fecho = saldo_estoque_crud.latest_checkpoint(db)
+        if ultimo_fecho is not None and data_rececao < ultimo_fecho:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Período já fechado: não são aceites receções anteriores a {ultimo_fecho.isoformat()}."
+            )
+
+
+rececao_service = RececaoService()
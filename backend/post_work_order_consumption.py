@@ -0,0 +1,26 @@
+# backend/post_work_order_consumption.py
+#
+# Lançamento periódico do consumo de peças das Ordens de Serviço no livro
+# razão de stock (ex: via cron). Cada OS é lançada na sua própria transação;
+# as OS com erro (ex: falta de stock ou de local) são listadas no fim.
+#
+#   python post_work_order_consumption.py
+
+import sys
+
+from app.core.database import SessionLocal
+from app.modules.maintenance.work_orders.work_orders_service import work_order_service
+
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        resultado = work_order_service.flush_parts_consumption(db)
+        for wo_number in resultado["lancadas"]:
+            print(f"  + {wo_number}")
+        for erro in resultado["falhadas"]:
+            print(f"  ! {erro}")
+        print(f"{len(resultado['lancadas'])} OS lançada(s), {len(resultado['falhadas'])} com erro.")
+        sys.exit(1 if resultado["falhadas"] else 0)
+    finally:
+        db.close()
@@ -0,0 +1,40 @@
+# backend/rebuild_stock_balances.py
+#
+# Reconstrói ou verifica a tabela de saldos (saldos_estoque) a partir do
+# livro razão.
+#
+#   python rebuild_stock_balances.py            -> apenas verifica (não altera nada)
+#   python rebuild_stock_balances.py --rebuild  -> reconstrói e volta a verificar
+#   python rebuild_stock_balances.py --fechos   -> cria os fechos mensais em falta (ex: via cron)
+
+import sys
+
+from app.core.database import SessionLocal
+from app.modules.inventory.stock_balances.stock_balances_crud import saldo_estoque_crud
+from app.modules.inventory.stock_balances.stock_balances_service import saldo_estoque_service
+
+
+def verify(db) -> int:
+    divergencias = saldo_estoque_crud.verify(db)
+    for linha in divergencias:
+        print(
+            f"  - variante={linha['variante_produto_id']} lote={linha['lote_id']} local={linha['local_id']}: "
+            f"saldo={linha['quantidade_saldo']} razão={linha['quantidade_razao']}"
+        )
+    print(f"{len(divergencias)} divergência(s) encontrada(s).")
+    return len(divergencias)
+
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        if "--rebuild" in sys.argv:
+            saldos = saldo_estoque_crud.rebuild(db)
+            db.commit()
+            print(f"Saldos reconstruídos: {saldos} linha(s).")
+        if "--fechos" in sys.argv:
+            for fecho in saldo_estoque_service.create_monthly_checkpoints(db):
+                print(f"Fecho {fecho.data_fecho:%Y-%m-%d}: {fecho.linhas} linha(s).")
+        sys.exit(1 if verify(db) else 0)
+    finally:
+        db.close()
@@ -1,5 +1,6 @@
 # backend/seeder.py
 
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal, engine
 from app import models
@@ -30,6 +31,14 @@ PERMISSIONS = {
     "inventory:admin":       { "descricao": "Permite acesso total ao módulo de inventário", "module": "inventory" },
     "inventory:read":        { "descricao": "Permite ler dados do módulo de inventário", "module": "inventory" },
     
+    # --- MÓDULO: COMPRAS ---
+    "purchasing:admin":      { "descricao": "Permite acesso total ao módulo de compras (ordens, linhas, receções)", "module": "purchasing" },
+    "purchasing:read":       { "descricao": "Permite ler dados do módulo de compras", "module": "purchasing" },
+
+    # --- MÓDULO: PRODUÇÃO ---
+    "production:admin":      { "descricao": "Permite acesso total ao módulo de produção", "module": "production" },
+    "production:read":       { "descricao": "Permite ler dados do módulo de produção (BOMs, necessidades)", "module": "production" },
+
     # Locais (Corrige o erro 403)
     "locais:ler":            { "descricao": "Ver locais", "module": "inventory" },
     "locais:criar":          { "descricao": "Criar locais", "module": "inventory" },
@@ -135,6 +144,9 @@ def seed_initial_data(db: Session):
 if __name__ == "__main__":
     db = SessionLocal()
     try:
+        # Os índices de trigramas (typeahead) precisam da extensão pg_trgm
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         # Garante que as tabelas existem antes de semear
         models.Base.metadata.create_all(bind=engine)
         seed_initial_data(db)
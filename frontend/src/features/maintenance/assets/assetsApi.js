@@ -30,6 +30,26 @@ export const getAsset = async (id) => {
   return response.data;
 };
 
+/**
+ * Obtém o resumo do ativo (OS em aberto, PMs, medidores, peças, paragens)
+ * num único pedido, para o ecrã de detalhe.
+ * @param {string} id - O UUID do ativo.
+ */
+export const getAssetSummary = async (id) => {
+  const response = await apiClient.get(`${ENDPOINT}/${id}/summary`);
+  return response.data;
+};
+
+/**
+ * Obtém a árvore de ativos (já aninhada) num único pedido.
+ * @param {Object} params - Opcional: { root_id, max_depth }.
+ *   Para expandir um nó com 'has_more', enviar o seu 'expand_cursor' como 'root_id'.
+ */
+export const getAssetTree = async (params = {}) => {
+  const response = await apiClient.get(`${ENDPOINT}/tree`, { params });
+  return response.data;
+};
+
 /**
  * Cria um novo ativo.
  * @param {Object} data - O objeto AssetCreate (name, internal_tag, etc.)